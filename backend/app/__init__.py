@@ -1,28 +1,43 @@
 # app/__init__.py
 
-from flask import Flask, send_from_directory, current_app
+from flask import Flask, abort
 import os
-from app.routes.youtube_routes import youtube_bp
+from app.routes.youtube_routes import youtube_bp, CLIP_SENDFILE_HEADER
 from app.routes.sse_stream import sse_bp
+from app.routes.metrics_routes import metrics_bp
+from app.services.static_assets import AssetIndex
+from app.services.transcript_index import transcript_index
+
+FRONTEND_DIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'frontend', 'dist')
 
 def create_app():
-    app = Flask(__name__, static_folder='../../frontend/dist', static_url_path='')
+    # Static files are served from the asset index below, not Flask's static view
+    app = Flask(__name__, static_folder=None)
+    app.config["USE_X_SENDFILE"] = CLIP_SENDFILE_HEADER == "X-Sendfile"
 
     app.register_blueprint(sse_bp, url_prefix="/api")
     app.register_blueprint(youtube_bp, url_prefix="/api")
+    app.register_blueprint(metrics_bp, url_prefix="/api")
+
+    # Catch up on transcripts cached before the search index existed
+    transcript_index.start_sync()
+
+    assets = AssetIndex(os.path.normpath(FRONTEND_DIST))
 
     # Serve index.html
     @app.route('/')
     def serve_frontend():
-        return current_app.send_static_file('index.html')
-
-    # Serve any static asset (CSS/JS/images)
-    @app.route('/<path:path>')
-    def serve_static(path):
-        file_path = os.path.join(app.static_folder, path)
-        if os.path.exists(file_path):
-            return send_from_directory(app.static_folder, path)
-        else:
-            return current_app.send_static_file('index.html')
-
-    return app
\ No newline at end of file
+        return serve_static('index.html')
+
+    # Serve any static asset (CSS/JS/images), endpoint kept as 'static' for url_for
+    @app.route('/<path:filename>', endpoint='static')
+    def serve_static(filename):
+        asset = assets.get(filename)
+        if asset is None:
+            # Unknown files are real 404s, extensionless paths are client-side routes
+            if os.path.splitext(filename)[1] or not assets.get('index.html'):
+                abort(404)
+            asset = assets.get('index.html')
+        return assets.serve(asset)
+
+    return app
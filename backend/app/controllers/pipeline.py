@@ -0,0 +1,164 @@
+# app/controllers/pipeline.py
+import os
+import json
+import time
+from flask import g
+from app.routes.sse_stream import send_event, end_stream
+from app.controllers.youtube_downloader import handle_youtube_url
+from app.controllers.transcriber import transcribe_audio
+from app.controllers.timestamps_extractor import generate_clip_timestamps
+from app.controllers.video_clipper import clip_video, ClipStreamer, ClipIndex, prefetch_source_video, CLIP_MODE, LOCAL_MODES, PROGRESSIVE_CLIPS
+from app.utils.video_tools import cancel_delayed_events
+from app.services.cache import cache
+from app.services.job_queue import job_queue
+from app.services.metrics import span
+from app.services.transcript_index import transcript_index
+
+STREAM_CLIPS = os.getenv("STREAM_CLIPS", "true").lower() in ("1", "true", "yes")
+
+
+def run_job(app, job):
+    # Worker threads have no request, give the pipeline its own app context
+    with app.app_context():
+        g.base_dir = os.path.join("app", "downloads", job.video_id)
+        os.makedirs(g.base_dir, exist_ok=True)
+        g.video_id = job.video_id
+        g.job = job
+        # Workers on other nodes sharing the cache see the lease and leave this video alone
+        lease = cache.lease(job.video_id)
+        lease.acquire()
+        try:
+            return run_pipeline(job)
+        finally:
+            if g.get("clip_streamer"):
+                g.clip_streamer.shutdown()
+            cancel_delayed_events(job.id)
+            end_stream(job.id)
+            # This job's video is still marked active here, so it is never evicted
+            evicted_videos = cache.evict(protect=job_queue.active_video_ids())
+            for evicted in evicted_videos:
+                send_event(f"[INFO] Cache full, removed {evicted}", topic="global")
+            if evicted_videos:
+                transcript_index.remove(evicted_videos)
+            lease.release()
+
+
+def run_pipeline(job):
+    start_time = time.time()
+    params = job.params
+
+    youtube_url = params["youtube_url"]
+    video_id = job.video_id
+    quality = params.get("quality")
+    keywords = params.get("keywords")
+    locally_cached = params.get("local_cache", True)
+    clip_count = params.get("clip_count", 4)
+    clip_duration = params.get("clip_duration", 60)
+    clip_mode = params.get("clip_mode")
+    progressive = params.get("progressive")
+    if progressive is None:
+        progressive = PROGRESSIVE_CLIPS
+
+    send_event("[INFO] Process Started")
+
+    # ---------------------- Fetch and Download Audio ----------------------
+    job.set_stage("download")
+    send_event("[INFO] Fetching URL Data")
+    with span("audio_download"):
+        download_res = handle_youtube_url(youtube_url, video_id)
+
+    if download_res.get("error"):
+        return {
+            "status": "failed",
+            "message": download_res.get("error"),
+            "content": download_res.get("message")
+        }, 502
+
+    audio_path = download_res.get("audio_path")
+
+    # The source video for local cutting downloads while the audio is transcribed
+    if (clip_mode or CLIP_MODE) in LOCAL_MODES:
+        prefetch_source_video(youtube_url, quality)
+
+    # ---------------------- Transcription ----------------------
+    job.set_stage("transcription")
+    send_event("[INFO] Transcribing Audio")
+    with span("transcription"):
+        transcription_result = transcribe_audio(audio_path, video_id)
+
+    if transcription_result.get("error"):
+        send_event("[ERROR] Transcription failed.")
+        return {
+            "status": "failed",
+            "message": transcription_result.get("error"),
+            "content": transcription_result.get("message")
+        }, 502
+
+    transcription_path = transcription_result.get("path")
+    send_event("[DONE] Transcription process Completed.")
+
+    # ---------------------- Generate Timestamps ----------------------
+    job.set_stage("timestamps")
+    send_event("[INFO] Generating Timestamps")
+    # Clips start downloading while the model is still writing the rest of the list
+    streamer = g.clip_streamer = ClipStreamer(youtube_url, quality, clip_mode, reuse=locally_cached,
+                                                progressive=progressive) if STREAM_CLIPS else None
+    with span("timestamps"):
+        timestamps_result = generate_clip_timestamps(transcription_path, video_id, clip_count, clip_duration, locally_cached, keywords,
+                                                     on_clip=streamer.add_clip if streamer else None)
+
+    # Fallback if JSON couldn't be parsed
+    if not timestamps_result["path"] or timestamps_result["path"].endswith(".txt"):
+        send_event("[FALLBACK] Using TXT Fallback")
+        return {
+            "status": "fallback",
+            "message": timestamps_result.get("message", "Returned fallback TXT because JSON parsing failed."),
+            "content": timestamps_result.get("raw_response", None),
+            "error": timestamps_result.get("error", None),
+            "path": timestamps_result.get("path", None)
+        }, 200
+
+    send_event("[DONE] Response saved as JSON.")
+
+    # ---------------------- Clip Video ----------------------
+    job.set_stage("clipping")
+    send_event("[INFO] Generating Video Clips")
+    with span("clipping", streamed=bool(streamer and streamer.started)):
+        if streamer and streamer.started:
+            send_event("[INFO] Waiting for the clips already in progress")
+            clips_folder = streamer.finish()
+        else:
+            clips_folder = clip_video(youtube_url, timestamps_result["path"], locally_cached, quality, clip_mode, progressive)
+
+    # Freshly generated timestamps are already in memory, only cached ones are read back
+    timestamp_data = timestamps_result.get("clips")
+    if timestamp_data is None:
+        with open(timestamps_result["path"], "r", encoding="utf-8") as f:
+            timestamp_data = json.load(f)
+
+    # ---------------------- Collect Clips ----------------------
+    job.set_stage("serving")
+    # The folder can hold clips past the requested count from an earlier, larger request
+    with span("serving"):
+        filenames = ClipIndex(clips_folder).names(len(timestamp_data) if isinstance(timestamp_data, list) else 0)
+
+    if not filenames:
+        return {
+            "status": "fallback",
+            "message": "Failed generating the clips",
+            "content": f"Sorry for the inconvenience, here's the content: {timestamp_data}"
+        }, 200
+
+    send_event("[DONE] Thanks for the patience, Videos downloaded successfully.")
+    send_event("[DONE] Video Clips Generated.")
+
+    send_event("[DONE] Process Completed")
+    end_time = time.time()
+
+    return {
+        "message": "YouTube processing completed successfully",
+        "clips": filenames,
+        "timestamp": timestamp_data,
+        "time_taken": round(end_time - start_time, 2),
+        "time_to_first_clip": job.time_to_first_clip()
+    }, 200
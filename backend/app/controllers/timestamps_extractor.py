@@ -1,13 +1,54 @@
 # app.controllers.timestamps_extractor.py
 import os
-# import re
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from flask import g
-from app.services.groq import get_groq_client
-from app.routes.sse_stream import send_event
-from app.utils.json_tools import compact_transcription_format
+from app.services.groq import create_chat_completion
+from app.services.cache import cache, artifact_key, atomic_write_json, atomic_write_text
+from app.services.executors import run_cpu_bound
+from app.services.locks import producing
+from app.services.metrics import span, tag_span
+from app.services.transcript_index import transcript_index
+from app.utils.transcript_store import Transcript, TranscriptError
+from app.routes.sse_stream import send_event, current_topic
+from app.utils.json_tools import compact_transcription_format, split_transcript_windows, score_window, JSONArrayStreamParser
 
-def generate_clip_timestamps(transcription_path, video_id, clips=4, duration=60, locally_cached=True, keywords=""):
+TIMESTAMPS_MODEL = "llama-3.3-70b-versatile"
+TIMESTAMPS_MAP_MODEL = os.getenv("TIMESTAMPS_MAP_MODEL", "llama-3.1-8b-instant")
+TIMESTAMPS_MODE = os.getenv("TIMESTAMPS_MODE", "auto")  # "single", "mapreduce", "auto" (map-reduce long transcripts) or "search"
+TIMESTAMPS_MAX_PROMPT_CHARS = int(os.getenv("TIMESTAMPS_MAX_PROMPT_CHARS", "40000"))
+TIMESTAMPS_WINDOW_SECONDS = int(os.getenv("TIMESTAMPS_WINDOW_SECONDS", "600"))
+TIMESTAMPS_MAX_WINDOWS = int(os.getenv("TIMESTAMPS_MAX_WINDOWS", "12"))
+TIMESTAMPS_WORKERS = int(os.getenv("TIMESTAMPS_WORKERS", "4"))
+
+SYSTEM_PROMPT = (
+    "You are a highly skilled content strategist and short-form video editor with deep expertise in virality psychology. "
+    "You specialize in identifying high-impact, emotionally resonant, and shareable moments from any genre of video — "
+    "comedy, brain rot, educational, emotional, patriotic, or edgy humor. You return structured JSON containing only the most "
+    "viral potential clips based on title, timestamps, hook, tags, and mood. Your output is concise, creative, and trimmed to "
+    "make perfect YouTube Shorts or TikToks."
+)
+
+CLIP_FIELDS_PROMPT = (
+    f"Return only a JSON array of clip objects with the following fields:\n"
+    f"- title: short catchy title\n"
+    f"- description: brief summary (1-2 lines)\n"
+    f"- tags: 4-6 related hashtags\n"
+    f"- timestamps: [start, end] in seconds (float with 2 decimal places, no ms)\n"
+    f"- hook: strong hook for first 3 seconds\n"
+    f"- mood: e.g., funny, emotional, educational, patriotic, edgy humor\n\n"
+
+    f"❗ Strictly return a valid JSON array. No comments or explanations. Format timestamps to 2 decimal places.\n\n"
+)
+
+def generate_clip_timestamps(transcription_path, video_id, clips=4, duration=60, locally_cached=True, keywords="", mode=None, on_clip=None):
+    # The pool and timestamp.json are shared by every request for the video, one worker picks at a time
+    with producing(g.base_dir, "timestamps"):
+        return extract_clip_timestamps(transcription_path, video_id, clips, duration, locally_cached, keywords, mode, on_clip)
+
+
+def extract_clip_timestamps(transcription_path, video_id, clips=4, duration=60, locally_cached=True, keywords="", mode=None, on_clip=None):
     result = {
         "cached": False,
         "path": None,
@@ -16,110 +57,373 @@ def generate_clip_timestamps(transcription_path, video_id, clips=4, duration=60,
         "message": None
     }
 
+    mode = mode or TIMESTAMPS_MODE
     output_path = os.path.join(g.base_dir, "timestamp.json")
     output_path_fallback = os.path.join(g.base_dir, "timestamp.txt")
+    pool_path = os.path.join(g.base_dir, "timestamp_pool.json")
+    pool_inputs = dict(
+        transcript=cache.key_of(video_id, "transcript"),
+        duration=duration,
+        keywords=keywords or "",
+        model=TIMESTAMPS_MODEL,
+        mode=mode
+    )
+    timestamps_key = artifact_key(clips=clips, **pool_inputs)
+    # Every clip picked so far for these settings, whatever the count was; a new count takes a prefix
+    pool_key = artifact_key(**pool_inputs)
 
     if locally_cached and os.path.exists(output_path):
         send_event("[INFO] Using locally cached metadata file")
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
-        num_segments = len(data) if isinstance(data, list) else 0
-        
-        if num_segments == clips:
+        if cache.lookup(video_id, "timestamps", timestamps_key):
             result.update({
                 "path": output_path,
                 "cached": True,
-                "message": f"Used cached transcription timestamps."                
+                "message": f"Used cached transcription timestamps."
             })
-            return result     
+            return result
         else:
-            send_event("[WARN] Failed using locally cached file as parameter might have changed")   
+            send_event("[WARN] Failed using locally cached file as parameter might have changed")
 
     if not os.path.exists(transcription_path):
         send_event("[ERROR] Missing transcription File path")
         result["error"] = "Transcription file not found."
         return result
 
-    send_event("[INFO] Loading Transcription")
-    with open(transcription_path, "r", encoding="utf-8") as f:
-        transcription = json.load(f)
+    chosen = load_pool(video_id, pool_key, pool_path) if locally_cached else []
+    if len(chosen) >= clips:
+        # The lookup for this exact count missed, but the model is not asked at all
+        tag_span(cache="hit")
+        send_event(f"[INFO] Reusing {clips} of the {len(chosen)} clips already picked")
+        for index, clip in enumerate(chosen[:clips], start=1):
+            if on_clip:
+                on_clip(clip, index)
+        return save_timestamps(result, chosen[:clips], video_id, timestamps_key, output_path)
 
-    transcription_input = compact_transcription_format(transcription)
+    needed = clips - len(chosen)
+    if chosen:
+        send_event(f"[INFO] Keeping the {len(chosen)} clips already picked, asking for {needed} more")
+        for index, clip in enumerate(chosen, start=1):
+            if on_clip:
+                on_clip(clip, index)
 
-    prompt = (
-        f"Transcription:\n{transcription_input}\n\n"
-        f"You are given a transcription composed of multiple segments with their start-end times."
-        f"Extract exactly {clips} clip ideas that are likely to go viral on social media with {keywords or 'interesting'} genre. Each clip must be strictly between {duration - 20} and {duration + 20} seconds."
-        f"Each clip can span multiple segments. Use the starting timestamp of the first included segment and the ending timestamp of the last included segment.\n\n"
-
-        f"Return only a JSON array of clip objects with the following fields:\n"
-        f"- title: short catchy title\n"
-        f"- description: brief summary (1-2 lines)\n"
-        f"- tags: 4-6 related hashtags\n"
-        f"- timestamps: [start, end] in seconds (float with 2 decimal places, no ms)\n"
-        f"- hook: strong hook for first 3 seconds\n"
-        f"- mood: e.g., funny, emotional, educational, patriotic, edgy humor\n\n"
-
-        f"❗ Strictly return a valid JSON array. No comments or explanations. Format timestamps to 2 decimal places.\n\n"
-    )
+    try:
+        transcript = Transcript.open(transcription_path)
+    except TranscriptError as e:
+        # The next run transcribes again instead of reading the same broken file
+        send_event(f"[ERROR] Could not read the transcription: {e}")
+        cache.invalidate(video_id, "transcript")
+        result["error"] = "Transcription file is unreadable."
+        return result
+
+    # Keyword requests can be answered from the transcript index without the model
+    if mode == "search" and keywords:
+        found = search_timestamps(video_id, needed, duration, keywords, ClipSelector(chosen, needed, transcript))
+        if found is not None:
+            for index, clip in enumerate(found, start=len(chosen) + 1):
+                if on_clip:
+                    on_clip(clip, index)
+            return save_timestamps(result, chosen + found, video_id, timestamps_key, output_path, pool_key, pool_path)
+        send_event("[INFO] Not enough keyword matches, asking the model instead")
+        mode = "auto"
+
+    send_event("[INFO] Loading Transcription")
+    with span("prompt_build"):
+        transcription, transcription_input = run_cpu_bound(load_transcription, transcript)
+        map_reduce = mode == "mapreduce" or (mode == "auto" and len(transcription_input) > TIMESTAMPS_MAX_PROMPT_CHARS)
+        prompt = None if map_reduce else (
+            f"Transcription:\n{transcription_input}\n\n"
+            f"You are given a transcription composed of multiple segments with their start-end times."
+            f"Extract exactly {needed} clip ideas that are likely to go viral on social media with {keywords or 'interesting'} genre. Each clip must be strictly between {duration - 20} and {duration + 20} seconds."
+            f"Each clip can span multiple segments. Use the starting timestamp of the first included segment and the ending timestamp of the last included segment.\n\n"
+            f"{exclusion_prompt(chosen)}"
+            f"{CLIP_FIELDS_PROMPT}"
+        )
 
     send_event("[INFO] Sending request to model")
-    client = get_groq_client()
-    
+    stream = selected(on_clip, ClipSelector(chosen, needed, transcript), len(chosen) + 1) if on_clip else None
+
     try:
-        completion_response = client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": (
-                    "You are a highly skilled content strategist and short-form video editor with deep expertise in virality psychology. "
-                    "You specialize in identifying high-impact, emotionally resonant, and shareable moments from any genre of video — "
-                    "comedy, brain rot, educational, emotional, patriotic, or edgy humor. You return structured JSON containing only the most "
-                    "viral potential clips based on title, timestamps, hook, tags, and mood. Your output is concise, creative, and trimmed to "
-                    "make perfect YouTube Shorts or TikToks."
-                )},
-                {"role": "user", "content": prompt}
-            ],
-            model="llama-3.3-70b-versatile"
-        )
+        with span("llm_call", mode="mapreduce" if map_reduce else "single"):
+            if map_reduce:
+                response = map_reduce_timestamps(transcription, needed, duration, keywords, stream, chosen)
+            else:
+                response = request_completion(prompt, TIMESTAMPS_MODEL, stream)
     except Exception as e:
         send_event("[ERROR] Failed fetching the viral timestamps")
         result.update({
             "error": f"Failed fetching the viral timestamps: {e}",
-            "message": "There may be an issue with third-party services or APIs."    
+            "message": "There may be an issue with third-party services or APIs."
         })
         return result
 
     send_event("[DONE] Got response from the model")
-
-    response = completion_response.choices[0].message.content.strip()
     result["raw_response"] = response
 
+    try:
+        parsed_json = parse_response(response, output_path_fallback)
+    except json.JSONDecodeError:
+        result.update({
+            "path": output_path_fallback,
+            "message": "Raw response saved as fallback text file."
+        })
+        return result
+
+    if not isinstance(parsed_json, list):
+        return save_timestamps(result, parsed_json, video_id, timestamps_key, output_path)
+
+    # Same rules the streamed clips went through, so both end up with the same list
+    selector = ClipSelector(chosen, needed, transcript)
+    found = [clip for clip in map(selector.take, parsed_json) if clip is not None]
+    return save_timestamps(result, chosen + found, video_id, timestamps_key, output_path, pool_key, pool_path)
+
+
+def save_timestamps(result, parsed_json, video_id, timestamps_key, output_path, pool_key=None, pool_path=None):
+    atomic_write_json(output_path, parsed_json, ensure_ascii=False, indent=2)
+    cache.record(video_id, "timestamps", timestamps_key, output_path)
+    if pool_key is not None:
+        atomic_write_json(pool_path, parsed_json, ensure_ascii=False, indent=2)
+        cache.record(video_id, "timestamps_pool", pool_key, pool_path)
+
+    result.update({"path": output_path, "clips": parsed_json})
+    return result
+
+
+def load_pool(video_id, pool_key, pool_path):
+    if not cache.lookup(video_id, "timestamps_pool", pool_key):
+        return []
+    try:
+        with open(pool_path, "r", encoding="utf-8") as f:
+            pool = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    return pool if isinstance(pool, list) else []
+
+
+def clip_range(clip):
+    try:
+        start, end = (float(value) for value in clip["timestamps"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return start, end
+
+
+def snap_clip(clip, transcript):
+    # Model timestamps come from segment times and can fall inside a word
+    found = clip_range(clip)
+    if found is None:
+        return clip
+    return {**clip, "timestamps": list(transcript.snap(*found))}
+
+
+class ClipSelector:
+    """Takes new clips in order, up to `wanted`, skipping any that overlap a clip already chosen.
+
+    Streamed clips and the parsed answer go through their own selector with
+    the same rules, so the clips started early are exactly the ones saved.
+    """
+
+    def __init__(self, chosen, wanted, transcript):
+        self.ranges = [found for found in map(clip_range, chosen) if found]
+        self.wanted = wanted
+        self.taken = 0
+        self.transcript = transcript
+
+    def take(self, clip):
+        if self.taken >= self.wanted or not isinstance(clip, dict):
+            return None
+        clip = snap_clip(clip, self.transcript)
+        found = clip_range(clip)
+        if found:
+            if any(found[0] < end and start < found[1] for start, end in self.ranges):
+                return None
+            self.ranges.append(found)
+        self.taken += 1
+        return clip
+
+
+def selected(on_clip, selector, first_index):
+    def take(clip):
+        clip = selector.take(clip)
+        if clip is not None:
+            on_clip(clip, first_index + selector.taken - 1)
+    return take
+
+
+def exclusion_prompt(chosen):
+    ranges = [found for found in map(clip_range, chosen) if found]
+    if not ranges:
+        return ""
+    listed = ", ".join(f"{start:.2f}-{end:.2f}" for start, end in ranges)
+    return f"These moments are already used as clips, do not pick anything overlapping them: {listed}.\n\n"
+
+
+def parse_response(response, output_path_fallback):
     try:
         send_event("[INFO] Trying to save the JSON response.")
         parsed_json = json.loads(response)
     except json.JSONDecodeError:
         send_event("[WARN] Failed! Filtering the JSON response.")
-        fixed_response = response.strip()
-        fixed_response = fixed_response.replace("“", "\"").replace("”", "\"").replace("‘", "'").replace("’", "'")
-        fixed_response = re.sub(r",(\s*[\]}])", r"\1", fixed_response)
 
         try:
             send_event("[INFO] Trying to load the filtered JSON response.")
-            parsed_json = json.loads(fixed_response)
+            with span("json_repair"):
+                parsed_json = repair_json(response)
         except json.JSONDecodeError:
             send_event("[FALLBACK] Fallback to the txt response.")
-            
-            with open(output_path_fallback, "w", encoding="utf-8") as fallback_file:
-                fallback_file.write(response)
-                
-            result.update({
-                "path": output_path_fallback,
-                "message": "Raw response saved as fallback text file."                
-            })
-            return result
 
-    with open(output_path, "w", encoding="utf-8") as out_file:
-        json.dump(parsed_json, out_file, ensure_ascii=False, indent=2)
+            atomic_write_text(output_path_fallback, response)
+            raise
+    return parsed_json
+
+
+def search_timestamps(video_id, clips, duration, keywords, selector):
+    """Clip objects built from the best keyword windows, or None when fewer than `clips` are usable."""
+    with span("keyword_search"):
+        # Extra windows make up for the ones overlapping clips picked earlier
+        windows = transcript_index.search(keywords, video_id=video_id, duration=duration,
+                                          limit=clips + len(selector.ranges))
+
+    tags = [f"#{word}" for word in dict.fromkeys(re.findall(r"\w+", keywords.lower()))][:5] + ["#shorts"]
+    found = []
+    for window in windows:
+        sentence = re.split(r"(?<=[.!?])\s", window["text"], maxsplit=1)[0]
+        clip = selector.take({
+            "title": " ".join(sentence.split()[:8]),
+            "description": window["text"][:160],
+            "tags": tags,
+            "timestamps": [window["start"], window["end"]],
+            "hook": " ".join(sentence.split()[:15]),
+            "mood": keywords,
+        })
+        if clip is not None:
+            found.append(clip)
+    if len(found) < clips:
+        return None
+
+    send_event(f"[INFO] Picked {len(found)} clips from keyword matches")
+    return sorted(found, key=lambda clip: clip["timestamps"][0])
+
+
+def load_transcription(transcript):
+    transcription = transcript.segments()
+    return transcription, compact_transcription_format(transcription)
+
+
+def request_completion(prompt, model, on_clip=None):
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+    if on_clip is None:
+        completion_response = create_chat_completion(messages=messages, model=model)
+        return completion_response.choices[0].message.content.strip()
+
+    # Stream the answer and hand every clip over as soon as its object is complete
+    parser = JSONArrayStreamParser()
+    parts = []
+    for chunk in create_chat_completion(messages=messages, model=model, stream=True):
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content
+        if not text:
+            continue
+        parts.append(text)
+        for clip in parser.feed(text):
+            on_clip(clip)
+    return "".join(parts).strip()
+
+
+def repair_json(response):
+    fixed_response = response.strip()
+    fixed_response = fixed_response.replace("“", "\"").replace("”", "\"").replace("‘", "'").replace("’", "'")
+    fixed_response = re.sub(r",(\s*[\]}])", r"\1", fixed_response)
+    # Models sometimes wrap the array in prose or a code fence
+    start, end = fixed_response.find("["), fixed_response.rfind("]")
+    if start != -1 and end > start:
+        fixed_response = fixed_response[start:end + 1]
+    return json.loads(fixed_response)
 
-    result["path"] = output_path
-    return result
\ No newline at end of file
+
+def map_reduce_timestamps(transcription, clips, duration, keywords, on_clip=None, chosen=()):
+    """Scores candidate moments per time window in parallel, then lets one small
+    call pick the final clips from the candidates only.
+
+    A local heuristic keeps the liveliest TIMESTAMPS_MAX_WINDOWS windows so the
+    number of LLM calls stays bounded however long the video is.
+    """
+    windows = split_transcript_windows(transcription, TIMESTAMPS_WINDOW_SECONDS, duration + 20)
+    if len(windows) > TIMESTAMPS_MAX_WINDOWS:
+        ranked = sorted(windows, key=lambda window: score_window(window["segments"], keywords), reverse=True)
+        windows = sorted(ranked[:TIMESTAMPS_MAX_WINDOWS], key=lambda window: window["start"])
+
+    per_window = max(2, min(clips, 4))
+    topic = current_topic()  # pool threads have no app context to find the job's channel
+    send_event(f"[INFO] Long transcript, scoring {len(windows)} windows in parallel")
+
+    with ThreadPoolExecutor(max_workers=TIMESTAMPS_WORKERS) as pool:
+        window_candidates = list(pool.map(
+            lambda window: find_window_candidates(window, per_window, duration, keywords, topic), windows
+        ))
+
+    taken = [found for found in map(clip_range, chosen) if found]
+    candidates = [candidate for found in window_candidates for candidate in found
+                  if not any(candidate["timestamps"][0] < end and start < candidate["timestamps"][1] for start, end in taken)]
+    if not candidates:
+        raise RuntimeError("No candidate moments were found in any window")
+
+    candidates.sort(key=lambda candidate: candidate["score"], reverse=True)
+    candidates = candidates[:clips * 4]
+    send_event(f"[INFO] Picking the best {clips} clips out of {len(candidates)} candidates")
+
+    candidate_lines = "\n".join(
+        f"{candidate['timestamps'][0]:.2f}-{candidate['timestamps'][1]:.2f} (score {candidate['score']}): "
+        f"{candidate['reason']} | {candidate['excerpt']}"
+        for candidate in candidates
+    )
+    prompt = (
+        f"Candidate moments:\n{candidate_lines}\n\n"
+        f"You are given candidate moments of a longer video with their start-end times, a score and an excerpt."
+        f"Pick exactly {clips} non-overlapping clips that are likely to go viral on social media with {keywords or 'interesting'} genre. Each clip must be strictly between {duration - 20} and {duration + 20} seconds."
+        f"Keep the timestamps of the chosen candidates.\n\n"
+        f"{exclusion_prompt(chosen)}"
+        f"{CLIP_FIELDS_PROMPT}"
+    )
+    return request_completion(prompt, TIMESTAMPS_MODEL, on_clip)
+
+
+def find_window_candidates(window, per_window, duration, keywords, topic=None):
+    prompt = (
+        f"Transcription:\n{compact_transcription_format(window['segments'])}\n\n"
+        f"Find up to {per_window} moments in this part of a video that could become viral clips with {keywords or 'interesting'} genre, "
+        f"each between {duration - 20} and {duration + 20} seconds, using segment start and end times.\n"
+        f"Return only a JSON array of objects with: timestamps [start, end] in seconds, score (1-10 viral potential), reason (one short line)."
+    )
+
+    try:
+        response = request_completion(prompt, TIMESTAMPS_MAP_MODEL)
+        found = repair_json(response)
+    except Exception as e:
+        send_event(f"[WARN] Skipped window {window['start']:.0f}s: {e}", topic=topic)
+        return []
+
+    candidates = []
+    for item in found if isinstance(found, list) else []:
+        try:
+            start, end = (float(value) for value in item["timestamps"])
+            score = float(item.get("score", 0))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if end <= start:
+            continue
+
+        excerpt = " ".join(segment["text"].strip() for segment in window["segments"]
+                           if segment["end"] > start and segment["start"] < end)
+        candidates.append({
+            "timestamps": [start, end],
+            "score": score,
+            "reason": str(item.get("reason", "")).replace("\n", " "),
+            "excerpt": excerpt[:300]
+        })
+    return candidates
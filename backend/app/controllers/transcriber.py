@@ -1,62 +1,174 @@
 import os
-import json
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from flask import g
-from app.services.groq import get_groq_client
+from app.services.groq import create_transcription
 from app.routes.sse_stream import send_event
+from app.services.cache import cache, artifact_key
+from app.services.locks import producing
+from app.services.executors import run_cpu_bound
+from app.services.transcript_index import transcript_index
+from app.utils.audio_tools import plan_chunks, stitch_segments, trim_silence, remap_segments, VAD_KEY
+from app.utils.ffmpeg_tools import probe_duration, detect_silences, extract_segment
+from app.utils.transcript_store import write_transcript, Transcript, TranscriptError
 
-def transcribe_audio(audio_path, video_id):
+TRANSCRIBE_MODE = os.getenv("TRANSCRIBE_MODE", "auto")  # "single", "chunked" or "auto" (chunk long audio)
+TRANSCRIBE_CHUNK_SECONDS = int(os.getenv("TRANSCRIBE_CHUNK_SECONDS", "600"))
+TRANSCRIBE_OVERLAP_SECONDS = float(os.getenv("TRANSCRIBE_OVERLAP_SECONDS", "5"))
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "4"))
+TRANSCRIBE_MODEL = "whisper-large-v3-turbo"
+TRANSCRIBE_TRIM_SILENCE = os.getenv("TRANSCRIBE_TRIM_SILENCE", "false").lower() == "true"  # send only the speech
+
+def transcribe_audio(audio_path, video_id, mode=None):
+    # One Groq transcription per video across workers and nodes, the rest wait for it
+    with producing(g.base_dir, "transcript"):
+        return run_transcription(audio_path, video_id, mode)
+
+
+def run_transcription(audio_path, video_id, mode=None):
     result = {
         "path" : None,
         "error" : None,
         "message" : None,
     }
-    
-    raw_path = os.path.join(g.base_dir, 'transcription.json')
+
+    raw_path = os.path.join(g.base_dir, 'transcript.bin')
+    legacy_path = os.path.join(g.base_dir, 'transcription.json')  # written before the binary store, has no words
+    key_inputs = {"audio": cache.key_of(video_id, "audio"), "model": TRANSCRIBE_MODEL}
+    if TRANSCRIBE_TRIM_SILENCE:
+        key_inputs["trim"] = VAD_KEY
+    transcript_key = artifact_key(**key_inputs)
     send_event(f"[INFO] Checking if the file exists in local Cached memory.")
-        
-    if os.path.exists(raw_path):
-        result["path"] = raw_path
-        return result       
+
+    cached_path = cache.lookup(video_id, "transcript", transcript_key, path=legacy_path)
+    if cached_path:
+        try:
+            Transcript.open(cached_path)
+        except (OSError, TranscriptError) as e:
+            # A damaged file is transcribed again instead of failing every job that reads it
+            send_event(f"[WARN] Cached transcript is unreadable, transcribing again: {e}")
+            cache.invalidate(video_id, "transcript")
+            cached_path = None
+    if cached_path:
+        index_transcript(video_id, cached_path, transcript_key)
+        result["path"] = cached_path
+        return result
     else:
         send_event(f"[DONE] File not found in local Cached memory.")
-    
+
+    # Timestamps from the speech-only audio are mapped back before saving, clips still cut the original
+    trimmed = trim_silence(audio_path, video_id) if TRANSCRIBE_TRIM_SILENCE else None
+    if trimmed:
+        audio_path = trimmed["path"]
+
+    mode = mode or TRANSCRIBE_MODE
+    duration = probe_duration(audio_path) if mode != "single" else None
+    chunked = mode == "chunked" or (mode == "auto" and duration and duration > TRANSCRIBE_CHUNK_SECONDS)
+
     send_event(f"[INFO] Audio sending for Transcription.")
-    client = get_groq_client()
-    
+
     try:
-        with open(audio_path, "rb") as file:
-            transcription = client.audio.transcriptions.create(
-                file=file,
-                model="whisper-large-v3-turbo",
-                response_format="verbose_json",
-            )
-            
+        if chunked and duration:
+            transcription = transcribe_in_chunks(audio_path, duration)
+        else:
+            transcription = transcribe_file(audio_path)
+
     except Exception as e:
         # Catch anything else (API errors, decoding issues, etc.)
         send_event(f"[ERROR] Failed the transcription of audio file")
-        
+
         result.update({
             "error": f"Error transcribing the audio: {e}",
             "message": "There was an issue transcribing the audio please try again after some time"
         })
         return result
-    
+
+    if trimmed:
+        transcription = {name: remap_segments(items, trimmed["remap"]) for name, items in transcription.items()}
+
     send_event(f"[DONE] Transcription complete.")
-        
-    transcription_dict = transcription.model_dump()    
-    filtered_segments = [
-        {
-            "start": segment["start"],
-            "end": segment["end"],
-            "text": segment["text"]
-        }
-        for segment in transcription_dict.get("segments", [])
-    ]
 
     send_event(f"[INFO] Saving transcription locally")
-    with open(raw_path, "w", encoding="utf-8") as f:
-        json.dump(filtered_segments, f, indent=2, ensure_ascii=False)
-    
+    write_transcript(raw_path, transcription["segments"], transcription["words"])
+    cache.record(video_id, "transcript", transcript_key, raw_path)
+    index_transcript(video_id, raw_path, transcript_key)
+
     send_event("[DONE] Transcription saved successfully.")
     result["path"] = raw_path
-    return result
\ No newline at end of file
+    return result
+
+
+def index_transcript(video_id, path, key):
+    # Search is a bonus, a broken index must not fail the transcription
+    try:
+        if transcript_index.add_transcript(video_id, path, key):
+            send_event("[INFO] Transcript indexed for search")
+    except (sqlite3.Error, OSError, ValueError) as e:
+        send_event(f"[WARN] Could not index the transcript for search: {e}")
+
+
+def transcribe_file(audio_path):
+    # Read once so a retried request can send the same bytes again
+    with open(audio_path, "rb") as file:
+        audio = (os.path.basename(audio_path), file.read())
+
+    transcription = create_transcription(
+        file=audio,
+        model=TRANSCRIBE_MODEL,
+        response_format="verbose_json",
+        timestamp_granularities=["segment", "word"],
+    )
+
+    transcription_dict = transcription.model_dump()
+    return {
+        "segments": [
+            {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"]
+            }
+            for segment in transcription_dict.get("segments") or []
+        ],
+        # Word timings let clip edges land between words
+        "words": [
+            {"start": word["start"], "end": word["end"], "word": word["word"]}
+            for word in transcription_dict.get("words") or []
+        ],
+    }
+
+
+def transcribe_in_chunks(audio_path, duration):
+    job = g.get("job")
+    chunk_dir = os.path.join(g.base_dir, "chunks")
+    os.makedirs(chunk_dir, exist_ok=True)
+
+    send_event("[INFO] Long audio, looking for silences to split it")
+    silences = detect_silences(audio_path)
+    chunks = plan_chunks(duration, silences, TRANSCRIBE_CHUNK_SECONDS, TRANSCRIBE_OVERLAP_SECONDS)
+    send_event(f"[INFO] Transcribing {len(chunks)} chunks in parallel")
+
+    for chunk in chunks:
+        chunk["path"] = os.path.join(chunk_dir, f"chunk_{chunk['index']:03d}.opus")
+        if not extract_segment(audio_path, chunk["start"], chunk["end"], chunk["path"]):
+            raise RuntimeError(f"Failed splitting audio chunk {chunk['index']}")
+
+    chunk_segments = []
+    try:
+        with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as pool:
+            futures = {pool.submit(transcribe_file, chunk["path"]): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                if job is not None and job.cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    job.check_cancelled()
+
+                chunk_segments.append((futures[future], future.result()))
+                send_event(f"[PROGRESS] Transcription: {len(chunk_segments)}/{len(chunks)} chunks done")
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    return {
+        "segments": run_cpu_bound(stitch_segments, [(chunk, found["segments"]) for chunk, found in chunk_segments]),
+        "words": run_cpu_bound(stitch_segments, [(chunk, found["words"]) for chunk, found in chunk_segments], dedupe=False),
+    }
@@ -1,71 +1,554 @@
 # app/controllers/video_clipper.py
 import os
 import json
-import subprocess
-from flask import g
-from app.utils.video_tools import delayed_message
+import threading
+import numpy as np
+import contextvars
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from flask import g, current_app
 from app.utils.video_tools import seconds_to_hms
 from app.utils.video_tools import send_event_with_delay
-from app.routes.sse_stream import send_event
+from app.utils.video_tools import ProgressReporter, snap_to_boundaries
+from app.utils.ffmpeg_tools import get_clip_pool, cut_clip, smart_cut, probe_keyframes
+from app.utils.transcript_store import Transcript
+from app.services.cache import cache, artifact_key, atomic_write_json
+from app.services.locks import producing, artifact_lock
+from app.services.video_info import resolve_video_info, process_video_info
+from app.services.download_workers import download_pool, WorkerDied
+from app.services.download_budget import download_budget
+from app.utils.download_tools import accelerated_ydl
+from app.routes.sse_stream import send_event, publish_event
 
-def clip_video(youtube_url, json_path, locally_cached, quality):
+# "sections" (yt-dlp per section), "local" (download once, cut with ffmpeg) or "smart"
+# (download once, frame-accurate cuts that only re-encode the partial GOPs at the edges)
+CLIP_MODE = os.getenv("CLIP_MODE", "sections")
+LOCAL_MODES = ("local", "smart")
+CLIP_STREAM_WORKERS = int(os.getenv("CLIP_STREAM_WORKERS", "4"))
+CLIP_SNAP_SECONDS = float(os.getenv("CLIP_SNAP_SECONDS", "1.0"))  # pull clip edges onto segment/speech boundaries this close
+SMART_CUT_SNAP_SECONDS = float(os.getenv("SMART_CUT_SNAP_SECONDS", "0.25"))  # or onto a keyframe this close, skipping an encode
+CLIP_INDEX_NAME = ".index.json"
+# Progressive delivery: a small preview of every clip first, the full-quality render replaces it when done
+PROGRESSIVE_CLIPS = os.getenv("PROGRESSIVE_CLIPS", "false").lower() in ("1", "true", "yes")
+PREVIEW_QUALITY = int(os.getenv("PREVIEW_QUALITY", "240"))
+PREVIEW_FORMAT = f"bestvideo[height<={PREVIEW_QUALITY}]+worstaudio/worst[height>=144]/worst"
+PREVIEW_WORKERS = int(os.getenv("PREVIEW_WORKERS", "2"))
+
+prefetch_pool = ThreadPoolExecutor(max_workers=int(os.getenv("PREFETCH_WORKERS", "2")), thread_name_prefix="prefetch")
+
+def clip_video(youtube_url, json_path, locally_cached, quality, mode=None, progressive=False):
     output_dir = os.path.join(g.base_dir, "clips")
     os.makedirs(output_dir, exist_ok=True)
+    mode = mode or CLIP_MODE
 
-    if locally_cached and os.listdir(output_dir):
-        send_event("[DONE] Found the locally cached clips.")
-        return output_dir
+    if not locally_cached:
+        reset_clips_dir(output_dir)
 
     with open(json_path, 'r', encoding='utf-8') as f:
         clips = json.load(f)
-    
-    # Build download_sections as a list of strings
-    download_sections = []
-    for clip in clips:
-        start, end = clip.get("timestamps", [0, 0])
-        if end <= start:
-            send_event(f"[WARN] Skipping invalid clip: {clip.get('title')} (start: {start}, end: {end})")
-            continue
-        hms_range = f"{seconds_to_hms(start)}-{seconds_to_hms(end)}"
-        download_sections.append(f"*{hms_range}")
-        
-    yt_output_template = os.path.join(output_dir, "%(id)s_clip_%(autonumber)03d.%(ext)s")
+
+    # Positions stay those of timestamp.json, so clip N keeps its file when the count changes
+    sections = []
+    for index, clip in enumerate(clips, start=1):
+        section = validate_clip(clip)
+        if section:
+            sections.append((index, *section))
+    snapped = snap_sections([(start, end) for _, start, end in sections], clip_boundaries(g.video_id))
+    sections = [(index, start, end) for (index, _, _), (start, end) in zip(sections, snapped)]
+
+    clip_index = ClipIndex(output_dir)
+    spec = {"quality": quality, "mode": mode}
+    missing = [(index, start, end) for index, start, end in sections if not clip_index.reusable(index, start, end, spec)]
+    if len(missing) < len(sections):
+        send_event(f"[DONE] Reusing {len(sections) - len(missing)} clips already cut.")
+    if not missing:
+        cache.record(g.video_id, "clips", clips_cache_key(quality, mode), output_dir)
+        return output_dir
+
+    if mode in LOCAL_MODES or progressive:
+        streamer = ClipStreamer(youtube_url, quality, mode, progressive=progressive)
+        send_event(f"[INFO] Cutting {len(missing)} clips" + (" from the local copy" if mode in LOCAL_MODES else ""))
+        for index, start, end in missing:
+            streamer.add(start, end, index)
+        return streamer.finish()
+
+    with ExitStack() as stack:
+        # Ascending order, like every other holder, so two workers can never deadlock
+        for index, _, _ in missing:
+            stack.enter_context(producing(g.base_dir, clip_lock_name(index)))
+        # A worker that held one of these meanwhile may have cut it already
+        missing = [(index, start, end) for index, start, end in missing if not clip_index.reusable(index, start, end, spec)]
+        for index, _, _ in missing:
+            clip_index.forget(index)
+        if missing:
+            for section in clip_video_sections(youtube_url, missing, output_dir, quality):
+                if section["path"] and not section["error"]:
+                    clip_index.record(section["index"], section["path"], section["start"], section["end"], spec)
+
+    if os.listdir(output_dir):
+        cache.record(g.video_id, "clips", clips_cache_key(quality, mode), output_dir)
+    return output_dir
+
+
+def clip_url(video_id, name):
+    # Relative, jobs run outside any request; the job status route hands out absolute ones
+    return current_app.url_map.bind("").build("youtube.serve_clip", {"video_id": video_id, "name": name})
+
+
+def clip_lock_name(index):
+    return f"clip_{index:03d}"
+
+
+def clips_cache_key(quality, mode):
+    return artifact_key(timestamps=cache.key_of(g.video_id, "timestamps"), quality=quality, mode=mode)
+
+
+def reset_clips_dir(output_dir):
+    # Clips cut for other timestamps or quality must not be served with the new ones
+    cache.invalidate(g.video_id, "clips")
+    os.makedirs(output_dir, exist_ok=True)
+    for name in os.listdir(output_dir):
+        path = os.path.join(output_dir, name)
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+class ClipIndex:
+    """Range, quality and mode every clip file in a clips directory was cut with.
+
+    A clip whose position, range and settings are unchanged is reused as is,
+    so asking for more clips only cuts the new ones and asking for fewer cuts
+    nothing at all.
+    """
+
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, CLIP_INDEX_NAME)
+        with self._locks_guard:
+            # Shared per directory, the streamer records clips from several threads
+            self.lock = self._locks.setdefault(os.path.abspath(output_dir), threading.Lock())
+        # ...and other workers may record into the same directory
+        self.file_lock = artifact_lock(os.path.dirname(output_dir), "clip_index")
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def reusable(self, index, start, end, spec):
+        entry = self.load().get(str(index))
+        if not entry or entry["range"] != [round(start, 2), round(end, 2)] or entry["spec"] != spec:
+            return None
+        path = os.path.join(self.output_dir, entry["name"])
+        return path if os.path.exists(path) else None
+
+    def record(self, index, path, start, end, spec):
+        with self.lock, self.file_lock:
+            entries = self.load()
+            entries[str(index)] = {"name": os.path.basename(path), "range": [round(start, 2), round(end, 2)], "spec": spec}
+            atomic_write_json(self.path, entries, indent=2)
+
+    def forget(self, index):
+        """Drops clip `index` before it is cut again, a failed cut must not leave the old clip listed."""
+        with self.lock, self.file_lock:
+            entries = self.load()
+            entry = entries.pop(str(index), None)
+            if entry:
+                path = os.path.join(self.output_dir, entry["name"])
+                if os.path.exists(path):
+                    os.remove(path)
+                atomic_write_json(self.path, entries, indent=2)
+
+    def names(self, count):
+        """File names of clips 1..count that exist, in order."""
+        entries = self.load()
+        return [entries[str(index)]["name"] for index in range(1, count + 1)
+                if str(index) in entries and os.path.exists(os.path.join(self.output_dir, entries[str(index)]["name"]))]
+
+
+def clip_boundaries(video_id):
+    """(start boundaries, end boundaries) a clip edge may snap to: transcript segments and speech regions."""
+    starts, ends = [], []
+    transcript_path = cache.path_of(video_id, "transcript")
+    if transcript_path:
+        try:
+            transcript = Transcript.open(transcript_path)
+            starts.append(transcript.starts)
+            ends.append(transcript.ends)
+        except (OSError, ValueError) as e:
+            send_event(f"[WARN] Could not read the transcript to align clips: {e}")
+
+    # Only there when silence trimming ran, the regions come for free with it
+    remap_path = cache.path_of(video_id, "speech_remap")
+    if remap_path:
+        with open(remap_path, "r", encoding="utf-8") as f:
+            remap = np.asarray(json.load(f)["remap"], dtype=np.float64).reshape(-1, 3)
+        starts.append(remap[:, 1])
+        ends.append(remap[:, 1] + remap[:, 2])
+
+    if not starts:
+        return None
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+def snap_sections(sections, boundaries):
+    """Moves all clip edges onto nearby sentence or speech boundaries at once."""
+    if not sections or boundaries is None:
+        return sections
+
+    original = np.asarray(sections, dtype=np.float64)
+    starts = snap_to_boundaries(original[:, 0], boundaries[0], CLIP_SNAP_SECONDS)
+    ends = snap_to_boundaries(original[:, 1], boundaries[1], CLIP_SNAP_SECONDS)
+    # A snap that would collapse a clip is not taken
+    valid = ends > starts
+    starts = np.where(valid, starts, original[:, 0])
+    ends = np.where(valid, ends, original[:, 1])
+    return [(round(float(start), 2), round(float(end), 2)) for start, end in zip(starts, ends)]
+
+
+_keyframes = {}
+_keyframes_lock = threading.Lock()
+_indexing = {}  # source_path -> lock held while that source is probed
+
+
+def keyframe_index(source_path):
+    """Keyframe times of a downloaded source, probed once and kept next to it."""
+    index_path = f"{os.path.splitext(source_path)[0]}.keyframes.npy"
+    with _keyframes_lock:
+        source_lock = _indexing.setdefault(source_path, threading.Lock())
+
+    with source_lock:
+        mtime = os.path.getmtime(source_path)
+        cached = _keyframes.get(source_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        if os.path.exists(index_path) and os.path.getmtime(index_path) >= mtime:
+            keyframes = np.load(index_path)
+        else:
+            send_event("[INFO] Indexing the keyframes of the source video")
+            probed = probe_keyframes(source_path)
+            if probed is None:
+                return None
+            keyframes = np.asarray(probed, dtype=np.float64)
+            # np.save appends .npy itself, keep the name without it for the rename; per process, workers may race here
+            tmp_path = f"{index_path[:-4]}.{os.getpid()}.tmp"
+            np.save(tmp_path, keyframes)
+            os.replace(f"{tmp_path}.npy", index_path)
+
+        _keyframes[source_path] = (mtime, keyframes)
+        return keyframes
+
+
+def validate_clip(clip):
+    """Returns (start, end) for a usable clip object, None (with a warning) otherwise."""
+    try:
+        start, end = (float(value) for value in clip.get("timestamps", [0, 0]))
+    except (TypeError, ValueError):
+        send_event(f"[WARN] Skipping clip with unreadable timestamps: {clip.get('title')}")
+        return None
+
+    if start < 0 or end <= start:
+        send_event(f"[WARN] Skipping invalid clip: {clip.get('title')} (start: {start}, end: {end})")
+        return None
+    return start, end
+
+
+def clip_video_sections(youtube_url, sections, output_dir, quality):
+    """Downloads (index, start, end) sections in one go on a download worker."""
     send_event("[INFO] Everything cleared, hopping to download process")
-    
-    command = [
-        "yt-dlp",
-        "--quiet",
-        *[f"--download-sections={section}" for section in download_sections],
-        "-f", f'bestvideo[height<={quality+50}]+bestaudio/best',
-        "--merge-output-format", "mp4",
-        "-o", yt_output_template,
-        youtube_url
-    ]
 
     send_event("[INFO] Downloading your videos...")
-    send_event_with_delay("[PROGRESS] Fetching the Video to be downlaoded from the server", 40)
-    send_event_with_delay("[PROGRESS] Selecting the best quality for the clips", 80)
-    send_event_with_delay("[PROGRESS] Clipping the videos according to the timestamps", 120)    
-    send_event_with_delay("[PROGRESS] Video clips are added in queue to download", 160)
-    send_event_with_delay("[PROGRESS] Be patient, your videos are downloading", 200)
     send_event_with_delay("[PROGRESS] Pretty big request huh, taking time to process", 300)
-    send_event_with_delay("[PROGRESS] This is taking more than expected, may be the internet issue! Just wait a more min if you can", 400)    
-    send_event_with_delay("[ERROR] Taking more than expected, you can reload the page and try again", 500)
-    
+    send_event_with_delay("[WARN] This is taking more than expected, may be the internet issue! Just wait a more min if you can", 500)
+
+    return download_sections(youtube_url, sections, output_dir, quality)
+
+
+class ClipStreamer:
+    """Starts producing each clip as soon as its timestamps are known.
+
+    The timestamps stage feeds clips in while the model is still writing the
+    rest of the list. Every task runs in a copy of the job's context, so `g`
+    and the job's event channel still resolve in the worker threads.
+
+    With `progressive`, a low-resolution preview of each clip is downloaded
+    on its own pool next to the full render, so the first clip can be
+    watched long before the full-quality renders are done. Both are
+    announced with a "clip" event and tracked on the job.
+    """
+
+    def __init__(self, youtube_url, quality, mode=None, reuse=True, progressive=False):
+        self.youtube_url = youtube_url
+        self.quality = quality
+        self.mode = mode or CLIP_MODE
+        self.reuse = reuse  # keep clips already cut with the same range and settings
+        self.output_dir = os.path.join(g.base_dir, "clips")
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.clip_index = ClipIndex(self.output_dir)
+        self.spec = {"quality": quality, "mode": self.mode}
+        self.executor = ThreadPoolExecutor(max_workers=CLIP_STREAM_WORKERS, thread_name_prefix="clip")
+        self.futures = []
+        self.added = 0
+        self.boundaries = None
+        self.source_future = None
+        self.reporter = ProgressReporter("Clips")
+        self.done = 0
+        self.lock = threading.Lock()
+        self.progressive = progressive
+        self.preview_executor = ThreadPoolExecutor(max_workers=PREVIEW_WORKERS, thread_name_prefix="preview") if progressive else None
+        self.previews = {}
+        self.preview_paths = {}  # index -> published preview, deleted once its full render is out
+        self.rendered = set()
+
+    @property
+    def started(self):
+        return self.added > 0
+
+    def add(self, start, end, index=None):
+        if not self.added and not self.reuse:
+            reset_clips_dir(self.output_dir)
+        self.added += 1
+        index = index or self.added
+
+        reusable = self.clip_index.reusable(index, start, end, self.spec)
+        if reusable:
+            send_event(f"[INFO] Clip {index} is already cut, reusing it")
+            self.publish(index, start, end, "full", reusable)
+            return
+
+        if self.mode in LOCAL_MODES and self.source_future is None:
+            self.source_future = g.get("source_future") or self._submit(download_source_video, self.youtube_url, self.quality)
+
+        self.futures.append(self._submit(self._make_clip, index, start, end))
+        send_event(f"[INFO] Clip {index} queued ({seconds_to_hms(start)} - {seconds_to_hms(end)})")
+
+        # Cutting from a source already on disk is quicker than any preview download
+        source_ready = self.source_future is not None and self.source_future.done()
+        if self.progressive and not source_ready:
+            self.previews[index] = self.preview_executor.submit(contextvars.copy_context().run,
+                                                                self._make_preview, index, start, end)
+
+    def add_clip(self, clip, index=None):
+        section = validate_clip(clip)
+        if section:
+            if self.boundaries is None:
+                self.boundaries = clip_boundaries(g.video_id) or ()
+            if self.boundaries:
+                section = snap_sections([section], self.boundaries)[0]
+            self.add(*section, index)
+
+    def finish(self):
+        job = g.get("job")
+        for future in self.futures:
+            if job is not None and job.cancel_event.is_set():
+                self.shutdown()
+                job.check_cancelled()
+            try:
+                future.result()
+            except Exception as e:
+                send_event(f"[ERROR] Clip failed: {e}")
+        self.executor.shutdown()
+        if self.preview_executor is not None:
+            # Every full render is done, previews still waiting are no use any more
+            self.preview_executor.shutdown(wait=False, cancel_futures=True)
+
+        if os.listdir(self.output_dir):
+            cache.record(g.video_id, "clips", clips_cache_key(self.quality, self.mode), self.output_dir)
+        return self.output_dir
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.preview_executor is not None:
+            self.preview_executor.shutdown(wait=False, cancel_futures=True)
+
+    def publish(self, index, start, end, kind, path):
+        """Announces the preview or full render of clip `index` on the job and its event stream."""
+        name = os.path.basename(path)
+        fields = {kind: name, "start": round(start, 2), "end": round(end, 2)}
+        if kind == "full":
+            with self.lock:
+                self.rendered.add(index)
+                preview_path = self.preview_paths.pop(index, None)
+            preview = self.previews.get(index)
+            if preview is not None:
+                preview.cancel()
+            if preview_path is not None:
+                # Superseded, the job's renders stop pointing at it
+                if os.path.exists(preview_path):
+                    os.remove(preview_path)
+                fields["preview"] = None
+
+        job = g.get("job")
+        render = job.track_render(index, **fields) if job is not None else {"index": index, **fields}
+        publish_event("clip", {**render, "ready": kind, "url": clip_url(g.video_id, name)})
+
+    def _submit(self, fn, *args):
+        return self.executor.submit(contextvars.copy_context().run, fn, *args)
+
+    def _make_clip(self, index, start, end):
+        # Another worker cutting the same clip finishes first, then it is simply reused
+        with producing(g.base_dir, clip_lock_name(index)):
+            reusable = self.clip_index.reusable(index, start, end, self.spec)
+            if reusable:
+                send_event(f"[INFO] Clip {index} was cut by another worker, reusing it")
+                self.publish(index, start, end, "full", reusable)
+                return
+            self.clip_index.forget(index)
+            self._cut_clip(index, start, end)
+
+    def _cut_clip(self, index, start, end):
+        output_name = f"{g.video_id}_clip_{index:03d}"
+
+        if self.mode in LOCAL_MODES:
+            source_path = self.source_future.result()
+            if not source_path:
+                return
+            output_path = os.path.join(self.output_dir, f"{output_name}.mp4")
+            keyframes = keyframe_index(source_path) if self.mode == "smart" else None
+            if keyframes is not None:
+                # Only the keyframes around this clip travel to the worker process
+                nearby = keyframes[np.searchsorted(keyframes, start - 60):np.searchsorted(keyframes, end + 60)]
+                future = get_clip_pool().submit(smart_cut, source_path, start, end, output_path,
+                                                nearby.tolist(), SMART_CUT_SNAP_SECONDS)
+            else:
+                future = get_clip_pool().submit(cut_clip, source_path, start, end, output_path)
+            result = future.result()
+            if result.get("error"):
+                send_event(f"[ERROR] Clip {index} failed: {result['error']}")
+                return
+        else:
+            results = download_sections(self.youtube_url, [(index, start, end)], self.output_dir,
+                                        self.quality, label=f"Clip {index}")
+            if not results or results[0]["error"]:
+                return
+            result = results[0]
+
+        self.clip_index.record(index, result["path"], start, end, self.spec)
+        self.publish(index, start, end, "full", result["path"])
+
+        with self.lock:
+            self.done += 1
+            done = self.done
+        self.reporter.report(f"clip {index} ready, {done}/{len(self.futures)} done", force=True)
+
+    def _make_preview(self, index, start, end):
+        prefix = f"{g.video_id}_preview_{index:03d}."
+        # yt-dlp keeps an existing file, a preview of an earlier range must go first
+        for name in os.listdir(self.output_dir):
+            if name.startswith(prefix):
+                os.remove(os.path.join(self.output_dir, name))
+
+        results = download_sections(self.youtube_url, [(index, start, end)], self.output_dir, PREVIEW_QUALITY,
+                                    label=f"Preview {index}", kind="preview", format_spec=PREVIEW_FORMAT)
+        if not results or results[0]["error"] or not results[0]["path"]:
+            send_event(f"[WARN] No preview for clip {index}, the full render is still on its way")
+            return
+        # Under the lock, a full render finishing meanwhile is never announced before its preview
+        with self.lock:
+            if index in self.rendered:
+                os.remove(results[0]["path"])  # the full render came first, nobody will see it
+                return
+            send_event(f"[INFO] Preview of clip {index} ready, full quality follows")
+            self.publish(index, start, end, "preview", results[0]["path"])
+            self.preview_paths[index] = results[0]["path"]
+
+
+def prefetch_source_video(youtube_url, quality):
+    """Starts the local-mode source download in the background, e.g. during transcription."""
+    if g.get("source_future") is None:
+        g.source_future = prefetch_pool.submit(contextvars.copy_context().run, download_source_video, youtube_url, quality)
+    return g.source_future
+
+
+def download_source_video(youtube_url, quality):
+    # yt-dlp publishes the mp4 with a rename, the lock stops a second worker downloading it in parallel
+    with producing(g.base_dir, f"source_{quality}"):
+        return fetch_source_video(youtube_url, quality)
+
+
+def fetch_source_video(youtube_url, quality):
+    source_path = os.path.join(g.base_dir, f"source_{quality}.mp4")
+    if os.path.exists(source_path):
+        send_event("[DONE] Found the locally cached source video.")
+        return source_path
+
+    reporter = ProgressReporter("Video")
+    ydl_opts = {
+        'format': f'bestvideo[height<={quality+50}][vcodec^=avc1]+bestaudio[acodec^=mp4a]/bestvideo[height<={quality+50}]+bestaudio/best',
+        'merge_output_format': 'mp4',
+        'outtmpl': os.path.join(g.base_dir, f"source_{quality}.%(ext)s"),
+        'progress_hooks': [reporter.ytdlp_hook],
+        'postprocessor_hooks': [reporter.postprocessor_hook],
+        'quiet': True
+    }
+
+    send_event("[INFO] Downloading the source video once for local cutting")
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True
-        )
+        with download_budget.connections() as connections, accelerated_ydl(ydl_opts, connections, download_budget.bandwidth) as ydl:
+            process_video_info(ydl, resolve_video_info(youtube_url, g.video_id))
+    except Exception as e:
+        send_event(f"[ERROR] Failed downloading the source video: {e}")
+        return None
+
+    if not os.path.exists(source_path):
+        send_event("[ERROR] Source video was not saved as mp4")
+        return None
+
+    return source_path
+
 
-        if result.stdout:
-            send_event("[WARN] " + result.stdout)
+def download_sections(youtube_url, sections, output_dir, quality, label="Clips", kind="clip", format_spec=None):
+    """Downloads (index, start, end) sections on a warm yt-dlp worker.
 
-        if result.stderr:
-            send_event("[ERROR] " + result.stderr)
+    Returns one {"index", "start", "end", "path", "error"} dict per section.
+    """
+    job = g.get("job")
+    reporter = ProgressReporter(label)
+    finished = set()
 
-    except subprocess.CalledProcessError as e:
-        send_event(f"[ERROR] Subprocess failed: {e}")
+    try:
+        info = resolve_video_info(youtube_url, g.video_id)
+    except Exception as e:
+        send_event(f"[WARN] Could not reuse the video info, the worker will extract it again: {e}")
+        info = None
+
+    task = {
+        "url": youtube_url,
+        "info": info,
+        "format": format_spec or f'bestvideo[height<={quality+50}]+bestaudio/best',
+        "merge_output_format": "mp4",
+        "sections": [
+            {"index": index, "start": start, "end": end,
+             "outtmpl": os.path.join(output_dir, f"{g.video_id}_{kind}_{index:03d}.%(ext)s")}
+            for index, start, end in sections
+        ],
+    }
+
+    def on_message(kind, payload):
+        if kind == "log":
+            # Errors come back with the section results, only warnings are forwarded here
+            if payload["level"] == "warning":
+                send_event(f"[WARN] Clip {payload['index']}: {payload['message']}")
+        elif payload.get("status") == "finished":
+            finished.add(payload["index"])
+            reporter.report(f"{len(finished)}/{len(sections)} sections downloaded", force=True)
+        else:
+            reporter.ytdlp_hook(payload)
+
+    try:
+        result = download_pool.run(task, on_message, cancel_event=job.cancel_event if job is not None else None)
+    except (WorkerDied, OSError) as e:
+        send_event(f"[ERROR] Clip download failed: {e}")
+        return [{"index": index, "start": start, "end": end, "path": None, "error": str(e)}
+                for index, start, end in sections]
 
-    return output_dir
\ No newline at end of file
+    for section in result["sections"]:
+        if section["error"] and section["error"] != "cancelled":
+            send_event(f"[ERROR] Clip {section['index']} failed: {section['error']}")
+    return result["sections"]
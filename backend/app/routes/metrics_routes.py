@@ -0,0 +1,11 @@
+# app/routes/metrics_routes.py
+from flask import Blueprint, Response
+from app.services.metrics import registry
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+# ---------------------- Prometheus Scrape Endpoint ----------------------
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
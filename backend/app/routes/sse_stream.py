@@ -1,49 +1,217 @@
 # app/routes/sse_stream.py
-import queue
+import os
+import json
+import time
 import threading
-from flask import Blueprint, Response, stream_with_context
+from collections import deque
+from flask import Blueprint, Response, request, stream_with_context, g, has_app_context, jsonify
+from app.services.metrics import registry
+from app.services.job_queue import job_queue
 
 sse_bp = Blueprint("sse", __name__)
-message_queues = []
-message_backlog = []  # stores recent messages (e.g., last 20)
-lock = threading.Lock()
 
-MAX_BACKLOG = 50  # keep last 50 messages for new connections
+MAX_BACKLOG = int(os.getenv("SSE_BACKLOG", "200"))  # per channel, replayed to new and resuming clients
+MAX_SUBSCRIBER_QUEUE = int(os.getenv("SSE_QUEUE_SIZE", "100"))  # undelivered messages per client
+HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT", "15"))
+CHANNEL_TTL = int(os.getenv("SSE_CHANNEL_TTL", "3600"))  # idle channels without clients are dropped
+
+GLOBAL_TOPIC = "global"
+END_EVENT = "end"
+
+
+class Subscriber:
+    def __init__(self):
+        self.pending = deque()
+        self.dropped = 0
+        self.cond = threading.Condition()
+
+    def put(self, event_id, message, event=None):
+        with self.cond:
+            if len(self.pending) >= MAX_SUBSCRIBER_QUEUE:
+                last = self.pending[-1]
+                if message.startswith("[PROGRESS]") and last[1].startswith("[PROGRESS]"):
+                    # Only the newest progress line matters, replace the stale one
+                    self.pending[-1] = (event_id, message, event)
+                    self.cond.notify()
+                    return
+                self.pending.popleft()
+                self.dropped += 1
+            self.pending.append((event_id, message, event))
+            self.cond.notify()
+
+    def get(self, timeout):
+        """Returns (items, dropped), an empty list when the timeout passed."""
+        with self.cond:
+            if not self.pending:
+                self.cond.wait(timeout)
+            items = list(self.pending)
+            self.pending.clear()
+            dropped, self.dropped = self.dropped, 0
+            return items, dropped
+
+
+class Channel:
+    def __init__(self, topic):
+        self.topic = topic
+        self.backlog = deque(maxlen=MAX_BACKLOG)
+        self.subscribers = set()
+        self.next_id = 1
+        self.last_activity = time.time()
+        self.lock = threading.Lock()
+
+    def publish(self, message, event=None):
+        with self.lock:
+            event_id = self.next_id
+            self.next_id += 1
+            self.backlog.append((event_id, message, event))
+            self.last_activity = time.time()
+            subscribers = list(self.subscribers)
+
+        for subscriber in subscribers:
+            subscriber.put(event_id, message, event)
+
+    def subscribe(self, last_event_id=None):
+        subscriber = Subscriber()
+        with self.lock:
+            self.subscribers.add(subscriber)
+            self.last_activity = time.time()
+            replay = [item for item in self.backlog if last_event_id is None or item[0] > last_event_id]
+            # Tell resuming clients when the backlog no longer reaches back to their last event
+            missed = bool(last_event_id is not None and self.backlog and self.backlog[0][0] > last_event_id + 1)
+        return subscriber, replay, missed
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+            self.last_activity = time.time()
+
+
+channels = {}
+channels_lock = threading.Lock()
+
+
+def get_channel(topic):
+    with channels_lock:
+        channel = channels.get(topic)
+        if channel is None:
+            _prune_channels()
+            channel = channels[topic] = Channel(topic)
+        return channel
+
+
+def known_topic(topic):
+    """Topics a client may subscribe to: the global log, a job or batch the server knows, or a live channel."""
+    from app.services.batch import batch_manager  # batch publishes through this module
+
+    if topic == GLOBAL_TOPIC or job_queue.get(topic) or batch_manager.get(topic):
+        return True
+    with channels_lock:
+        return topic in channels
+
+
+def _prune_channels():
+    # Caller holds channels_lock
+    cutoff = time.time() - CHANNEL_TTL
+    stale = [topic for topic, channel in channels.items()
+             if topic != GLOBAL_TOPIC and not channel.subscribers and channel.last_activity < cutoff]
+    for topic in stale:
+        del channels[topic]
+
+
+def count_subscribers():
+    with channels_lock:
+        return sum(len(channel.subscribers) for channel in channels.values())
+
+
+def count_channels():
+    with channels_lock:
+        return len(channels)
+
+
+registry.gauge("shortcutter_sse_subscribers", "Open event stream connections.", count_subscribers)
+registry.gauge("shortcutter_sse_channels", "Event channels kept in memory.", count_channels)
+
+
+def format_event(event_id, message, event=None):
+    lines = [f"id: {event_id}"]
+    if event:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in str(message).split("\n"))
+    return "\n".join(lines) + "\n\n"
+
 
 @sse_bp.route("/events")
-def stream():
-    q = queue.Queue()
+@sse_bp.route("/events/<topic>")
+def stream(topic=None):
+    """Event stream of one job or batch, /api/events/<job or batch id>.
 
-    with lock:
-        message_queues.append(q)
-        # Replay backlog to newly connected client
-        backlog_copy = list(message_backlog)  # make a copy while locked
+    The topic-less /api/events (or /api/events?job=<id>) stays supported on
+    purpose: without a job it carries the global log, the server-wide
+    messages such as cache evictions that belong to no job.
+    """
+    topic = topic or request.args.get("job") or GLOBAL_TOPIC
 
-    def event_stream():
-        # First, send the backlog
-        for msg in backlog_copy:
-            yield f"data: {msg}\n\n"
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    # Subscribing must not create channels for made-up topics
+    if not known_topic(topic):
+        return jsonify({"error": "Unknown event topic"}), 404
 
+    channel = get_channel(topic)
+    subscriber, replay, missed = channel.subscribe(last_event_id)
+
+    def event_stream():
         try:
+            yield "retry: 3000\n\n"
+            if missed:
+                yield "data: [WARN] Some older logs are no longer available.\n\n"
+
+            # First, send the backlog
+            for event_id, msg, event in replay:
+                yield format_event(event_id, msg, event)
+                if event == END_EVENT:
+                    return
+
             while True:
-                msg = q.get()
-                yield f"data: {msg}\n\n"
-        except GeneratorExit:
-            # Client disconnected
-            with lock:
-                if q in message_queues:
-                    message_queues.remove(q)
-
-    return Response(stream_with_context(event_stream()), mimetype="text/event-stream")
-
-
-def send_event(message: str):
-    with lock:
-        # Add to backlog
-        message_backlog.append(message)
-        if len(message_backlog) > MAX_BACKLOG:
-            message_backlog.pop(0)
-
-        # Send to all connected clients
-        for q in message_queues:
-            q.put(message)
\ No newline at end of file
+                items, dropped = subscriber.get(HEARTBEAT_INTERVAL)
+                if dropped:
+                    yield f"data: [WARN] Skipped {dropped} messages, the connection is too slow.\n\n"
+                if not items:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                for event_id, msg, event in items:
+                    yield format_event(event_id, msg, event)
+                    if event == END_EVENT:
+                        return
+        finally:
+            # Client disconnected or the stream ended
+            channel.unsubscribe(subscriber)
+
+    return Response(stream_with_context(event_stream()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def current_topic():
+    if has_app_context():
+        job = g.get("job")
+        if job is not None:
+            return job.id
+    return GLOBAL_TOPIC
+
+
+def send_event(message: str, topic=None):
+    get_channel(topic or current_topic()).publish(message)
+
+
+def publish_event(event, payload, topic=None):
+    """Named event with a JSON payload, for clients that act on it rather than print it."""
+    get_channel(topic or current_topic()).publish(json.dumps(payload), event=event)
+
+
+def end_stream(topic, message="[DONE] Stream closed"):
+    get_channel(topic).publish(message, event=END_EVENT)
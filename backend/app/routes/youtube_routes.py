@@ -1,39 +1,42 @@
 # app/routes/youtube_routes.py
 import os
-import json
+import re
 import time
-from flask import Blueprint, request, jsonify, url_for
+from functools import partial
+from flask import Blueprint, request, jsonify, url_for, current_app, send_from_directory, abort
 
-from flask import g
 from app.routes.sse_stream import send_event
-from app.controllers.youtube_downloader import handle_youtube_url
-from app.controllers.transcriber import transcribe_audio
-from app.controllers.timestamps_extractor import generate_clip_timestamps
-from app.controllers.video_clipper import clip_video
+from app.controllers.pipeline import run_job
+from app.services.job_queue import job_queue, QueueFull
+from app.services.cache import cache
+from app.services.batch import batch_manager, BATCH_MAX_VIDEOS
+from app.services.transcript_index import transcript_index
+from app.utils.transcript_store import Transcript, TranscriptError
 from app.utils.parse_link import extract_url_id
 
 youtube_bp = Blueprint('youtube', __name__)
 
+VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{6,64}$")
+CLIP_EXTENSIONS = (".mp4", ".webm", ".mkv", ".mov")
+# "X-Accel-Redirect" (nginx) or "X-Sendfile" (Apache, lighttpd) hands the transfer to the proxy's sendfile
+CLIP_SENDFILE_HEADER = os.getenv("CLIP_SENDFILE_HEADER", "")
+CLIP_ACCEL_PREFIX = os.getenv("CLIP_ACCEL_PREFIX", "/protected-clips")
+
 # ---------------------- Main Route to Process YouTube URL ----------------------
 @youtube_bp.route('/process', methods=['POST'])
 def process_youtube_video():
-    start_time = time.time()
     send_event("[INFO] Process Started, Fetching Input")
-    
+
     # ---------------------- Getting Data ----------------------
     data = request.json
-    quality = data.get("quality")
-    keywords = data.get("keywords")
     youtube_url = data.get("youtube_url")
-    locally_cached = data.get("local_cache", True)
-    clip_count = min(data.get("clipCount", 4), 10)
-    clip_duration = min(data.get("maxDuration", 60), 100)
+    params = {"youtube_url": youtube_url, **read_job_params(data)}
 
     # ---------------------- Validating Input ----------------------
-    send_event("[INFO] Validating Input")    
+    send_event("[INFO] Validating Input")
     if not youtube_url:
         return jsonify({"error": "user id or youtube link is missin"}), 400
-    
+
     # ---------------------- Extracting Video ID ----------------------
     send_event("[INFO] Extracting video ID from URL...")
     video_id = extract_url_id(youtube_url)
@@ -42,91 +45,220 @@ def process_youtube_video():
         return jsonify({
             "status": "Failed",
             "error": "Invalid YouTube URL",
-            "message": "The link you have provided does not contain verified youtube paths."            
-        }), 400    
-
-    # ---------------------- Initialising Globals ----------------------
-    send_event("[INFO] Initialising globals")
-    g.base_dir = os.path.join("app", "downloads", video_id)
-    os.makedirs(g.base_dir, exist_ok=True)
-    
-    g.video_id = video_id    
-    send_event("[INFO] Process Started")
-    
-    # ---------------------- Fetch and Download Audio ----------------------
-    send_event("[INFO] Fetching URL Data")
-    download_res = handle_youtube_url(youtube_url, video_id) 
-    
-    title = download_res.get("title")
-    duration = download_res.get("duration")
-    time_required = download_res.get("total_time")          
-    audio_path = download_res.get("audio_path")
-
-    # ---------------------- Transcription ----------------------
-    send_event("[INFO] Transcribing Audio")        
-    transcription_result = transcribe_audio(audio_path, video_id)
-    
-    if transcription_result.get("error"):
-        send_event("[ERROR] Transcription failed.")
+            "message": "The link you have provided does not contain verified youtube paths."
+        }), 400
+
+    # ---------------------- Queue the Job ----------------------
+    app = current_app._get_current_object()
+    try:
+        job, coalesced = job_queue.submit(video_id, params, partial(run_job, app))
+    except QueueFull as e:
+        send_event("[ERROR] Server is busy, try again later.")
         return jsonify({
             "status": "failed",
-            "message": transcription_result.get("error"), 
-            "content": transcription_result.get("message")
-        }), 502
-        
-    transcription_path = transcription_result.get("path")            
-    send_event("[DONE] Transcription process Completed.")    
-
-    # ---------------------- Generate Timestamps ----------------------
-    send_event("[INFO] Generating Timestamps")
-    timestamps_result = generate_clip_timestamps(transcription_path, video_id, clip_count, clip_duration, locally_cached, keywords)
-
-    # Fallback if JSON couldn't be parsed
-    if not timestamps_result["path"] or timestamps_result["path"].endswith(".txt"):
-        send_event("[FALLBACK] Using TXT Fallback")
-        return jsonify({
-            "status": "fallback",
-            "message": timestamps_result.get("message", "Returned fallback TXT because JSON parsing failed."),
-            "content": timestamps_result.get("raw_response", None),
-            "error": timestamps_result.get("error", None),
-            "path": timestamps_result.get("path", None)
-        }), 200
-
-    send_event("[DONE] Response saved as JSON.")
-
-    # ---------------------- Clip Video ----------------------
-    send_event("[INFO] Generating Video Clips")
-    clips_folder = clip_video(youtube_url, timestamps_result["path"], locally_cached, quality)
-    
-    with open(timestamps_result["path"], "r", encoding="utf-8") as f:
-        timestamp_data = json.load(f)
-        
-    if not clips_folder or not os.listdir(clips_folder):
-        return jsonify({
-            "status": "fallback",
-            "message": "Failed generating the clips",
-            "content": f"Sorry for the inconvenience, here's the content: {timestamp_data}"
-        }), 200
-
-    send_event("[DONE] Thanks for the patience, Videos downloaded successfully.")
-    send_event("[DONE] Video Clips Generated.")
-
-    # ---------------------- Serve Clip URLs ----------------------
-    send_event("[INFO] Serving Clips")
-    filenames = [f for f in os.listdir(clips_folder)
-                 if os.path.isfile(os.path.join(clips_folder, f)) and f.lower().endswith(('.mp4', '.mov', '.webm'))]
-
-    video_urls = [
-        url_for('static', filename=f'{user_id}/{video_id}/clips/{name}', _external=True)
-        for name in filenames
-    ]
-
-    send_event("[DONE] Process Completed")
-    end_time = time.time()
-    
+            "error": str(e),
+            "message": "Too many videos are being processed right now, please try again later."
+        }), 503
+
+    if coalesced:
+        send_event("[INFO] Same video is already being processed, joining that job")
+    else:
+        send_event("[INFO] Job queued")
+
+    return jsonify({
+        **job.to_dict(),
+        "coalesced": coalesced,
+        "status_url": url_for('youtube.job_status', job_id=job.id)
+    }), 202
+
+
+def read_job_params(data):
+    return {
+        "quality": data.get("quality"),
+        "keywords": data.get("keywords"),
+        "local_cache": data.get("local_cache", True),
+        "clip_count": min(data.get("clipCount", 4), 10),
+        "clip_duration": min(data.get("maxDuration", 60), 100),
+        "clip_mode": data.get("clipMode"),
+        "progressive": data.get("progressive"),  # None falls back to PROGRESSIVE_CLIPS
+    }
+
+
+# ---------------------- Batch and Playlist Submission ----------------------
+@youtube_bp.route('/batch', methods=['POST'])
+def process_batch():
+    data = request.json or {}
+    # A list of video, playlist or channel links; a single playlist/channel link works too
+    sources = data.get("urls") or ([data["playlist_url"]] if data.get("playlist_url") else [])
+    if not isinstance(sources, list) or not sources or not all(isinstance(url, str) for url in sources):
+        return jsonify({"error": "Provide urls (a list of links) or playlist_url"}), 400
+
+    try:
+        max_videos = int(data.get("max_videos", BATCH_MAX_VIDEOS))
+    except (TypeError, ValueError):
+        return jsonify({"error": "max_videos must be a number"}), 400
+
+    app = current_app._get_current_object()
+    batch = batch_manager.submit(app, sources, read_job_params(data), max_videos)
+    send_event(f"[INFO] Batch {batch.id} queued with {len(sources)} links")
+
     return jsonify({
-        "message": "YouTube processing completed successfully",
-        "videos": video_urls,
-        "timestamp": timestamp_data,
-        "time_taken": round(end_time - start_time, 2)
-    }), 200
\ No newline at end of file
+        **batch.to_dict(),
+        "status_url": url_for('youtube.batch_status', batch_id=batch.id),
+        "events_url": url_for('sse.stream', topic=batch.id),
+    }), 202
+
+
+@youtube_bp.route('/batches/<batch_id>', methods=['GET'])
+def batch_status(batch_id):
+    batch = batch_manager.get(batch_id)
+    if not batch:
+        return jsonify({"error": "Batch not found"}), 404
+    return jsonify(batch.to_dict()), 200
+
+
+@youtube_bp.route('/batches/<batch_id>', methods=['DELETE'])
+def cancel_batch(batch_id):
+    batch = batch_manager.cancel(batch_id)
+    if not batch:
+        return jsonify({"error": "Batch not found"}), 404
+    return jsonify(batch.to_dict()), 200
+
+
+# ---------------------- Transcript Search ----------------------
+@youtube_bp.route('/search', methods=['GET'])
+def search_transcripts():
+    query = request.args.get("q", "").strip()
+    video_id = request.args.get("video_id")
+    if not query:
+        return jsonify({"error": "Missing search query q"}), 400
+    if video_id and not VIDEO_ID.match(video_id):
+        return jsonify({"error": "Invalid video id"}), 400
+
+    duration = min(request.args.get("duration", 60, type=int), 100)
+    limit = min(request.args.get("limit", 10, type=int), 50)
+
+    started = time.perf_counter()
+    windows = transcript_index.search(query, video_id=video_id, duration=duration, limit=limit)
+    return jsonify({
+        "query": query,
+        "video_id": video_id,
+        "results": windows,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+    }), 200
+
+
+@youtube_bp.route('/transcripts/<video_id>', methods=['GET'])
+def get_transcript(video_id):
+    # The segment JSON is built from the binary store on demand
+    path = cache.path_of(video_id, "transcript") if VIDEO_ID.match(video_id) else None
+    if not path:
+        return jsonify({"error": "Transcript not found"}), 404
+
+    try:
+        transcript = Transcript.open(path)
+    except TranscriptError as e:
+        return jsonify({"error": "Transcript is unreadable", "message": str(e)}), 500
+    except FileNotFoundError:
+        return jsonify({"error": "Transcript not found"}), 404
+    start = request.args.get("start", 0.0, type=float)
+    end = request.args.get("end", type=float)
+    response = {"video_id": video_id, "segments": transcript.segments(*transcript.segment_range(start, end))}
+    if request.args.get("words") in ("1", "true"):
+        response["words"] = transcript.words(start, end)
+    return jsonify(response), 200
+
+
+# ---------------------- Job Status and Result ----------------------
+@youtube_bp.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    response = job.to_dict()
+    if job.result is not None:
+        result = dict(job.result)
+        if "clips" in result:
+            result["videos"] = [
+                url_for('youtube.serve_clip', video_id=job.video_id, name=name, _external=True)
+                for name in result["clips"]
+            ]
+        response["result"] = result
+        response["result_status"] = job.status_code
+
+    # Previews and full renders as they become ready, also while the job runs
+    for render in response["renders"]:
+        for kind, key in (("preview", "preview_url"), ("full", "url")):
+            if render.get(kind):
+                render[key] = url_for('youtube.serve_clip', video_id=job.video_id, name=render[kind], _external=True)
+
+    # ?timings=1 adds every timed step of the job, in the order they finished
+    if request.args.get("timings") in ("1", "true"):
+        response["spans"] = list(job.spans)
+
+    return jsonify(response), 200
+
+
+# ---------------------- Job Cancellation ----------------------
+@youtube_bp.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_queue.cancel(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    return jsonify(job.to_dict()), 200
+
+
+# ---------------------- Clip Delivery ----------------------
+@youtube_bp.route('/clips/<video_id>/<name>', methods=['GET'])
+def serve_clip(video_id, name):
+    # Only finished clips: .part files are still being written
+    if not VIDEO_ID.match(video_id) or not name.endswith(CLIP_EXTENSIONS) or ".part" in name:
+        abort(404)
+
+    clips_dir = os.path.abspath(os.path.join(cache.root, video_id, "clips"))
+
+    if CLIP_SENDFILE_HEADER == "X-Accel-Redirect":
+        if not os.path.isfile(os.path.join(clips_dir, name)):
+            abort(404)
+        response = current_app.response_class(status=200)
+        response.headers["X-Accel-Redirect"] = f"{CLIP_ACCEL_PREFIX}/{video_id}/clips/{name}"
+        return response
+
+    if not os.path.isfile(os.path.join(clips_dir, name)):
+        abort(404)
+    # The lease keeps eviction away until the body has been sent
+    lease = cache.lease(video_id)
+    lease.acquire()
+    try:
+        # Range, ETag and Last-Modified are handled by conditional send_file, a seek only reads the requested bytes
+        # With USE_X_SENDFILE (CLIP_SENDFILE_HEADER=X-Sendfile) only the header goes out,
+        # otherwise serve.py's handler passes the file to os.sendfile, no proxy needed
+        response = send_from_directory(clips_dir, name, conditional=True, etag=True)
+    except BaseException:
+        lease.release()
+        raise
+    release_on_close(response, lease.release)
+    return response
+
+
+def release_on_close(response, release):
+    """Calls `release` once the server closes the body.
+
+    send_file's body is passed straight through to the server, which closes
+    it instead of the response, so call_on_close would never run.
+    """
+    body = response.response
+    if isinstance(body, (list, tuple)):  # X-Sendfile: the proxy opens the file after we answered
+        release()
+        return
+    close = body.close
+
+    def closing():
+        try:
+            close()
+        finally:
+            release()
+
+    body.close = closing
@@ -0,0 +1,244 @@
+# app/services/batch.py
+import os
+import json
+import time
+import uuid
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from yt_dlp import YoutubeDL
+from app.routes.sse_stream import send_event, get_channel, end_stream
+from app.controllers.pipeline import run_job
+from app.services.job_queue import job_queue, QueueFull
+from app.services.cache import cache
+from app.utils.parse_link import extract_url_id, is_collection_url
+
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "4"))
+BATCH_MAX_VIDEOS = int(os.getenv("BATCH_MAX_VIDEOS", "50"))
+BATCH_MAX_IN_FLIGHT = int(os.getenv("BATCH_MAX_IN_FLIGHT", "6"))  # jobs a batch keeps queued or running
+BATCH_TTL = int(os.getenv("BATCH_TTL", "3600"))
+VIDEO_EVENT = "video"
+
+
+def canonical_url(video_id):
+    # One URL per video, so the same video reached through different links coalesces
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+class Batch:
+    def __init__(self, sources, params, max_videos):
+        self.id = uuid.uuid4().hex
+        self.sources = sources
+        self.params = params
+        self.max_videos = max_videos
+        self.status = "expanding"
+        self.items = []  # one dict per distinct video, in the order they were found
+        self.skipped = []
+        self.created_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.submitted = set()  # ids of unfinished jobs this batch holds a submission on
+        self.lock = threading.Lock()
+
+    @property
+    def finished(self):
+        return self.status in ("completed", "cancelled")
+
+    def to_dict(self):
+        with self.lock:
+            items = [dict(item) for item in self.items]
+        counts = {}
+        for item in items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        return {
+            "batch_id": self.id,
+            "status": self.status,
+            "videos": len(items),
+            "counts": counts,
+            "items": items,
+            "skipped": list(self.skipped),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+def playlist_videos(ydl, info, depth=0):
+    """Yields (video_id, title) from flat playlist entries, pages are fetched as they are consumed."""
+    for entry in info.get("entries") or []:
+        if not entry:
+            continue
+        if entry.get("ie_key") in (None, "Youtube") and entry.get("_type", "url") == "url" and entry.get("id"):
+            yield entry["id"], entry.get("title")
+        elif depth < 2 and entry.get("url"):
+            # Channel pages list their tabs (videos, shorts, ...) as nested playlists
+            nested = ydl.extract_info(entry["url"], download=False, process=False)
+            yield from playlist_videos(ydl, nested, depth + 1)
+
+
+class BatchManager:
+    """Runs batches of videos through the job queue.
+
+    Sources are expanded lazily (playlists and channels page by page), each
+    video is submitted once, and a batch never holds more than
+    BATCH_MAX_IN_FLIGHT jobs, so one large channel cannot fill the queue for
+    everyone else. Finished videos are published on the batch's event channel
+    as `video` events as soon as they are done.
+    """
+
+    def __init__(self, max_workers=BATCH_WORKERS, ttl=BATCH_TTL):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch")
+        self.ttl = ttl
+        self.batches = {}
+        self.lock = threading.Lock()
+
+    def submit(self, app, sources, params, max_videos=BATCH_MAX_VIDEOS):
+        batch = Batch(sources, params, min(max_videos, BATCH_MAX_VIDEOS))
+        with self.lock:
+            self._prune()
+            self.batches[batch.id] = batch
+        self.executor.submit(self._run, app, batch)
+        return batch
+
+    def get(self, batch_id):
+        with self.lock:
+            return self.batches.get(batch_id)
+
+    def cancel(self, batch_id):
+        batch = self.get(batch_id)
+        if batch and not batch.finished:
+            batch.cancel_event.set()
+            with batch.lock:
+                job_ids = list(batch.submitted)
+            for job_id in job_ids:
+                self._release(batch, job_id)
+        return batch
+
+    def _release(self, batch, job_id):
+        # Jobs may be coalesced with other requests, withdraw only the batch's own submission, once
+        with batch.lock:
+            if job_id not in batch.submitted:
+                return
+            batch.submitted.discard(job_id)
+        job_queue.cancel(job_id)
+
+    def _run(self, app, batch):
+        urls = app.url_map.bind("")  # relative URLs, there is no request here
+        in_flight = []
+        seen = set()
+
+        try:
+            for video_id, title in self.expand(batch):
+                if batch.cancel_event.is_set() or len(seen) >= batch.max_videos:
+                    break
+                if video_id in seen:
+                    continue
+                seen.add(video_id)
+
+                item = {"video_id": video_id, "title": title, "status": "queued", "job_id": None,
+                        "cached": cache.key_of(video_id, "clips") is not None}
+                with batch.lock:
+                    batch.items.append(item)
+
+                while len(in_flight) >= BATCH_MAX_IN_FLIGHT:
+                    self._collect(batch, in_flight, urls)
+
+                job = self._submit_job(app, batch, item, urls)
+                if job is not None:
+                    in_flight.append((item, job))
+
+            batch.status = "running"
+            while in_flight:
+                self._collect(batch, in_flight, urls)
+        except Exception as e:
+            send_event(f"[ERROR] Batch stopped: {e}", topic=batch.id)
+        finally:
+            for item, job in in_flight:
+                self._release(batch, job.id)
+            batch.status = "cancelled" if batch.cancel_event.is_set() else "completed"
+            batch.finished_at = time.time()
+            end_stream(batch.id, f"[DONE] Batch finished: {len(batch.items)} videos")
+
+    def expand(self, batch):
+        """Yields (video_id, title) for every source, asking YouTube only as far as needed."""
+        for source in batch.sources:
+            if batch.cancel_event.is_set():
+                return
+
+            video_id = extract_url_id(source)
+            if video_id and not is_collection_url(source):
+                yield video_id, None
+                continue
+            if not is_collection_url(source):
+                batch.skipped.append({"url": source, "reason": "Not a YouTube video, playlist or channel link"})
+                continue
+
+            send_event(f"[INFO] Expanding {source}", topic=batch.id)
+            try:
+                with YoutubeDL({'quiet': True, 'extract_flat': 'in_playlist', 'lazy_playlist': True,
+                                'playlistend': batch.max_videos}) as ydl:
+                    info = ydl.extract_info(source, download=False, process=False)
+                    yield from playlist_videos(ydl, info)
+            except Exception as e:
+                batch.skipped.append({"url": source, "reason": str(e)})
+                send_event(f"[WARN] Could not expand {source}: {e}", topic=batch.id)
+
+    def _submit_job(self, app, batch, item, urls):
+        params = {**batch.params, "youtube_url": canonical_url(item["video_id"])}
+        done = job_queue.find_completed(item["video_id"], params)
+        if done is not None:
+            # Same video with the same settings finished recently, reuse it
+            self._report(batch, item, done, urls, reused=True)
+            return None
+
+        while True:
+            if batch.cancel_event.is_set():
+                with batch.lock:
+                    item["status"] = "cancelled"
+                return None
+            try:
+                job, coalesced = job_queue.submit(item["video_id"], params, partial(run_job, app))
+                break
+            except QueueFull:
+                time.sleep(1)
+
+        with batch.lock:
+            item.update({"job_id": job.id, "status": "submitted", "coalesced": coalesced})
+            batch.submitted.add(job.id)
+        send_event(f"[INFO] Queued {item['video_id']} ({len(batch.items)} found so far)", topic=batch.id)
+        return job
+
+    def _collect(self, batch, in_flight, urls):
+        # Wake up as soon as any of the jobs finishes
+        in_flight[0][1].done_event.wait(0.5)
+        for entry in [entry for entry in in_flight if entry[1].finished]:
+            in_flight.remove(entry)
+            with batch.lock:
+                batch.submitted.discard(entry[1].id)
+            self._report(batch, entry[0], entry[1], urls)
+
+    def _report(self, batch, item, job, urls, reused=False):
+        result = job.result or {}
+        with batch.lock:
+            item.update({
+                "job_id": job.id,
+                "status": job.status if job.status_code in (None, 200) else "failed",
+                "result_status": job.status_code,
+                "reused": reused,
+                "error": job.error or result.get("error"),
+                "status_url": urls.build("youtube.job_status", {"job_id": job.id}),
+                "clips": [urls.build("youtube.serve_clip", {"video_id": job.video_id, "name": name})
+                          for name in result.get("clips") or []],
+            })
+            payload = json.dumps(item)
+        get_channel(batch.id).publish(payload, event=VIDEO_EVENT)
+
+    def _prune(self):
+        # Caller holds self.lock
+        cutoff = time.time() - self.ttl
+        expired = [batch_id for batch_id, batch in self.batches.items()
+                   if batch.finished and batch.finished_at < cutoff]
+        for batch_id in expired:
+            del self.batches[batch_id]
+
+
+batch_manager = BatchManager()
@@ -0,0 +1,222 @@
+# app/services/cache.py
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from app.services.locks import artifact_lock, LOCKS_DIR
+from app.services.metrics import record_cache_lookup
+
+CACHE_ROOT = os.path.join("app", "downloads")
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(20 * 1024 ** 3)))
+MANIFEST_NAME = "manifest.json"
+
+
+def artifact_key(**inputs):
+    """Stable short hash of everything an artifact was produced from."""
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def atomic_write_json(path, data, **json_kwargs):
+    atomic_write_text(path, json.dumps(data, **json_kwargs))
+
+
+def atomic_write_text(path, text):
+    # Write next to the target and rename, readers never see a half-written file
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def path_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+class CacheManager:
+    """Manifest-backed artifact cache under app/downloads/<video_id>/.
+
+    Every artifact (audio, metadata, transcript, timestamps, clips) is recorded
+    with the key of the inputs it was built from, its size and last access. A
+    lookup only hits when the key matches, and whole videos are evicted least
+    recently used first once the directory grows past CACHE_MAX_BYTES.
+
+    The directory may be shared by several workers or nodes: manifest updates
+    are serialised with a file lock, and a video whose lease or artifact locks
+    are held (a running job, a producer, a clip download) is never evicted,
+    whichever process asks.
+    """
+
+    def __init__(self, root=CACHE_ROOT, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+
+    def video_dir(self, video_id):
+        return os.path.join(self.root, video_id)
+
+    @contextmanager
+    def manifest_lock(self, video_id):
+        # The thread lock orders this process, the file lock every other worker
+        with self.lock, artifact_lock(self.video_dir(video_id), "manifest"):
+            yield
+
+    def lease(self, video_id):
+        """Shared lock a job or clip download holds on its video, evict() skips videos with any lock held."""
+        return artifact_lock(self.video_dir(video_id), "lease", shared=True)
+
+    def load_manifest(self, video_id):
+        path = os.path.join(self.video_dir(video_id), MANIFEST_NAME)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {"video_id": video_id, "last_access": 0, "artifacts": {}}
+
+    def save_manifest(self, video_id, manifest):
+        os.makedirs(self.video_dir(video_id), exist_ok=True)
+        atomic_write_json(os.path.join(self.video_dir(video_id), MANIFEST_NAME), manifest, indent=2)
+
+    def key_of(self, video_id, name):
+        with self.lock:
+            entry = self.load_manifest(video_id)["artifacts"].get(name)
+            return entry["key"] if entry else None
+
+    def path_of(self, video_id, name):
+        with self.lock:
+            entry = self.load_manifest(video_id)["artifacts"].get(name)
+            return entry["path"] if entry and os.path.exists(entry["path"]) else None
+
+    def lookup(self, video_id, name, key, path=None):
+        """Returns the artifact path when it is cached for this key, else None.
+
+        `path` adopts a file written before the manifest existed; only pass it
+        for artifacts whose inputs cannot have changed.
+        """
+        with self.manifest_lock(video_id):
+            manifest = self.load_manifest(video_id)
+            entry = manifest["artifacts"].get(name)
+
+            if entry is None and path and os.path.exists(path):
+                entry = self._entry(key, path)
+                manifest["artifacts"][name] = entry
+
+            if not entry or entry["key"] != key or not os.path.exists(entry["path"]):
+                record_cache_lookup(name, False)
+                return None
+
+            now = time.time()
+            entry["last_access"] = now
+            manifest["last_access"] = now
+            self.save_manifest(video_id, manifest)
+            record_cache_lookup(name, True)
+            return entry["path"]
+
+    def record(self, video_id, name, key, path):
+        with self.manifest_lock(video_id):
+            manifest = self.load_manifest(video_id)
+            manifest["artifacts"][name] = self._entry(key, path)
+            manifest["last_access"] = time.time()
+            self.save_manifest(video_id, manifest)
+
+    def invalidate(self, video_id, name):
+        with self.manifest_lock(video_id):
+            manifest = self.load_manifest(video_id)
+            if manifest["artifacts"].pop(name, None) is not None:
+                self.save_manifest(video_id, manifest)
+
+    def evict(self, protect=()):
+        """Removes least recently used videos until the cache fits its budget.
+
+        Only picking the victims and moving them aside as tombstones happens
+        under the cache lock; sizing the videos beforehand and deleting the
+        tombstones afterwards do not hold up lookups and records of other jobs.
+        """
+        if not os.path.isdir(self.root):
+            return []
+
+        videos = []
+        tombstones = []
+        for video_id in os.listdir(self.root):
+            directory = self.video_dir(video_id)
+            if video_id.startswith(".evicted-"):
+                tombstones.append(directory)  # left over from an interrupted eviction
+            elif os.path.isdir(directory) and not video_id.startswith("."):
+                last_access = self.load_manifest(video_id).get("last_access") or os.path.getmtime(directory)
+                videos.append((last_access, video_id, path_size(directory)))
+
+        total = sum(size for _, _, size in videos)
+        evicted = []
+        with self.lock:
+            for _, video_id, size in sorted(videos):
+                if total <= self.max_bytes:
+                    break
+                if video_id in protect:
+                    continue
+                trash = self._move_aside(video_id)
+                if trash is None:
+                    continue
+                tombstones.append(trash)
+                total -= size
+                evicted.append(video_id)
+
+        for trash in tombstones:
+            shutil.rmtree(trash, ignore_errors=True)
+        return evicted
+
+    def _move_aside(self, video_id):
+        """Renames a video no one is using to a tombstone, None when it is in use or already gone."""
+        # A job, clip download or producer in any worker or on any node holds one of the video's locks
+        locks_dir = os.path.join(self.video_dir(video_id), LOCKS_DIR)
+        try:
+            names = {name[:-len(".lock")] for name in os.listdir(locks_dir) if name.endswith(".lock")}
+        except OSError:
+            names = set()
+        held = []
+        try:
+            for name in sorted(names | {"lease"}):
+                lock = artifact_lock(self.video_dir(video_id), name)
+                if not lock.acquire(blocking=False):
+                    return None
+                held.append(lock)
+            # Moved aside first, a job starting meanwhile gets a fresh directory
+            trash = os.path.join(self.root, f".evicted-{video_id}-{os.getpid()}-{time.time_ns()}")
+            os.replace(self.video_dir(video_id), trash)
+            return trash
+        except FileNotFoundError:  # evicted by another process since the listing
+            return None
+        finally:
+            for lock in held:
+                lock.release()
+
+    def _entry(self, key, path):
+        now = time.time()
+        return {
+            "key": key,
+            "path": path,
+            "size": path_size(path),
+            "created_at": now,
+            "last_access": now,
+        }
+
+
+cache = CacheManager()
@@ -0,0 +1,108 @@
+# app/services/download_budget.py
+# One connection and bandwidth budget for every download on the host: the
+# in-process audio/source fetches, the yt-dlp worker processes and every other
+# server process working on the same cache root.
+import os
+import time
+import random
+import struct
+import threading
+from contextlib import contextmanager
+from app.services.cache import CACHE_ROOT
+from app.services.locks import FileLock, LOCKS_DIR, LOCK_POLL_INTERVAL
+
+DOWNLOAD_MAX_CONNECTIONS = int(os.getenv("DOWNLOAD_MAX_CONNECTIONS", "16"))  # open at once, all processes together
+DOWNLOAD_CONNECTIONS_PER_FILE = int(os.getenv("DOWNLOAD_CONNECTIONS_PER_FILE", "4"))  # ranges or fragments fetched in parallel
+DOWNLOAD_MAX_BANDWIDTH = int(float(os.getenv("DOWNLOAD_MAX_BANDWIDTH_MB", "0")) * 1024 * 1024)  # bytes/s, 0 = unlimited
+BUDGET_DIR = os.path.join(CACHE_ROOT, LOCKS_DIR, "downloads")
+BUCKET = struct.Struct("dd")  # tokens, last refill
+
+
+class Bandwidth:
+    """Token bucket kept in its lock file, so every process sharing the cache root draws from one budget.
+
+    Every downloaded block is paid for after the fact; once the bucket is in
+    debt the caller sleeps until its share has refilled, which spreads the
+    rate over all downloads running at that moment. Only the path travels to
+    worker processes, each opens the file itself.
+    """
+
+    def __init__(self, rate=DOWNLOAD_MAX_BANDWIDTH, path=os.path.join(BUDGET_DIR, "bandwidth.lock")):
+        self.rate = rate
+        self.path = path
+
+    def consume(self, amount):
+        if not self.rate or amount <= 0:
+            return
+        with FileLock(self.path) as lock:
+            os.lseek(lock.fd, 0, os.SEEK_SET)
+            state = os.read(lock.fd, BUCKET.size)
+            now = time.time()
+            # A new bucket starts full; at most one second of burst after an idle spell
+            tokens, stamp = BUCKET.unpack(state) if len(state) == BUCKET.size else (float(self.rate), now)
+            tokens = min(float(self.rate), tokens + (now - stamp) * self.rate) - amount
+            os.lseek(lock.fd, 0, os.SEEK_SET)
+            os.write(lock.fd, BUCKET.pack(tokens, now))
+        if tokens < 0:
+            time.sleep(-tokens / self.rate)
+
+    def progress_hook(self):
+        """yt-dlp progress hook paying for the bytes each update reports."""
+        seen = {}
+        lock = threading.Lock()
+
+        def hook(progress):
+            if not self.rate or progress.get("status") != "downloading":
+                return
+            name = progress.get("tmpfilename") or progress.get("filename")
+            done = progress.get("downloaded_bytes") or 0
+            with lock:
+                # Bytes an earlier run fetched are not paid again, when the downloader says how many
+                delta = done - seen.get(name, progress.get("resumed_bytes") or 0)
+                seen[name] = done
+            self.consume(delta)
+
+        return hook
+
+
+class DownloadBudget:
+    """Caps the connections all downloads hold together and shares the bandwidth.
+
+    Every connection is a lock file slot in the cache root, so the cap holds
+    across threads, worker processes and server processes alike, and a
+    crashed process gives its slots back with its locks. connections(wanted)
+    grants between one and `wanted` connections, whatever is free; a download
+    asking when everything is taken waits for the first one to come back
+    instead of opening more.
+    """
+
+    def __init__(self, max_connections=DOWNLOAD_MAX_CONNECTIONS, bandwidth=None, directory=BUDGET_DIR):
+        self.slots = [os.path.join(directory, f"connection-{slot}.lock") for slot in range(max_connections)]
+        self.bandwidth = bandwidth or Bandwidth()
+
+    @contextmanager
+    def connections(self, wanted=DOWNLOAD_CONNECTIONS_PER_FILE):
+        held = self._take(wanted)
+        while not held:
+            time.sleep(LOCK_POLL_INTERVAL)
+            held = self._take(wanted)
+        try:
+            yield len(held)
+        finally:
+            for lock in held:
+                lock.release()
+
+    def _take(self, wanted):
+        # Starting anywhere keeps concurrent callers from all fighting over the first slots
+        offset = random.randrange(len(self.slots))
+        held = []
+        for path in self.slots[offset:] + self.slots[:offset]:
+            lock = FileLock(path)
+            if lock.acquire(blocking=False):
+                held.append(lock)
+                if len(held) >= max(1, wanted):
+                    break
+        return held
+
+
+download_budget = DownloadBudget()
@@ -0,0 +1,232 @@
+# app/services/download_workers.py
+# Long-lived yt-dlp worker processes, so a clip download does not pay for a
+# fresh interpreter and extractor import every time.
+import os
+import copy
+import queue
+import threading
+import multiprocessing
+from app.services.download_budget import download_budget
+
+DOWNLOAD_WORKERS = int(os.getenv("DOWNLOAD_WORKERS", "4"))
+DOWNLOAD_WORKER_MAX_JOBS = int(os.getenv("DOWNLOAD_WORKER_MAX_JOBS", "50"))
+DOWNLOAD_WORKER_MAX_RSS = int(os.getenv("DOWNLOAD_WORKER_MAX_RSS_MB", "512")) * 1024 * 1024
+POLL_INTERVAL = 0.5
+
+# Keys of a yt-dlp progress dict worth sending back; the rest holds the whole info dict
+PROGRESS_KEYS = ("status", "downloaded_bytes", "total_bytes", "total_bytes_estimate",
+                 "speed", "eta", "elapsed", "fragment_index", "fragment_count")
+
+
+class WorkerDied(Exception):
+    pass
+
+
+class DownloadWorker:
+    def __init__(self, context, bandwidth=None):
+        self.conn, child_conn = context.Pipe()
+        self.cancel_event = context.Event()
+        self.process = context.Process(target=worker_main, args=(child_conn, self.cancel_event, bandwidth),
+                                       name="yt-dlp-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.rss = 0
+
+    def alive(self):
+        return self.process.is_alive()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class DownloadWorkerPool:
+    """Hands download tasks to warm worker processes, one task per worker at a time.
+
+    A worker is replaced after DOWNLOAD_WORKER_MAX_JOBS tasks or once its
+    resident memory passes DOWNLOAD_WORKER_MAX_RSS_MB, so extractor caches and
+    leaks cannot pile up in a process that lives as long as the server.
+    Tasks draw their connections and bandwidth from the server-wide budget.
+    """
+
+    def __init__(self, size=DOWNLOAD_WORKERS, max_jobs=DOWNLOAD_WORKER_MAX_JOBS, max_rss=DOWNLOAD_WORKER_MAX_RSS,
+                 budget=download_budget):
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss = max_rss
+        self.budget = budget
+        self.context = multiprocessing.get_context("spawn")
+        self.idle = queue.LifoQueue()  # the most recently used worker has the warmest caches
+        self.slots = threading.BoundedSemaphore(size)
+
+    def run(self, task, on_message=None, cancel_event=None):
+        """Runs a task and returns its result dict.
+
+        `on_message(kind, payload)` receives "progress" and "log" messages as
+        they arrive. Setting `cancel_event` stops the download at the next
+        progress update.
+        """
+        with self.slots, self.budget.connections(task.get("connections", 1)) as connections:
+            task = {**task, "connections": connections}
+            worker = self._acquire()
+            try:
+                return self._run_on(worker, task, on_message, cancel_event)
+            finally:
+                self._release(worker)
+
+    def shutdown(self):
+        while True:
+            try:
+                self.idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+    def _acquire(self):
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except queue.Empty:
+                return DownloadWorker(self.context, self.budget.bandwidth)
+            if worker.alive():
+                return worker
+            worker.stop()
+
+    def _release(self, worker):
+        if not worker.alive() or worker.jobs >= self.max_jobs or (self.max_rss and worker.rss > self.max_rss):
+            worker.stop()
+            return
+        worker.cancel_event.clear()
+        self.idle.put(worker)
+
+    def _run_on(self, worker, task, on_message, cancel_event):
+        worker.jobs += 1
+        worker.conn.send(task)
+
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                worker.cancel_event.set()
+
+            try:
+                if not worker.conn.poll(POLL_INTERVAL):
+                    if not worker.alive():
+                        raise WorkerDied(f"Download worker exited with code {worker.process.exitcode}")
+                    continue
+                kind, payload = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                raise WorkerDied(f"Lost the download worker: {e}")
+
+            if kind == "result":
+                worker.rss = payload.pop("rss", 0)
+                return payload
+            if on_message is not None:
+                on_message(kind, payload)
+
+
+# Everything below runs inside the worker processes
+
+def worker_main(conn, cancel_event, bandwidth=None):
+    import yt_dlp  # imported once per worker, this is the cost the pool saves
+    from app.utils.download_tools import accelerated_ydl
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        result = download_sections(yt_dlp, accelerated_ydl, task, conn, cancel_event, bandwidth)
+        result["rss"] = resident_memory()
+        conn.send(("result", result))
+
+
+def download_sections(yt_dlp, accelerated_ydl, task, conn, cancel_event, bandwidth=None):
+    """Downloads each section of a task separately so every one gets its own result.
+
+    task: {"url", "info" (optional, unprocessed yt-dlp info), "format",
+           "merge_output_format", "connections" (granted by the pool),
+           "sections": [{"index", "start", "end", "outtmpl"}]}
+    """
+    results = []
+    info = task.get("info")
+
+    for section in task["sections"]:
+        outcome = {"index": section["index"], "start": section["start"], "end": section["end"],
+                   "path": None, "error": None}
+        results.append(outcome)
+
+        if cancel_event.is_set():
+            outcome["error"] = "cancelled"
+            continue
+
+        def progress_hook(progress, index=section["index"]):
+            if cancel_event.is_set():
+                raise yt_dlp.utils.DownloadCancelled("Cancelled")
+            payload = {key: progress.get(key) for key in PROGRESS_KEYS}
+            payload["index"] = index
+            conn.send(("progress", payload))
+
+        ydl_opts = {
+            'format': task["format"],
+            'merge_output_format': task.get("merge_output_format", "mp4"),
+            'outtmpl': section["outtmpl"],
+            'download_ranges': yt_dlp.utils.download_range_func(None, [(section["start"], section["end"])]),
+            'progress_hooks': [progress_hook],
+            'logger': WorkerLogger(conn, section["index"]),
+            'quiet': True,
+            'noprogress': True,
+        }
+
+        try:
+            with accelerated_ydl(ydl_opts, task.get("connections", 1), bandwidth) as ydl:
+                if info is not None:
+                    downloaded = ydl.process_ie_result(copy.deepcopy(info), download=True)
+                else:
+                    downloaded = ydl.extract_info(task["url"], download=True)
+            requested = (downloaded or {}).get("requested_downloads") or [{}]
+            outcome["path"] = requested[0].get("filepath")
+        except yt_dlp.utils.DownloadCancelled:
+            outcome["error"] = "cancelled"
+        except Exception as e:
+            outcome["error"] = str(e)
+
+    return {"sections": results}
+
+
+class WorkerLogger:
+    # yt-dlp logger that forwards warnings and errors instead of printing them
+    def __init__(self, conn, index):
+        self.conn = conn
+        self.index = index
+
+    def debug(self, message):
+        pass
+
+    def info(self, message):
+        pass
+
+    def warning(self, message):
+        self.conn.send(("log", {"index": self.index, "level": "warning", "message": message}))
+
+    def error(self, message):
+        self.conn.send(("log", {"index": self.index, "level": "error", "message": message}))
+
+
+def resident_memory():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+download_pool = DownloadWorkerPool()
@@ -0,0 +1,22 @@
+# app/services/executors.py
+# Where blocking work runs. Under serve.py requests and jobs are greenlets
+# sharing one OS thread: waiting on sockets, pipes and subprocesses yields to
+# the others, but pure Python number crunching would stall every open stream.
+# Such steps go through run_cpu_bound, which hands them to gevent's pool of
+# native threads. Heavier tools already run in their own processes
+# (ffmpeg_tools.get_clip_pool, download_workers.download_pool).
+
+
+def gevent_active():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
+
+def run_cpu_bound(fn, *args, **kwargs):
+    if gevent_active():
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+    return fn(*args, **kwargs)
@@ -1,9 +1,119 @@
 # app.services.groq.py
 import os
-from groq import Groq
+import time
+import random
+import threading
+import httpx
+from groq import Groq, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+from app.services.cache import CACHE_ROOT
+from app.services.locks import LOCKS_DIR
+from app.services.rate_limiter import TokenBucket
+from app.services.metrics import groq_requests
+
+GROQ_TIMEOUT = float(os.getenv("GROQ_TIMEOUT", "120"))
+GROQ_CONNECT_TIMEOUT = float(os.getenv("GROQ_CONNECT_TIMEOUT", "10"))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "4"))
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+GROQ_CHAT_RPM = int(os.getenv("GROQ_CHAT_RPM", "30"))
+GROQ_CHAT_TPM = int(os.getenv("GROQ_CHAT_TPM", "12000"))
+GROQ_AUDIO_RPM = int(os.getenv("GROQ_AUDIO_RPM", "20"))
+GROQ_CHAT_MAX_TOKENS = int(os.getenv("GROQ_CHAT_MAX_TOKENS", "2048"))  # answer length asked for when the caller sets none
+# The quota belongs to the API key, so the buckets are shared by every process working on the same cache root
+RATE_LIMIT_DIR = os.path.join(CACHE_ROOT, LOCKS_DIR, "groq")
+
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+_client = None
+_client_lock = threading.Lock()
+
+concurrency = threading.BoundedSemaphore(GROQ_MAX_CONCURRENCY)
+chat_requests = TokenBucket(GROQ_CHAT_RPM, path=os.path.join(RATE_LIMIT_DIR, "chat-requests.lock"))
+chat_tokens = TokenBucket(GROQ_CHAT_TPM, path=os.path.join(RATE_LIMIT_DIR, "chat-tokens.lock"))
+audio_requests = TokenBucket(GROQ_AUDIO_RPM, path=os.path.join(RATE_LIMIT_DIR, "audio-requests.lock"))
 
 def get_groq_client():
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if not groq_api_key:
-        raise Exception("Missing GROQ_API_KEY in environment.")
-    return Groq(api_key=groq_api_key)
\ No newline at end of file
+    # One client per process: its httpx pool keeps connections (and TLS sessions) alive
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                groq_api_key = os.getenv("GROQ_API_KEY")
+                if not groq_api_key:
+                    raise Exception("Missing GROQ_API_KEY in environment.")
+                _client = Groq(
+                    api_key=groq_api_key,
+                    max_retries=0,  # retries happen in call_with_retries so the limiter sees them
+                    http_client=httpx.Client(
+                        timeout=httpx.Timeout(GROQ_TIMEOUT, connect=GROQ_CONNECT_TIMEOUT),
+                        limits=httpx.Limits(max_connections=GROQ_MAX_CONCURRENCY * 2,
+                                            max_keepalive_connections=GROQ_MAX_CONCURRENCY),
+                    ),
+                )
+    return _client
+
+
+def create_transcription(**kwargs):
+    return call_with_retries(lambda client: client.audio.transcriptions.create(**kwargs), [(audio_requests, 1)],
+                             endpoint="transcriptions")
+
+
+def create_chat_completion(**kwargs):
+    # The answer is capped explicitly, so the tokens reserved for it are the ones the request may use
+    if kwargs.get("max_completion_tokens") is None and kwargs.get("max_tokens") is None:
+        kwargs["max_tokens"] = GROQ_CHAT_MAX_TOKENS
+    max_answer = kwargs.get("max_completion_tokens") or kwargs["max_tokens"]
+    # ~4 characters per token for the prompt, plus the longest answer allowed
+    prompt_chars = sum(len(message.get("content") or "") for message in kwargs.get("messages", []))
+    estimated_tokens = prompt_chars // 4 + max_answer
+    return call_with_retries(lambda client: client.chat.completions.create(**kwargs),
+                             [(chat_requests, 1), (chat_tokens, estimated_tokens)], endpoint="chat")
+
+
+def call_with_retries(request, buckets, endpoint="other"):
+    client = get_groq_client()
+    attempt = 0
+    while True:
+        for bucket, amount in buckets:
+            bucket.acquire(amount)
+
+        try:
+            with concurrency:
+                response = request(client)
+            groq_requests.inc(endpoint=endpoint, outcome="ok")
+            return response
+        except RETRYABLE_ERRORS as e:
+            attempt += 1
+            groq_requests.inc(endpoint=endpoint, outcome="rate_limited" if isinstance(e, RateLimitError) else "retryable_error")
+            if isinstance(e.__cause__, httpx.ConnectError):
+                # No connection, the request never reached the provider and used up no quota
+                for bucket, amount in buckets:
+                    bucket.refund(amount)
+
+            if attempt > GROQ_MAX_RETRIES:
+                raise
+
+            delay = retry_after(e) or min(60, 2 ** attempt) * (0.5 + random.random() / 2)
+            if isinstance(e, RateLimitError):
+                # Every job shares the provider quota, so everyone waits
+                for bucket, _ in buckets:
+                    bucket.pause(delay)
+            time.sleep(delay)
+        except Exception:
+            groq_requests.inc(endpoint=endpoint, outcome="error")
+            raise
+
+
+def retry_after(error):
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
@@ -0,0 +1,274 @@
+# app/services/job_queue.py
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.services.metrics import registry, jobs_finished, job_seconds
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "6"))
+JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "50"))
+JOB_TTL = int(os.getenv("JOB_TTL", "3600"))  # seconds a finished job stays queryable
+# Jobs allowed in each stage at once, so downloads (network), transcription and
+# timestamps (Groq) and clipping (CPU) of different videos overlap instead of queueing
+STAGE_LIMITS = os.getenv("STAGE_LIMITS", "download=2,transcription=3,timestamps=3,clipping=2")
+
+FINISHED_STATES = ("completed", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class QueueFull(Exception):
+    pass
+
+
+class StageGates:
+    def __init__(self, limits):
+        self.slots = {}
+        for item in filter(None, (part.strip() for part in limits.split(","))):
+            stage, _, limit = item.partition("=")
+            self.slots[stage.strip()] = threading.BoundedSemaphore(int(limit))
+
+    def enter(self, job, stage):
+        self.leave(job)
+        slot = self.slots.get(stage)
+        if slot is None:
+            return
+        while not slot.acquire(timeout=0.5):
+            job.check_cancelled()
+        job.stage_slot = slot
+
+    def leave(self, job):
+        if job.stage_slot is not None:
+            job.stage_slot.release()
+            job.stage_slot = None
+
+
+stage_gates = StageGates(STAGE_LIMITS)
+
+
+class Job:
+    def __init__(self, video_id, params):
+        self.id = uuid.uuid4().hex
+        self.video_id = video_id
+        self.params = params
+        self.status = "queued"
+        self.stage = None
+        self.result = None
+        self.status_code = None
+        self.error = None
+        self.submissions = 1
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.stage_started = []  # (stage, time) in the order the stages ran
+        self.spans = []  # timed steps, see app.services.metrics.span
+        self.renders = {}  # clip index -> preview and full render state, see track_render
+        self.first_clip_at = None
+        self.renders_lock = threading.Lock()
+        self.stage_slot = None
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+        self.future = None
+        self.followers = []
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def set_stage(self, stage):
+        self.check_cancelled()
+        self.stage = stage
+        # Time waiting for a free slot counts towards the stage
+        self.stage_started.append((stage, time.time()))
+        stage_gates.enter(self, stage)
+
+    def timings(self):
+        """Seconds spent per stage; a running stage counts up to now."""
+        ends = [started for _, started in self.stage_started[1:]] + [self.finished_at or time.time()]
+        return {stage: round(end - started, 3) for (stage, started), end in zip(self.stage_started, ends)}
+
+    def track_render(self, index, **fields):
+        """Records what is ready of clip `index`, e.g. preview="<name>" or full="<name>"."""
+        with self.renders_lock:
+            render = self.renders.setdefault(index, {"index": index, "preview": None, "full": None})
+            render.update(fields)
+            if self.first_clip_at is None and (render["preview"] or render["full"]):
+                self.first_clip_at = time.time()
+            return dict(render)
+
+    def render_list(self):
+        with self.renders_lock:
+            return [dict(self.renders[index]) for index in sorted(self.renders)]
+
+    def time_to_first_clip(self):
+        if self.first_clip_at is None or self.started_at is None:
+            return None
+        return round(self.first_clip_at - self.started_at, 3)
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "video_id": self.video_id,
+            "status": self.status,
+            "stage": self.stage,
+            "submissions": self.submissions,
+            "cancel_requested": self.cancel_event.is_set(),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "timings": self.timings(),
+            "time_to_first_clip": self.time_to_first_clip(),
+            "renders": self.render_list(),
+        }
+
+
+class JobQueue:
+    """Bounded worker pool running one pipeline per job.
+
+    Submissions for a video that already has an identical job queued or
+    running are coalesced into that job. A submission for the same video with
+    different parameters is held back until the running one finishes, so two
+    jobs never work on the same download directory at once.
+    """
+
+    def __init__(self, max_workers=JOB_WORKERS, max_pending=JOB_MAX_PENDING, ttl=JOB_TTL):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.jobs = {}
+        self.active = {}  # video_id -> latest unfinished job for that video
+        self.lock = threading.Lock()
+
+    def submit(self, video_id, params, runner):
+        with self.lock:
+            self._prune()
+
+            latest = self.active.get(video_id)
+            if latest and not latest.finished and not latest.cancel_event.is_set() and latest.params == params:
+                latest.submissions += 1
+                return latest, True
+
+            pending = sum(1 for job in self.jobs.values() if job.status == "queued")
+            if pending >= self.max_pending:
+                raise QueueFull(f"Job queue is full ({pending} pending)")
+
+            job = Job(video_id, params)
+            self.jobs[job.id] = job
+            self.active[video_id] = job
+
+            if latest and not latest.finished:
+                latest.followers.append((job, runner))
+            else:
+                job.future = self.executor.submit(self._run, job, runner)
+
+        return job, False
+
+    def find_completed(self, video_id, params):
+        """Latest successful job for exactly these parameters, while it is still kept."""
+        with self.lock:
+            done = [job for job in self.jobs.values()
+                    if job.video_id == video_id and job.params == params
+                    and job.status == "completed" and job.status_code == 200]
+        return max(done, key=lambda job: job.finished_at, default=None)
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Withdraws one submission; the job only stops once nobody is waiting on it."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job or job.finished:
+                return job
+
+            job.submissions = max(job.submissions - 1, 0)
+            if job.submissions:
+                return job
+
+            job.cancel_event.set()
+            # Jobs still waiting on a predecessor (no future yet) are finished
+            # when that predecessor hands over to its followers
+            if job.status == "queued" and job.future is not None and job.future.cancel():
+                self._finish(job, "cancelled")
+
+        return job
+
+    def count_by_status(self):
+        with self.lock:
+            counts = {}
+            for job in self.jobs.values():
+                counts[(job.status,)] = counts.get((job.status,), 0) + 1
+            return counts
+
+    def active_video_ids(self):
+        with self.lock:
+            return set(self.active)
+
+    def wait(self, job_id, timeout=None):
+        job = self.get(job_id)
+        if job:
+            job.done_event.wait(timeout)
+        return job
+
+    def _run(self, job, runner):
+        with self.lock:
+            if job.cancel_event.is_set():
+                self._finish(job, "cancelled")
+                return
+            job.status = "running"
+            job.started_at = time.time()
+
+        try:
+            job.result, job.status_code = runner(job)
+            # The pipeline reports its own failures as error responses, result keeps the details
+            status = "failed" if job.status_code >= 400 else "completed"
+        except JobCancelled:
+            status = "cancelled"
+        except Exception as e:
+            job.error = str(e)
+            status = "failed"
+        finally:
+            stage_gates.leave(job)
+
+        with self.lock:
+            self._finish(job, status)
+
+    def _finish(self, job, status):
+        # Caller holds self.lock
+        job.status = status
+        job.finished_at = time.time()
+        job.done_event.set()
+        jobs_finished.inc(status=status)
+        if job.started_at:
+            job_seconds.observe(job.finished_at - job.started_at, status=status)
+
+        for follower, runner in job.followers:
+            if follower.cancel_event.is_set():
+                self._finish(follower, "cancelled")
+            else:
+                follower.future = self.executor.submit(self._run, follower, runner)
+        job.followers = []
+
+        if self.active.get(job.video_id) is job:
+            del self.active[job.video_id]
+
+    def _prune(self):
+        # Caller holds self.lock
+        cutoff = time.time() - self.ttl
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job.finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+job_queue = JobQueue()
+registry.gauge("shortcutter_jobs", "Jobs the queue currently knows about, by status.", job_queue.count_by_status, ("status",))
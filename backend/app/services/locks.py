@@ -0,0 +1,119 @@
+# app/services/locks.py
+import os
+import time
+import errno
+from contextlib import contextmanager
+from flask import g, has_app_context
+from app.routes.sse_stream import send_event
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+    import msvcrt
+
+LOCKS_DIR = ".locks"
+LOCK_POLL_INTERVAL = float(os.getenv("LOCK_POLL_INTERVAL", "0.2"))
+LOCK_TIMEOUT = float(os.getenv("LOCK_TIMEOUT", "7200"))  # longest a waiter sits behind one producer
+
+
+class LockTimeout(Exception):
+    pass
+
+
+class FileLock:
+    """Advisory lock on a file, exclusive or shared.
+
+    flock() belongs to the open file, so threads, worker processes and, on a
+    shared volume with lock support (NFSv4, EFS, CephFS), other nodes all
+    exclude each other. The lock goes away with its holder, a crashed worker
+    never leaves a stale one. Waiting polls instead of blocking in the kernel,
+    so a gevent worker keeps serving other requests meanwhile.
+    """
+
+    def __init__(self, path, shared=False):
+        self.path = path
+        self.shared = shared
+        self.fd = None
+
+    def acquire(self, blocking=True, timeout=LOCK_TIMEOUT, cancel_event=None):
+        """True once held; False when not blocking and taken, or when `cancel_event` is set while waiting."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + timeout
+        try:
+            while not self._try_lock(fd):
+                if not blocking or (cancel_event is not None and cancel_event.is_set()):
+                    os.close(fd)
+                    return False
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeout(f"Gave up waiting for {self.path} after {timeout:.0f}s")
+                time.sleep(LOCK_POLL_INTERVAL)
+        except BaseException:
+            if self.fd != fd:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            raise
+        self.fd = fd
+        return True
+
+    def release(self):
+        if self.fd is None:
+            return
+        fd, self.fd = self.fd, None
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def _try_lock(self, fd):
+        try:
+            if fcntl:
+                fcntl.flock(fd, (fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+            else:
+                # msvcrt has no shared locks, readers simply exclude each other there
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EACCES, errno.EWOULDBLOCK, errno.EDEADLK):
+                return False
+            raise
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def artifact_lock(video_dir, name, shared=False):
+    return FileLock(os.path.join(video_dir, LOCKS_DIR, f"{name}.lock"), shared=shared)
+
+
+@contextmanager
+def producing(video_dir, name):
+    """Held while one worker produces an artifact of a video.
+
+    Anyone else producing the same artifact waits here instead of doing the
+    work twice; the code inside should check the cache first, so a waiter
+    finds what the holder just published and returns straight away.
+    """
+    lock = artifact_lock(video_dir, name)
+    if not lock.acquire(blocking=False):
+        send_event(f"[INFO] Another worker is already producing the {name.replace('_', ' ')}, waiting for it")
+        job = g.get("job") if has_app_context() else None
+        if not lock.acquire(cancel_event=job.cancel_event if job is not None else None):
+            job.check_cancelled()
+    try:
+        yield
+    finally:
+        lock.release()
@@ -0,0 +1,206 @@
+# app/services/metrics.py
+import time
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+from flask import g, has_app_context
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+
+    def key(self, labels):
+        return tuple(str(labels.get(label, "")) for label in self.labels)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+
+    def format_labels(self, values, extra=()):
+        pairs = list(zip(self.labels, values)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, description, labels=()):
+        super().__init__(name, description, labels)
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        with self.lock:
+            values = sorted(self.values.items())
+        return self.header() + [f"{self.name}{self.format_labels(key)} {format_value(value)}" for key, value in values]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, description, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+        self.series = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.setdefault(key, [0] * (len(self.buckets) + 2))
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        with self.lock:
+            series = sorted((key, list(values)) for key, values in self.series.items())
+
+        lines = self.header()
+        for key, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{self.format_labels(key, [('le', format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{self.format_labels(key, [('le', '+Inf')])} {values[-1]}")
+            lines.append(f"{self.name}_sum{self.format_labels(key)} {format_value(values[-2])}")
+            lines.append(f"{self.name}_count{self.format_labels(key)} {values[-1]}")
+        return lines
+
+
+class Gauge(Metric):
+    """Read when scraped: `collect()` returns a number or {label values tuple: number}."""
+    kind = "gauge"
+
+    def __init__(self, name, description, collect, labels=()):
+        super().__init__(name, description, labels)
+        self.collect = collect
+
+    def render(self):
+        values = self.collect()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return self.header() + [f"{self.name}{self.format_labels(key)} {format_value(value)}"
+                                for key, value in sorted(values.items())]
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, description, labels=()):
+        return self.register(Counter(name, description, labels))
+
+    def histogram(self, name, description, labels=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, description, labels, buckets))
+
+    def gauge(self, name, description, collect, labels=()):
+        return self.register(Gauge(name, description, collect, labels))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_value(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+registry = Registry()
+
+stage_seconds = registry.histogram(
+    "shortcutter_stage_seconds", "Time spent in each pipeline step.", ("stage", "cache", "outcome"))
+jobs_finished = registry.counter(
+    "shortcutter_jobs_finished_total", "Jobs that reached a final status.", ("status",))
+job_seconds = registry.histogram(
+    "shortcutter_job_seconds", "Wall time of a job from start to final status.", ("status",))
+cache_lookups = registry.counter(
+    "shortcutter_cache_lookups_total", "Artifact cache lookups by artifact and result.", ("artifact", "result"))
+groq_requests = registry.counter(
+    "shortcutter_groq_requests_total", "Groq API calls by endpoint and outcome.", ("endpoint", "outcome"))
+
+
+# ---------------------- Spans ----------------------
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+        self.started = time.time()
+        self.seconds = None
+
+    def tag(self, **labels):
+        self.labels.update(labels)
+
+
+@contextmanager
+def span(name, **labels):
+    """Times a pipeline step into shortcutter_stage_seconds and the job's breakdown.
+
+    Code inside can label the step through tag_span, e.g. tag_span(cache="hit").
+    """
+    current = Span(name, labels)
+    token = _current_span.set(current)
+    outcome = "ok"
+    try:
+        yield current
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.seconds = time.time() - current.started
+        stage_seconds.observe(current.seconds, stage=name, cache=current.labels.get("cache", "none"), outcome=outcome)
+
+        job = g.get("job") if has_app_context() else None
+        if job is not None:
+            job.spans.append({
+                "name": name,
+                "offset": round(current.started - (job.started_at or job.created_at), 3),
+                "seconds": round(current.seconds, 3),
+                "outcome": outcome,
+                **current.labels,
+            })
+
+
+def tag_span(**labels):
+    current = _current_span.get()
+    if current is not None:
+        current.tag(**labels)
+
+
+def record_cache_lookup(artifact, hit):
+    cache_lookups.inc(artifact=artifact, result="hit" if hit else "miss")
+    # The first lookup in a step is the one that decides whether the step does any work
+    current = _current_span.get()
+    if current is not None and "cache" not in current.labels:
+        current.tag(cache="hit" if hit else "miss")
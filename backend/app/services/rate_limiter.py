@@ -0,0 +1,79 @@
+# app/services/rate_limiter.py
+import os
+import time
+import struct
+import threading
+from contextlib import contextmanager
+from app.services.locks import FileLock
+
+BUCKET = struct.Struct("ddd")  # tokens, last refill, paused until
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate_per_minute`.
+
+    Shared by every job in the process, so bursts from many pipelines are
+    spread out instead of all hitting the provider in the same second. With a
+    `path` the state lives in that lock file instead, read and written under
+    its lock like download_budget.Bandwidth, so every server process on the
+    host draws from the one quota. Times are wall clock so processes agree.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None, path=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.path = path
+        self.tokens = float(self.capacity)
+        self.updated = time.time()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def _state(self):
+        with self.lock:
+            if self.path is None:
+                yield
+                return
+            with FileLock(self.path) as lock:
+                os.lseek(lock.fd, 0, os.SEEK_SET)
+                state = os.read(lock.fd, BUCKET.size)
+                if len(state) == BUCKET.size:
+                    self.tokens, self.updated, self.paused_until = BUCKET.unpack(state)
+                yield
+                os.lseek(lock.fd, 0, os.SEEK_SET)
+                os.write(lock.fd, BUCKET.pack(self.tokens, self.updated, self.paused_until))
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + max(now - self.updated, 0) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount=1, timeout=None):
+        """Blocks until `amount` tokens are available, False if `timeout` passed first."""
+        amount = min(amount, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._state():
+                now = time.time()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= amount:
+                    self.tokens -= amount
+                    return True
+                wait = max(self.paused_until - now, (amount - self.tokens) / self.rate if self.rate else 1.0)
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(max(wait, 0.01))
+
+    def refund(self, amount):
+        """Gives back tokens taken for a request that was never sent."""
+        with self._state():
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def pause(self, seconds):
+        """Holds every caller back, e.g. after the provider answered 429 with retry-after."""
+        with self._state():
+            self.paused_until = max(self.paused_until, time.time() + seconds)
@@ -0,0 +1,132 @@
+# app/services/static_assets.py
+import os
+import re
+import gzip
+import hashlib
+import mimetypes
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # optional, gzip only without it
+    brotli = None
+
+# Vite writes its build output to assets/ as name-<8 char hash>.ext, e.g. assets/index-B4hiN_pR.js;
+# only those never change under their name, public/ files like apple-touch-icon.png do
+HASHED_NAME = re.compile(r"^assets/(?:.+/)?[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml",
+                      "image/svg+xml", "application/wasm", "image/x-icon", "image/vnd.microsoft.icon")
+MIN_COMPRESS_SIZE = 512
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+
+class Asset:
+    def __init__(self, path, body, mimetype, immutable):
+        self.path = path
+        self.mimetype = mimetype
+        self.immutable = immutable
+        self.etag = hashlib.sha1(body).hexdigest()[:20]
+        self.variants = {None: body}  # content-encoding -> bytes
+
+    def choose(self, accept_encoding):
+        accepted = _accepted_encodings(accept_encoding)
+        best, best_q = None, 0.0
+        # Highest q-value wins, brotli on a tie; q=0 means "not this one"
+        for encoding in ("br", "gzip"):
+            q = accepted.get(encoding, accepted.get("*", 0.0))
+            if encoding in self.variants and q > best_q:
+                best, best_q = encoding, q
+        return best
+
+
+class AssetIndex:
+    """The built frontend, read and compressed once at startup.
+
+    Requests are answered from memory: no stat per hit, gzip/brotli picked by
+    Accept-Encoding, strong ETags, and long immutable caching for hashed names.
+    A rebuilt frontend is picked up on restart.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.assets = {}
+        if os.path.isdir(root):
+            self._load()
+
+    def _load(self):
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith((".gz", ".br")):
+                    continue  # picked up as variants of the plain file below
+                full_path = os.path.join(directory, name)
+                path = os.path.relpath(full_path, self.root).replace(os.sep, "/")
+                with open(full_path, "rb") as f:
+                    body = f.read()
+
+                mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                asset = Asset(path, body, mimetype, bool(HASHED_NAME.match(path)))
+                if len(body) >= MIN_COMPRESS_SIZE and mimetype.startswith(COMPRESSIBLE_TYPES):
+                    asset.variants["gzip"] = _precompressed(full_path + ".gz") or gzip.compress(body, 9, mtime=0)
+                    compressed = _precompressed(full_path + ".br") or (brotli.compress(body) if brotli else None)
+                    if compressed:
+                        asset.variants["br"] = compressed
+                self.assets[path] = asset
+
+    def get(self, path):
+        return self.assets.get(path)
+
+    def serve(self, asset):
+        encoding = asset.choose(request.headers.get("Accept-Encoding", ""))
+        # Each representation gets its own strong validator
+        etag = f"{asset.etag}-{encoding}" if encoding else asset.etag
+        headers = {
+            "ETag": f'"{etag}"',
+            "Cache-Control": IMMUTABLE_CACHE if asset.immutable else REVALIDATE_CACHE,
+            "Vary": "Accept-Encoding",
+        }
+
+        if etag in _etags(request.headers.get("If-None-Match", "")):
+            return Response(status=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        # Werkzeug drops the body itself for HEAD requests
+        return Response(asset.variants[encoding], mimetype=asset.mimetype, headers=headers)
+
+
+def _precompressed(path):
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return None
+
+
+def _accepted_encodings(header):
+    """Accept-Encoding as {coding: q}, e.g. "gzip;q=0, br" -> {"gzip": 0.0, "br": 1.0}."""
+    accepted = {}
+    for item in header.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def _etags(header):
+    if header.strip() == "*":
+        return _AnyTag()
+    return {tag.strip().removeprefix("W/").strip('"') for tag in header.split(",") if tag.strip()}
+
+
+class _AnyTag:
+    def __contains__(self, _):
+        return True
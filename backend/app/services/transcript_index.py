@@ -0,0 +1,203 @@
+# app/services/transcript_index.py
+import os
+import re
+import json
+import time
+import bisect
+import sqlite3
+import threading
+from app.services.cache import CACHE_ROOT, MANIFEST_NAME
+from app.utils.transcript_store import Transcript
+
+# Rebuilt from the cache by sync() at startup, so it lives with the user's caches rather than in the source tree
+TRANSCRIPT_INDEX_PATH = os.getenv("TRANSCRIPT_INDEX_PATH", os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "short-cutter", "transcripts.db"))
+SEARCH_MAX_HITS = int(os.getenv("SEARCH_MAX_HITS", "2000"))  # matching segments ranked before windows are built
+SEARCH_DURATION_SLACK = 20  # windows may run this much past the requested duration, same bounds the LLM gets
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    transcript_key TEXT,
+    duration REAL,
+    segments INTEGER,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS segments_video_seq ON segments (video_id, seq);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5 (
+    text, content='segments', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS segments_insert AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_delete AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts (segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def fts_query(text):
+    """Turns free-form keywords into an FTS5 query that matches any of the words."""
+    words = re.findall(r"\w+", text or "")
+    return " OR ".join(f'"{word}"' for word in dict.fromkeys(word.lower() for word in words))
+
+
+class TranscriptIndex:
+    """Full-text index of every cached transcript, one row per segment.
+
+    Transcripts are added as transcribe_audio finishes and removed when the
+    cache evicts their video. search() ranks matching segments with BM25 and
+    grows each hit into a window of whole segments close to the requested
+    duration, so keyword requests can pick clips without asking the model.
+    """
+
+    def __init__(self, path=TRANSCRIPT_INDEX_PATH):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()  # SQLite takes one writer at a time anyway, this avoids busy retries
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self.lock:
+                conn.executescript(SCHEMA)
+            self.local.conn = conn
+        return conn
+
+    def key_of(self, video_id):
+        row = self.connection().execute(
+            "SELECT transcript_key FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+        return row[0] if row else None
+
+    def add(self, video_id, segments, key=None):
+        """Replaces the video's segments; a no-op when the same transcript is already indexed."""
+        if key is not None and self.key_of(video_id) == key:
+            return False
+
+        rows = [(video_id, seq, float(segment["start"]), float(segment["end"]), segment["text"].strip())
+                for seq, segment in enumerate(segments)]
+        conn = self.connection()
+        with self.lock, conn:
+            conn.execute("DELETE FROM segments WHERE video_id = ?", (video_id,))
+            conn.executemany("INSERT INTO segments (video_id, seq, start, end, text) VALUES (?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO videos (video_id, transcript_key, duration, segments, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (video_id, key, rows[-1][3] if rows else 0.0, len(rows), time.time()))
+        return True
+
+    def add_transcript(self, video_id, path, key=None):
+        if key is not None and self.key_of(video_id) == key:
+            return False
+        return self.add(video_id, Transcript.open(path).segments(), key)
+
+    def remove(self, video_ids):
+        conn = self.connection()
+        with self.lock, conn:
+            for video_id in video_ids:
+                conn.execute("DELETE FROM segments WHERE video_id = ?", (video_id,))
+                conn.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+
+    def sync(self, root=CACHE_ROOT):
+        """Indexes transcripts cached before the index existed and drops videos no longer cached."""
+        started = time.time()
+        cached = set()
+        if os.path.isdir(root):
+            for video_id in os.listdir(root):
+                try:
+                    with open(os.path.join(root, video_id, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                        entry = json.load(f)["artifacts"].get("transcript")
+                except (OSError, ValueError, KeyError):
+                    continue
+                if entry and os.path.exists(entry["path"]):
+                    cached.add(video_id)
+                    self.add_transcript(video_id, entry["path"], entry["key"])
+
+        # Videos indexed while this ran were recorded in the cache after the listing above
+        indexed = {row[0] for row in self.connection().execute(
+            "SELECT video_id FROM videos WHERE indexed_at < ?", (started,))}
+        self.remove(indexed - cached)
+
+    def start_sync(self):
+        threading.Thread(target=self.sync, daemon=True, name="transcript-index-sync").start()
+
+    def search(self, query, video_id=None, duration=60, limit=10):
+        """Returns the best `limit` windows of about `duration` seconds, best first."""
+        match = fts_query(query)
+        if not match:
+            return []
+
+        conn = self.connection()
+        sql = "SELECT s.video_id, s.seq, -bm25(segments_fts) FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid WHERE segments_fts MATCH ?"
+        args = [match]
+        if video_id:
+            sql += " AND s.video_id = ?"
+            args.append(video_id)
+        sql += " ORDER BY bm25(segments_fts) LIMIT ?"
+        args.append(SEARCH_MAX_HITS)
+
+        hits = {}
+        for hit_video, seq, score in conn.execute(sql, args):
+            hits.setdefault(hit_video, {})[seq] = score
+
+        windows = []
+        for hit_video, video_hits in hits.items():
+            segments = conn.execute(
+                "SELECT start, end FROM segments WHERE video_id = ? ORDER BY seq", (hit_video,)).fetchall()
+            windows.extend(build_windows(hit_video, segments, video_hits, duration, duration + SEARCH_DURATION_SLACK))
+
+        windows.sort(key=lambda window: window["score"], reverse=True)
+        windows = windows[:limit]
+        # Text only for the windows returned, most of a transcript is never read
+        for window in windows:
+            first, last = window.pop("segments")
+            rows = conn.execute("SELECT text FROM segments WHERE video_id = ? AND seq BETWEEN ? AND ? ORDER BY seq",
+                                (window["video_id"], first, last))
+            window["text"] = " ".join(row[0] for row in rows)[:500]
+        return windows
+
+
+def build_windows(video_id, segments, hits, duration, max_duration):
+    """Grows the strongest hits into non-overlapping windows of whole segments."""
+    covered = bytearray(len(segments))
+    ordered = sorted(hits)
+    windows = []
+    for seq in sorted(hits, key=hits.get, reverse=True):
+        if covered[seq]:
+            continue
+
+        lo = hi = seq
+        # Extend after the hit first, the payoff usually follows the keyword
+        while segments[hi][1] - segments[lo][0] < duration:
+            if hi + 1 < len(segments) and not covered[hi + 1] and segments[hi + 1][1] - segments[lo][0] <= max_duration:
+                hi += 1
+            elif lo > 0 and not covered[lo - 1] and segments[hi][1] - segments[lo - 1][0] <= max_duration:
+                lo -= 1
+            else:
+                break
+
+        covered[lo:hi + 1] = b"\x01" * (hi - lo + 1)
+        inside = ordered[bisect.bisect_left(ordered, lo):bisect.bisect_right(ordered, hi)]
+        windows.append({
+            "video_id": video_id,
+            "start": round(segments[lo][0], 2),
+            "end": round(segments[hi][1], 2),
+            "score": round(sum(hits[index] for index in inside), 4),
+            "hits": len(inside),
+            "segments": (lo, hi),
+        })
+    return windows
+
+
+transcript_index = TranscriptIndex()
@@ -0,0 +1,89 @@
+# app/services/video_info.py
+import os
+import copy
+import time
+import threading
+from urllib.parse import urlparse, parse_qs
+from yt_dlp import YoutubeDL
+from app.services.metrics import span, tag_span
+
+VIDEO_INFO_TTL = int(os.getenv("VIDEO_INFO_TTL", "1800"))  # used when the format URLs carry no expiry
+VIDEO_INFO_MAX_ENTRIES = int(os.getenv("VIDEO_INFO_MAX_ENTRIES", "64"))
+EXPIRY_MARGIN = 300  # stop reusing signed URLs a few minutes before they run out
+
+_infos = {}  # video_id -> (expires_at, info)
+_resolving = {}  # video_id -> lock, so one job resolves while the others wait
+_lock = threading.Lock()
+
+
+def resolve_video_info(youtube_url, video_id):
+    """Extracts a video's info once and shares it until its format URLs expire.
+
+    The result is yt-dlp's unprocessed info (process=False), shared and not to
+    be modified: each stage runs its own format selection on a copy with
+    process_video_info, so the extractor runs only once per video.
+    """
+    info = _cached(video_id)
+    if info is not None:
+        return info
+
+    with _lock:
+        video_lock = _resolving.setdefault(video_id, threading.Lock())
+
+    with video_lock, span("metadata"):
+        info = _cached(video_id)
+        if info is not None:
+            tag_span(cache="hit")  # another job resolved it while this one waited
+            return info
+
+        tag_span(cache="miss")
+        with YoutubeDL({'quiet': True}) as ydl:
+            info = ydl.sanitize_info(ydl.extract_info(youtube_url, download=False, process=False))
+
+        with _lock:
+            _prune()
+            _infos[video_id] = (time.time() + url_lifetime(info), info)
+            _resolving.pop(video_id, None)
+
+    return info
+
+
+def prime_video_info(video_id, info, ttl=None):
+    """Stores already known info, e.g. a local media fixture in the benchmarks."""
+    with _lock:
+        _prune()
+        _infos[video_id] = (time.time() + (ttl if ttl is not None else url_lifetime(info)), info)
+
+
+def process_video_info(ydl, info, download=True):
+    # process_ie_result mutates the dict, every stage gets its own copy
+    return ydl.process_ie_result(copy.deepcopy(info), download=download)
+
+
+def url_lifetime(info):
+    expiries = []
+    for fmt in info.get("formats") or []:
+        expire = parse_qs(urlparse(fmt.get("url") or "").query).get("expire")
+        if expire and expire[0].isdigit():
+            expiries.append(int(expire[0]))
+
+    if not expiries:
+        return VIDEO_INFO_TTL
+    return max(0, min(expiries) - time.time() - EXPIRY_MARGIN)
+
+
+def _cached(video_id):
+    with _lock:
+        entry = _infos.get(video_id)
+        if entry and entry[0] > time.time():
+            return entry[1]
+    return None
+
+
+def _prune():
+    # Caller holds _lock
+    now = time.time()
+    for video_id in [video_id for video_id, (expires_at, _) in _infos.items() if expires_at <= now]:
+        del _infos[video_id]
+    while len(_infos) >= VIDEO_INFO_MAX_ENTRIES:
+        del _infos[min(_infos, key=lambda video_id: _infos[video_id][0])]
@@ -2,24 +2,54 @@
 import os
 import time
 import json
+import numpy as np
 from flask import g
-from yt_dlp import YoutubeDL
 from app.routes.sse_stream import send_event
+from app.utils.video_tools import ProgressReporter
+from app.services.cache import cache, artifact_key, atomic_write_json
+from app.services.locks import producing
+from app.services.download_budget import download_budget
+from app.services.video_info import resolve_video_info, process_video_info
+from app.services.executors import run_cpu_bound
+from app.utils.ffmpeg_tools import stream_pcm, encode_pcm
+from app.utils.download_tools import accelerated_ydl
+
+AUDIO_ARGS = ['-c:a', 'libopus', '-b:a', '32k', '-ac', '1', '-ar', '16000']
+AUDIO_KEY = artifact_key(codec="opus", args=AUDIO_ARGS)
+
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 30
+VAD_BLOCK_FRAMES = 2000  # frames decoded and measured at a time, a minute of audio
+VAD_MARGIN_DB = float(os.getenv("VAD_MARGIN_DB", "12"))  # above the noise floor counts as speech
+VAD_FLOOR_DB = float(os.getenv("VAD_FLOOR_DB", "-50"))  # never treat quieter frames as speech
+VAD_MIN_SILENCE = float(os.getenv("VAD_MIN_SILENCE", "1.0"))  # shorter pauses stay in
+VAD_PADDING = float(os.getenv("VAD_PADDING", "0.25"))  # kept around every speech region
+VAD_KEY = artifact_key(margin=VAD_MARGIN_DB, floor=VAD_FLOOR_DB, min_silence=VAD_MIN_SILENCE,
+                       padding=VAD_PADDING, frame=VAD_FRAME_MS, args=AUDIO_ARGS)
 
 def download_audio(youtube_url):
+    # Workers sharing the cache download a video's audio once, the others wait and find it cached
+    with producing(g.base_dir, "audio"):
+        return fetch_audio(youtube_url)
+
+
+def fetch_audio(youtube_url):
     start_time = time.time()    
 
     DOWNLOAD_DIR = g.base_dir
     audio_path = os.path.join(DOWNLOAD_DIR, f'audio.opus')
-    
-    if os.path.exists(audio_path):
+    meta_data_path = os.path.join(DOWNLOAD_DIR, "metadata.json")
+
+    # Files from before the manifest are trusted only when the metadata was written after them
+    legacy_audio = audio_path if os.path.exists(meta_data_path) else None
+
+    if cache.lookup(g.video_id, "audio", AUDIO_KEY, path=legacy_audio):
         send_event(f"[DONE] File found in the local cache")
                 
         # check if metadata also exists
         send_event(f"[INFO] Checking if metadata also exists")
-        meta_data_path = os.path.join(DOWNLOAD_DIR, "metadata.json")
         
-        if os.path.exists(meta_data_path):
+        if cache.lookup(g.video_id, "metadata", AUDIO_KEY, path=meta_data_path):
             send_event(f"[DONE] Metadata found in the local memory")
             
             with open(meta_data_path, "r", encoding='utf-8') as f:
@@ -30,19 +60,13 @@ def download_audio(youtube_url):
         send_event(f"[INFO] Metadata not found in cache proceeding to fetch from url")
         
         # Get metadata without downloading again
-        ydl_opts = {
-            'quiet': True,            
-            'skip_download': True,
-        }
-
         send_event(f"[INFO] Extracting metadata from the URL")        
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
+        info = resolve_video_info(youtube_url, g.video_id)
 
         # Return metadata + cached file path and size
         send_event(f"[DONE] Successfully extracted metadata from the URL")
         end_time = time.time()
-        return {
+        metadata = {
             "title": info.get("title"),
             "duration": info.get("duration"),
             "file_path": audio_path,
@@ -50,8 +74,12 @@ def download_audio(youtube_url):
             "downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
             "time_taken": round(end_time - start_time, 2),
         }
+        atomic_write_json(meta_data_path, metadata, indent=2, ensure_ascii=False)
+        cache.record(g.video_id, "metadata", AUDIO_KEY, meta_data_path)
+        return metadata
 
     # If file doesn't exist, download the audio file
+    reporter = ProgressReporter("Audio")
     ydl_opts = {
         'format': 'bestaudio[acodec=opus][abr<=55]/bestaudio[acodec=opus][abr<=75]/bestaudio',
         'outtmpl': f'{DOWNLOAD_DIR}/audio.%(ext)s',
@@ -59,19 +87,16 @@ def download_audio(youtube_url):
             'key': 'FFmpegExtractAudio',
             'preferredcodec': 'opus',
         }],
-        'postprocessor_args': [
-            '-c:a', 'libopus',
-            '-b:a', '32k',
-            '-ac', '1',
-            '-ar', '16000',
-        ],
+        'postprocessor_args': AUDIO_ARGS,
         'prefer_ffmpeg': True,
+        'progress_hooks': [reporter.ytdlp_hook],
+        'postprocessor_hooks': [reporter.postprocessor_hook],
         'quiet': True
     }
 
     send_event("[INFO] Downloading with the best format, will incurr some time")
-    with YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(youtube_url, download=True)
+    with download_budget.connections() as connections, accelerated_ydl(ydl_opts, connections, download_budget.bandwidth) as ydl:
+        info = process_video_info(ydl, resolve_video_info(youtube_url, g.video_id))
         file_path = os.path.splitext(ydl.prepare_filename(info))[0] + ".opus"
         
         send_event("[DONE] Audio downloaded successfully.")
@@ -88,8 +113,212 @@ def download_audio(youtube_url):
         }
 
         # Save metadata to JSON file
-        metadata_file = os.path.join(DOWNLOAD_DIR, "metadata.json")
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        cache.record(g.video_id, "audio", AUDIO_KEY, file_path)
+        atomic_write_json(meta_data_path, metadata, indent=2, ensure_ascii=False)
+        cache.record(g.video_id, "metadata", AUDIO_KEY, meta_data_path)
+
+        return metadata
+
+def plan_chunks(duration, silences, chunk_length=600, overlap=5, search_window=60):
+    """Splits [0, duration] into overlapping chunks cut in the middle of silences.
+
+    Each chunk keeps the part between its two cut points (keep_from/keep_to);
+    the overlap on either side is only there so words at the edge are heard whole.
+    """
+    cuts = [0.0]
+    position = 0.0
+    while duration - position > chunk_length:
+        target = position + chunk_length
+        candidates = [(start + end) / 2 for start, end in silences
+                      if abs((start + end) / 2 - target) <= search_window]
+        cut = min(candidates, key=lambda c: abs(c - target)) if candidates else target
+        if cut <= position:
+            cut = target
+        cuts.append(cut)
+        position = cut
+    cuts.append(float(duration))
+
+    return [
+        {
+            "index": index,
+            "start": max(0.0, keep_from - overlap),
+            "end": min(float(duration), keep_to + overlap),
+            "keep_from": keep_from,
+            "keep_to": keep_to,
+        }
+        for index, (keep_from, keep_to) in enumerate(zip(cuts, cuts[1:]))
+    ]
+
+
+def stitch_segments(chunk_segments, dedupe=True):
+    """Merges [(chunk, segments), ...] back onto the original timeline.
+
+    Segment times are shifted by the chunk offset and a segment is kept only by
+    the chunk whose keep range holds its midpoint, which drops the copies
+    transcribed twice inside the overlaps. Works for word timings too, pass
+    dedupe=False there so a repeated word is not mistaken for a copy.
+    """
+    stitched = []
+    last_chunk = max((chunk["index"] for chunk, _ in chunk_segments), default=0)
+
+    for chunk, segments in sorted(chunk_segments, key=lambda item: item[0]["index"]):
+        for segment in segments:
+            start = round(segment["start"] + chunk["start"], 2)
+            end = round(segment["end"] + chunk["start"], 2)
+            middle = (start + end) / 2
+            if middle < chunk["keep_from"]:
+                continue
+            if middle >= chunk["keep_to"] and chunk["index"] != last_chunk:
+                continue
+
+            if dedupe and stitched and stitched[-1]["text"].strip() == segment["text"].strip() and start - stitched[-1]["start"] < 1:
+                continue
+            stitched.append({**segment, "start": start, "end": end})
+
+    return stitched
+
+
+def trim_silence(audio_path, video_id):
+    """Writes a speech-only copy of the audio and the table mapping it back.
+
+    Returns {"path", "remap", "kept", "total"}, None when nothing worth
+    cutting was found or the audio could not be decoded.
+    """
+    speech_path = os.path.join(g.base_dir, "speech.opus")
+    remap_path = os.path.join(g.base_dir, "speech_remap.json")
+    speech_key = artifact_key(audio=cache.key_of(video_id, "audio"), vad=VAD_KEY)
+
+    if cache.lookup(video_id, "speech", speech_key) and cache.lookup(video_id, "speech_remap", speech_key):
+        with open(remap_path, "r", encoding="utf-8") as f:
+            trimmed = json.load(f)
+        send_event("[DONE] Using the cached speech-only audio")
+        return {**trimmed, "path": speech_path}
+
+    send_event("[INFO] Looking for silence to cut before transcription")
+    frame = int(VAD_SAMPLE_RATE * VAD_FRAME_MS / 1000)
+    block_size = frame * 2 * VAD_BLOCK_FRAMES  # whole frames of 16-bit samples
+    levels = []
+    sample_count = 0
+    try:
+        # Only the frame levels stay in memory, never the decoded audio
+        for block in stream_pcm(audio_path, VAD_SAMPLE_RATE, block_size):
+            samples = np.frombuffer(block, dtype=np.int16)
+            levels.append(run_cpu_bound(frame_levels, samples, frame))
+            sample_count += len(samples)
+    except (RuntimeError, OSError):
+        sample_count = 0
+    if not sample_count:
+        send_event("[WARN] Could not decode the audio, transcribing it untrimmed")
+        return None
+
+    total = sample_count / VAD_SAMPLE_RATE
+    regions = run_cpu_bound(detect_speech, np.concatenate(levels), frame, VAD_SAMPLE_RATE, total)
+    kept = sum(end - start for start, end in regions)
+    if not regions or total - kept < VAD_MIN_SILENCE:
+        send_event("[INFO] No silence worth cutting, transcribing the full audio")
+        return None
+
+    # A second decode feeds the encoder the kept regions as they go by
+    try:
+        encoded = encode_pcm(kept_samples(stream_pcm(audio_path, VAD_SAMPLE_RATE, block_size), regions),
+                             VAD_SAMPLE_RATE, speech_path, AUDIO_ARGS)
+    except (RuntimeError, OSError):
+        encoded = False
+    if not encoded:
+        send_event("[WARN] Could not write the speech-only audio, transcribing it untrimmed")
+        return None
+
+    trimmed = {"remap": build_remap(regions), "kept": round(kept, 2), "total": round(total, 2)}
+    atomic_write_json(remap_path, trimmed)
+    cache.record(video_id, "speech", speech_key, speech_path)
+    cache.record(video_id, "speech_remap", speech_key, remap_path)
+    send_event(f"[DONE] Cut {total - kept:.0f}s of silence, {kept:.0f}s of {total:.0f}s left to transcribe")
+    return {**trimmed, "path": speech_path}
+
+
+def frame_levels(samples, frame):
+    """RMS level in dB of every whole `frame` samples of 16-bit audio."""
+    frames = len(samples) // frame
+    chunk = samples[:frames * frame].astype(np.float32).reshape(-1, frame) / 32768.0
+    return (10 * np.log10(np.mean(chunk * chunk, axis=1) + 1e-10)).astype(np.float32)
+
+
+def detect_speech(levels, frame, sample_rate, duration, margin_db=VAD_MARGIN_DB,
+                  floor_db=VAD_FLOOR_DB, min_silence=VAD_MIN_SILENCE, padding=VAD_PADDING):
+    """Energy VAD: returns [(start, end), ...] seconds of the regions worth keeping.
+
+    `levels` are the frame levels from frame_levels(). A frame is speech when
+    its level is `margin_db` above the recording's noise floor (10th
+    percentile) and above `floor_db`. Pauses shorter than `min_silence` are
+    kept, every region is padded by `padding` on both sides.
+    """
+    if len(levels) == 0:
+        return []
+
+    threshold = max(float(np.percentile(levels, 10)) + margin_db, floor_db)
+    voiced = levels > threshold
+    if not voiced.any():
+        return []
+
+    # Rising and falling edges of the voiced mask give the speech runs
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1) * frame / sample_rate
+    ends = np.flatnonzero(edges == -1) * frame / sample_rate
+
+    regions = []
+    for start, end in zip(starts, ends):
+        start, end = max(0.0, start - padding), min(duration, end + padding)
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+    return [(round(float(start), 3), round(float(end), 3)) for start, end in regions]
+
+
+def kept_samples(blocks, regions, sample_rate=VAD_SAMPLE_RATE):
+    """Yields the bytes of 16-bit PCM `blocks` that fall inside the sorted `regions`, in order."""
+    bounds = [(int(start * sample_rate) * 2, int(end * sample_rate) * 2) for start, end in regions]
+    index = 0
+    position = 0  # byte offset of the current block in the decoded audio
+    for block in blocks:
+        block_end = position + len(block)
+        while index < len(bounds) and bounds[index][0] < block_end:
+            start, end = bounds[index]
+            piece = block[max(start - position, 0):min(end, block_end) - position]
+            if piece:
+                yield piece
+            if end > block_end:
+                break  # the region goes on in the next block
+            index += 1
+        position = block_end
+
+
+def build_remap(regions):
+    """[[trimmed_start, original_start, length], ...] for each kept region, in order."""
+    table = []
+    position = 0.0
+    for start, end in regions:
+        table.append([round(position, 3), start, round(end - start, 3)])
+        position += end - start
+    return table
+
+
+def remap_segments(segments, remap):
+    """Moves segment times from the trimmed audio back onto the original timeline."""
+    if not segments or not remap:
+        return segments
+
+    table = np.asarray(remap, dtype=np.float64)
+
+    def original(times):
+        times = np.asarray(times, dtype=np.float64)
+        region = np.clip(np.searchsorted(table[:, 0], times, side="right") - 1, 0, len(table) - 1)
+        offset = np.clip(times - table[region, 0], 0, table[region, 2])
+        return np.round(table[region, 1] + offset, 2)
 
-        return metadata
\ No newline at end of file
+    starts = original([segment["start"] for segment in segments])
+    ends = original([segment["end"] for segment in segments])
+    return [
+        {**segment, "start": float(start), "end": float(max(end, start))}
+        for segment, start, end in zip(segments, starts, ends)
+    ]
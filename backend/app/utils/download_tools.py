@@ -0,0 +1,278 @@
+# app/utils/download_tools.py
+import os
+import json
+import time
+import queue
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+from yt_dlp import YoutubeDL
+
+DOWNLOAD_ACCELERATE = os.getenv("DOWNLOAD_ACCELERATE", "true").lower() in ("1", "true", "yes")
+DOWNLOAD_RANGE_SIZE = int(float(os.getenv("DOWNLOAD_RANGE_MB", "4")) * 1024 * 1024)  # YouTube throttles ranges past ~10MB
+DOWNLOAD_RANGE_RETRIES = int(os.getenv("DOWNLOAD_RANGE_RETRIES", "5"))
+DOWNLOAD_TIMEOUT = float(os.getenv("DOWNLOAD_TIMEOUT", "30"))
+READ_BLOCK = 64 * 1024
+MAX_REDIRECTS = 5
+
+
+class RangeNotSupported(OSError):
+    pass
+
+
+def accelerated_ydl(ydl_opts, connections, bandwidth=None):
+    """YoutubeDL downloading over up to `connections` connections, paying `bandwidth` for every block.
+
+    DASH/HLS formats fetch that many fragments at once, plain HTTP formats of
+    known size are split into ranges (see RangeDownload); partial files stay
+    in the output directory and are resumed by the next attempt.
+    """
+    opts = {
+        **ydl_opts,
+        'concurrent_fragment_downloads': connections,
+        'continuedl': True,
+        'retries': 10,
+        'fragment_retries': 10,
+    }
+    if bandwidth is not None:
+        opts['progress_hooks'] = [*ydl_opts.get('progress_hooks', []), bandwidth.progress_hook()]
+    if not DOWNLOAD_ACCELERATE:
+        # Still the subclass, it finishes range downloads left from when acceleration was on
+        return AcceleratedYoutubeDL({**opts, 'concurrent_fragment_downloads': 1}, connections=1)
+    return AcceleratedYoutubeDL(opts, connections=connections)
+
+
+class AcceleratedYoutubeDL(YoutubeDL):
+    """Routes plain HTTP downloads of known size through RangeDownload.
+
+    Everything else (fragments, sections cut by ffmpeg, proxies, unknown
+    sizes) goes to yt-dlp's own downloaders, as does a server that ignores
+    range requests.
+    """
+
+    def __init__(self, params=None, connections=1, **kwargs):
+        super().__init__(params, **kwargs)
+        self.connections = connections
+
+    def dl(self, name, info, subtitle=False, test=False):
+        size = info.get("filesize")
+        # A .part with ranges still missing is full size, yt-dlp would take it as complete
+        resuming = os.path.exists(f"{name}.part.ranges")
+        if (test or subtitle or name == "-" or (self.connections < 2 and not resuming) or not hasattr(os, "pwrite")
+                or info.get("protocol") not in ("http", "https") or not info.get("url")
+                or not size or size < 2 * DOWNLOAD_RANGE_SIZE
+                or "section_start" in info or self.params.get("proxy")):
+            return super().dl(name, info, subtitle, test)
+
+        headers = dict(info.get("http_headers") or {})
+        cookies = self.cookiejar.get_cookie_header(info["url"])
+        if cookies:
+            headers["Cookie"] = cookies
+
+        download = RangeDownload(info["url"], headers, name, size, self.connections,
+                                 resource=info.get("format_id"), on_progress=self.report_range_progress)
+        try:
+            download.run()
+        except RangeNotSupported as e:
+            self.report_warning(f"{e}, downloading over a single connection")
+            return super().dl(name, info, subtitle, test)
+        return True, True
+
+    def report_range_progress(self, progress):
+        for hook in self._progress_hooks:
+            hook(progress)
+
+
+class RangeDownload:
+    """Fetches one HTTP resource over several keep-alive connections, a range at a time.
+
+    Ranges land in `<path>.part` at their offsets, finished ones are listed in
+    `<path>.part.ranges`, so an interrupted download only fetches the ranges
+    still missing, even from a fresh (re-signed) URL. The file is renamed to
+    `path` once complete.
+    """
+
+    def __init__(self, url, headers, path, size, connections, resource=None, on_progress=None,
+                 range_size=DOWNLOAD_RANGE_SIZE):
+        self.url = url
+        self.headers = headers
+        self.path = path
+        self.size = size
+        self.connections = connections
+        self.resource = resource
+        self.on_progress = on_progress
+        self.range_size = range_size
+        self.part_path = f"{path}.part"
+        self.ranges_path = f"{self.part_path}.ranges"
+        self.lock = threading.Lock()
+        self.failed = threading.Event()
+        self.errors = []
+
+    def run(self):
+        done = self.load_done()
+        pending = queue.SimpleQueue()
+        for start in range(0, self.size, self.range_size):
+            if start not in done:
+                pending.put((start, min(start + self.range_size, self.size) - 1))
+        self.done = done
+        self.downloaded = sum(min(self.range_size, self.size - start) for start in done)
+        self.resumed = self.downloaded
+        self.started = time.monotonic()
+
+        fd = os.open(self.part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, self.size)
+            workers = [threading.Thread(target=self.fetch_ranges, args=(fd, pending), daemon=True,
+                                        name=f"range-{index}")
+                       for index in range(min(self.connections, pending.qsize()))]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            os.close(fd)
+
+        if self.errors:
+            unsupported = [error for error in self.errors if isinstance(error, RangeNotSupported)]
+            if unsupported:
+                # The caller starts over with a single connection, which must not resume this file
+                self.discard()
+                raise unsupported[0]
+            raise self.errors[0]
+        os.replace(self.part_path, self.path)
+        self.discard()
+        self.report("finished")
+
+    def discard(self):
+        for path in (self.part_path, self.ranges_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def load_done(self):
+        # Ranges only count for the same format, size and range size, and while the .part is still there
+        try:
+            with open(self.ranges_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return set()
+        if (not os.path.exists(self.part_path) or state.get("size") != self.size
+                or state.get("resource") != self.resource or state.get("range_size") != self.range_size):
+            return set()
+        return set(state.get("done", []))
+
+    def fetch_ranges(self, fd, pending):
+        connection = Connection()
+        try:
+            while not self.failed.is_set():
+                try:
+                    start, end = pending.get_nowait()
+                except queue.Empty:
+                    return
+                if self.fetch(connection, fd, start, end):
+                    self.finish_range(start)
+        except BaseException as e:
+            # Progress hooks raise to cancel; the first error stops every connection
+            self.errors.append(e)
+            self.failed.set()
+        finally:
+            connection.close()
+
+    def fetch(self, connection, fd, start, end):
+        """True once bytes start..end are written, False when another connection failed first."""
+        position = start
+        for attempt in range(DOWNLOAD_RANGE_RETRIES + 1):
+            try:
+                response = connection.get(self.url, {**self.headers, "Range": f"bytes={position}-{end}"})
+                if response.status != 206:
+                    response.read()
+                    if response.status == 200:
+                        raise RangeNotSupported("Server ignored the range request")
+                    raise OSError(f"HTTP {response.status} for bytes {position}-{end}")
+                while position <= end:
+                    if self.failed.is_set():
+                        return False
+                    block = response.read(min(READ_BLOCK, end - position + 1))
+                    if not block:
+                        break
+                    os.pwrite(fd, block, position)
+                    position += len(block)
+                    self.advance(len(block))
+                if position > end:
+                    return True
+                raise OSError(f"Connection closed at byte {position} of range {start}-{end}")
+            except RangeNotSupported:
+                raise
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                if attempt == DOWNLOAD_RANGE_RETRIES:
+                    raise OSError(f"Range {start}-{end} failed after {attempt + 1} attempts: {e}") from e
+                # Continue from the last byte written, not from the start of the range
+                time.sleep(min(2 ** attempt, 10) * 0.5)
+
+    def finish_range(self, start):
+        with self.lock:
+            self.done.add(start)
+            state = {"resource": self.resource, "size": self.size, "range_size": self.range_size,
+                     "done": sorted(self.done)}
+            tmp_path = f"{self.ranges_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.ranges_path)
+
+    def advance(self, amount):
+        with self.lock:
+            self.downloaded += amount
+        self.report("downloading")
+
+    def report(self, status):
+        if self.on_progress is None:
+            return
+        elapsed = time.monotonic() - self.started
+        downloaded = self.downloaded
+        speed = (downloaded - self.resumed) / elapsed if elapsed > 0 else None
+        self.on_progress({
+            "status": status,
+            "filename": self.path,
+            "tmpfilename": self.part_path,
+            "downloaded_bytes": downloaded,
+            "resumed_bytes": self.resumed,
+            "total_bytes": self.size,
+            "elapsed": elapsed,
+            "speed": speed,
+            "eta": (self.size - downloaded) / speed if speed else None,
+        })
+
+
+class Connection:
+    """One keep-alive HTTP connection, reopened when a redirect or error moves it to another host."""
+
+    def __init__(self):
+        self.conn = None
+        self.origin = None
+
+    def get(self, url, headers):
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            origin = (parts.scheme, parts.netloc)
+            if self.conn is None or self.origin != origin:
+                self.close()
+                connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                self.conn = connection_class(parts.netloc, timeout=DOWNLOAD_TIMEOUT)
+                self.origin = origin
+
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+            self.conn.request("GET", path, headers={**headers, "Connection": "keep-alive"})
+            response = self.conn.getresponse()
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                response.read()
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            return response
+        raise OSError(f"Too many redirects for {url}")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
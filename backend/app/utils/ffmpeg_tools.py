@@ -0,0 +1,322 @@
+# app/utils/ffmpeg_tools.py
+# Plain functions only: these run inside the clip process pool.
+import os
+import json
+import bisect
+import shutil
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+CLIP_WORKERS = int(os.getenv("CLIP_WORKERS", str(min(4, os.cpu_count() or 1))))
+FRAME_TOLERANCE = 0.04  # edges closer than about a frame to a keyframe need no re-encode
+ENCODE_ARGS = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "23"]
+X264_PROFILES = {"constrained baseline": "baseline", "baseline": "baseline", "main": "main", "high": "high",
+                 "high 10": "high10", "high 4:2:2": "high422", "high 4:4:4 predictive": "high444"}
+
+_pool = None
+
+
+def get_clip_pool():
+    global _pool
+    if _pool is None:
+        # spawn keeps the workers clear of locks held by the server's threads
+        _pool = ProcessPoolExecutor(max_workers=CLIP_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def cut_clip(source_path, start, end, output_path):
+    """Cuts [start, end] out of a local file, stream copy first and re-encode as fallback."""
+    # ffmpeg writes a temp name, the clip only appears under its real name when complete
+    root, ext = os.path.splitext(output_path)
+    part_path = f"{root}.part{ext}"
+    base = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-ss", f"{start:.3f}", "-i", source_path, "-t", f"{end - start:.3f}"]
+
+    copy_cmd = base + ["-c", "copy", "-avoid_negative_ts", "make_zero",
+                       "-movflags", "+faststart", part_path]
+    result = subprocess.run(copy_cmd, capture_output=True, text=True)
+    if result.returncode == 0 and os.path.exists(part_path) and os.path.getsize(part_path) > 0:
+        os.replace(part_path, output_path)
+        return {"path": output_path, "mode": "copy", "error": None}
+
+    return encode_clip(source_path, start, end, output_path)
+
+
+def encode_clip(source_path, start, end, output_path):
+    """Frame-accurate cut of [start, end], the whole clip re-encoded."""
+    root, ext = os.path.splitext(output_path)
+    part_path = f"{root}.part{ext}"
+    encode_cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                  "-ss", f"{start:.3f}", "-i", source_path, "-t", f"{end - start:.3f}",
+                  *ENCODE_ARGS, "-c:a", "aac", "-b:a", "128k", "-movflags", "+faststart", part_path]
+    result = subprocess.run(encode_cmd, capture_output=True, text=True)
+    if result.returncode == 0:
+        os.replace(part_path, output_path)
+        return {"path": output_path, "mode": "encode", "error": None}
+
+    if os.path.exists(part_path):
+        os.remove(part_path)
+
+    return {"path": None, "mode": "encode", "error": result.stderr.strip()[-500:]}
+
+
+def smart_cut(source_path, start, end, output_path, keyframes, snap=0.0):
+    """Frame-accurate cut that only re-encodes the partial GOPs at the edges.
+
+    The video from the first keyframe inside [start, end] up to the frame
+    before the last one is stream copied; the bits before and after are
+    encoded with the source's profile, level and pixel format. Every piece is
+    written as MPEG-TS so it carries its own SPS/PPS, then the pieces are
+    joined with the concat demuxer. Audio is cut separately and encoded, which
+    is cheap. The result must decode cleanly with exactly the source's frames,
+    otherwise the clip is encoded whole. An edge within `snap` seconds of a
+    keyframe moves onto it and skips its encode. `keyframes` must be sorted;
+    only H.264 sources can be joined this way.
+    """
+    index = bisect.bisect_left(keyframes, start - snap)
+    if index < len(keyframes) and keyframes[index] - start <= snap:
+        start = keyframes[index]
+    index = bisect.bisect_right(keyframes, end + snap) - 1
+    if index >= 0 and end - keyframes[index] <= snap and keyframes[index] > start:
+        end = keyframes[index]
+
+    inner = keyframes[bisect.bisect_left(keyframes, start - FRAME_TOLERANCE):bisect.bisect_right(keyframes, end)]
+    stream = probe_video_stream(source_path) if len(inner) >= 2 else None
+    if not stream or stream.get("codec_name") != "h264":
+        return encode_clip(source_path, start, end, output_path)
+
+    first, last = inner[0], inner[-1]
+    has_head = first - start > FRAME_TOLERANCE
+    has_tail = end - last > FRAME_TOLERANCE
+    frames = probe_frame_times(source_path, min(start, first), end)
+    if frames is None:
+        return encode_clip(source_path, start, end, output_path)
+    # Closed GOPs: the frames shown before `last` are exactly the packets decoded before it
+    middle_frames = sum(1 for pts in frames if first <= pts < last)
+    expected = ((sum(1 for pts in frames if start <= pts < first) if has_head else 0) + middle_frames
+                + (sum(1 for pts in frames if last <= pts < end) if has_tail else 0))
+
+    root, ext = os.path.splitext(output_path)
+    part_path = f"{root}.part{ext}"
+    work_dir = tempfile.mkdtemp(dir=os.path.dirname(output_path) or ".", prefix=".smart-")
+    base = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"]
+    edge_args = [*ENCODE_ARGS, *profile_args(stream)]
+    pieces = []
+    try:
+        if has_head:
+            pieces.append((["-ss", f"{start:.6f}", "-i", source_path, "-t", f"{first - start:.6f}", *edge_args], "head"))
+        # A hair past the keyframe so the input seek cannot land on the one before it; counted
+        # packets, so the copy stops on the frame before `last` instead of duplicating it
+        pieces.append((["-ss", f"{first + 0.001:.6f}", "-i", source_path, "-frames:v", str(middle_frames),
+                        "-c:v", "copy", "-bsf:v", "h264_mp4toannexb"], "middle"))
+        if has_tail:
+            # Encoding seeks exactly, the tail starts on the keyframe the copied middle stops before
+            pieces.append((["-ss", f"{last:.6f}", "-i", source_path, "-t", f"{end - last:.6f}", *edge_args], "tail"))
+
+        list_path = os.path.join(work_dir, "pieces.txt")
+        with open(list_path, "w", encoding="utf-8") as listing:
+            for args, name in pieces:
+                piece_path = os.path.join(work_dir, f"{name}.ts")
+                result = subprocess.run(base + args + ["-an", "-sn", "-dn", "-f", "mpegts", piece_path],
+                                        capture_output=True, text=True)
+                if result.returncode != 0:
+                    raise RuntimeError(result.stderr.strip()[-500:])
+                listing.write(f"file '{piece_path}'\n")
+
+        result = subprocess.run(
+            base + ["-f", "concat", "-safe", "0", "-i", list_path,
+                    "-ss", f"{start:.6f}", "-t", f"{end - start:.6f}", "-i", source_path,
+                    "-map", "0:v", "-map", "1:a?", "-c:v", "copy", "-c:a", "aac", "-b:a", "128k",
+                    "-movflags", "+faststart", part_path],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip()[-500:])
+        decoded = count_decoded_frames(part_path)
+        if decoded != expected:
+            raise RuntimeError(f"Joined clip decodes to {decoded} frames, expected {expected}")
+        os.replace(part_path, output_path)
+        return {"path": output_path, "mode": "smart", "error": None,
+                "encoded": [name for _, name in pieces if name != "middle"]}
+    except (RuntimeError, OSError):
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        return encode_clip(source_path, start, end, output_path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def profile_args(stream):
+    """libx264 options matching the source stream, so the re-encoded edges join its copied middle."""
+    args = []
+    profile = X264_PROFILES.get((stream.get("profile") or "").lower())
+    if profile:
+        args += ["-profile:v", profile]
+    level = stream.get("level")
+    if isinstance(level, int) and level > 0:
+        args += ["-level:v", f"{level / 10:g}"]
+    if stream.get("pix_fmt"):
+        args += ["-pix_fmt", stream["pix_fmt"]]
+    return args
+
+
+def count_decoded_frames(media_path):
+    """Video frames of a file decoded in full, None when the decoder reports any error."""
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats", "-xerror", "-i", media_path,
+         "-map", "0:v:0", "-f", "null", "-progress", "pipe:1", "-"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0 or result.stderr.strip():
+        return None
+    frames = [line.partition("=")[2] for line in result.stdout.splitlines() if line.startswith("frame=")]
+    return int(frames[-1]) if frames else None
+
+
+def probe_keyframes(media_path):
+    """Sorted keyframe times of the first video stream, from packet flags without decoding."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", media_path],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    keyframes = []
+    for line in result.stdout.splitlines():
+        pts, _, flags = line.partition(",")
+        if "K" in flags and pts not in ("", "N/A"):
+            keyframes.append(float(pts))
+    return sorted(keyframes)
+
+
+def probe_video_stream(media_path):
+    """codec_name, profile, level and pix_fmt of the first video stream, None if there is none."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "stream=codec_name,profile,level,pix_fmt", "-of", "json", media_path],
+        capture_output=True, text=True
+    )
+    try:
+        streams = json.loads(result.stdout).get("streams") or []
+    except ValueError:
+        return None
+    return streams[0] if streams else None
+
+
+def probe_frame_times(media_path, start, end):
+    """Sorted presentation times of the video packets between start and end, reading only that part."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", "-read_intervals", f"{start:.6f}%{end:.6f}",
+         "-show_entries", "packet=pts_time", "-of", "csv=p=0", media_path],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return sorted(float(line.split(",")[0]) for line in result.stdout.splitlines()
+                  if line and not line.startswith("N/A"))
+
+
+def probe_duration(media_path):
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", media_path],
+        capture_output=True, text=True
+    )
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def detect_silences(audio_path, noise="-35dB", min_duration=0.5):
+    """Returns [(start, end), ...] of the silent stretches ffmpeg's silencedetect finds."""
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", "-i", audio_path,
+         "-af", f"silencedetect=noise={noise}:d={min_duration}", "-f", "null", "-"],
+        capture_output=True, text=True
+    )
+
+    silences = []
+    start = None
+    for line in result.stderr.splitlines():
+        if "silence_start:" in line:
+            start = float(line.split("silence_start:")[1].split()[0])
+        elif "silence_end:" in line and start is not None:
+            end = float(line.split("silence_end:")[1].split()[0])
+            silences.append((start, end))
+            start = None
+    return silences
+
+
+def extract_segment(source_path, start, end, output_path):
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+         "-ss", f"{start:.3f}", "-i", source_path, "-t", f"{end - start:.3f}",
+         "-c", "copy", output_path],
+        capture_output=True, text=True
+    )
+    return result.returncode == 0
+
+
+def stream_pcm(audio_path, sample_rate=16000, block_size=1 << 20):
+    """Decodes audio to mono 16-bit PCM at `sample_rate`, yielded `block_size` bytes at a time.
+
+    Only the last block may be shorter. Raises RuntimeError once the output
+    runs out if ffmpeg failed; a consumer stopping early stops ffmpeg too.
+    """
+    process = subprocess.Popen(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", audio_path,
+         "-ac", "1", "-ar", str(sample_rate), "-f", "s16le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        while True:
+            block = process.stdout.read(block_size)
+            if not block:
+                break
+            yield block
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode {os.path.basename(audio_path)} (exit code {returncode})")
+
+
+def encode_pcm(blocks, sample_rate, output_path, codec_args):
+    """Encodes mono 16-bit PCM blocks with `codec_args` as they come, written under a temp name first.
+
+    Returns False if the encoder fails; an error raised by `blocks` stops the
+    encoder and is passed on.
+    """
+    root, ext = os.path.splitext(output_path)
+    part_path = f"{root}.part{ext}"
+    ok = False
+    try:
+        with subprocess.Popen(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+             "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-i", "-",
+             *codec_args, part_path],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ) as process:
+            try:
+                for block in blocks:
+                    process.stdin.write(block)
+                process.stdin.close()
+                ok = process.wait() == 0
+            except BrokenPipeError:
+                pass  # the encoder stopped early, so it failed
+            finally:
+                if not ok:
+                    process.kill()
+    finally:
+        if not ok and os.path.exists(part_path):
+            os.remove(part_path)
+    if ok:
+        os.replace(part_path, output_path)
+    return ok
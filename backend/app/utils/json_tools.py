@@ -1,4 +1,7 @@
 # app/utils/json_tools.py
+import re
+import json
+
 def compact_transcription_format(transcription_json):
     parts = []
     for segment in transcription_json:
@@ -6,4 +9,98 @@ def compact_transcription_format(transcription_json):
         end = segment["end"]
         text = segment["text"].strip().replace("\n", " ")
         parts.append(f"{start}-{end}: {text},")
-    return " ".join(parts)
\ No newline at end of file
+    return " ".join(parts)
+
+def split_transcript_windows(transcription_json, window_seconds=600, overlap=60):
+    """Groups segments into time windows; each window also takes the next `overlap`
+    seconds so a clip crossing a window edge is still seen whole by one window."""
+    if not transcription_json:
+        return []
+
+    total = transcription_json[-1]["end"]
+    windows = []
+    window_start = 0.0
+    while window_start < total:
+        window_end = window_start + window_seconds
+        segments = [segment for segment in transcription_json
+                    if segment["end"] > window_start and segment["start"] < window_end + overlap]
+        if segments:
+            windows.append({"start": window_start, "end": min(window_end + overlap, total), "segments": segments})
+        window_start = window_end
+    return windows
+
+
+def score_window(segments, keywords=""):
+    """Cheap local guess of how lively a window is, used to skip dull windows before any LLM call."""
+    text = " ".join(segment["text"] for segment in segments).lower()
+    seconds = max(segments[-1]["end"] - segments[0]["start"], 1)
+
+    words_per_second = len(text.split()) / seconds
+    excitement = (text.count("!") + text.count("?")) / seconds * 60
+    keyword_hits = sum(text.count(word) for word in keywords.lower().replace(",", " ").split()) if keywords else 0
+
+    return words_per_second + excitement + keyword_hits * 3
+
+
+class JSONArrayStreamParser:
+    """Pulls complete objects out of a JSON array while it is still being streamed.
+
+    feed() takes the next piece of text and returns the objects of the top-level
+    array that became complete with it. Anything before the opening bracket
+    (prose, a code fence) is ignored.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.object_start = None
+
+    def feed(self, text):
+        self.buffer += text
+        objects = []
+
+        while self.pos < len(self.buffer):
+            char = self.buffer[self.pos]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"' and self.depth > 0:
+                self.in_string = True
+            elif char in "[{":
+                if char == "{" and self.depth == 1:
+                    self.object_start = self.pos
+                if self.depth > 0 or char == "[":
+                    self.depth += 1
+            elif char in "]}" and self.depth > 0:
+                self.depth -= 1
+                if char == "}" and self.depth == 1 and self.object_start is not None:
+                    parsed = self._parse(self.buffer[self.object_start:self.pos + 1])
+                    if parsed is not None:
+                        objects.append(parsed)
+                    self.object_start = None
+            self.pos += 1
+
+        # Drop what has been consumed, keep a half-received object
+        keep_from = self.object_start if self.object_start is not None else self.pos
+        self.buffer = self.buffer[keep_from:]
+        self.pos -= keep_from
+        if self.object_start is not None:
+            self.object_start = 0
+        return objects
+
+    def _parse(self, raw):
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            try:
+                parsed = json.loads(re.sub(r",(\s*[\]}])", r"\1", raw))
+            except json.JSONDecodeError:
+                return None
+        return parsed if isinstance(parsed, dict) else None
@@ -23,4 +23,20 @@ def extract_url_id(youtube_url: str) -> str | None:
     except Exception as e:
         send_event(f"[ERROR] Extracting video id: {e}")
     
-    return None
\ No newline at end of file
+    return None
+
+def is_collection_url(youtube_url: str) -> bool:
+    """Playlist and channel links, which expand to many videos."""
+    try:
+        parsed_url = urlparse(youtube_url)
+    except ValueError:
+        return False
+
+    host = parsed_url.hostname or ""
+    if "youtube" not in host:
+        return False
+
+    query = parse_qs(parsed_url.query)
+    if "list" in query and "v" not in query:
+        return True
+    return parsed_url.path.startswith(("/playlist", "/@", "/channel/", "/c/", "/user/"))
@@ -0,0 +1,169 @@
+# app/utils/transcript_store.py
+import os
+import mmap
+import json
+import struct
+import tempfile
+import numpy as np
+
+MAGIC = b"SCTR"
+VERSION = 1
+# magic, version, segment count, word count, segment text bytes, word text bytes
+HEADER = struct.Struct("<4sIIIQQ")
+
+
+class TranscriptError(ValueError):
+    """A transcript file that is not one, or is truncated or corrupt."""
+
+
+def write_transcript(path, segments, words=()):
+    """Writes segments and word timings as one columnar file, atomically.
+
+    Layout after the header: segment starts, ends (float64), text offsets
+    (uint64, count + 1), then the same three columns for words, then the
+    segment and word UTF-8 text blobs. Every column is 8-byte aligned so it
+    can be mapped straight into a NumPy array.
+    """
+    segment_text = [segment["text"].encode("utf-8") for segment in segments]
+    word_text = [word["word"].encode("utf-8") for word in words]
+
+    columns = [
+        np.array([segment["start"] for segment in segments], dtype="<f8"),
+        np.array([segment["end"] for segment in segments], dtype="<f8"),
+        text_offsets(segment_text),
+        np.array([word["start"] for word in words], dtype="<f8"),
+        np.array([word["end"] for word in words], dtype="<f8"),
+        text_offsets(word_text),
+    ]
+    segment_blob, word_blob = b"".join(segment_text), b"".join(word_text)
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(segments), len(words), len(segment_blob), len(word_blob)))
+            for column in columns:
+                f.write(column.tobytes())
+            f.write(segment_blob)
+            f.write(word_blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def text_offsets(encoded):
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(text) for text in encoded], out=offsets[1:])
+    return offsets
+
+
+class Transcript:
+    """Read-only view of a transcript file, columns are memory-mapped, not parsed.
+
+    Opening costs the same for a three-hour video as for a short one; text is
+    only decoded for the segments that are asked for. Old transcription.json
+    files open too, without word timings.
+    """
+
+    def __init__(self, starts, ends, offsets, text, word_starts, word_ends, word_offsets, word_text):
+        self.starts, self.ends, self.offsets, self.text_blob = starts, ends, offsets, text
+        self.word_starts, self.word_ends, self.word_offsets, self.word_blob = word_starts, word_ends, word_offsets, word_text
+
+    @classmethod
+    def open(cls, path):
+        if path.endswith(".json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls.from_segments(json.load(f))
+            except (ValueError, KeyError, TypeError) as e:
+                raise TranscriptError(f"{path} is not a readable transcript: {e}") from e
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise TranscriptError(f"{path} is too short to be a transcript file ({size} bytes)")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, segment_count, word_count, text_bytes, word_bytes = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise TranscriptError(f"{path} is not a transcript file")
+        # Six 8-byte columns: starts, ends and count + 1 offsets, for segments and for words
+        expected = HEADER.size + 8 * (3 * segment_count + 1 + 3 * word_count + 1) + text_bytes + word_bytes
+        if expected > len(buffer):
+            raise TranscriptError(f"{path} is truncated: {len(buffer)} bytes, the header describes {expected}")
+
+        position = HEADER.size
+        columns = []
+        for dtype, count in (("<f8", segment_count), ("<f8", segment_count), ("<u8", segment_count + 1),
+                             ("<f8", word_count), ("<f8", word_count), ("<u8", word_count + 1)):
+            columns.append(np.frombuffer(buffer, dtype=dtype, count=count, offset=position))
+            position += count * 8
+        if columns[2][-1] != text_bytes or columns[5][-1] != word_bytes:
+            raise TranscriptError(f"{path} is corrupt: its text offsets do not match the text sizes")
+        text = memoryview(buffer)[position:position + text_bytes]
+        word_text = memoryview(buffer)[position + text_bytes:position + text_bytes + word_bytes]
+        return cls(columns[0], columns[1], columns[2], text, columns[3], columns[4], columns[5], word_text)
+
+    @classmethod
+    def from_segments(cls, segments, words=()):
+        segment_text = [segment["text"].encode("utf-8") for segment in segments]
+        word_text = [word["word"].encode("utf-8") for word in words]
+        return cls(
+            np.array([segment["start"] for segment in segments], dtype="<f8"),
+            np.array([segment["end"] for segment in segments], dtype="<f8"),
+            text_offsets(segment_text), b"".join(segment_text),
+            np.array([word["start"] for word in words], dtype="<f8"),
+            np.array([word["end"] for word in words], dtype="<f8"),
+            text_offsets(word_text), b"".join(word_text),
+        )
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def has_words(self):
+        return len(self.word_starts) > 0
+
+    def text(self, index):
+        return bytes(self.text_blob[self.offsets[index]:self.offsets[index + 1]]).decode("utf-8")
+
+    def segment_range(self, start=0.0, end=None):
+        """(first, last) indexes of the segments overlapping [start, end]."""
+        first = int(np.searchsorted(self.ends, start, side="right"))
+        last = len(self) if end is None else int(np.searchsorted(self.starts, end, side="left"))
+        return first, last
+
+    def segments(self, first=0, last=None):
+        """The segment dicts the JSON transcript used to hold, optionally only a range."""
+        last = len(self) if last is None else last
+        return [
+            {"start": float(start), "end": float(end), "text": self.text(index)}
+            for index, start, end in zip(range(first, last), self.starts[first:last].tolist(), self.ends[first:last].tolist())
+        ]
+
+    def words(self, start=0.0, end=None):
+        """Word dicts overlapping [start, end]."""
+        first = int(np.searchsorted(self.word_ends, start, side="right"))
+        last = len(self.word_starts) if end is None else int(np.searchsorted(self.word_starts, end, side="left"))
+        return [
+            {"word": bytes(self.word_blob[self.word_offsets[index]:self.word_offsets[index + 1]]).decode("utf-8"),
+             "start": float(self.word_starts[index]), "end": float(self.word_ends[index])}
+            for index in range(first, last)
+        ]
+
+    def snap(self, start, end):
+        """Moves clip edges onto word boundaries so no word is cut in half.
+
+        The start moves back to the beginning of a word it falls inside (or
+        forward to the next word in a pause), the end moves to the end of the
+        last word that starts before it.
+        """
+        if not self.has_words:
+            return start, end
+
+        first = int(np.searchsorted(self.word_ends, start, side="right"))
+        last = int(np.searchsorted(self.word_starts, end, side="left")) - 1
+        if first >= len(self.word_starts) or last < first:
+            return start, end
+        return round(float(self.word_starts[first]), 2), round(float(self.word_ends[last]), 2)
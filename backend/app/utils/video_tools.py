@@ -1,22 +1,141 @@
 # app.utils.video_tools.py
+import os
 import time
+import heapq
+import itertools
 import threading
-from app.routes.sse_stream import send_event
-from flask import g
-
-def delayed_message(message="", delay=60):
-    time.sleep(delay)
-    send_event(message)
-    
-def send_event_with_delay(message="", delay=60):
-    threading.Thread(target=delayed_message, kwargs={
-        'message': message,
-        'delay': delay
-    }).start()
+import numpy as np
+from app.routes.sse_stream import send_event, current_topic
+
+PROGRESS_INTERVAL = float(os.getenv("PROGRESS_INTERVAL", "2"))  # min seconds between progress events
+
+
+class TimerScheduler:
+    """One daemon thread firing every delayed notification in the process.
+
+    Timers are grouped (by SSE topic) so a finished job can drop all of its
+    pending notifications at once instead of leaving sleeping threads behind.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()
+        self.cond = threading.Condition()
+        self.thread = None
+
+    def schedule(self, delay, fn, *args, group=None):
+        with self.cond:
+            heapq.heappush(self.heap, (time.monotonic() + delay, next(self.counter), group, fn, args))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._loop, name="timer-scheduler", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def cancel_group(self, group):
+        with self.cond:
+            self.heap = [entry for entry in self.heap if entry[2] != group]
+            heapq.heapify(self.heap)
+            self.cond.notify()
+
+    def _loop(self):
+        while True:
+            with self.cond:
+                while not self.heap or self.heap[0][0] > time.monotonic():
+                    timeout = self.heap[0][0] - time.monotonic() if self.heap else None
+                    self.cond.wait(timeout)
+                _, _, _, fn, args = heapq.heappop(self.heap)
+            try:
+                fn(*args)
+            except Exception:
+                pass
+
+
+scheduler = TimerScheduler()
+
+
+def send_event_with_delay(message="", delay=60, topic=None):
+    topic = topic or current_topic()
+    scheduler.schedule(delay, send_event, message, topic, group=topic)
+
+def cancel_delayed_events(topic):
+    scheduler.cancel_group(topic)
+
+
+class ProgressReporter:
+    """Turns progress callbacks into [PROGRESS] events, at most one per interval."""
+
+    def __init__(self, label, interval=PROGRESS_INTERVAL, topic=None):
+        self.label = label
+        self.interval = interval
+        self.topic = topic or current_topic()
+        self.last_sent = 0
+
+    def report(self, message, force=False):
+        now = time.monotonic()
+        if not force and now - self.last_sent < self.interval:
+            return
+        self.last_sent = now
+        send_event(f"[PROGRESS] {self.label}: {message}", topic=self.topic)
+
+    def ytdlp_hook(self, progress):
+        # Hook for YoutubeDL(progress_hooks=[...]) and `--progress-template %(progress)j`
+        status = progress.get("status")
+        if status == "downloading":
+            self.report(format_download_progress(progress))
+        elif status == "finished":
+            size = progress.get("total_bytes") or progress.get("downloaded_bytes")
+            self.report(f"downloaded {format_bytes(size)}", force=True)
+
+    def postprocessor_hook(self, progress):
+        if progress.get("status") == "started":
+            self.report(f"running {progress.get('postprocessor')}", force=True)
+
+
+def format_download_progress(progress):
+    downloaded = progress.get("downloaded_bytes")
+    total = progress.get("total_bytes") or progress.get("total_bytes_estimate")
+    speed = progress.get("speed")
+    eta = progress.get("eta")
+
+    parts = []
+    if downloaded and total:
+        parts.append(f"{downloaded / total * 100:.1f}% of {format_bytes(total)}")
+    elif downloaded:
+        parts.append(f"{format_bytes(downloaded)}")
+    if speed:
+        parts.append(f"at {format_bytes(speed)}/s")
+    if eta is not None:
+        parts.append(f"ETA {seconds_to_hms(eta)[:8]}")
+    return " ".join(parts) or "in progress"
+
+
+def format_bytes(size):
+    if not size:
+        return "0B"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TiB"
+
+
+def snap_to_boundaries(times, boundaries, tolerance):
+    """Moves every time onto its nearest boundary when one is within `tolerance`, in one pass."""
+    times = np.asarray(times, dtype=np.float64)
+    boundaries = np.unique(np.asarray(boundaries, dtype=np.float64))
+    if not len(boundaries) or not len(times):
+        return times
+
+    right = np.clip(np.searchsorted(boundaries, times), 0, len(boundaries) - 1)
+    left = np.clip(right - 1, 0, len(boundaries) - 1)
+    nearest = np.where(np.abs(boundaries[left] - times) <= np.abs(boundaries[right] - times),
+                       boundaries[left], boundaries[right])
+    return np.where(np.abs(nearest - times) <= tolerance, nearest, times)
+
 
 def seconds_to_hms(seconds):
     hrs = int(seconds // 3600)
     mins = int((seconds % 3600) // 60)
     secs = int(seconds % 60)
     millis = int((seconds - int(seconds)) * 1000)
-    return f"{hrs:02}:{mins:02}:{secs:02}.{millis:03}"
\ No newline at end of file
+    return f"{hrs:02}:{mins:02}:{secs:02}.{millis:03}"
@@ -0,0 +1,182 @@
+# benchmarks/download_bench.py
+# Download accelerator benchmark against the local fixture server, with every
+# connection throttled the way the YouTube CDN throttles them: one file over a
+# single connection and split into ranges, an HLS playlist fragment by
+# fragment (needs ffmpeg to cut it), an interrupted download resumed, and
+# several jobs at once sharing one connection and bandwidth budget.
+#
+#   cd backend
+#   python -m benchmarks.download_bench --size-mb 64 --rate-mb 4 --connections 4
+#   python -m benchmarks.download_bench --hls --duration 120
+#   python -m benchmarks.download_bench --jobs 4 --max-connections 8 --bandwidth-mb 20
+import os
+import copy
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline download accelerator benchmark.")
+    parser.add_argument("--size-mb", type=float, default=64, help="size of the plain HTTP fixture")
+    parser.add_argument("--rate-mb", type=float, default=4, help="per-connection throttle of the fixture server, MB/s")
+    parser.add_argument("--connections", type=int, default=4, help="connections per accelerated download")
+    parser.add_argument("--jobs", type=int, default=1, help="accelerated downloads running at once")
+    parser.add_argument("--max-connections", type=int, default=16, help="connection budget shared by the jobs")
+    parser.add_argument("--bandwidth-mb", type=float, default=0, help="bandwidth budget shared by the jobs, MB/s")
+    parser.add_argument("--interrupt-at", type=float, default=0.5, help="fraction after which the resume run stops")
+    parser.add_argument("--hls", action="store_true", help="also download an HLS fixture (needs ffmpeg)")
+    parser.add_argument("--duration", type=int, default=120, help="seconds of generated media for --hls")
+    parser.add_argument("--workdir", help="where fixtures and downloads go, a temp dir by default")
+    return parser.parse_args()
+
+
+def write_blob(path, size):
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            block = os.urandom(min(remaining, 1024 * 1024))
+            f.write(block)
+            remaining -= len(block)
+    return path
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def blob_info(video_id, url, size):
+    return {
+        "id": video_id,
+        "title": f"Download fixture {video_id}",
+        "extractor": "generic",
+        "extractor_key": "Generic",
+        "webpage_url": url,
+        "formats": [{"format_id": "blob", "url": url, "ext": "webm", "acodec": "opus", "vcodec": "none",
+                     "protocol": "http", "filesize": size}],
+    }
+
+
+def download(info, out_dir, connections, bandwidth=None, stop_at=None):
+    """Returns (seconds, path, bytes fetched in this run); stop_at cancels after that many bytes."""
+    from yt_dlp.utils import DownloadCancelled
+    from app.utils.download_tools import accelerated_ydl
+
+    fetched = {"first": None, "last": 0}
+
+    def hook(progress):
+        if progress.get("status") != "downloading":
+            return
+        done = progress.get("downloaded_bytes") or 0
+        if fetched["first"] is None:
+            fetched["first"] = done
+        fetched["last"] = max(fetched["last"], done)
+        if stop_at is not None and done >= stop_at:
+            raise DownloadCancelled("Interrupted by the benchmark")
+
+    ydl_opts = {
+        "outtmpl": os.path.join(out_dir, "%(id)s.%(ext)s"),
+        "progress_hooks": [hook],
+        "quiet": True,
+        "noprogress": True,
+    }
+    started = time.perf_counter()
+    path = None
+    try:
+        with accelerated_ydl(ydl_opts, connections, bandwidth) as ydl:
+            result = ydl.process_ie_result(copy.deepcopy(info), download=True)
+            path = ((result or {}).get("requested_downloads") or [{}])[0].get("filepath")
+    except DownloadCancelled:
+        pass
+    return time.perf_counter() - started, path, fetched["last"] - (fetched["first"] or 0)
+
+
+def report(label, seconds, size, path=None, expected=None):
+    check = ""
+    if expected is not None:
+        check = "  ok" if path and sha256(path) == expected else "  CORRUPT"
+    print(f"{label:<34} {seconds:7.2f}s  {size / seconds / 1024 / 1024:7.2f} MB/s{check}")
+
+
+def main():
+    args = parse_args()
+    # Read at import time by the app modules
+    os.environ["DOWNLOAD_ACCELERATE"] = "true"
+
+    from benchmarks.fixtures import MediaServer, generate_media, generate_hls, hls_fixture_info
+    from app.services.download_budget import Bandwidth, DownloadBudget
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="short-cutter-download-bench-")
+    fixtures_dir = os.path.join(workdir, "fixtures")
+    os.makedirs(fixtures_dir, exist_ok=True)
+    size = int(args.size_mb * 1024 * 1024)
+    blob = write_blob(os.path.join(fixtures_dir, "blob.webm"), size)
+    expected = sha256(blob)
+
+    server = MediaServer(fixtures_dir, rate=int(args.rate_mb * 1024 * 1024) or None)
+    media_url = server.start()
+    info = blob_info("blob", f"{media_url}/blob.webm", size)
+    print(f"Fixtures in {workdir}, {args.size_mb:.0f}MB at {args.rate_mb:g} MB/s per connection")
+
+    try:
+        for label, connections in (("plain http, 1 connection", 1),
+                                   (f"plain http, {args.connections} connections", args.connections)):
+            out_dir = tempfile.mkdtemp(dir=workdir)
+            seconds, path, _ = download(info, out_dir, connections)
+            report(label, seconds, size, path, expected)
+
+        out_dir = tempfile.mkdtemp(dir=workdir)
+        download(info, out_dir, args.connections, stop_at=int(size * args.interrupt_at))
+        seconds, path, fetched = download(info, out_dir, args.connections)
+        report(f"resumed after {args.interrupt_at:.0%}", seconds, size, path, expected)
+        print(f"{'':<34} fetched {fetched / size:.0%} of the file on resume")
+
+        # Slots and bucket of its own, a server running on this checkout keeps its budget
+        budget_dir = tempfile.mkdtemp(dir=workdir)
+        budget = DownloadBudget(args.max_connections,
+                                Bandwidth(int(args.bandwidth_mb * 1024 * 1024), os.path.join(budget_dir, "bandwidth.lock")),
+                                budget_dir)
+        timings = []
+
+        def job(index):
+            out_dir = tempfile.mkdtemp(dir=workdir)
+            with budget.connections(args.connections) as granted:
+                timings.append(download({**info, "id": f"blob{index}"}, out_dir, granted, budget.bandwidth))
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=job, args=(index,)) for index in range(args.jobs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        corrupt = sum(1 for _, path, _ in timings if not path or sha256(path) != expected)
+        report(f"{args.jobs} jobs sharing the budget", elapsed, size * args.jobs)
+        print(f"{'':<34} {corrupt} corrupt, budget {args.max_connections} connections, "
+              f"{args.bandwidth_mb or 'unlimited'} MB/s")
+
+        if args.hls:
+            media = generate_media(fixtures_dir, args.duration)
+            playlist = generate_hls(fixtures_dir, media["video"])
+            hls_info = hls_fixture_info("hlsfixture", media_url, playlist, fixtures_dir, args.duration)
+            hls_size = sum(os.path.getsize(os.path.join(os.path.dirname(playlist), name))
+                           for name in os.listdir(os.path.dirname(playlist)) if name.endswith(".ts"))
+            for label, connections in (("hls, 1 fragment at a time", 1),
+                                       (f"hls, {args.connections} fragments at a time", args.connections)):
+                out_dir = tempfile.mkdtemp(dir=workdir)
+                seconds, path, _ = download(hls_info, out_dir, connections)
+                report(label, seconds, hls_size)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
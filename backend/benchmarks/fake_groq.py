@@ -0,0 +1,164 @@
+# benchmarks/fake_groq.py
+# Stand-in for the Groq HTTP API: transcriptions and chat completions (plain
+# and streamed) with configurable latency and 429 answers. Point the app at it
+# with GROQ_BASE_URL.
+import re
+import json
+import time
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+AUDIO_BYTES_PER_SECOND = 4000  # the app uploads 32 kbps Opus
+SEGMENT_SECONDS = 6.0
+WORDS = ("so", "this", "is", "honestly", "the", "craziest", "part", "nobody", "expected", "what",
+         "happened", "next", "and", "everyone", "laughed", "because", "it", "was", "true")
+
+
+class FakeGroq:
+    def __init__(self, latency=0.2, jitter=0.1, rate_limit_every=0, retry_after_ms=200, stream_delay=0.01, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every  # every Nth request answers 429, 0 never
+        self.retry_after_ms = retry_after_ms
+        self.stream_delay = stream_delay
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"transcriptions": 0, "chat": 0, "chat_stream": 0, "rate_limited": 0, "requests": 0}
+        self.server = None
+
+    def start(self, host="127.0.0.1", port=0):
+        handler = type("Handler", (FakeGroqHandler,), {"fake": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True, name="fake-groq").start()
+        return f"http://{host}:{self.server.server_port}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def count(self, name, request=True):
+        with self.lock:
+            self.counts[name] += 1
+            if request:
+                self.counts["requests"] += 1
+            return self.counts["requests"]
+
+    def wait(self):
+        with self.lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+        time.sleep(delay)
+
+    def transcription(self, upload_bytes):
+        duration = max(SEGMENT_SECONDS, upload_bytes / AUDIO_BYTES_PER_SECOND)
+        segments = []
+        words = []
+        start = 0.0
+        while start < duration:
+            end = min(duration, start + SEGMENT_SECONDS)
+            with self.lock:
+                spoken = [self.random.choice(WORDS) for _ in range(12)]
+            step = (end - start) / len(spoken)
+            words.extend({"word": word, "start": round(start + index * step, 2), "end": round(start + (index + 0.8) * step, 2)}
+                         for index, word in enumerate(spoken))
+            segments.append({"id": len(segments), "start": round(start, 2), "end": round(end, 2), "text": f" {' '.join(spoken)}"})
+            start = end
+        return {"text": " ".join(segment["text"] for segment in segments), "segments": segments, "words": words,
+                "duration": round(duration, 2), "language": "english"}
+
+    def clips(self, prompt):
+        """Answers both the window prompts and the final pick with clip objects inside the transcript."""
+        times = [float(value) for value in re.findall(r"(\d+(?:\.\d+)?)-(\d+(?:\.\d+)?)", prompt) for value in value]
+        first, last = (min(times), max(times)) if times else (0.0, 300.0)
+        wanted = re.search(r"(?:exactly|up to) (\d+)", prompt)
+        count = int(wanted.group(1)) if wanted else 4
+        length = re.search(r"between (\d+) and (\d+) seconds", prompt)
+        clip_length = (int(length.group(1)) + int(length.group(2))) / 2 if length else 60
+
+        span = max(clip_length, last - first)
+        step = span / count
+        clips = []
+        for index in range(count):
+            start = first + index * step
+            end = min(last, start + clip_length) if last > start else start + clip_length
+            clips.append({
+                "title": f"Benchmark clip {index + 1}",
+                "description": "Generated by the fake Groq server.",
+                "tags": ["#bench", "#shorts", "#viral", "#test"],
+                "timestamps": [round(start, 2), round(end, 2)],
+                "hook": "You will not believe this",
+                "mood": "funny",
+                "score": 10 - index % 10,
+                "reason": "benchmark fixture",
+            })
+        return json.dumps(clips)
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    fake = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        if self.path.endswith("/audio/transcriptions"):
+            number = self.fake.count("transcriptions")
+        elif self.path.endswith("/chat/completions"):
+            number = self.fake.count("chat")
+        else:
+            return self.send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+        if self.fake.rate_limit_every and number % self.fake.rate_limit_every == 0:
+            self.fake.count("rate_limited", request=False)
+            return self.send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                                  {"retry-after-ms": str(self.fake.retry_after_ms)})
+
+        self.fake.wait()
+        if self.path.endswith("/audio/transcriptions"):
+            return self.send_json(200, self.fake.transcription(len(body)))
+
+        request = json.loads(body or b"{}")
+        prompt = "\n".join(message.get("content") or "" for message in request.get("messages", []))
+        content = self.fake.clips(prompt)
+        if request.get("stream"):
+            self.fake.count("chat_stream", request=False)
+            return self.send_stream(request.get("model"), content)
+        return self.send_json(200, {
+            "id": "chatcmpl-bench", "object": "chat.completion", "created": int(time.time()),
+            "model": request.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                      "total_tokens": (len(prompt) + len(content)) // 4},
+        })
+
+    def send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_stream(self, model, content):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        for start in range(0, len(content), 40):
+            chunk = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": {"content": content[start:start + 40]},
+                                                  "finish_reason": None}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(self.fake.stream_delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
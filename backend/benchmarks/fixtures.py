@@ -0,0 +1,185 @@
+# benchmarks/fixtures.py
+# Generated media served over local HTTP in place of YouTube. The pipeline only
+# extracts through app.services.video_info, so priming that cache with an info
+# dict pointing here keeps every stage (audio, source video, sections) offline.
+import os
+import re
+import time
+import subprocess
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from app.services.video_info import prime_video_info
+
+
+def generate_media(directory, duration):
+    """Writes a speech-like audio track and a test-pattern video with audio of `duration` seconds."""
+    os.makedirs(directory, exist_ok=True)
+    video_path = os.path.join(directory, f"video_{duration}.mp4")
+    audio_path = os.path.join(directory, f"audio_{duration}.webm")
+
+    # Bursts of tone with pauses, so silence trimming has something to cut
+    audio_source = f"sine=frequency=220:duration={duration},volume='if(lt(mod(t,8),5),1,0.001)':eval=frame"
+    if not os.path.exists(video_path):
+        run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+             "-f", "lavfi", "-i", f"testsrc2=size=640x360:rate=25:duration={duration}",
+             "-f", "lavfi", "-i", audio_source,
+             "-c:v", "libx264", "-preset", "ultrafast", "-g", "50", "-pix_fmt", "yuv420p",
+             "-c:a", "aac", "-b:a", "64k", "-shortest", "-movflags", "+faststart", video_path])
+    if not os.path.exists(audio_path):
+        run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+             "-f", "lavfi", "-i", audio_source, "-c:a", "libopus", "-b:a", "48k", audio_path])
+    return {"video": video_path, "audio": audio_path}
+
+
+def generate_hls(directory, video_path, segment_seconds=2):
+    """Cuts the fixture video into an HLS playlist of `segment_seconds` fragments, returns the playlist path."""
+    name = os.path.splitext(os.path.basename(video_path))[0]
+    hls_dir = os.path.join(directory, f"{name}_hls")
+    playlist = os.path.join(hls_dir, "index.m3u8")
+    if not os.path.exists(playlist):
+        os.makedirs(hls_dir, exist_ok=True)
+        run(["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", video_path, "-c", "copy",
+             "-f", "hls", "-hls_time", str(segment_seconds), "-hls_playlist_type", "vod",
+             "-hls_segment_filename", os.path.join(hls_dir, "segment_%04d.ts"), playlist])
+    return playlist
+
+
+def run(command):
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{command[0]} failed: {result.stderr.strip()[-500:]}")
+
+
+class MediaServer:
+    def __init__(self, directory, rate=None):
+        self.directory = directory
+        self.rate = rate  # bytes/s per connection, None for as fast as the loopback goes
+        self.server = None
+
+    def start(self, host="127.0.0.1", port=0):
+        handler = type("Handler", (RangeRequestHandler,), {"media_root": self.directory, "rate": self.rate})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True, name="fixture-media").start()
+        self.url = f"http://{host}:{self.server.server_port}"
+        return self.url
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Static files with single byte ranges, which ffmpeg needs to seek into sections.
+
+    Connections are kept alive, and `rate` throttles each one the way the
+    YouTube CDN does, which is what parallel range downloads get around.
+    """
+    media_root = None
+    rate = None
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=self.media_root, **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except (ConnectionResetError, BrokenPipeError):
+            pass  # the client cancelled a download
+
+    def send_head(self):
+        self.range_remaining = None  # the handler lives as long as the keep-alive connection
+        match = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get("Range", ""))
+        path = self.translate_path(self.path)
+        if not match or not os.path.isfile(path):
+            return super().send_head()
+
+        size = os.path.getsize(path)
+        first = int(match.group(1)) if match.group(1) else max(0, size - int(match.group(2)))
+        last = min(int(match.group(2)), size - 1) if match.group(1) and match.group(2) else size - 1
+        if first >= size:
+            self.send_error(416)
+            return None
+
+        f = open(path, "rb")
+        f.seek(first)
+        self.range_remaining = last - first + 1
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Range", f"bytes {first}-{last}/{size}")
+        self.send_header("Content-Length", str(self.range_remaining))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile):
+        remaining = self.range_remaining
+        if remaining is None and not self.rate:
+            return super().copyfile(source, outputfile)
+        started, sent = time.monotonic(), 0
+        while remaining is None or remaining > 0:
+            data = source.read(64 * 1024 if remaining is None else min(64 * 1024, remaining))
+            if not data:
+                break
+            outputfile.write(data)
+            sent += len(data)
+            if remaining is not None:
+                remaining -= len(data)
+            if self.rate:
+                delay = sent / self.rate - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+
+
+def fixture_info(video_id, media_url, media, duration):
+    """Unprocessed info dict in the shape yt-dlp extractors return, formats served locally."""
+    # Sizes are known up front like on YouTube, which lets downloads split into ranges
+    return {
+        "id": video_id,
+        "title": f"Benchmark fixture {video_id}",
+        "duration": duration,
+        "extractor": "generic",
+        "extractor_key": "Generic",
+        "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+        "formats": [
+            {"format_id": "251", "url": f"{media_url}/{os.path.basename(media['audio'])}", "ext": "webm",
+             "acodec": "opus", "vcodec": "none", "abr": 48, "protocol": "http",
+             "filesize": os.path.getsize(media["audio"])},
+            {"format_id": "18", "url": f"{media_url}/{os.path.basename(media['video'])}", "ext": "mp4",
+             "acodec": "mp4a.40.2", "vcodec": "avc1.42001E", "height": 360, "width": 640, "protocol": "http",
+             "filesize": os.path.getsize(media["video"])},
+        ],
+    }
+
+
+def hls_fixture_info(video_id, media_url, playlist_path, media_root, duration):
+    """Info dict whose only format is the HLS playlist, downloaded fragment by fragment."""
+    playlist_url = f"{media_url}/{os.path.relpath(playlist_path, media_root).replace(os.sep, '/')}"
+    return {
+        "id": video_id,
+        "title": f"Benchmark HLS fixture {video_id}",
+        "duration": duration,
+        "extractor": "generic",
+        "extractor_key": "Generic",
+        "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+        "formats": [
+            {"format_id": "hls-360", "url": playlist_url, "ext": "mp4", "acodec": "mp4a.40.2",
+             "vcodec": "avc1.42001E", "height": 360, "width": 640, "protocol": "m3u8_native"},
+        ],
+    }
+
+
+def fixture_video_ids(count, prefix="bench"):
+    # YouTube ids are 11 characters, extract_url_id and the clip route expect that shape
+    return [f"{prefix}{index:0{11 - len(prefix)}d}" for index in range(count)]
+
+
+def prime_fixtures(video_ids, media_url, media, duration):
+    for video_id in video_ids:
+        prime_video_info(video_id, fixture_info(video_id, media_url, media, duration), ttl=24 * 3600)
@@ -0,0 +1,392 @@
+# benchmarks/pipeline_bench.py
+# Offline end-to-end benchmark: the real /api/process route and pipeline run
+# against a fake Groq server and generated media served locally, nothing
+# leaves the machine. Needs ffmpeg on PATH.
+#
+#   cd backend
+#   python -m benchmarks.pipeline_bench --jobs 8 --concurrency 4 --duration 300
+#   python -m benchmarks.pipeline_bench --baseline benchmarks/results/<earlier>.json
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import http.client
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+FANOUT_TOPIC = "bench-fanout"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark.")
+    parser.add_argument("--jobs", type=int, default=8, help="videos to process, one job each")
+    parser.add_argument("--concurrency", type=int, default=4, help="submissions in flight at once")
+    parser.add_argument("--duration", type=int, default=300, help="seconds of generated media per video")
+    parser.add_argument("--clips", type=int, default=4)
+    parser.add_argument("--clip-duration", type=int, default=30)
+    parser.add_argument("--clip-mode", choices=("sections", "local"), default="local")
+    parser.add_argument("--quality", type=int, default=360)
+    parser.add_argument("--groq-latency", type=float, default=0.3, help="seconds per fake Groq response")
+    parser.add_argument("--groq-jitter", type=float, default=0.1)
+    parser.add_argument("--groq-429-every", type=int, default=0, help="answer every Nth Groq request with 429")
+    parser.add_argument("--sse-subscribers", type=int, default=200)
+    parser.add_argument("--sse-messages", type=int, default=500)
+    parser.add_argument("--job-timeout", type=float, default=900)
+    parser.add_argument("--workdir", help="where downloads and fixtures go, a temp dir by default")
+    parser.add_argument("--output", help=f"results file, {RESULTS_DIR}/<timestamp>.json by default")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    return parser.parse_args()
+
+
+def configure_environment(args, groq_url):
+    # Module level settings are read at import time, so this runs before the app is imported
+    os.environ["GROQ_BASE_URL"] = groq_url
+    os.environ["GROQ_API_KEY"] = "benchmark"
+    os.environ.setdefault("JOB_MAX_PENDING", str(max(50, args.jobs * 2)))
+    os.environ.setdefault("GROQ_CHAT_RPM", "100000")
+    os.environ.setdefault("GROQ_CHAT_TPM", "100000000")
+    os.environ.setdefault("GROQ_AUDIO_RPM", "100000")
+    os.environ.setdefault("GROQ_MAX_RETRIES", "8")
+
+
+# ---------------------- Memory ----------------------
+def process_tree_rss(pid):
+    """RSS of a process and all its descendants (download workers, ffmpeg, the clip pool)."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                total += next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+            for tid in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{tid}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, StopIteration, ValueError):
+            continue
+    return total
+
+
+class RSSSampler(threading.Thread):
+    def __init__(self, interval=0.2):
+        super().__init__(daemon=True, name="rss-sampler")
+        self.interval = interval
+        self.peak_tree = 0
+        self.peak_self = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        pid = os.getpid()
+        self.peak_tree = max(self.peak_tree, process_tree_rss(pid))
+        self.peak_self = max(self.peak_self, process_rss(pid))
+
+    def stop(self):
+        self.stopped.set()
+        self.sample()
+
+
+def process_rss(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+    except (OSError, StopIteration):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# ---------------------- HTTP helpers ----------------------
+def request_json(base_url, method, path, payload=None):
+    parsed = urlparse(base_url)
+    connection = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=60)
+    try:
+        body = json.dumps(payload).encode() if payload is not None else None
+        connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+
+def follow_events(base_url, topic, timeout, on_ready=None):
+    """Reads /api/events/<topic> until the end event; returns (data lines, seconds)."""
+    parsed = urlparse(base_url)
+    connection = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=timeout)
+    started = time.monotonic()
+    events = 0
+    try:
+        connection.request("GET", f"/api/events/{topic}", headers={"Accept": "text/event-stream"})
+        response = connection.getresponse()
+        if on_ready:
+            on_ready()
+        event = None
+        while True:
+            line = response.readline()
+            if not line:
+                break
+            line = line.decode().rstrip("\n")
+            if line.startswith("event:"):
+                event = line.split(":", 1)[1].strip()
+            elif line.startswith("data:"):
+                events += 1
+            elif line == "":
+                if event == "end":
+                    break
+                event = None
+    finally:
+        connection.close()
+    return events, time.monotonic() - started
+
+
+# ---------------------- Phases ----------------------
+def run_job(base_url, video_id, args):
+    submitted = time.monotonic()
+    status, job = request_json(base_url, "POST", "/api/process", {
+        "youtube_url": f"https://www.youtube.com/watch?v={video_id}",
+        "quality": args.quality,
+        "keywords": "",
+        "local_cache": False,
+        "clipCount": args.clips,
+        "maxDuration": args.clip_duration,
+        "clipMode": args.clip_mode,
+    })
+    if status != 202:
+        return {"video_id": video_id, "status": "rejected", "http_status": status, "error": job.get("error")}
+
+    events, _ = follow_events(base_url, job["job_id"], args.job_timeout)
+    # The stream closes just before the job records its final status
+    deadline = time.monotonic() + 30
+    while True:
+        _, final = request_json(base_url, "GET", job["status_url"])
+        if final.get("status") in ("completed", "failed", "cancelled") or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+    result = final.get("result") or {}
+    return {
+        "video_id": video_id,
+        "job_id": job["job_id"],
+        "status": final.get("status"),
+        "result_status": final.get("result_status"),
+        "error": final.get("error") or result.get("error"),
+        "latency": round(time.monotonic() - submitted, 3),
+        "queue_wait": round((final.get("started_at") or 0) - (final.get("created_at") or 0), 3),
+        "timings": final.get("timings") or {},
+        "clips": len(result.get("clips") or []),
+        "sse_events": events,
+    }
+
+
+def run_jobs(base_url, video_ids, args):
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        jobs = list(pool.map(lambda video_id: run_job(base_url, video_id, args), video_ids))
+    wall = time.monotonic() - started
+
+    completed = [job for job in jobs if job["status"] == "completed" and job.get("result_status") == 200]
+    stages = {}
+    for job in completed:
+        for stage, seconds in job["timings"].items():
+            stages.setdefault(stage, []).append(seconds)
+
+    return {
+        "wall_seconds": round(wall, 3),
+        "submitted": len(jobs),
+        "completed": len(completed),
+        "failed": len(jobs) - len(completed),
+        "jobs_per_minute": round(len(completed) / wall * 60, 3) if wall else None,
+        "latency": summarize([job["latency"] for job in completed]),
+        "queue_wait": summarize([job["queue_wait"] for job in completed]),
+        "stages": {stage: summarize(values) for stage, values in stages.items()},
+        "jobs": jobs,
+    }
+
+
+def run_fanout(base_url, subscribers, messages):
+    """Publishes `messages` events to one topic with `subscribers` clients listening."""
+    from app.routes.sse_stream import send_event, end_stream
+
+    ready = threading.Barrier(subscribers + 1)
+    results = []
+    results_lock = threading.Lock()
+
+    def listen():
+        count, seconds = follow_events(base_url, FANOUT_TOPIC, 120, on_ready=ready.wait)
+        with results_lock:
+            results.append(count)
+
+    threads = [threading.Thread(target=listen, daemon=True) for _ in range(subscribers)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    time.sleep(0.2)  # the last subscriber registers right after its headers went out
+
+    started = time.monotonic()
+    for index in range(messages):
+        # [INFO], not [PROGRESS]: slow subscribers would get progress lines coalesced
+        send_event(f"[INFO] fan-out message {index}", topic=FANOUT_TOPIC)
+    end_stream(FANOUT_TOPIC)
+    for thread in threads:
+        thread.join(timeout=120)
+    elapsed = time.monotonic() - started
+
+    delivered = sum(results)
+    return {
+        "subscribers": subscribers,
+        "messages": messages,
+        "seconds": round(elapsed, 3),
+        "delivered": delivered,
+        "expected": subscribers * (messages + 1),  # + the end event; skip warnings count as delivered lines
+        "deliveries_per_second": round(delivered / elapsed) if elapsed else None,
+        "completed_subscribers": len(results),
+    }
+
+
+# ---------------------- Reporting ----------------------
+def summarize(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def percentile(ordered, pct):
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    def pick(data, *keys):
+        for key in keys:
+            data = (data or {}).get(key)
+        return data
+
+    metrics = [("jobs/min", ("pipeline", "jobs_per_minute")),
+               ("latency p50", ("pipeline", "latency", "p50")),
+               ("latency p95", ("pipeline", "latency", "p95")),
+               ("sse deliveries/s", ("sse", "deliveries_per_second")),
+               ("peak rss MB", ("memory", "peak_tree_mb"))]
+    metrics += [(f"{stage} p50", ("pipeline", "stages", stage, "p50")) for stage in results["pipeline"]["stages"]]
+
+    lines = [f"Compared with {baseline_path} ({baseline.get('meta', {}).get('commit')}):"]
+    for label, keys in metrics:
+        old, new = pick(baseline, *keys), pick(results, *keys)
+        if old is None or new is None:
+            continue
+        change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+        lines.append(f"  {label:<22} {old:>10} -> {new:<10} {change}")
+    return "\n".join(lines)
+
+
+def main():
+    args = parse_args()
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + ".json")
+    output = os.path.abspath(output)
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+
+    sys.path.insert(0, BACKEND_DIR)
+    from benchmarks.fake_groq import FakeGroq
+
+    fake_groq = FakeGroq(latency=args.groq_latency, jitter=args.groq_jitter, rate_limit_every=args.groq_429_every)
+    configure_environment(args, fake_groq.start())
+
+    # Downloads land in <workdir>/app/downloads, like they do under backend/
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="short-cutter-bench-"))
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+
+    import logging
+    from werkzeug.serving import make_server
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    from app import create_app
+    from benchmarks.fixtures import generate_media, MediaServer, fixture_video_ids, prime_fixtures
+
+    print(f"Generating {args.duration}s fixtures in {workdir} ...")
+    media = generate_media(os.path.join(workdir, "fixtures"), args.duration)
+    media_server = MediaServer(os.path.join(workdir, "fixtures"))
+    media_url = media_server.start()
+
+    video_ids = fixture_video_ids(args.jobs)
+    prime_fixtures(video_ids, media_url, media, args.duration)
+
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True, name="app-server").start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    sampler = RSSSampler()
+    sampler.start()
+    try:
+        print(f"Running {args.jobs} jobs, {args.concurrency} at a time ...")
+        pipeline = run_jobs(base_url, video_ids, args)
+        print(f"Fanning out {args.sse_messages} events to {args.sse_subscribers} subscribers ...")
+        sse = run_fanout(base_url, args.sse_subscribers, args.sse_messages)
+    finally:
+        sampler.stop()
+        server.shutdown()
+        media_server.stop()
+        fake_groq.stop()
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "baseline", "workdir")},
+        },
+        "pipeline": pipeline,
+        "sse": sse,
+        "memory": {
+            "peak_tree_mb": round(sampler.peak_tree / 2**20, 1),
+            "peak_server_mb": round(sampler.peak_self / 2**20, 1),
+        },
+        "groq": dict(fake_groq.counts),
+    }
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print(json.dumps({key: value for key, value in pipeline.items() if key != "jobs"}, indent=2))
+    print(json.dumps({"sse": sse, "memory": results["memory"], "groq": results["groq"]}, indent=2))
+    if baseline:
+        print(compare(results, baseline))
+    print(f"Results written to {output}")
+
+    # Worker pools hold non-daemon processes
+    os._exit(0 if pipeline["failed"] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
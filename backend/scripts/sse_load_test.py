@@ -0,0 +1,147 @@
+# scripts/sse_load_test.py
+# Opens many idle event streams against a running server and reports how many
+# stayed connected and how the server's memory grew.
+#
+#   python serve.py &
+#   python scripts/sse_load_test.py --connections 10000 --hold 60 --server-pid $!
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import resource
+
+
+def server_rss(pid):
+    if not pid:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class Stats:
+    def __init__(self):
+        self.connected = 0
+        self.failed = 0
+        self.closed = 0
+        self.events = 0
+        self.keep_alives = 0
+        self.errors = {}
+
+    def fail(self, error):
+        self.failed += 1
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+
+async def hold_stream(host, port, path, stats, stop):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+        await writer.drain()
+
+        status = await reader.readline()
+        if b" 200 " not in status:
+            raise ConnectionError(status.decode(errors="replace").strip())
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+    except Exception as e:
+        stats.fail(e)
+        return
+
+    stats.connected += 1
+    try:
+        while not stop.is_set():
+            try:
+                line = await asyncio.wait_for(reader.readline(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+            if not line:
+                stats.closed += 1
+                break
+            if line.startswith(b": keep-alive"):
+                stats.keep_alives += 1
+            elif line.startswith(b"data:"):
+                stats.events += 1
+    except Exception as e:
+        stats.fail(e)
+    finally:
+        stats.connected -= 1
+        writer.close()
+
+
+async def run(args):
+    stats = Stats()
+    stop = asyncio.Event()
+    samples = []
+    baseline = server_rss(args.server_pid)
+
+    tasks = []
+    started = time.monotonic()
+    for index in range(args.connections):
+        topic = args.topic[index % len(args.topic)]
+        tasks.append(asyncio.create_task(hold_stream(args.host, args.port, f"/api/events/{topic}", stats, stop)))
+        if args.ramp and index % args.ramp == args.ramp - 1:
+            await asyncio.sleep(0.05)
+    ramp_seconds = time.monotonic() - started
+
+    deadline = time.monotonic() + args.hold
+    while time.monotonic() < deadline:
+        await asyncio.sleep(args.sample_every)
+        sample = {"t": round(time.monotonic() - started, 1), "connected": stats.connected,
+                  "server_rss": server_rss(args.server_pid)}
+        samples.append(sample)
+        print(json.dumps(sample), file=sys.stderr)
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    peak = max((sample["server_rss"] or 0 for sample in samples), default=0)
+    return {
+        "connections": args.connections,
+        "peak_connected": max((sample["connected"] for sample in samples), default=0),
+        "failed": stats.failed,
+        "closed_by_server": stats.closed,
+        "errors": stats.errors,
+        "events": stats.events,
+        "keep_alives": stats.keep_alives,
+        "ramp_seconds": round(ramp_seconds, 2),
+        "server_rss_baseline": baseline,
+        "server_rss_peak": peak or None,
+        "server_rss_per_connection": round((peak - baseline) / args.connections) if peak and baseline else None,
+        "samples": samples,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hold many idle SSE connections open against the server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--topic", action="append",
+                        help="job or batch id to listen on, repeat to spread the streams (default: global); "
+                             "the server refuses topics it does not know")
+    parser.add_argument("--hold", type=float, default=60, help="seconds to keep the streams open")
+    parser.add_argument("--ramp", type=int, default=500, help="connections opened per 50ms step, 0 for all at once")
+    parser.add_argument("--sample-every", type=float, default=5)
+    parser.add_argument("--server-pid", type=int, help="pid of the server, to sample its memory")
+    args = parser.parse_args()
+    args.topic = args.topic or ["global"]
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = args.connections + 256
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted if hard == resource.RLIM_INFINITY else min(wanted, hard), hard))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
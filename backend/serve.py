@@ -0,0 +1,110 @@
+# serve.py
+# Production entry point. gevent's WSGI server runs every connection as a
+# greenlet, so an idle event stream costs a few KB instead of an OS thread.
+# main.py stays the development server.
+from gevent import monkey
+monkey.patch_all()
+
+import os
+import socket
+import resource
+import gevent
+from gevent.pool import Pool
+from gevent.pywsgi import WSGIServer, WSGIHandler
+from gevent.socket import wait_write
+from werkzeug.wsgi import FileWrapper as WerkzeugFileWrapper
+from dotenv import load_dotenv
+
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "5000"))
+SERVER_MAX_CONNECTIONS = int(os.getenv("SERVER_MAX_CONNECTIONS", "20000"))
+SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", "2048"))
+CPU_THREADS = int(os.getenv("CPU_THREADS", str(os.cpu_count() or 2)))
+
+
+def raise_open_files_limit(wanted):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY or soft >= wanted:
+        return soft
+    limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    return limit
+
+
+class FileWrapper(WerkzeugFileWrapper):
+    """The server's wsgi.file_wrapper, marks file responses SendfileHandler can sendfile()."""
+
+
+def file_range(result):
+    """(file, offset, count) of a file response, None for anything else."""
+    if isinstance(result, FileWrapper):
+        file, offset, count = result.file, None, None
+    elif isinstance(getattr(result, "iterable", None), FileWrapper) and getattr(result, "byte_range", None) is not None:
+        # werkzeug's range wrapper around the file of a 206 response
+        file, offset, count = result.iterable.file, result.start_byte, result.byte_range
+    else:
+        return None
+    try:
+        fileno = file.fileno()
+        if offset is None:
+            offset = file.tell()
+            count = os.fstat(fileno).st_size - offset
+    except OSError:  # not a real file, e.g. BytesIO
+        return None
+    return fileno, offset, count
+
+
+class SendfileHandler(WSGIHandler):
+    """Hands file responses to os.sendfile, so clips go from the page cache to the socket without passing through Python.
+
+    gevent offers no wsgi.file_wrapper and its socket.sendfile copies through
+    Python, so this handler does both: Flask's send_file passes the wrapper
+    through untouched (inside werkzeug's range wrapper for Range requests),
+    and the kernel sends the bytes while the greenlet waits for the socket.
+    Every other response is written as usual.
+    """
+
+    def process_result(self):
+        source = file_range(self.result)
+        if source is None or self.provided_content_length is None:
+            return super().process_result()
+        fileno, offset, count = source
+        self.write(b"")  # status line and headers
+        out = self.socket.fileno()
+        sent = 0
+        try:
+            while sent < count:
+                try:
+                    done = os.sendfile(out, fileno, offset + sent, count - sent)
+                except BlockingIOError:
+                    wait_write(out, timeout=self.socket.gettimeout())
+                    continue
+                if not done:  # the file shrank under us
+                    break
+                sent += done
+        except socket.error as ex:
+            self.status = f"socket error: {ex}"
+            if self.code > 0:
+                self.code = -self.code
+            raise
+        finally:
+            self.response_length += sent
+
+
+def main():
+    load_dotenv()
+    from app import create_app
+
+    open_files = raise_open_files_limit(SERVER_MAX_CONNECTIONS + 1024)
+    # Native threads for CPU-bound steps, see app/services/executors.py
+    gevent.get_hub().threadpool.maxsize = CPU_THREADS
+
+    server = WSGIServer((SERVER_HOST, SERVER_PORT), create_app(),
+                        spawn=Pool(SERVER_MAX_CONNECTIONS), backlog=SERVER_BACKLOG,
+                        handler_class=SendfileHandler, environ={"wsgi.file_wrapper": FileWrapper})
+    print(f"Serving on http://{SERVER_HOST}:{SERVER_PORT} (max {SERVER_MAX_CONNECTIONS} connections, open files limit {open_files})")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# tests/test_json_tools.py
+import json
+import pytest
+from app.utils.json_tools import JSONArrayStreamParser
+from app.controllers.timestamps_extractor import repair_json
+
+CLIPS = [
+    {"timestamps": [12.5, 40.0], "title": "The \"big\" reveal [part 1]", "score": 9},
+    {"timestamps": [95.0, 130.25], "title": "Braces {inside} a string \\o/", "tags": {"mood": ["funny"]}},
+    {"timestamps": [300.0, 342.0], "title": "Ünïcödé ✓"},
+]
+
+
+def feed_all(parser, pieces):
+    found = []
+    for piece in pieces:
+        found.extend(parser.feed(piece))
+    return found
+
+
+def test_whole_array_in_one_piece():
+    assert feed_all(JSONArrayStreamParser(), [json.dumps(CLIPS)]) == CLIPS
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64])
+def test_objects_split_across_pieces(size):
+    text = json.dumps(CLIPS, indent=2, ensure_ascii=False)
+    pieces = [text[i:i + size] for i in range(0, len(text), size)]
+    assert feed_all(JSONArrayStreamParser(), pieces) == CLIPS
+
+
+def test_objects_come_out_as_soon_as_they_close():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"timestamps": [1, 2]}, {"timestamps"') == [{"timestamps": [1, 2]}]
+    assert parser.feed(': [3, 4]}') == [{"timestamps": [3, 4]}]
+    assert parser.feed("]") == []
+
+
+def test_prose_and_code_fence_before_the_array_are_ignored():
+    text = 'Here are the clips {as requested}:\n```json\n' + json.dumps(CLIPS[:1]) + "\n```"
+    assert feed_all(JSONArrayStreamParser(), [text]) == CLIPS[:1]
+
+
+def test_trailing_commas_are_tolerated():
+    assert feed_all(JSONArrayStreamParser(), ['[{"timestamps": [1, 2,], "title": "a",},]']) == [
+        {"timestamps": [1, 2], "title": "a"}]
+
+
+def test_unparseable_objects_are_skipped():
+    assert feed_all(JSONArrayStreamParser(), ['[{"timestamps": [1, 2]}, {oops}, {"title": "b"}]']) == [
+        {"timestamps": [1, 2]}, {"title": "b"}]
+
+
+def test_buffer_only_keeps_the_unfinished_object():
+    parser = JSONArrayStreamParser()
+    parser.feed(json.dumps(CLIPS[:2])[:-1] + ', {"title": "half')
+    assert parser.buffer == '{"title": "half'
+
+
+def test_repair_json_smart_quotes_and_trailing_commas():
+    assert repair_json("[{“title”: “a”, “timestamps”: [1, 2,],},]") == [{"title": "a", "timestamps": [1, 2]}]
+
+
+def test_repair_json_strips_prose_and_fences():
+    text = "Sure! Here you go:\n```json\n" + json.dumps(CLIPS) + "\n```\nEnjoy."
+    assert repair_json(text) == CLIPS
+
+
+def test_repair_json_still_fails_on_garbage():
+    with pytest.raises(json.JSONDecodeError):
+        repair_json("no clips today")
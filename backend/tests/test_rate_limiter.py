@@ -0,0 +1,124 @@
+# tests/test_rate_limiter.py
+import httpx
+import pytest
+from groq import APIConnectionError, APITimeoutError
+from app.services import groq as groq_service
+from app.services.rate_limiter import TokenBucket
+
+REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+@pytest.fixture(params=["memory", "file"])
+def bucket_factory(request, tmp_path):
+    def make(rate_per_minute, name="bucket"):
+        path = str(tmp_path / f"{name}.lock") if request.param == "file" else None
+        return TokenBucket(rate_per_minute, path=path)
+    return make
+
+
+def test_acquire_until_empty(bucket_factory):
+    bucket = bucket_factory(60)
+    assert all(bucket.acquire(1, timeout=0) for _ in range(60))
+    assert not bucket.acquire(1, timeout=0)
+
+
+def test_refund_gives_tokens_back(bucket_factory):
+    bucket = bucket_factory(60)
+    assert bucket.acquire(60, timeout=0)
+    bucket.refund(5)
+    assert bucket.acquire(5, timeout=0)
+    assert not bucket.acquire(1, timeout=0)
+
+
+def test_refund_never_exceeds_capacity(bucket_factory):
+    bucket = bucket_factory(60)
+    bucket.refund(1000)
+    assert bucket.acquire(60, timeout=0)
+    assert not bucket.acquire(1, timeout=0)
+
+
+def test_pause_holds_callers_back(bucket_factory):
+    bucket = bucket_factory(60)
+    bucket.pause(30)
+    assert not bucket.acquire(1, timeout=0.05)
+
+
+def test_file_buckets_share_one_quota(tmp_path):
+    path = str(tmp_path / "shared.lock")
+    first, second = TokenBucket(60, path=path), TokenBucket(60, path=path)
+    assert first.acquire(50, timeout=0)
+    assert not second.acquire(20, timeout=0)
+    assert second.acquire(10, timeout=0)
+    first.refund(10)
+    assert second.acquire(10, timeout=0)
+
+
+@pytest.fixture
+def buckets(tmp_path, monkeypatch):
+    monkeypatch.setattr(groq_service, "get_groq_client", lambda: object())
+    monkeypatch.setattr(groq_service, "GROQ_MAX_RETRIES", 0)
+    return [(TokenBucket(10, path=str(tmp_path / "requests.lock")), 1),
+            (TokenBucket(1000, path=str(tmp_path / "tokens.lock")), 400)]
+
+
+def remaining(bucket):
+    with bucket._state():
+        bucket._refill(bucket.updated)
+        return bucket.tokens
+
+
+def failing(error):
+    def request(client):
+        raise error
+    return request
+
+
+def test_connect_error_refunds_every_bucket(buckets):
+    def request(client):
+        try:
+            raise httpx.ConnectError("connection refused", request=REQUEST)
+        except httpx.ConnectError as e:
+            raise APIConnectionError(request=REQUEST) from e
+
+    with pytest.raises(APIConnectionError):
+        groq_service.call_with_retries(request, buckets)
+    assert remaining(buckets[0][0]) == pytest.approx(10, abs=0.1)
+    assert remaining(buckets[1][0]) == pytest.approx(1000, abs=1)
+
+
+def test_timeout_is_not_refunded(buckets):
+    with pytest.raises(APITimeoutError):
+        groq_service.call_with_retries(failing(APITimeoutError(request=REQUEST)), buckets)
+    assert remaining(buckets[0][0]) == pytest.approx(9, abs=0.1)
+    assert remaining(buckets[1][0]) == pytest.approx(600, abs=1)
+
+
+def test_success_keeps_the_tokens(buckets):
+    assert groq_service.call_with_retries(lambda client: "ok", buckets) == "ok"
+    assert remaining(buckets[0][0]) == pytest.approx(9, abs=0.1)
+
+
+def test_chat_estimate_reserves_prompt_and_answer(monkeypatch):
+    calls = []
+    monkeypatch.setattr(groq_service, "call_with_retries", lambda request, buckets, endpoint: calls.append(buckets))
+    messages = [{"role": "user", "content": "x" * 4000}]
+
+    groq_service.create_chat_completion(messages=messages, max_tokens=500)
+    groq_service.create_chat_completion(messages=messages, max_completion_tokens=300)
+    groq_service.create_chat_completion(messages=messages)
+    assert [tokens for (_, _), (_, tokens) in calls] == [1500, 1300, 1000 + groq_service.GROQ_CHAT_MAX_TOKENS]
+
+
+def test_chat_request_is_capped_at_what_was_reserved(monkeypatch):
+    sent = {}
+
+    class Completions:
+        def create(self, **kwargs):
+            sent.update(kwargs)
+
+    class Client:
+        chat = type("Chat", (), {"completions": Completions()})()
+
+    monkeypatch.setattr(groq_service, "call_with_retries", lambda request, buckets, endpoint: request(Client()))
+    groq_service.create_chat_completion(messages=[{"role": "user", "content": "hi"}])
+    assert sent["max_tokens"] == groq_service.GROQ_CHAT_MAX_TOKENS
@@ -0,0 +1,56 @@
+# tests/test_silence_remap.py
+import pytest
+from app.utils.audio_tools import build_remap, remap_segments
+
+REGIONS = [(2.0, 10.0), (15.5, 20.0), (30.0, 45.25)]
+
+
+def test_build_remap_lays_kept_regions_end_to_end():
+    assert build_remap(REGIONS) == [[0.0, 2.0, 8.0], [8.0, 15.5, 4.5], [12.5, 30.0, 15.25]]
+
+
+def test_build_remap_of_nothing():
+    assert build_remap([]) == []
+
+
+@pytest.mark.parametrize("trimmed, original", [
+    (0.0, 2.0),     # start of the first region
+    (5.0, 7.0),     # inside the first region
+    (8.0, 15.5),    # exactly on a boundary: the next region starts there
+    (10.0, 17.5),   # inside the second region
+    (12.5, 30.0),   # start of the last region
+    (20.0, 37.5),
+])
+def test_remap_segments_moves_times_back(trimmed, original):
+    remap = build_remap(REGIONS)
+    [segment] = remap_segments([{"start": trimmed, "end": trimmed, "text": "x"}], remap)
+    assert segment["start"] == pytest.approx(original)
+
+
+def test_remap_segments_keeps_other_fields_and_order():
+    remap = build_remap(REGIONS)
+    segments = [{"start": 1.0, "end": 3.0, "text": "a", "id": 0}, {"start": 9.0, "end": 11.0, "text": "b", "id": 1}]
+    out = remap_segments(segments, remap)
+    assert [(s["id"], s["text"], s["start"], s["end"]) for s in out] == [(0, "a", 3.0, 5.0), (1, "b", 16.5, 18.5)]
+
+
+def test_segment_crossing_a_cut_spans_the_silence():
+    # Trimmed 7..9 starts in the first region and ends in the second
+    [segment] = remap_segments([{"start": 7.0, "end": 9.0, "text": "x"}], build_remap(REGIONS))
+    assert (segment["start"], segment["end"]) == (9.0, 16.5)
+
+
+def test_times_past_the_end_are_clamped_to_the_last_region():
+    [segment] = remap_segments([{"start": 27.0, "end": 99.0, "text": "x"}], build_remap(REGIONS))
+    assert (segment["start"], segment["end"]) == (44.5, 45.25)
+
+
+def test_end_never_before_start():
+    [segment] = remap_segments([{"start": 5.0, "end": 4.0, "text": "x"}], build_remap(REGIONS))
+    assert segment["end"] >= segment["start"]
+
+
+def test_nothing_to_remap():
+    segments = [{"start": 1.0, "end": 2.0, "text": "x"}]
+    assert remap_segments(segments, []) is segments
+    assert remap_segments([], build_remap(REGIONS)) == []
@@ -0,0 +1,107 @@
+# tests/test_sse_stream.py
+import uuid
+import pytest
+from flask import Flask
+from app.routes import sse_stream
+from app.routes.sse_stream import Channel, sse_bp, get_channel, send_event, end_stream, END_EVENT
+
+
+def event_ids(items):
+    return [event_id for event_id, _, _ in items]
+
+
+def test_new_subscriber_gets_the_whole_backlog():
+    channel = Channel("t")
+    for n in range(3):
+        channel.publish(f"message {n}")
+    _, replay, missed = channel.subscribe()
+    assert event_ids(replay) == [1, 2, 3]
+    assert not missed
+
+
+def test_resume_replays_only_what_came_after_last_event_id():
+    channel = Channel("t")
+    for n in range(5):
+        channel.publish(f"message {n}")
+    _, replay, missed = channel.subscribe(last_event_id=3)
+    assert [(event_id, message) for event_id, message, _ in replay] == [(4, "message 3"), (5, "message 4")]
+    assert not missed
+
+
+def test_resume_when_up_to_date_replays_nothing():
+    channel = Channel("t")
+    channel.publish("only")
+    _, replay, missed = channel.subscribe(last_event_id=1)
+    assert replay == [] and not missed
+
+
+def test_resume_past_the_backlog_reports_missed(monkeypatch):
+    monkeypatch.setattr(sse_stream, "MAX_BACKLOG", 3)
+    channel = Channel("t")
+    for n in range(10):
+        channel.publish(f"message {n}")
+    _, replay, missed = channel.subscribe(last_event_id=2)
+    assert event_ids(replay) == [8, 9, 10]
+    assert missed
+
+
+def test_resumed_subscriber_receives_live_messages():
+    channel = Channel("t")
+    channel.publish("old")
+    subscriber, _, _ = channel.subscribe(last_event_id=1)
+    channel.publish("new")
+    items, dropped = subscriber.get(timeout=1)
+    assert [(event_id, message) for event_id, message, _ in items] == [(2, "new")] and dropped == 0
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(sse_bp, url_prefix="/api")
+    return app.test_client()
+
+
+@pytest.fixture
+def topic():
+    name = f"test-{uuid.uuid4().hex}"
+    get_channel(name)  # a live channel is a known topic
+    yield name
+    sse_stream.channels.pop(name, None)
+
+
+def read_stream(client, path, **headers):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200
+    return response.get_data(as_text=True)
+
+
+def test_stream_resumes_from_last_event_id_header(client, topic):
+    for n in range(4):
+        send_event(f"[INFO] step {n}", topic=topic)
+    end_stream(topic)
+    body = read_stream(client, f"/api/events/{topic}", **{"Last-Event-ID": "2"})
+    assert "step 0" not in body and "step 1" not in body
+    assert "id: 3\ndata: [INFO] step 2" in body
+    assert "id: 4\ndata: [INFO] step 3" in body
+    assert f"id: 5\nevent: {END_EVENT}\n" in body
+    assert "no longer available" not in body
+
+
+def test_stream_resumes_from_query_parameter(client, topic):
+    send_event("[INFO] a", topic=topic)
+    send_event("[INFO] b", topic=topic)
+    end_stream(topic)
+    body = read_stream(client, f"/api/events/{topic}?last_event_id=1")
+    assert "[INFO] a" not in body and "id: 2\ndata: [INFO] b" in body
+
+
+def test_stream_ignores_a_malformed_last_event_id(client, topic):
+    send_event("[INFO] a", topic=topic)
+    end_stream(topic)
+    assert "id: 1\ndata: [INFO] a" in read_stream(client, f"/api/events/{topic}", **{"Last-Event-ID": "abc"})
+
+
+def test_unknown_topic_is_404(client):
+    response = client.get(f"/api/events/{uuid.uuid4().hex}")
+    assert response.status_code == 404
+    assert response.get_json()["error"]
@@ -0,0 +1,91 @@
+# tests/test_transcript_store.py
+import json
+import pytest
+from app.utils.transcript_store import write_transcript, Transcript, TranscriptError, HEADER
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": "Hello there."},
+    {"start": 2.5, "end": 6.0, "text": "Ünïcödé and emoji 🎬 survive."},
+    {"start": 6.0, "end": 9.75, "text": ""},
+    {"start": 9.75, "end": 12.0, "text": "Last one."},
+]
+WORDS = [
+    {"start": 0.0, "end": 0.8, "word": "Hello"},
+    {"start": 0.9, "end": 2.5, "word": "there."},
+    {"start": 2.5, "end": 3.1, "word": "Ünïcödé"},
+]
+
+
+@pytest.fixture
+def transcript_path(tmp_path):
+    path = str(tmp_path / "transcript.bin")
+    write_transcript(path, SEGMENTS, WORDS)
+    return path
+
+
+def test_round_trip(transcript_path):
+    transcript = Transcript.open(transcript_path)
+    assert len(transcript) == len(SEGMENTS)
+    assert transcript.has_words
+    assert [transcript.text(i) for i in range(len(transcript))] == [s["text"] for s in SEGMENTS]
+    assert list(transcript.starts) == [s["start"] for s in SEGMENTS]
+    assert list(transcript.ends) == [s["end"] for s in SEGMENTS]
+    assert list(transcript.word_starts) == [w["start"] for w in WORDS]
+
+
+def test_round_trip_without_words(tmp_path):
+    path = str(tmp_path / "transcript.bin")
+    write_transcript(path, SEGMENTS)
+    transcript = Transcript.open(path)
+    assert not transcript.has_words
+    assert transcript.text(1) == SEGMENTS[1]["text"]
+
+
+def test_empty_transcript(tmp_path):
+    path = str(tmp_path / "transcript.bin")
+    write_transcript(path, [])
+    assert len(Transcript.open(path)) == 0
+
+
+def test_segment_range(transcript_path):
+    transcript = Transcript.open(transcript_path)
+    assert transcript.segment_range(3.0, 7.0) == (1, 3)
+    assert transcript.segment_range(10.0) == (3, 4)
+
+
+def test_legacy_json_transcript(tmp_path):
+    path = tmp_path / "transcription.json"
+    path.write_text(json.dumps(SEGMENTS), encoding="utf-8")
+    transcript = Transcript.open(str(path))
+    assert [transcript.text(i) for i in range(len(transcript))] == [s["text"] for s in SEGMENTS]
+
+
+@pytest.mark.parametrize("keep", [0, HEADER.size - 1, HEADER.size, HEADER.size + 40, -1])
+def test_truncated_file_is_rejected(transcript_path, keep):
+    with open(transcript_path, "rb") as f:
+        data = f.read()
+    with open(transcript_path, "wb") as f:
+        f.write(data[:keep])
+    with pytest.raises(TranscriptError):
+        Transcript.open(transcript_path)
+
+
+def test_wrong_magic_is_rejected(transcript_path):
+    with open(transcript_path, "r+b") as f:
+        f.write(b"NOPE")
+    with pytest.raises(TranscriptError, match="not a transcript"):
+        Transcript.open(transcript_path)
+
+
+def test_unreadable_json_is_rejected(tmp_path):
+    path = tmp_path / "transcription.json"
+    path.write_text('[{"start": 0', encoding="utf-8")
+    with pytest.raises(TranscriptError):
+        Transcript.open(str(path))
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    path = str(tmp_path / "transcript.bin")
+    with pytest.raises(KeyError):
+        write_transcript(path, [{"start": 0.0, "end": 1.0}])
+    assert list(tmp_path.iterdir()) == []
@@ -1,70 +0,0 @@
-(function(){const i=document.createElement("link").relList;if(i&&i.supports&&i.supports("modulepreload"))return;for(const c of document.querySelectorAll('link[rel="modulepreload"]'))u(c);new MutationObserver(c=>{for(const h of c)if(h.type==="childList")for(const f of h.addedNodes)f.tagName==="LINK"&&f.rel==="modulepreload"&&u(f)}).observe(document,{childList:!0,subtree:!0});function s(c){const h={};return c.integrity&&(h.integrity=c.integrity),c.referrerPolicy&&(h.referrerPolicy=c.referrerPolicy),c.crossOrigin==="use-credentials"?h.credentials="include":c.crossOrigin==="anonymous"?h.credentials="omit":h.credentials="same-origin",h}function u(c){if(c.ep)return;c.ep=!0;const h=s(c);fetch(c.href,h)}})();var Ho={exports:{}},dl={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var cp;function tS(){if(cp)return dl;cp=1;var a=Symbol.for("react.transitional.element"),i=Symbol.for("react.fragment");function s(u,c,h){var f=null;if(h!==void 0&&(f=""+h),c.key!==void 0&&(f=""+c.key),"key"in c){h={};for(var p in c)p!=="key"&&(h[p]=c[p])}else h=c;return c=h.ref,{$$typeof:a,type:u,key:f,ref:c!==void 0?c:null,props:h}}return dl.Fragment=i,dl.jsx=s,dl.jsxs=s,dl}var fp;function eS(){return fp||(fp=1,Ho.exports=tS()),Ho.exports}var G=eS(),Yo={exports:{}},ut={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var hp;function nS(){if(hp)return ut;hp=1;var a=Symbol.for("react.transitional.element"),i=Symbol.for("react.portal"),s=Symbol.for("react.fragment"),u=Symbol.for("react.strict_mode"),c=Symbol.for("react.profiler"),h=Symbol.for("react.consumer"),f=Symbol.for("react.context"),p=Symbol.for("react.forward_ref"),d=Symbol.for("react.suspense"),m=Symbol.for("react.memo"),g=Symbol.for("react.lazy"),S=Symbol.iterator;function b(T){return T===null||typeof T!="object"?null:(T=S&&T[S]||T["@@iterator"],typeof T=="function"?T:null)}var R={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},D=Object.assign,w={};function U(T,X,k){this.props=T,this.context=X,this.refs=w,this.updater=k||R}U.prototype.isReactComponent={},U.prototype.setState=function(T,X){if(typeof T!="object"&&typeof T!="function"&&T!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,T,X,"setState")},U.prototype.forceUpdate=function(T){this.updater.enqueueForceUpdate(this,T,"forceUpdate")};function O(){}O.prototype=U.prototype;function j(T,X,k){this.props=T,this.context=X,this.refs=w,this.updater=k||R}var _=j.prototype=new O;_.constructor=j,D(_,U.prototype),_.isPureReactComponent=!0;var Z=Array.isArray,q={H:null,A:null,T:null,S:null,V:null},P=Object.prototype.hasOwnProperty;function nt(T,X,k,Q,I,dt){return k=dt.ref,{$$typeof:a,type:T,key:X,ref:k!==void 0?k:null,props:dt}}function F(T,X){return nt(T.type,X,void 0,void 0,void 0,T.props)}function st(T){return typeof T=="object"&&T!==null&&T.$$typeof===a}function gt(T){var X={"=":"=0",":":"=2"};return"$"+T.replace(/[=:]/g,function(k){return X[k]})}var Yt=/\/+/g;function qt(T,X){return typeof T=="object"&&T!==null&&T.key!=null?gt(""+T.key):X.toString(36)}function $e(){}function Ye(T){switch(T.status){case"fulfilled":return T.value;case"rejected":throw T.reason;default:switch(typeof T.status=="string"?T.then($e,$e):(T.status="pending",T.then(function(X){T.status==="pending"&&(T.status="fulfilled",T.value=X)},function(X){T.status==="pending"&&(T.status="rejected",T.reason=X)})),T.status){case"fulfilled":return T.value;case"rejected":throw T.reason}}throw T}function Pt(T,X,k,Q,I){var dt=typeof T;(dt==="undefined"||dt==="boolean")&&(T=null);var lt=!1;if(T===null)lt=!0;else switch(dt){case"bigint":case"string":case"number":lt=!0;break;case"object":switch(T.$$typeof){case a:case i:lt=!0;break;case g:return lt=T._init,Pt(lt(T._payload),X,k,Q,I)}}if(lt)return I=I(T),lt=Q===""?"."+qt(T,0):Q,Z(I)?(k="",lt!=null&&(k=lt.replace(Yt,"$&/")+"/"),Pt(I,X,k,"",function(vn){return vn})):I!=null&&(st(I)&&(I=F(I,k+(I.key==null||T&&T.key===I.key?"":(""+I.key).replace(Yt,"$&/")+"/")+lt)),X.push(I)),1;lt=0;var he=Q===""?".":Q+":";if(Z(T))for(var Dt=0;Dt<T.length;Dt++)Q=T[Dt],dt=he+qt(Q,Dt),lt+=Pt(Q,X,k,dt,I);else if(Dt=b(T),typeof Dt=="function")for(T=Dt.call(T),Dt=0;!(Q=T.next()).done;)Q=Q.value,dt=he+qt(Q,Dt++),lt+=Pt(Q,X,k,dt,I);else if(dt==="object"){if(typeof T.then=="function")return Pt(Ye(T),X,k,Q,I);throw X=String(T),Error("Objects are not valid as a React child (found: "+(X==="[object Object]"?"object with keys {"+Object.keys(T).join(", ")+"}":X)+"). If you meant to render a collection of children, use an array instead.")}return lt}function B(T,X,k){if(T==null)return T;var Q=[],I=0;return Pt(T,Q,"","",function(dt){return X.call(k,dt,I++)}),Q}function K(T){if(T._status===-1){var X=T._result;X=X(),X.then(function(k){(T._status===0||T._status===-1)&&(T._status=1,T._result=k)},function(k){(T._status===0||T._status===-1)&&(T._status=2,T._result=k)}),T._status===-1&&(T._status=0,T._result=X)}if(T._status===1)return T._result.default;throw T._result}var $=typeof reportError=="function"?reportError:function(T){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var X=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof T=="object"&&T!==null&&typeof T.message=="string"?String(T.message):String(T),error:T});if(!window.dispatchEvent(X))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",T);return}console.error(T)};function pt(){}return ut.Children={map:B,forEach:function(T,X,k){B(T,function(){X.apply(this,arguments)},k)},count:function(T){var X=0;return B(T,function(){X++}),X},toArray:function(T){return B(T,function(X){return X})||[]},only:function(T){if(!st(T))throw Error("React.Children.only expected to receive a single React element child.");return T}},ut.Component=U,ut.Fragment=s,ut.Profiler=c,ut.PureComponent=j,ut.StrictMode=u,ut.Suspense=d,ut.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=q,ut.__COMPILER_RUNTIME={__proto__:null,c:function(T){return q.H.useMemoCache(T)}},ut.cache=function(T){return function(){return T.apply(null,arguments)}},ut.cloneElement=function(T,X,k){if(T==null)throw Error("The argument must be a React element, but you passed "+T+".");var Q=D({},T.props),I=T.key,dt=void 0;if(X!=null)for(lt in X.ref!==void 0&&(dt=void 0),X.key!==void 0&&(I=""+X.key),X)!P.call(X,lt)||lt==="key"||lt==="__self"||lt==="__source"||lt==="ref"&&X.ref===void 0||(Q[lt]=X[lt]);var lt=arguments.length-2;if(lt===1)Q.children=k;else if(1<lt){for(var he=Array(lt),Dt=0;Dt<lt;Dt++)he[Dt]=arguments[Dt+2];Q.children=he}return nt(T.type,I,void 0,void 0,dt,Q)},ut.createContext=function(T){return T={$$typeof:f,_currentValue:T,_currentValue2:T,_threadCount:0,Provider:null,Consumer:null},T.Provider=T,T.Consumer={$$typeof:h,_context:T},T},ut.createElement=function(T,X,k){var Q,I={},dt=null;if(X!=null)for(Q in X.key!==void 0&&(dt=""+X.key),X)P.call(X,Q)&&Q!=="key"&&Q!=="__self"&&Q!=="__source"&&(I[Q]=X[Q]);var lt=arguments.length-2;if(lt===1)I.children=k;else if(1<lt){for(var he=Array(lt),Dt=0;Dt<lt;Dt++)he[Dt]=arguments[Dt+2];I.children=he}if(T&&T.defaultProps)for(Q in lt=T.defaultProps,lt)I[Q]===void 0&&(I[Q]=lt[Q]);return nt(T,dt,void 0,void 0,null,I)},ut.createRef=function(){return{current:null}},ut.forwardRef=function(T){return{$$typeof:p,render:T}},ut.isValidElement=st,ut.lazy=function(T){return{$$typeof:g,_payload:{_status:-1,_result:T},_init:K}},ut.memo=function(T,X){return{$$typeof:m,type:T,compare:X===void 0?null:X}},ut.startTransition=function(T){var X=q.T,k={};q.T=k;try{var Q=T(),I=q.S;I!==null&&I(k,Q),typeof Q=="object"&&Q!==null&&typeof Q.then=="function"&&Q.then(pt,$)}catch(dt){$(dt)}finally{q.T=X}},ut.unstable_useCacheRefresh=function(){return q.H.useCacheRefresh()},ut.use=function(T){return q.H.use(T)},ut.useActionState=function(T,X,k){return q.H.useActionState(T,X,k)},ut.useCallback=function(T,X){return q.H.useCallback(T,X)},ut.useContext=function(T){return q.H.useContext(T)},ut.useDebugValue=function(){},ut.useDeferredValue=function(T,X){return q.H.useDeferredValue(T,X)},ut.useEffect=function(T,X,k){var Q=q.H;if(typeof k=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return Q.useEffect(T,X)},ut.useId=function(){return q.H.useId()},ut.useImperativeHandle=function(T,X,k){return q.H.useImperativeHandle(T,X,k)},ut.useInsertionEffect=function(T,X){return q.H.useInsertionEffect(T,X)},ut.useLayoutEffect=function(T,X){return q.H.useLayoutEffect(T,X)},ut.useMemo=function(T,X){return q.H.useMemo(T,X)},ut.useOptimistic=function(T,X){return q.H.useOptimistic(T,X)},ut.useReducer=function(T,X,k){return q.H.useReducer(T,X,k)},ut.useRef=function(T){return q.H.useRef(T)},ut.useState=function(T){return q.H.useState(T)},ut.useSyncExternalStore=function(T,X,k){return q.H.useSyncExternalStore(T,X,k)},ut.useTransition=function(){return q.H.useTransition()},ut.version="19.1.0",ut}var dp;function wc(){return dp||(dp=1,Yo.exports=nS()),Yo.exports}var E=wc(),qo={exports:{}},ml={},Go={exports:{}},Xo={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var mp;function aS(){return mp||(mp=1,function(a){function i(B,K){var $=B.length;B.push(K);t:for(;0<$;){var pt=$-1>>>1,T=B[pt];if(0<c(T,K))B[pt]=K,B[$]=T,$=pt;else break t}}function s(B){return B.length===0?null:B[0]}function u(B){if(B.length===0)return null;var K=B[0],$=B.pop();if($!==K){B[0]=$;t:for(var pt=0,T=B.length,X=T>>>1;pt<X;){var k=2*(pt+1)-1,Q=B[k],I=k+1,dt=B[I];if(0>c(Q,$))I<T&&0>c(dt,Q)?(B[pt]=dt,B[I]=$,pt=I):(B[pt]=Q,B[k]=$,pt=k);else if(I<T&&0>c(dt,$))B[pt]=dt,B[I]=$,pt=I;else break t}}return K}function c(B,K){var $=B.sortIndex-K.sortIndex;return $!==0?$:B.id-K.id}if(a.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var h=performance;a.unstable_now=function(){return h.now()}}else{var f=Date,p=f.now();a.unstable_now=function(){return f.now()-p}}var d=[],m=[],g=1,S=null,b=3,R=!1,D=!1,w=!1,U=!1,O=typeof setTimeout=="function"?setTimeout:null,j=typeof clearTimeout=="function"?clearTimeout:null,_=typeof setImmediate<"u"?setImmediate:null;function Z(B){for(var K=s(m);K!==null;){if(K.callback===null)u(m);else if(K.startTime<=B)u(m),K.sortIndex=K.expirationTime,i(d,K);else break;K=s(m)}}function q(B){if(w=!1,Z(B),!D)if(s(d)!==null)D=!0,P||(P=!0,qt());else{var K=s(m);K!==null&&Pt(q,K.startTime-B)}}var P=!1,nt=-1,F=5,st=-1;function gt(){return U?!0:!(a.unstable_now()-st<F)}function Yt(){if(U=!1,P){var B=a.unstable_now();st=B;var K=!0;try{t:{D=!1,w&&(w=!1,j(nt),nt=-1),R=!0;var $=b;try{e:{for(Z(B),S=s(d);S!==null&&!(S.expirationTime>B&&gt());){var pt=S.callback;if(typeof pt=="function"){S.callback=null,b=S.priorityLevel;var T=pt(S.expirationTime<=B);if(B=a.unstable_now(),typeof T=="function"){S.callback=T,Z(B),K=!0;break e}S===s(d)&&u(d),Z(B)}else u(d);S=s(d)}if(S!==null)K=!0;else{var X=s(m);X!==null&&Pt(q,X.startTime-B),K=!1}}break t}finally{S=null,b=$,R=!1}K=void 0}}finally{K?qt():P=!1}}}var qt;if(typeof _=="function")qt=function(){_(Yt)};else if(typeof MessageChannel<"u"){var $e=new MessageChannel,Ye=$e.port2;$e.port1.onmessage=Yt,qt=function(){Ye.postMessage(null)}}else qt=function(){O(Yt,0)};function Pt(B,K){nt=O(function(){B(a.unstable_now())},K)}a.unstable_IdlePriority=5,a.unstable_ImmediatePriority=1,a.unstable_LowPriority=4,a.unstable_NormalPriority=3,a.unstable_Profiling=null,a.unstable_UserBlockingPriority=2,a.unstable_cancelCallback=function(B){B.callback=null},a.unstable_forceFrameRate=function(B){0>B||125<B?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):F=0<B?Math.floor(1e3/B):5},a.unstable_getCurrentPriorityLevel=function(){return b},a.unstable_next=function(B){switch(b){case 1:case 2:case 3:var K=3;break;default:K=b}var $=b;b=K;try{return B()}finally{b=$}},a.unstable_requestPaint=function(){U=!0},a.unstable_runWithPriority=function(B,K){switch(B){case 1:case 2:case 3:case 4:case 5:break;default:B=3}var $=b;b=B;try{return K()}finally{b=$}},a.unstable_scheduleCallback=function(B,K,$){var pt=a.unstable_now();switch(typeof $=="object"&&$!==null?($=$.delay,$=typeof $=="number"&&0<$?pt+$:pt):$=pt,B){case 1:var T=-1;break;case 2:T=250;break;case 5:T=1073741823;break;case 4:T=1e4;break;default:T=5e3}return T=$+T,B={id:g++,callback:K,priorityLevel:B,startTime:$,expirationTime:T,sortIndex:-1},$>pt?(B.sortIndex=$,i(m,B),s(d)===null&&B===s(m)&&(w?(j(nt),nt=-1):w=!0,Pt(q,$-pt))):(B.sortIndex=T,i(d,B),D||R||(D=!0,P||(P=!0,qt()))),B},a.unstable_shouldYield=gt,a.unstable_wrapCallback=function(B){var K=b;return function(){var $=b;b=K;try{return B.apply(this,arguments)}finally{b=$}}}}(Xo)),Xo}var pp;function iS(){return pp||(pp=1,Go.exports=aS()),Go.exports}var Ko={exports:{}},ee={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var yp;function lS(){if(yp)return ee;yp=1;var a=wc();function i(d){var m="https://react.dev/errors/"+d;if(1<arguments.length){m+="?args[]="+encodeURIComponent(arguments[1]);for(var g=2;g<arguments.length;g++)m+="&args[]="+encodeURIComponent(arguments[g])}return"Minified React error #"+d+"; visit "+m+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function s(){}var u={d:{f:s,r:function(){throw Error(i(522))},D:s,C:s,L:s,m:s,X:s,S:s,M:s},p:0,findDOMNode:null},c=Symbol.for("react.portal");function h(d,m,g){var S=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:c,key:S==null?null:""+S,children:d,containerInfo:m,implementation:g}}var f=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function p(d,m){if(d==="font")return"";if(typeof m=="string")return m==="use-credentials"?m:""}return ee.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=u,ee.createPortal=function(d,m){var g=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!m||m.nodeType!==1&&m.nodeType!==9&&m.nodeType!==11)throw Error(i(299));return h(d,m,null,g)},ee.flushSync=function(d){var m=f.T,g=u.p;try{if(f.T=null,u.p=2,d)return d()}finally{f.T=m,u.p=g,u.d.f()}},ee.preconnect=function(d,m){typeof d=="string"&&(m?(m=m.crossOrigin,m=typeof m=="string"?m==="use-credentials"?m:"":void 0):m=null,u.d.C(d,m))},ee.prefetchDNS=function(d){typeof d=="string"&&u.d.D(d)},ee.preinit=function(d,m){if(typeof d=="string"&&m&&typeof m.as=="string"){var g=m.as,S=p(g,m.crossOrigin),b=typeof m.integrity=="string"?m.integrity:void 0,R=typeof m.fetchPriority=="string"?m.fetchPriority:void 0;g==="style"?u.d.S(d,typeof m.precedence=="string"?m.precedence:void 0,{crossOrigin:S,integrity:b,fetchPriority:R}):g==="script"&&u.d.X(d,{crossOrigin:S,integrity:b,fetchPriority:R,nonce:typeof m.nonce=="string"?m.nonce:void 0})}},ee.preinitModule=function(d,m){if(typeof d=="string")if(typeof m=="object"&&m!==null){if(m.as==null||m.as==="script"){var g=p(m.as,m.crossOrigin);u.d.M(d,{crossOrigin:g,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0})}}else m==null&&u.d.M(d)},ee.preload=function(d,m){if(typeof d=="string"&&typeof m=="object"&&m!==null&&typeof m.as=="string"){var g=m.as,S=p(g,m.crossOrigin);u.d.L(d,g,{crossOrigin:S,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0,type:typeof m.type=="string"?m.type:void 0,fetchPriority:typeof m.fetchPriority=="string"?m.fetchPriority:void 0,referrerPolicy:typeof m.referrerPolicy=="string"?m.referrerPolicy:void 0,imageSrcSet:typeof m.imageSrcSet=="string"?m.imageSrcSet:void 0,imageSizes:typeof m.imageSizes=="string"?m.imageSizes:void 0,media:typeof m.media=="string"?m.media:void 0})}},ee.preloadModule=function(d,m){if(typeof d=="string")if(m){var g=p(m.as,m.crossOrigin);u.d.m(d,{as:typeof m.as=="string"&&m.as!=="script"?m.as:void 0,crossOrigin:g,integrity:typeof m.integrity=="string"?m.integrity:void 0})}else u.d.m(d)},ee.requestFormReset=function(d){u.d.r(d)},ee.unstable_batchedUpdates=function(d,m){return d(m)},ee.useFormState=function(d,m,g){return f.H.useFormState(d,m,g)},ee.useFormStatus=function(){return f.H.useHostTransitionStatus()},ee.version="19.1.0",ee}var gp;function sS(){if(gp)return Ko.exports;gp=1;function a(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(a)}catch(i){console.error(i)}}return a(),Ko.exports=lS(),Ko.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var vp;function uS(){if(vp)return ml;vp=1;var a=iS(),i=wc(),s=sS();function u(t){var e="https://react.dev/errors/"+t;if(1<arguments.length){e+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)e+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function c(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}function h(t){var e=t,n=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do e=t,(e.flags&4098)!==0&&(n=e.return),t=e.return;while(t)}return e.tag===3?n:null}function f(t){if(t.tag===13){var e=t.memoizedState;if(e===null&&(t=t.alternate,t!==null&&(e=t.memoizedState)),e!==null)return e.dehydrated}return null}function p(t){if(h(t)!==t)throw Error(u(188))}function d(t){var e=t.alternate;if(!e){if(e=h(t),e===null)throw Error(u(188));return e!==t?null:t}for(var n=t,l=e;;){var r=n.return;if(r===null)break;var o=r.alternate;if(o===null){if(l=r.return,l!==null){n=l;continue}break}if(r.child===o.child){for(o=r.child;o;){if(o===n)return p(r),t;if(o===l)return p(r),e;o=o.sibling}throw Error(u(188))}if(n.return!==l.return)n=r,l=o;else{for(var y=!1,v=r.child;v;){if(v===n){y=!0,n=r,l=o;break}if(v===l){y=!0,l=r,n=o;break}v=v.sibling}if(!y){for(v=o.child;v;){if(v===n){y=!0,n=o,l=r;break}if(v===l){y=!0,l=o,n=r;break}v=v.sibling}if(!y)throw Error(u(189))}}if(n.alternate!==l)throw Error(u(190))}if(n.tag!==3)throw Error(u(188));return n.stateNode.current===n?t:e}function m(t){var e=t.tag;if(e===5||e===26||e===27||e===6)return t;for(t=t.child;t!==null;){if(e=m(t),e!==null)return e;t=t.sibling}return null}var g=Object.assign,S=Symbol.for("react.element"),b=Symbol.for("react.transitional.element"),R=Symbol.for("react.portal"),D=Symbol.for("react.fragment"),w=Symbol.for("react.strict_mode"),U=Symbol.for("react.profiler"),O=Symbol.for("react.provider"),j=Symbol.for("react.consumer"),_=Symbol.for("react.context"),Z=Symbol.for("react.forward_ref"),q=Symbol.for("react.suspense"),P=Symbol.for("react.suspense_list"),nt=Symbol.for("react.memo"),F=Symbol.for("react.lazy"),st=Symbol.for("react.activity"),gt=Symbol.for("react.memo_cache_sentinel"),Yt=Symbol.iterator;function qt(t){return t===null||typeof t!="object"?null:(t=Yt&&t[Yt]||t["@@iterator"],typeof t=="function"?t:null)}var $e=Symbol.for("react.client.reference");function Ye(t){if(t==null)return null;if(typeof t=="function")return t.$$typeof===$e?null:t.displayName||t.name||null;if(typeof t=="string")return t;switch(t){case D:return"Fragment";case U:return"Profiler";case w:return"StrictMode";case q:return"Suspense";case P:return"SuspenseList";case st:return"Activity"}if(typeof t=="object")switch(t.$$typeof){case R:return"Portal";case _:return(t.displayName||"Context")+".Provider";case j:return(t._context.displayName||"Context")+".Consumer";case Z:var e=t.render;return t=t.displayName,t||(t=e.displayName||e.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case nt:return e=t.displayName||null,e!==null?e:Ye(t.type)||"Memo";case F:e=t._payload,t=t._init;try{return Ye(t(e))}catch{}}return null}var Pt=Array.isArray,B=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,K=s.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,$={pending:!1,data:null,method:null,action:null},pt=[],T=-1;function X(t){return{current:t}}function k(t){0>T||(t.current=pt[T],pt[T]=null,T--)}function Q(t,e){T++,pt[T]=t.current,t.current=e}var I=X(null),dt=X(null),lt=X(null),he=X(null);function Dt(t,e){switch(Q(lt,e),Q(dt,t),Q(I,null),e.nodeType){case 9:case 11:t=(t=e.documentElement)&&(t=t.namespaceURI)?jm(t):0;break;default:if(t=e.tagName,e=e.namespaceURI)e=jm(e),t=Hm(e,t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}k(I),Q(I,t)}function vn(){k(I),k(dt),k(lt)}function Eu(t){t.memoizedState!==null&&Q(he,t);var e=I.current,n=Hm(e,t.type);e!==n&&(Q(dt,t),Q(I,n))}function jl(t){dt.current===t&&(k(I),k(dt)),he.current===t&&(k(he),rl._currentValue=$)}var Au=Object.prototype.hasOwnProperty,Ru=a.unstable_scheduleCallback,Du=a.unstable_cancelCallback,V0=a.unstable_shouldYield,z0=a.unstable_requestPaint,qe=a.unstable_now,U0=a.unstable_getCurrentPriorityLevel,vf=a.unstable_ImmediatePriority,Sf=a.unstable_UserBlockingPriority,Hl=a.unstable_NormalPriority,_0=a.unstable_LowPriority,bf=a.unstable_IdlePriority,L0=a.log,B0=a.unstable_setDisableYieldValue,yi=null,de=null;function Sn(t){if(typeof L0=="function"&&B0(t),de&&typeof de.setStrictMode=="function")try{de.setStrictMode(yi,t)}catch{}}var me=Math.clz32?Math.clz32:Y0,j0=Math.log,H0=Math.LN2;function Y0(t){return t>>>=0,t===0?32:31-(j0(t)/H0|0)|0}var Yl=256,ql=4194304;function Pn(t){var e=t&42;if(e!==0)return e;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function Gl(t,e,n){var l=t.pendingLanes;if(l===0)return 0;var r=0,o=t.suspendedLanes,y=t.pingedLanes;t=t.warmLanes;var v=l&134217727;return v!==0?(l=v&~o,l!==0?r=Pn(l):(y&=v,y!==0?r=Pn(y):n||(n=v&~t,n!==0&&(r=Pn(n))))):(v=l&~o,v!==0?r=Pn(v):y!==0?r=Pn(y):n||(n=l&~t,n!==0&&(r=Pn(n)))),r===0?0:e!==0&&e!==r&&(e&o)===0&&(o=r&-r,n=e&-e,o>=n||o===32&&(n&4194048)!==0)?e:r}function gi(t,e){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&e)===0}function q0(t,e){switch(t){case 1:case 2:case 4:case 8:case 64:return e+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function xf(){var t=Yl;return Yl<<=1,(Yl&4194048)===0&&(Yl=256),t}function Tf(){var t=ql;return ql<<=1,(ql&62914560)===0&&(ql=4194304),t}function Mu(t){for(var e=[],n=0;31>n;n++)e.push(t);return e}function vi(t,e){t.pendingLanes|=e,e!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function G0(t,e,n,l,r,o){var y=t.pendingLanes;t.pendingLanes=n,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=n,t.entangledLanes&=n,t.errorRecoveryDisabledLanes&=n,t.shellSuspendCounter=0;var v=t.entanglements,x=t.expirationTimes,N=t.hiddenUpdates;for(n=y&~n;0<n;){var L=31-me(n),Y=1<<L;v[L]=0,x[L]=-1;var V=N[L];if(V!==null)for(N[L]=null,L=0;L<V.length;L++){var z=V[L];z!==null&&(z.lane&=-536870913)}n&=~Y}l!==0&&Ef(t,l,0),o!==0&&r===0&&t.tag!==0&&(t.suspendedLanes|=o&~(y&~e))}function Ef(t,e,n){t.pendingLanes|=e,t.suspendedLanes&=~e;var l=31-me(e);t.entangledLanes|=e,t.entanglements[l]=t.entanglements[l]|1073741824|n&4194090}function Af(t,e){var n=t.entangledLanes|=e;for(t=t.entanglements;n;){var l=31-me(n),r=1<<l;r&e|t[l]&e&&(t[l]|=e),n&=~r}}function wu(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function Cu(t){return t&=-t,2<t?8<t?(t&134217727)!==0?32:268435456:8:2}function Rf(){var t=K.p;return t!==0?t:(t=window.event,t===void 0?32:ip(t.type))}function X0(t,e){var n=K.p;try{return K.p=t,e()}finally{K.p=n}}var bn=Math.random().toString(36).slice(2),It="__reactFiber$"+bn,se="__reactProps$"+bn,va="__reactContainer$"+bn,Ou="__reactEvents$"+bn,K0="__reactListeners$"+bn,Z0="__reactHandles$"+bn,Df="__reactResources$"+bn,Si="__reactMarker$"+bn;function Nu(t){delete t[It],delete t[se],delete t[Ou],delete t[K0],delete t[Z0]}function Sa(t){var e=t[It];if(e)return e;for(var n=t.parentNode;n;){if(e=n[va]||n[It]){if(n=e.alternate,e.child!==null||n!==null&&n.child!==null)for(t=Xm(t);t!==null;){if(n=t[It])return n;t=Xm(t)}return e}t=n,n=t.parentNode}return null}function ba(t){if(t=t[It]||t[va]){var e=t.tag;if(e===5||e===6||e===13||e===26||e===27||e===3)return t}return null}function bi(t){var e=t.tag;if(e===5||e===26||e===27||e===6)return t.stateNode;throw Error(u(33))}function xa(t){var e=t[Df];return e||(e=t[Df]={hoistableStyles:new Map,hoistableScripts:new Map}),e}function Kt(t){t[Si]=!0}var Mf=new Set,wf={};function Jn(t,e){Ta(t,e),Ta(t+"Capture",e)}function Ta(t,e){for(wf[t]=e,t=0;t<e.length;t++)Mf.add(e[t])}var Q0=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Cf={},Of={};function k0(t){return Au.call(Of,t)?!0:Au.call(Cf,t)?!1:Q0.test(t)?Of[t]=!0:(Cf[t]=!0,!1)}function Xl(t,e,n){if(k0(e))if(n===null)t.removeAttribute(e);else{switch(typeof n){case"undefined":case"function":case"symbol":t.removeAttribute(e);return;case"boolean":var l=e.toLowerCase().slice(0,5);if(l!=="data-"&&l!=="aria-"){t.removeAttribute(e);return}}t.setAttribute(e,""+n)}}function Kl(t,e,n){if(n===null)t.removeAttribute(e);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttribute(e,""+n)}}function We(t,e,n,l){if(l===null)t.removeAttribute(n);else{switch(typeof l){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(n);return}t.setAttributeNS(e,n,""+l)}}var Vu,Nf;function Ea(t){if(Vu===void 0)try{throw Error()}catch(n){var e=n.stack.trim().match(/\n( *(at )?)/);Vu=e&&e[1]||"",Nf=-1<n.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Vu+t+Nf}var zu=!1;function Uu(t,e){if(!t||zu)return"";zu=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var l={DetermineComponentFrameRoot:function(){try{if(e){var Y=function(){throw Error()};if(Object.defineProperty(Y.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(Y,[])}catch(z){var V=z}Reflect.construct(t,[],Y)}else{try{Y.call()}catch(z){V=z}t.call(Y.prototype)}}else{try{throw Error()}catch(z){V=z}(Y=t())&&typeof Y.catch=="function"&&Y.catch(function(){})}}catch(z){if(z&&V&&typeof z.stack=="string")return[z.stack,V.stack]}return[null,null]}};l.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var r=Object.getOwnPropertyDescriptor(l.DetermineComponentFrameRoot,"name");r&&r.configurable&&Object.defineProperty(l.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var o=l.DetermineComponentFrameRoot(),y=o[0],v=o[1];if(y&&v){var x=y.split(`
-`),N=v.split(`
-`);for(r=l=0;l<x.length&&!x[l].includes("DetermineComponentFrameRoot");)l++;for(;r<N.length&&!N[r].includes("DetermineComponentFrameRoot");)r++;if(l===x.length||r===N.length)for(l=x.length-1,r=N.length-1;1<=l&&0<=r&&x[l]!==N[r];)r--;for(;1<=l&&0<=r;l--,r--)if(x[l]!==N[r]){if(l!==1||r!==1)do if(l--,r--,0>r||x[l]!==N[r]){var L=`
-`+x[l].replace(" at new "," at ");return t.displayName&&L.includes("<anonymous>")&&(L=L.replace("<anonymous>",t.displayName)),L}while(1<=l&&0<=r);break}}}finally{zu=!1,Error.prepareStackTrace=n}return(n=t?t.displayName||t.name:"")?Ea(n):""}function P0(t){switch(t.tag){case 26:case 27:case 5:return Ea(t.type);case 16:return Ea("Lazy");case 13:return Ea("Suspense");case 19:return Ea("SuspenseList");case 0:case 15:return Uu(t.type,!1);case 11:return Uu(t.type.render,!1);case 1:return Uu(t.type,!0);case 31:return Ea("Activity");default:return""}}function Vf(t){try{var e="";do e+=P0(t),t=t.return;while(t);return e}catch(n){return`
-Error generating stack: `+n.message+`
-`+n.stack}}function Te(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function zf(t){var e=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(e==="checkbox"||e==="radio")}function J0(t){var e=zf(t)?"checked":"value",n=Object.getOwnPropertyDescriptor(t.constructor.prototype,e),l=""+t[e];if(!t.hasOwnProperty(e)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var r=n.get,o=n.set;return Object.defineProperty(t,e,{configurable:!0,get:function(){return r.call(this)},set:function(y){l=""+y,o.call(this,y)}}),Object.defineProperty(t,e,{enumerable:n.enumerable}),{getValue:function(){return l},setValue:function(y){l=""+y},stopTracking:function(){t._valueTracker=null,delete t[e]}}}}function Zl(t){t._valueTracker||(t._valueTracker=J0(t))}function Uf(t){if(!t)return!1;var e=t._valueTracker;if(!e)return!0;var n=e.getValue(),l="";return t&&(l=zf(t)?t.checked?"true":"false":t.value),t=l,t!==n?(e.setValue(t),!0):!1}function Ql(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}var F0=/[\n"\\]/g;function Ee(t){return t.replace(F0,function(e){return"\\"+e.charCodeAt(0).toString(16)+" "})}function _u(t,e,n,l,r,o,y,v){t.name="",y!=null&&typeof y!="function"&&typeof y!="symbol"&&typeof y!="boolean"?t.type=y:t.removeAttribute("type"),e!=null?y==="number"?(e===0&&t.value===""||t.value!=e)&&(t.value=""+Te(e)):t.value!==""+Te(e)&&(t.value=""+Te(e)):y!=="submit"&&y!=="reset"||t.removeAttribute("value"),e!=null?Lu(t,y,Te(e)):n!=null?Lu(t,y,Te(n)):l!=null&&t.removeAttribute("value"),r==null&&o!=null&&(t.defaultChecked=!!o),r!=null&&(t.checked=r&&typeof r!="function"&&typeof r!="symbol"),v!=null&&typeof v!="function"&&typeof v!="symbol"&&typeof v!="boolean"?t.name=""+Te(v):t.removeAttribute("name")}function _f(t,e,n,l,r,o,y,v){if(o!=null&&typeof o!="function"&&typeof o!="symbol"&&typeof o!="boolean"&&(t.type=o),e!=null||n!=null){if(!(o!=="submit"&&o!=="reset"||e!=null))return;n=n!=null?""+Te(n):"",e=e!=null?""+Te(e):n,v||e===t.value||(t.value=e),t.defaultValue=e}l=l??r,l=typeof l!="function"&&typeof l!="symbol"&&!!l,t.checked=v?t.checked:!!l,t.defaultChecked=!!l,y!=null&&typeof y!="function"&&typeof y!="symbol"&&typeof y!="boolean"&&(t.name=y)}function Lu(t,e,n){e==="number"&&Ql(t.ownerDocument)===t||t.defaultValue===""+n||(t.defaultValue=""+n)}function Aa(t,e,n,l){if(t=t.options,e){e={};for(var r=0;r<n.length;r++)e["$"+n[r]]=!0;for(n=0;n<t.length;n++)r=e.hasOwnProperty("$"+t[n].value),t[n].selected!==r&&(t[n].selected=r),r&&l&&(t[n].defaultSelected=!0)}else{for(n=""+Te(n),e=null,r=0;r<t.length;r++){if(t[r].value===n){t[r].selected=!0,l&&(t[r].defaultSelected=!0);return}e!==null||t[r].disabled||(e=t[r])}e!==null&&(e.selected=!0)}}function Lf(t,e,n){if(e!=null&&(e=""+Te(e),e!==t.value&&(t.value=e),n==null)){t.defaultValue!==e&&(t.defaultValue=e);return}t.defaultValue=n!=null?""+Te(n):""}function Bf(t,e,n,l){if(e==null){if(l!=null){if(n!=null)throw Error(u(92));if(Pt(l)){if(1<l.length)throw Error(u(93));l=l[0]}n=l}n==null&&(n=""),e=n}n=Te(e),t.defaultValue=n,l=t.textContent,l===n&&l!==""&&l!==null&&(t.value=l)}function Ra(t,e){if(e){var n=t.firstChild;if(n&&n===t.lastChild&&n.nodeType===3){n.nodeValue=e;return}}t.textContent=e}var $0=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function jf(t,e,n){var l=e.indexOf("--")===0;n==null||typeof n=="boolean"||n===""?l?t.setProperty(e,""):e==="float"?t.cssFloat="":t[e]="":l?t.setProperty(e,n):typeof n!="number"||n===0||$0.has(e)?e==="float"?t.cssFloat=n:t[e]=(""+n).trim():t[e]=n+"px"}function Hf(t,e,n){if(e!=null&&typeof e!="object")throw Error(u(62));if(t=t.style,n!=null){for(var l in n)!n.hasOwnProperty(l)||e!=null&&e.hasOwnProperty(l)||(l.indexOf("--")===0?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="");for(var r in e)l=e[r],e.hasOwnProperty(r)&&n[r]!==l&&jf(t,r,l)}else for(var o in e)e.hasOwnProperty(o)&&jf(t,o,e[o])}function Bu(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var W0=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),I0=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function kl(t){return I0.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}var ju=null;function Hu(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var Da=null,Ma=null;function Yf(t){var e=ba(t);if(e&&(t=e.stateNode)){var n=t[se]||null;t:switch(t=e.stateNode,e.type){case"input":if(_u(t,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),e=n.name,n.type==="radio"&&e!=null){for(n=t;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+Ee(""+e)+'"][type="radio"]'),e=0;e<n.length;e++){var l=n[e];if(l!==t&&l.form===t.form){var r=l[se]||null;if(!r)throw Error(u(90));_u(l,r.value,r.defaultValue,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name)}}for(e=0;e<n.length;e++)l=n[e],l.form===t.form&&Uf(l)}break t;case"textarea":Lf(t,n.value,n.defaultValue);break t;case"select":e=n.value,e!=null&&Aa(t,!!n.multiple,e,!1)}}}var Yu=!1;function qf(t,e,n){if(Yu)return t(e,n);Yu=!0;try{var l=t(e);return l}finally{if(Yu=!1,(Da!==null||Ma!==null)&&(Vs(),Da&&(e=Da,t=Ma,Ma=Da=null,Yf(e),t)))for(e=0;e<t.length;e++)Yf(t[e])}}function xi(t,e){var n=t.stateNode;if(n===null)return null;var l=n[se]||null;if(l===null)return null;n=l[e];t:switch(e){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(l=!l.disabled)||(t=t.type,l=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!l;break t;default:t=!1}if(t)return null;if(n&&typeof n!="function")throw Error(u(231,e,typeof n));return n}var Ie=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),qu=!1;if(Ie)try{var Ti={};Object.defineProperty(Ti,"passive",{get:function(){qu=!0}}),window.addEventListener("test",Ti,Ti),window.removeEventListener("test",Ti,Ti)}catch{qu=!1}var xn=null,Gu=null,Pl=null;function Gf(){if(Pl)return Pl;var t,e=Gu,n=e.length,l,r="value"in xn?xn.value:xn.textContent,o=r.length;for(t=0;t<n&&e[t]===r[t];t++);var y=n-t;for(l=1;l<=y&&e[n-l]===r[o-l];l++);return Pl=r.slice(t,1<l?1-l:void 0)}function Jl(t){var e=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&e===13&&(t=13)):t=e,t===10&&(t=13),32<=t||t===13?t:0}function Fl(){return!0}function Xf(){return!1}function ue(t){function e(n,l,r,o,y){this._reactName=n,this._targetInst=r,this.type=l,this.nativeEvent=o,this.target=y,this.currentTarget=null;for(var v in t)t.hasOwnProperty(v)&&(n=t[v],this[v]=n?n(o):o[v]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Fl:Xf,this.isPropagationStopped=Xf,this}return g(e.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Fl)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Fl)},persist:function(){},isPersistent:Fl}),e}var Fn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},$l=ue(Fn),Ei=g({},Fn,{view:0,detail:0}),tv=ue(Ei),Xu,Ku,Ai,Wl=g({},Ei,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Qu,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==Ai&&(Ai&&t.type==="mousemove"?(Xu=t.screenX-Ai.screenX,Ku=t.screenY-Ai.screenY):Ku=Xu=0,Ai=t),Xu)},movementY:function(t){return"movementY"in t?t.movementY:Ku}}),Kf=ue(Wl),ev=g({},Wl,{dataTransfer:0}),nv=ue(ev),av=g({},Ei,{relatedTarget:0}),Zu=ue(av),iv=g({},Fn,{animationName:0,elapsedTime:0,pseudoElement:0}),lv=ue(iv),sv=g({},Fn,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),uv=ue(sv),rv=g({},Fn,{data:0}),Zf=ue(rv),ov={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},cv={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fv={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function hv(t){var e=this.nativeEvent;return e.getModifierState?e.getModifierState(t):(t=fv[t])?!!e[t]:!1}function Qu(){return hv}var dv=g({},Ei,{key:function(t){if(t.key){var e=ov[t.key]||t.key;if(e!=="Unidentified")return e}return t.type==="keypress"?(t=Jl(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?cv[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Qu,charCode:function(t){return t.type==="keypress"?Jl(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?Jl(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),mv=ue(dv),pv=g({},Wl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Qf=ue(pv),yv=g({},Ei,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Qu}),gv=ue(yv),vv=g({},Fn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Sv=ue(vv),bv=g({},Wl,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),xv=ue(bv),Tv=g({},Fn,{newState:0,oldState:0}),Ev=ue(Tv),Av=[9,13,27,32],ku=Ie&&"CompositionEvent"in window,Ri=null;Ie&&"documentMode"in document&&(Ri=document.documentMode);var Rv=Ie&&"TextEvent"in window&&!Ri,kf=Ie&&(!ku||Ri&&8<Ri&&11>=Ri),Pf=" ",Jf=!1;function Ff(t,e){switch(t){case"keyup":return Av.indexOf(e.keyCode)!==-1;case"keydown":return e.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function $f(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var wa=!1;function Dv(t,e){switch(t){case"compositionend":return $f(e);case"keypress":return e.which!==32?null:(Jf=!0,Pf);case"textInput":return t=e.data,t===Pf&&Jf?null:t;default:return null}}function Mv(t,e){if(wa)return t==="compositionend"||!ku&&Ff(t,e)?(t=Gf(),Pl=Gu=xn=null,wa=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(e.ctrlKey||e.altKey||e.metaKey)||e.ctrlKey&&e.altKey){if(e.char&&1<e.char.length)return e.char;if(e.which)return String.fromCharCode(e.which)}return null;case"compositionend":return kf&&e.locale!=="ko"?null:e.data;default:return null}}var wv={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wf(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e==="input"?!!wv[t.type]:e==="textarea"}function If(t,e,n,l){Da?Ma?Ma.push(l):Ma=[l]:Da=l,e=js(e,"onChange"),0<e.length&&(n=new $l("onChange","change",null,n,l),t.push({event:n,listeners:e}))}var Di=null,Mi=null;function Cv(t){zm(t,0)}function Il(t){var e=bi(t);if(Uf(e))return t}function th(t,e){if(t==="change")return e}var eh=!1;if(Ie){var Pu;if(Ie){var Ju="oninput"in document;if(!Ju){var nh=document.createElement("div");nh.setAttribute("oninput","return;"),Ju=typeof nh.oninput=="function"}Pu=Ju}else Pu=!1;eh=Pu&&(!document.documentMode||9<document.documentMode)}function ah(){Di&&(Di.detachEvent("onpropertychange",ih),Mi=Di=null)}function ih(t){if(t.propertyName==="value"&&Il(Mi)){var e=[];If(e,Mi,t,Hu(t)),qf(Cv,e)}}function Ov(t,e,n){t==="focusin"?(ah(),Di=e,Mi=n,Di.attachEvent("onpropertychange",ih)):t==="focusout"&&ah()}function Nv(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return Il(Mi)}function Vv(t,e){if(t==="click")return Il(e)}function zv(t,e){if(t==="input"||t==="change")return Il(e)}function Uv(t,e){return t===e&&(t!==0||1/t===1/e)||t!==t&&e!==e}var pe=typeof Object.is=="function"?Object.is:Uv;function wi(t,e){if(pe(t,e))return!0;if(typeof t!="object"||t===null||typeof e!="object"||e===null)return!1;var n=Object.keys(t),l=Object.keys(e);if(n.length!==l.length)return!1;for(l=0;l<n.length;l++){var r=n[l];if(!Au.call(e,r)||!pe(t[r],e[r]))return!1}return!0}function lh(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function sh(t,e){var n=lh(t);t=0;for(var l;n;){if(n.nodeType===3){if(l=t+n.textContent.length,t<=e&&l>=e)return{node:n,offset:e-t};t=l}t:{for(;n;){if(n.nextSibling){n=n.nextSibling;break t}n=n.parentNode}n=void 0}n=lh(n)}}function uh(t,e){return t&&e?t===e?!0:t&&t.nodeType===3?!1:e&&e.nodeType===3?uh(t,e.parentNode):"contains"in t?t.contains(e):t.compareDocumentPosition?!!(t.compareDocumentPosition(e)&16):!1:!1}function rh(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var e=Ql(t.document);e instanceof t.HTMLIFrameElement;){try{var n=typeof e.contentWindow.location.href=="string"}catch{n=!1}if(n)t=e.contentWindow;else break;e=Ql(t.document)}return e}function Fu(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e&&(e==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||e==="textarea"||t.contentEditable==="true")}var _v=Ie&&"documentMode"in document&&11>=document.documentMode,Ca=null,$u=null,Ci=null,Wu=!1;function oh(t,e,n){var l=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Wu||Ca==null||Ca!==Ql(l)||(l=Ca,"selectionStart"in l&&Fu(l)?l={start:l.selectionStart,end:l.selectionEnd}:(l=(l.ownerDocument&&l.ownerDocument.defaultView||window).getSelection(),l={anchorNode:l.anchorNode,anchorOffset:l.anchorOffset,focusNode:l.focusNode,focusOffset:l.focusOffset}),Ci&&wi(Ci,l)||(Ci=l,l=js($u,"onSelect"),0<l.length&&(e=new $l("onSelect","select",null,e,n),t.push({event:e,listeners:l}),e.target=Ca)))}function $n(t,e){var n={};return n[t.toLowerCase()]=e.toLowerCase(),n["Webkit"+t]="webkit"+e,n["Moz"+t]="moz"+e,n}var Oa={animationend:$n("Animation","AnimationEnd"),animationiteration:$n("Animation","AnimationIteration"),animationstart:$n("Animation","AnimationStart"),transitionrun:$n("Transition","TransitionRun"),transitionstart:$n("Transition","TransitionStart"),transitioncancel:$n("Transition","TransitionCancel"),transitionend:$n("Transition","TransitionEnd")},Iu={},ch={};Ie&&(ch=document.createElement("div").style,"AnimationEvent"in window||(delete Oa.animationend.animation,delete Oa.animationiteration.animation,delete Oa.animationstart.animation),"TransitionEvent"in window||delete Oa.transitionend.transition);function Wn(t){if(Iu[t])return Iu[t];if(!Oa[t])return t;var e=Oa[t],n;for(n in e)if(e.hasOwnProperty(n)&&n in ch)return Iu[t]=e[n];return t}var fh=Wn("animationend"),hh=Wn("animationiteration"),dh=Wn("animationstart"),Lv=Wn("transitionrun"),Bv=Wn("transitionstart"),jv=Wn("transitioncancel"),mh=Wn("transitionend"),ph=new Map,tr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");tr.push("scrollEnd");function Ue(t,e){ph.set(t,e),Jn(e,[t])}var yh=new WeakMap;function Ae(t,e){if(typeof t=="object"&&t!==null){var n=yh.get(t);return n!==void 0?n:(e={value:t,source:e,stack:Vf(e)},yh.set(t,e),e)}return{value:t,source:e,stack:Vf(e)}}var Re=[],Na=0,er=0;function ts(){for(var t=Na,e=er=Na=0;e<t;){var n=Re[e];Re[e++]=null;var l=Re[e];Re[e++]=null;var r=Re[e];Re[e++]=null;var o=Re[e];if(Re[e++]=null,l!==null&&r!==null){var y=l.pending;y===null?r.next=r:(r.next=y.next,y.next=r),l.pending=r}o!==0&&gh(n,r,o)}}function es(t,e,n,l){Re[Na++]=t,Re[Na++]=e,Re[Na++]=n,Re[Na++]=l,er|=l,t.lanes|=l,t=t.alternate,t!==null&&(t.lanes|=l)}function nr(t,e,n,l){return es(t,e,n,l),ns(t)}function Va(t,e){return es(t,null,null,e),ns(t)}function gh(t,e,n){t.lanes|=n;var l=t.alternate;l!==null&&(l.lanes|=n);for(var r=!1,o=t.return;o!==null;)o.childLanes|=n,l=o.alternate,l!==null&&(l.childLanes|=n),o.tag===22&&(t=o.stateNode,t===null||t._visibility&1||(r=!0)),t=o,o=o.return;return t.tag===3?(o=t.stateNode,r&&e!==null&&(r=31-me(n),t=o.hiddenUpdates,l=t[r],l===null?t[r]=[e]:l.push(e),e.lane=n|536870912),o):null}function ns(t){if(50<tl)throw tl=0,ro=null,Error(u(185));for(var e=t.return;e!==null;)t=e,e=t.return;return t.tag===3?t.stateNode:null}var za={};function Hv(t,e,n,l){this.tag=t,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=l,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ye(t,e,n,l){return new Hv(t,e,n,l)}function ar(t){return t=t.prototype,!(!t||!t.isReactComponent)}function tn(t,e){var n=t.alternate;return n===null?(n=ye(t.tag,e,t.key,t.mode),n.elementType=t.elementType,n.type=t.type,n.stateNode=t.stateNode,n.alternate=t,t.alternate=n):(n.pendingProps=e,n.type=t.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=t.flags&65011712,n.childLanes=t.childLanes,n.lanes=t.lanes,n.child=t.child,n.memoizedProps=t.memoizedProps,n.memoizedState=t.memoizedState,n.updateQueue=t.updateQueue,e=t.dependencies,n.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext},n.sibling=t.sibling,n.index=t.index,n.ref=t.ref,n.refCleanup=t.refCleanup,n}function vh(t,e){t.flags&=65011714;var n=t.alternate;return n===null?(t.childLanes=0,t.lanes=e,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=n.childLanes,t.lanes=n.lanes,t.child=n.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=n.memoizedProps,t.memoizedState=n.memoizedState,t.updateQueue=n.updateQueue,t.type=n.type,e=n.dependencies,t.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),t}function as(t,e,n,l,r,o){var y=0;if(l=t,typeof t=="function")ar(t)&&(y=1);else if(typeof t=="string")y=q1(t,n,I.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case st:return t=ye(31,n,e,r),t.elementType=st,t.lanes=o,t;case D:return In(n.children,r,o,e);case w:y=8,r|=24;break;case U:return t=ye(12,n,e,r|2),t.elementType=U,t.lanes=o,t;case q:return t=ye(13,n,e,r),t.elementType=q,t.lanes=o,t;case P:return t=ye(19,n,e,r),t.elementType=P,t.lanes=o,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case O:case _:y=10;break t;case j:y=9;break t;case Z:y=11;break t;case nt:y=14;break t;case F:y=16,l=null;break t}y=29,n=Error(u(130,t===null?"null":typeof t,"")),l=null}return e=ye(y,n,e,r),e.elementType=t,e.type=l,e.lanes=o,e}function In(t,e,n,l){return t=ye(7,t,l,e),t.lanes=n,t}function ir(t,e,n){return t=ye(6,t,null,e),t.lanes=n,t}function lr(t,e,n){return e=ye(4,t.children!==null?t.children:[],t.key,e),e.lanes=n,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}var Ua=[],_a=0,is=null,ls=0,De=[],Me=0,ta=null,en=1,nn="";function ea(t,e){Ua[_a++]=ls,Ua[_a++]=is,is=t,ls=e}function Sh(t,e,n){De[Me++]=en,De[Me++]=nn,De[Me++]=ta,ta=t;var l=en;t=nn;var r=32-me(l)-1;l&=~(1<<r),n+=1;var o=32-me(e)+r;if(30<o){var y=r-r%5;o=(l&(1<<y)-1).toString(32),l>>=y,r-=y,en=1<<32-me(e)+r|n<<r|l,nn=o+t}else en=1<<o|n<<r|l,nn=t}function sr(t){t.return!==null&&(ea(t,1),Sh(t,1,0))}function ur(t){for(;t===is;)is=Ua[--_a],Ua[_a]=null,ls=Ua[--_a],Ua[_a]=null;for(;t===ta;)ta=De[--Me],De[Me]=null,nn=De[--Me],De[Me]=null,en=De[--Me],De[Me]=null}var ie=null,Vt=null,yt=!1,na=null,Ge=!1,rr=Error(u(519));function aa(t){var e=Error(u(418,""));throw Vi(Ae(e,t)),rr}function bh(t){var e=t.stateNode,n=t.type,l=t.memoizedProps;switch(e[It]=t,e[se]=l,n){case"dialog":ft("cancel",e),ft("close",e);break;case"iframe":case"object":case"embed":ft("load",e);break;case"video":case"audio":for(n=0;n<nl.length;n++)ft(nl[n],e);break;case"source":ft("error",e);break;case"img":case"image":case"link":ft("error",e),ft("load",e);break;case"details":ft("toggle",e);break;case"input":ft("invalid",e),_f(e,l.value,l.defaultValue,l.checked,l.defaultChecked,l.type,l.name,!0),Zl(e);break;case"select":ft("invalid",e);break;case"textarea":ft("invalid",e),Bf(e,l.value,l.defaultValue,l.children),Zl(e)}n=l.children,typeof n!="string"&&typeof n!="number"&&typeof n!="bigint"||e.textContent===""+n||l.suppressHydrationWarning===!0||Bm(e.textContent,n)?(l.popover!=null&&(ft("beforetoggle",e),ft("toggle",e)),l.onScroll!=null&&ft("scroll",e),l.onScrollEnd!=null&&ft("scrollend",e),l.onClick!=null&&(e.onclick=Hs),e=!0):e=!1,e||aa(t)}function xh(t){for(ie=t.return;ie;)switch(ie.tag){case 5:case 13:Ge=!1;return;case 27:case 3:Ge=!0;return;default:ie=ie.return}}function Oi(t){if(t!==ie)return!1;if(!yt)return xh(t),yt=!0,!1;var e=t.tag,n;if((n=e!==3&&e!==27)&&((n=e===5)&&(n=t.type,n=!(n!=="form"&&n!=="button")||Ro(t.type,t.memoizedProps)),n=!n),n&&Vt&&aa(t),xh(t),e===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(u(317));t:{for(t=t.nextSibling,e=0;t;){if(t.nodeType===8)if(n=t.data,n==="/$"){if(e===0){Vt=Le(t.nextSibling);break t}e--}else n!=="$"&&n!=="$!"&&n!=="$?"||e++;t=t.nextSibling}Vt=null}}else e===27?(e=Vt,Bn(t.type)?(t=Co,Co=null,Vt=t):Vt=e):Vt=ie?Le(t.stateNode.nextSibling):null;return!0}function Ni(){Vt=ie=null,yt=!1}function Th(){var t=na;return t!==null&&(ce===null?ce=t:ce.push.apply(ce,t),na=null),t}function Vi(t){na===null?na=[t]:na.push(t)}var or=X(null),ia=null,an=null;function Tn(t,e,n){Q(or,e._currentValue),e._currentValue=n}function ln(t){t._currentValue=or.current,k(or)}function cr(t,e,n){for(;t!==null;){var l=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,l!==null&&(l.childLanes|=e)):l!==null&&(l.childLanes&e)!==e&&(l.childLanes|=e),t===n)break;t=t.return}}function fr(t,e,n,l){var r=t.child;for(r!==null&&(r.return=t);r!==null;){var o=r.dependencies;if(o!==null){var y=r.child;o=o.firstContext;t:for(;o!==null;){var v=o;o=r;for(var x=0;x<e.length;x++)if(v.context===e[x]){o.lanes|=n,v=o.alternate,v!==null&&(v.lanes|=n),cr(o.return,n,t),l||(y=null);break t}o=v.next}}else if(r.tag===18){if(y=r.return,y===null)throw Error(u(341));y.lanes|=n,o=y.alternate,o!==null&&(o.lanes|=n),cr(y,n,t),y=null}else y=r.child;if(y!==null)y.return=r;else for(y=r;y!==null;){if(y===t){y=null;break}if(r=y.sibling,r!==null){r.return=y.return,y=r;break}y=y.return}r=y}}function zi(t,e,n,l){t=null;for(var r=e,o=!1;r!==null;){if(!o){if((r.flags&524288)!==0)o=!0;else if((r.flags&262144)!==0)break}if(r.tag===10){var y=r.alternate;if(y===null)throw Error(u(387));if(y=y.memoizedProps,y!==null){var v=r.type;pe(r.pendingProps.value,y.value)||(t!==null?t.push(v):t=[v])}}else if(r===he.current){if(y=r.alternate,y===null)throw Error(u(387));y.memoizedState.memoizedState!==r.memoizedState.memoizedState&&(t!==null?t.push(rl):t=[rl])}r=r.return}t!==null&&fr(e,t,n,l),e.flags|=262144}function ss(t){for(t=t.firstContext;t!==null;){if(!pe(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function la(t){ia=t,an=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function te(t){return Eh(ia,t)}function us(t,e){return ia===null&&la(t),Eh(t,e)}function Eh(t,e){var n=e._currentValue;if(e={context:e,memoizedValue:n,next:null},an===null){if(t===null)throw Error(u(308));an=e,t.dependencies={lanes:0,firstContext:e},t.flags|=524288}else an=an.next=e;return n}var Yv=typeof AbortController<"u"?AbortController:function(){var t=[],e=this.signal={aborted:!1,addEventListener:function(n,l){t.push(l)}};this.abort=function(){e.aborted=!0,t.forEach(function(n){return n()})}},qv=a.unstable_scheduleCallback,Gv=a.unstable_NormalPriority,Gt={$$typeof:_,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function hr(){return{controller:new Yv,data:new Map,refCount:0}}function Ui(t){t.refCount--,t.refCount===0&&qv(Gv,function(){t.controller.abort()})}var _i=null,dr=0,La=0,Ba=null;function Xv(t,e){if(_i===null){var n=_i=[];dr=0,La=yo(),Ba={status:"pending",value:void 0,then:function(l){n.push(l)}}}return dr++,e.then(Ah,Ah),e}function Ah(){if(--dr===0&&_i!==null){Ba!==null&&(Ba.status="fulfilled");var t=_i;_i=null,La=0,Ba=null;for(var e=0;e<t.length;e++)(0,t[e])()}}function Kv(t,e){var n=[],l={status:"pending",value:null,reason:null,then:function(r){n.push(r)}};return t.then(function(){l.status="fulfilled",l.value=e;for(var r=0;r<n.length;r++)(0,n[r])(e)},function(r){for(l.status="rejected",l.reason=r,r=0;r<n.length;r++)(0,n[r])(void 0)}),l}var Rh=B.S;B.S=function(t,e){typeof e=="object"&&e!==null&&typeof e.then=="function"&&Xv(t,e),Rh!==null&&Rh(t,e)};var sa=X(null);function mr(){var t=sa.current;return t!==null?t:Rt.pooledCache}function rs(t,e){e===null?Q(sa,sa.current):Q(sa,e.pool)}function Dh(){var t=mr();return t===null?null:{parent:Gt._currentValue,pool:t}}var Li=Error(u(460)),Mh=Error(u(474)),os=Error(u(542)),pr={then:function(){}};function wh(t){return t=t.status,t==="fulfilled"||t==="rejected"}function cs(){}function Ch(t,e,n){switch(n=t[n],n===void 0?t.push(e):n!==e&&(e.then(cs,cs),e=n),e.status){case"fulfilled":return e.value;case"rejected":throw t=e.reason,Nh(t),t;default:if(typeof e.status=="string")e.then(cs,cs);else{if(t=Rt,t!==null&&100<t.shellSuspendCounter)throw Error(u(482));t=e,t.status="pending",t.then(function(l){if(e.status==="pending"){var r=e;r.status="fulfilled",r.value=l}},function(l){if(e.status==="pending"){var r=e;r.status="rejected",r.reason=l}})}switch(e.status){case"fulfilled":return e.value;case"rejected":throw t=e.reason,Nh(t),t}throw Bi=e,Li}}var Bi=null;function Oh(){if(Bi===null)throw Error(u(459));var t=Bi;return Bi=null,t}function Nh(t){if(t===Li||t===os)throw Error(u(483))}var En=!1;function yr(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function gr(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function An(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function Rn(t,e,n){var l=t.updateQueue;if(l===null)return null;if(l=l.shared,(vt&2)!==0){var r=l.pending;return r===null?e.next=e:(e.next=r.next,r.next=e),l.pending=e,e=ns(t),gh(t,null,n),e}return es(t,l,e,n),ns(t)}function ji(t,e,n){if(e=e.updateQueue,e!==null&&(e=e.shared,(n&4194048)!==0)){var l=e.lanes;l&=t.pendingLanes,n|=l,e.lanes=n,Af(t,n)}}function vr(t,e){var n=t.updateQueue,l=t.alternate;if(l!==null&&(l=l.updateQueue,n===l)){var r=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var y={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};o===null?r=o=y:o=o.next=y,n=n.next}while(n!==null);o===null?r=o=e:o=o.next=e}else r=o=e;n={baseState:l.baseState,firstBaseUpdate:r,lastBaseUpdate:o,shared:l.shared,callbacks:l.callbacks},t.updateQueue=n;return}t=n.lastBaseUpdate,t===null?n.firstBaseUpdate=e:t.next=e,n.lastBaseUpdate=e}var Sr=!1;function Hi(){if(Sr){var t=Ba;if(t!==null)throw t}}function Yi(t,e,n,l){Sr=!1;var r=t.updateQueue;En=!1;var o=r.firstBaseUpdate,y=r.lastBaseUpdate,v=r.shared.pending;if(v!==null){r.shared.pending=null;var x=v,N=x.next;x.next=null,y===null?o=N:y.next=N,y=x;var L=t.alternate;L!==null&&(L=L.updateQueue,v=L.lastBaseUpdate,v!==y&&(v===null?L.firstBaseUpdate=N:v.next=N,L.lastBaseUpdate=x))}if(o!==null){var Y=r.baseState;y=0,L=N=x=null,v=o;do{var V=v.lane&-536870913,z=V!==v.lane;if(z?(ht&V)===V:(l&V)===V){V!==0&&V===La&&(Sr=!0),L!==null&&(L=L.next={lane:0,tag:v.tag,payload:v.payload,callback:null,next:null});t:{var at=t,tt=v;V=e;var Tt=n;switch(tt.tag){case 1:if(at=tt.payload,typeof at=="function"){Y=at.call(Tt,Y,V);break t}Y=at;break t;case 3:at.flags=at.flags&-65537|128;case 0:if(at=tt.payload,V=typeof at=="function"?at.call(Tt,Y,V):at,V==null)break t;Y=g({},Y,V);break t;case 2:En=!0}}V=v.callback,V!==null&&(t.flags|=64,z&&(t.flags|=8192),z=r.callbacks,z===null?r.callbacks=[V]:z.push(V))}else z={lane:V,tag:v.tag,payload:v.payload,callback:v.callback,next:null},L===null?(N=L=z,x=Y):L=L.next=z,y|=V;if(v=v.next,v===null){if(v=r.shared.pending,v===null)break;z=v,v=z.next,z.next=null,r.lastBaseUpdate=z,r.shared.pending=null}}while(!0);L===null&&(x=Y),r.baseState=x,r.firstBaseUpdate=N,r.lastBaseUpdate=L,o===null&&(r.shared.lanes=0),zn|=y,t.lanes=y,t.memoizedState=Y}}function Vh(t,e){if(typeof t!="function")throw Error(u(191,t));t.call(e)}function zh(t,e){var n=t.callbacks;if(n!==null)for(t.callbacks=null,t=0;t<n.length;t++)Vh(n[t],e)}var ja=X(null),fs=X(0);function Uh(t,e){t=hn,Q(fs,t),Q(ja,e),hn=t|e.baseLanes}function br(){Q(fs,hn),Q(ja,ja.current)}function xr(){hn=fs.current,k(ja),k(fs)}var Dn=0,rt=null,bt=null,jt=null,hs=!1,Ha=!1,ua=!1,ds=0,qi=0,Ya=null,Zv=0;function _t(){throw Error(u(321))}function Tr(t,e){if(e===null)return!1;for(var n=0;n<e.length&&n<t.length;n++)if(!pe(t[n],e[n]))return!1;return!0}function Er(t,e,n,l,r,o){return Dn=o,rt=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,B.H=t===null||t.memoizedState===null?gd:vd,ua=!1,o=n(l,r),ua=!1,Ha&&(o=Lh(e,n,l,r)),_h(t),o}function _h(t){B.H=Ss;var e=bt!==null&&bt.next!==null;if(Dn=0,jt=bt=rt=null,hs=!1,qi=0,Ya=null,e)throw Error(u(300));t===null||Zt||(t=t.dependencies,t!==null&&ss(t)&&(Zt=!0))}function Lh(t,e,n,l){rt=t;var r=0;do{if(Ha&&(Ya=null),qi=0,Ha=!1,25<=r)throw Error(u(301));if(r+=1,jt=bt=null,t.updateQueue!=null){var o=t.updateQueue;o.lastEffect=null,o.events=null,o.stores=null,o.memoCache!=null&&(o.memoCache.index=0)}B.H=Wv,o=e(n,l)}while(Ha);return o}function Qv(){var t=B.H,e=t.useState()[0];return e=typeof e.then=="function"?Gi(e):e,t=t.useState()[0],(bt!==null?bt.memoizedState:null)!==t&&(rt.flags|=1024),e}function Ar(){var t=ds!==0;return ds=0,t}function Rr(t,e,n){e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~n}function Dr(t){if(hs){for(t=t.memoizedState;t!==null;){var e=t.queue;e!==null&&(e.pending=null),t=t.next}hs=!1}Dn=0,jt=bt=rt=null,Ha=!1,qi=ds=0,Ya=null}function re(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return jt===null?rt.memoizedState=jt=t:jt=jt.next=t,jt}function Ht(){if(bt===null){var t=rt.alternate;t=t!==null?t.memoizedState:null}else t=bt.next;var e=jt===null?rt.memoizedState:jt.next;if(e!==null)jt=e,bt=t;else{if(t===null)throw rt.alternate===null?Error(u(467)):Error(u(310));bt=t,t={memoizedState:bt.memoizedState,baseState:bt.baseState,baseQueue:bt.baseQueue,queue:bt.queue,next:null},jt===null?rt.memoizedState=jt=t:jt=jt.next=t}return jt}function Mr(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Gi(t){var e=qi;return qi+=1,Ya===null&&(Ya=[]),t=Ch(Ya,t,e),e=rt,(jt===null?e.memoizedState:jt.next)===null&&(e=e.alternate,B.H=e===null||e.memoizedState===null?gd:vd),t}function ms(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return Gi(t);if(t.$$typeof===_)return te(t)}throw Error(u(438,String(t)))}function wr(t){var e=null,n=rt.updateQueue;if(n!==null&&(e=n.memoCache),e==null){var l=rt.alternate;l!==null&&(l=l.updateQueue,l!==null&&(l=l.memoCache,l!=null&&(e={data:l.data.map(function(r){return r.slice()}),index:0})))}if(e==null&&(e={data:[],index:0}),n===null&&(n=Mr(),rt.updateQueue=n),n.memoCache=e,n=e.data[e.index],n===void 0)for(n=e.data[e.index]=Array(t),l=0;l<t;l++)n[l]=gt;return e.index++,n}function sn(t,e){return typeof e=="function"?e(t):e}function ps(t){var e=Ht();return Cr(e,bt,t)}function Cr(t,e,n){var l=t.queue;if(l===null)throw Error(u(311));l.lastRenderedReducer=n;var r=t.baseQueue,o=l.pending;if(o!==null){if(r!==null){var y=r.next;r.next=o.next,o.next=y}e.baseQueue=r=o,l.pending=null}if(o=t.baseState,r===null)t.memoizedState=o;else{e=r.next;var v=y=null,x=null,N=e,L=!1;do{var Y=N.lane&-536870913;if(Y!==N.lane?(ht&Y)===Y:(Dn&Y)===Y){var V=N.revertLane;if(V===0)x!==null&&(x=x.next={lane:0,revertLane:0,action:N.action,hasEagerState:N.hasEagerState,eagerState:N.eagerState,next:null}),Y===La&&(L=!0);else if((Dn&V)===V){N=N.next,V===La&&(L=!0);continue}else Y={lane:0,revertLane:N.revertLane,action:N.action,hasEagerState:N.hasEagerState,eagerState:N.eagerState,next:null},x===null?(v=x=Y,y=o):x=x.next=Y,rt.lanes|=V,zn|=V;Y=N.action,ua&&n(o,Y),o=N.hasEagerState?N.eagerState:n(o,Y)}else V={lane:Y,revertLane:N.revertLane,action:N.action,hasEagerState:N.hasEagerState,eagerState:N.eagerState,next:null},x===null?(v=x=V,y=o):x=x.next=V,rt.lanes|=Y,zn|=Y;N=N.next}while(N!==null&&N!==e);if(x===null?y=o:x.next=v,!pe(o,t.memoizedState)&&(Zt=!0,L&&(n=Ba,n!==null)))throw n;t.memoizedState=o,t.baseState=y,t.baseQueue=x,l.lastRenderedState=o}return r===null&&(l.lanes=0),[t.memoizedState,l.dispatch]}function Or(t){var e=Ht(),n=e.queue;if(n===null)throw Error(u(311));n.lastRenderedReducer=t;var l=n.dispatch,r=n.pending,o=e.memoizedState;if(r!==null){n.pending=null;var y=r=r.next;do o=t(o,y.action),y=y.next;while(y!==r);pe(o,e.memoizedState)||(Zt=!0),e.memoizedState=o,e.baseQueue===null&&(e.baseState=o),n.lastRenderedState=o}return[o,l]}function Bh(t,e,n){var l=rt,r=Ht(),o=yt;if(o){if(n===void 0)throw Error(u(407));n=n()}else n=e();var y=!pe((bt||r).memoizedState,n);y&&(r.memoizedState=n,Zt=!0),r=r.queue;var v=Yh.bind(null,l,r,t);if(Xi(2048,8,v,[t]),r.getSnapshot!==e||y||jt!==null&&jt.memoizedState.tag&1){if(l.flags|=2048,qa(9,ys(),Hh.bind(null,l,r,n,e),null),Rt===null)throw Error(u(349));o||(Dn&124)!==0||jh(l,e,n)}return n}function jh(t,e,n){t.flags|=16384,t={getSnapshot:e,value:n},e=rt.updateQueue,e===null?(e=Mr(),rt.updateQueue=e,e.stores=[t]):(n=e.stores,n===null?e.stores=[t]:n.push(t))}function Hh(t,e,n,l){e.value=n,e.getSnapshot=l,qh(e)&&Gh(t)}function Yh(t,e,n){return n(function(){qh(e)&&Gh(t)})}function qh(t){var e=t.getSnapshot;t=t.value;try{var n=e();return!pe(t,n)}catch{return!0}}function Gh(t){var e=Va(t,2);e!==null&&xe(e,t,2)}function Nr(t){var e=re();if(typeof t=="function"){var n=t;if(t=n(),ua){Sn(!0);try{n()}finally{Sn(!1)}}}return e.memoizedState=e.baseState=t,e.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:sn,lastRenderedState:t},e}function Xh(t,e,n,l){return t.baseState=n,Cr(t,bt,typeof l=="function"?l:sn)}function kv(t,e,n,l,r){if(vs(t))throw Error(u(485));if(t=e.action,t!==null){var o={payload:r,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(y){o.listeners.push(y)}};B.T!==null?n(!0):o.isTransition=!1,l(o),n=e.pending,n===null?(o.next=e.pending=o,Kh(e,o)):(o.next=n.next,e.pending=n.next=o)}}function Kh(t,e){var n=e.action,l=e.payload,r=t.state;if(e.isTransition){var o=B.T,y={};B.T=y;try{var v=n(r,l),x=B.S;x!==null&&x(y,v),Zh(t,e,v)}catch(N){Vr(t,e,N)}finally{B.T=o}}else try{o=n(r,l),Zh(t,e,o)}catch(N){Vr(t,e,N)}}function Zh(t,e,n){n!==null&&typeof n=="object"&&typeof n.then=="function"?n.then(function(l){Qh(t,e,l)},function(l){return Vr(t,e,l)}):Qh(t,e,n)}function Qh(t,e,n){e.status="fulfilled",e.value=n,kh(e),t.state=n,e=t.pending,e!==null&&(n=e.next,n===e?t.pending=null:(n=n.next,e.next=n,Kh(t,n)))}function Vr(t,e,n){var l=t.pending;if(t.pending=null,l!==null){l=l.next;do e.status="rejected",e.reason=n,kh(e),e=e.next;while(e!==l)}t.action=null}function kh(t){t=t.listeners;for(var e=0;e<t.length;e++)(0,t[e])()}function Ph(t,e){return e}function Jh(t,e){if(yt){var n=Rt.formState;if(n!==null){t:{var l=rt;if(yt){if(Vt){e:{for(var r=Vt,o=Ge;r.nodeType!==8;){if(!o){r=null;break e}if(r=Le(r.nextSibling),r===null){r=null;break e}}o=r.data,r=o==="F!"||o==="F"?r:null}if(r){Vt=Le(r.nextSibling),l=r.data==="F!";break t}}aa(l)}l=!1}l&&(e=n[0])}}return n=re(),n.memoizedState=n.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ph,lastRenderedState:e},n.queue=l,n=md.bind(null,rt,l),l.dispatch=n,l=Nr(!1),o=Br.bind(null,rt,!1,l.queue),l=re(),r={state:e,dispatch:null,action:t,pending:null},l.queue=r,n=kv.bind(null,rt,r,o,n),r.dispatch=n,l.memoizedState=t,[e,n,!1]}function Fh(t){var e=Ht();return $h(e,bt,t)}function $h(t,e,n){if(e=Cr(t,e,Ph)[0],t=ps(sn)[0],typeof e=="object"&&e!==null&&typeof e.then=="function")try{var l=Gi(e)}catch(y){throw y===Li?os:y}else l=e;e=Ht();var r=e.queue,o=r.dispatch;return n!==e.memoizedState&&(rt.flags|=2048,qa(9,ys(),Pv.bind(null,r,n),null)),[l,o,t]}function Pv(t,e){t.action=e}function Wh(t){var e=Ht(),n=bt;if(n!==null)return $h(e,n,t);Ht(),e=e.memoizedState,n=Ht();var l=n.queue.dispatch;return n.memoizedState=t,[e,l,!1]}function qa(t,e,n,l){return t={tag:t,create:n,deps:l,inst:e,next:null},e=rt.updateQueue,e===null&&(e=Mr(),rt.updateQueue=e),n=e.lastEffect,n===null?e.lastEffect=t.next=t:(l=n.next,n.next=t,t.next=l,e.lastEffect=t),t}function ys(){return{destroy:void 0,resource:void 0}}function Ih(){return Ht().memoizedState}function gs(t,e,n,l){var r=re();l=l===void 0?null:l,rt.flags|=t,r.memoizedState=qa(1|e,ys(),n,l)}function Xi(t,e,n,l){var r=Ht();l=l===void 0?null:l;var o=r.memoizedState.inst;bt!==null&&l!==null&&Tr(l,bt.memoizedState.deps)?r.memoizedState=qa(e,o,n,l):(rt.flags|=t,r.memoizedState=qa(1|e,o,n,l))}function td(t,e){gs(8390656,8,t,e)}function ed(t,e){Xi(2048,8,t,e)}function nd(t,e){return Xi(4,2,t,e)}function ad(t,e){return Xi(4,4,t,e)}function id(t,e){if(typeof e=="function"){t=t();var n=e(t);return function(){typeof n=="function"?n():e(null)}}if(e!=null)return t=t(),e.current=t,function(){e.current=null}}function ld(t,e,n){n=n!=null?n.concat([t]):null,Xi(4,4,id.bind(null,e,t),n)}function zr(){}function sd(t,e){var n=Ht();e=e===void 0?null:e;var l=n.memoizedState;return e!==null&&Tr(e,l[1])?l[0]:(n.memoizedState=[t,e],t)}function ud(t,e){var n=Ht();e=e===void 0?null:e;var l=n.memoizedState;if(e!==null&&Tr(e,l[1]))return l[0];if(l=t(),ua){Sn(!0);try{t()}finally{Sn(!1)}}return n.memoizedState=[l,e],l}function Ur(t,e,n){return n===void 0||(Dn&1073741824)!==0?t.memoizedState=e:(t.memoizedState=n,t=cm(),rt.lanes|=t,zn|=t,n)}function rd(t,e,n,l){return pe(n,e)?n:ja.current!==null?(t=Ur(t,n,l),pe(t,e)||(Zt=!0),t):(Dn&42)===0?(Zt=!0,t.memoizedState=n):(t=cm(),rt.lanes|=t,zn|=t,e)}function od(t,e,n,l,r){var o=K.p;K.p=o!==0&&8>o?o:8;var y=B.T,v={};B.T=v,Br(t,!1,e,n);try{var x=r(),N=B.S;if(N!==null&&N(v,x),x!==null&&typeof x=="object"&&typeof x.then=="function"){var L=Kv(x,l);Ki(t,e,L,be(t))}else Ki(t,e,l,be(t))}catch(Y){Ki(t,e,{then:function(){},status:"rejected",reason:Y},be())}finally{K.p=o,B.T=y}}function Jv(){}function _r(t,e,n,l){if(t.tag!==5)throw Error(u(476));var r=cd(t).queue;od(t,r,e,$,n===null?Jv:function(){return fd(t),n(l)})}function cd(t){var e=t.memoizedState;if(e!==null)return e;e={memoizedState:$,baseState:$,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:sn,lastRenderedState:$},next:null};var n={};return e.next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:sn,lastRenderedState:n},next:null},t.memoizedState=e,t=t.alternate,t!==null&&(t.memoizedState=e),e}function fd(t){var e=cd(t).next.queue;Ki(t,e,{},be())}function Lr(){return te(rl)}function hd(){return Ht().memoizedState}function dd(){return Ht().memoizedState}function Fv(t){for(var e=t.return;e!==null;){switch(e.tag){case 24:case 3:var n=be();t=An(n);var l=Rn(e,t,n);l!==null&&(xe(l,e,n),ji(l,e,n)),e={cache:hr()},t.payload=e;return}e=e.return}}function $v(t,e,n){var l=be();n={lane:l,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},vs(t)?pd(e,n):(n=nr(t,e,n,l),n!==null&&(xe(n,t,l),yd(n,e,l)))}function md(t,e,n){var l=be();Ki(t,e,n,l)}function Ki(t,e,n,l){var r={lane:l,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(vs(t))pd(e,r);else{var o=t.alternate;if(t.lanes===0&&(o===null||o.lanes===0)&&(o=e.lastRenderedReducer,o!==null))try{var y=e.lastRenderedState,v=o(y,n);if(r.hasEagerState=!0,r.eagerState=v,pe(v,y))return es(t,e,r,0),Rt===null&&ts(),!1}catch{}finally{}if(n=nr(t,e,r,l),n!==null)return xe(n,t,l),yd(n,e,l),!0}return!1}function Br(t,e,n,l){if(l={lane:2,revertLane:yo(),action:l,hasEagerState:!1,eagerState:null,next:null},vs(t)){if(e)throw Error(u(479))}else e=nr(t,n,l,2),e!==null&&xe(e,t,2)}function vs(t){var e=t.alternate;return t===rt||e!==null&&e===rt}function pd(t,e){Ha=hs=!0;var n=t.pending;n===null?e.next=e:(e.next=n.next,n.next=e),t.pending=e}function yd(t,e,n){if((n&4194048)!==0){var l=e.lanes;l&=t.pendingLanes,n|=l,e.lanes=n,Af(t,n)}}var Ss={readContext:te,use:ms,useCallback:_t,useContext:_t,useEffect:_t,useImperativeHandle:_t,useLayoutEffect:_t,useInsertionEffect:_t,useMemo:_t,useReducer:_t,useRef:_t,useState:_t,useDebugValue:_t,useDeferredValue:_t,useTransition:_t,useSyncExternalStore:_t,useId:_t,useHostTransitionStatus:_t,useFormState:_t,useActionState:_t,useOptimistic:_t,useMemoCache:_t,useCacheRefresh:_t},gd={readContext:te,use:ms,useCallback:function(t,e){return re().memoizedState=[t,e===void 0?null:e],t},useContext:te,useEffect:td,useImperativeHandle:function(t,e,n){n=n!=null?n.concat([t]):null,gs(4194308,4,id.bind(null,e,t),n)},useLayoutEffect:function(t,e){return gs(4194308,4,t,e)},useInsertionEffect:function(t,e){gs(4,2,t,e)},useMemo:function(t,e){var n=re();e=e===void 0?null:e;var l=t();if(ua){Sn(!0);try{t()}finally{Sn(!1)}}return n.memoizedState=[l,e],l},useReducer:function(t,e,n){var l=re();if(n!==void 0){var r=n(e);if(ua){Sn(!0);try{n(e)}finally{Sn(!1)}}}else r=e;return l.memoizedState=l.baseState=r,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:r},l.queue=t,t=t.dispatch=$v.bind(null,rt,t),[l.memoizedState,t]},useRef:function(t){var e=re();return t={current:t},e.memoizedState=t},useState:function(t){t=Nr(t);var e=t.queue,n=md.bind(null,rt,e);return e.dispatch=n,[t.memoizedState,n]},useDebugValue:zr,useDeferredValue:function(t,e){var n=re();return Ur(n,t,e)},useTransition:function(){var t=Nr(!1);return t=od.bind(null,rt,t.queue,!0,!1),re().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,e,n){var l=rt,r=re();if(yt){if(n===void 0)throw Error(u(407));n=n()}else{if(n=e(),Rt===null)throw Error(u(349));(ht&124)!==0||jh(l,e,n)}r.memoizedState=n;var o={value:n,getSnapshot:e};return r.queue=o,td(Yh.bind(null,l,o,t),[t]),l.flags|=2048,qa(9,ys(),Hh.bind(null,l,o,n,e),null),n},useId:function(){var t=re(),e=Rt.identifierPrefix;if(yt){var n=nn,l=en;n=(l&~(1<<32-me(l)-1)).toString(32)+n,e="«"+e+"R"+n,n=ds++,0<n&&(e+="H"+n.toString(32)),e+="»"}else n=Zv++,e="«"+e+"r"+n.toString(32)+"»";return t.memoizedState=e},useHostTransitionStatus:Lr,useFormState:Jh,useActionState:Jh,useOptimistic:function(t){var e=re();e.memoizedState=e.baseState=t;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return e.queue=n,e=Br.bind(null,rt,!0,n),n.dispatch=e,[t,e]},useMemoCache:wr,useCacheRefresh:function(){return re().memoizedState=Fv.bind(null,rt)}},vd={readContext:te,use:ms,useCallback:sd,useContext:te,useEffect:ed,useImperativeHandle:ld,useInsertionEffect:nd,useLayoutEffect:ad,useMemo:ud,useReducer:ps,useRef:Ih,useState:function(){return ps(sn)},useDebugValue:zr,useDeferredValue:function(t,e){var n=Ht();return rd(n,bt.memoizedState,t,e)},useTransition:function(){var t=ps(sn)[0],e=Ht().memoizedState;return[typeof t=="boolean"?t:Gi(t),e]},useSyncExternalStore:Bh,useId:hd,useHostTransitionStatus:Lr,useFormState:Fh,useActionState:Fh,useOptimistic:function(t,e){var n=Ht();return Xh(n,bt,t,e)},useMemoCache:wr,useCacheRefresh:dd},Wv={readContext:te,use:ms,useCallback:sd,useContext:te,useEffect:ed,useImperativeHandle:ld,useInsertionEffect:nd,useLayoutEffect:ad,useMemo:ud,useReducer:Or,useRef:Ih,useState:function(){return Or(sn)},useDebugValue:zr,useDeferredValue:function(t,e){var n=Ht();return bt===null?Ur(n,t,e):rd(n,bt.memoizedState,t,e)},useTransition:function(){var t=Or(sn)[0],e=Ht().memoizedState;return[typeof t=="boolean"?t:Gi(t),e]},useSyncExternalStore:Bh,useId:hd,useHostTransitionStatus:Lr,useFormState:Wh,useActionState:Wh,useOptimistic:function(t,e){var n=Ht();return bt!==null?Xh(n,bt,t,e):(n.baseState=t,[t,n.queue.dispatch])},useMemoCache:wr,useCacheRefresh:dd},Ga=null,Zi=0;function bs(t){var e=Zi;return Zi+=1,Ga===null&&(Ga=[]),Ch(Ga,t,e)}function Qi(t,e){e=e.props.ref,t.ref=e!==void 0?e:null}function xs(t,e){throw e.$$typeof===S?Error(u(525)):(t=Object.prototype.toString.call(e),Error(u(31,t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)))}function Sd(t){var e=t._init;return e(t._payload)}function bd(t){function e(M,A){if(t){var C=M.deletions;C===null?(M.deletions=[A],M.flags|=16):C.push(A)}}function n(M,A){if(!t)return null;for(;A!==null;)e(M,A),A=A.sibling;return null}function l(M){for(var A=new Map;M!==null;)M.key!==null?A.set(M.key,M):A.set(M.index,M),M=M.sibling;return A}function r(M,A){return M=tn(M,A),M.index=0,M.sibling=null,M}function o(M,A,C){return M.index=C,t?(C=M.alternate,C!==null?(C=C.index,C<A?(M.flags|=67108866,A):C):(M.flags|=67108866,A)):(M.flags|=1048576,A)}function y(M){return t&&M.alternate===null&&(M.flags|=67108866),M}function v(M,A,C,H){return A===null||A.tag!==6?(A=ir(C,M.mode,H),A.return=M,A):(A=r(A,C),A.return=M,A)}function x(M,A,C,H){var J=C.type;return J===D?L(M,A,C.props.children,H,C.key):A!==null&&(A.elementType===J||typeof J=="object"&&J!==null&&J.$$typeof===F&&Sd(J)===A.type)?(A=r(A,C.props),Qi(A,C),A.return=M,A):(A=as(C.type,C.key,C.props,null,M.mode,H),Qi(A,C),A.return=M,A)}function N(M,A,C,H){return A===null||A.tag!==4||A.stateNode.containerInfo!==C.containerInfo||A.stateNode.implementation!==C.implementation?(A=lr(C,M.mode,H),A.return=M,A):(A=r(A,C.children||[]),A.return=M,A)}function L(M,A,C,H,J){return A===null||A.tag!==7?(A=In(C,M.mode,H,J),A.return=M,A):(A=r(A,C),A.return=M,A)}function Y(M,A,C){if(typeof A=="string"&&A!==""||typeof A=="number"||typeof A=="bigint")return A=ir(""+A,M.mode,C),A.return=M,A;if(typeof A=="object"&&A!==null){switch(A.$$typeof){case b:return C=as(A.type,A.key,A.props,null,M.mode,C),Qi(C,A),C.return=M,C;case R:return A=lr(A,M.mode,C),A.return=M,A;case F:var H=A._init;return A=H(A._payload),Y(M,A,C)}if(Pt(A)||qt(A))return A=In(A,M.mode,C,null),A.return=M,A;if(typeof A.then=="function")return Y(M,bs(A),C);if(A.$$typeof===_)return Y(M,us(M,A),C);xs(M,A)}return null}function V(M,A,C,H){var J=A!==null?A.key:null;if(typeof C=="string"&&C!==""||typeof C=="number"||typeof C=="bigint")return J!==null?null:v(M,A,""+C,H);if(typeof C=="object"&&C!==null){switch(C.$$typeof){case b:return C.key===J?x(M,A,C,H):null;case R:return C.key===J?N(M,A,C,H):null;case F:return J=C._init,C=J(C._payload),V(M,A,C,H)}if(Pt(C)||qt(C))return J!==null?null:L(M,A,C,H,null);if(typeof C.then=="function")return V(M,A,bs(C),H);if(C.$$typeof===_)return V(M,A,us(M,C),H);xs(M,C)}return null}function z(M,A,C,H,J){if(typeof H=="string"&&H!==""||typeof H=="number"||typeof H=="bigint")return M=M.get(C)||null,v(A,M,""+H,J);if(typeof H=="object"&&H!==null){switch(H.$$typeof){case b:return M=M.get(H.key===null?C:H.key)||null,x(A,M,H,J);case R:return M=M.get(H.key===null?C:H.key)||null,N(A,M,H,J);case F:var ot=H._init;return H=ot(H._payload),z(M,A,C,H,J)}if(Pt(H)||qt(H))return M=M.get(C)||null,L(A,M,H,J,null);if(typeof H.then=="function")return z(M,A,C,bs(H),J);if(H.$$typeof===_)return z(M,A,C,us(A,H),J);xs(A,H)}return null}function at(M,A,C,H){for(var J=null,ot=null,W=A,et=A=0,kt=null;W!==null&&et<C.length;et++){W.index>et?(kt=W,W=null):kt=W.sibling;var mt=V(M,W,C[et],H);if(mt===null){W===null&&(W=kt);break}t&&W&&mt.alternate===null&&e(M,W),A=o(mt,A,et),ot===null?J=mt:ot.sibling=mt,ot=mt,W=kt}if(et===C.length)return n(M,W),yt&&ea(M,et),J;if(W===null){for(;et<C.length;et++)W=Y(M,C[et],H),W!==null&&(A=o(W,A,et),ot===null?J=W:ot.sibling=W,ot=W);return yt&&ea(M,et),J}for(W=l(W);et<C.length;et++)kt=z(W,M,et,C[et],H),kt!==null&&(t&&kt.alternate!==null&&W.delete(kt.key===null?et:kt.key),A=o(kt,A,et),ot===null?J=kt:ot.sibling=kt,ot=kt);return t&&W.forEach(function(Gn){return e(M,Gn)}),yt&&ea(M,et),J}function tt(M,A,C,H){if(C==null)throw Error(u(151));for(var J=null,ot=null,W=A,et=A=0,kt=null,mt=C.next();W!==null&&!mt.done;et++,mt=C.next()){W.index>et?(kt=W,W=null):kt=W.sibling;var Gn=V(M,W,mt.value,H);if(Gn===null){W===null&&(W=kt);break}t&&W&&Gn.alternate===null&&e(M,W),A=o(Gn,A,et),ot===null?J=Gn:ot.sibling=Gn,ot=Gn,W=kt}if(mt.done)return n(M,W),yt&&ea(M,et),J;if(W===null){for(;!mt.done;et++,mt=C.next())mt=Y(M,mt.value,H),mt!==null&&(A=o(mt,A,et),ot===null?J=mt:ot.sibling=mt,ot=mt);return yt&&ea(M,et),J}for(W=l(W);!mt.done;et++,mt=C.next())mt=z(W,M,et,mt.value,H),mt!==null&&(t&&mt.alternate!==null&&W.delete(mt.key===null?et:mt.key),A=o(mt,A,et),ot===null?J=mt:ot.sibling=mt,ot=mt);return t&&W.forEach(function(I1){return e(M,I1)}),yt&&ea(M,et),J}function Tt(M,A,C,H){if(typeof C=="object"&&C!==null&&C.type===D&&C.key===null&&(C=C.props.children),typeof C=="object"&&C!==null){switch(C.$$typeof){case b:t:{for(var J=C.key;A!==null;){if(A.key===J){if(J=C.type,J===D){if(A.tag===7){n(M,A.sibling),H=r(A,C.props.children),H.return=M,M=H;break t}}else if(A.elementType===J||typeof J=="object"&&J!==null&&J.$$typeof===F&&Sd(J)===A.type){n(M,A.sibling),H=r(A,C.props),Qi(H,C),H.return=M,M=H;break t}n(M,A);break}else e(M,A);A=A.sibling}C.type===D?(H=In(C.props.children,M.mode,H,C.key),H.return=M,M=H):(H=as(C.type,C.key,C.props,null,M.mode,H),Qi(H,C),H.return=M,M=H)}return y(M);case R:t:{for(J=C.key;A!==null;){if(A.key===J)if(A.tag===4&&A.stateNode.containerInfo===C.containerInfo&&A.stateNode.implementation===C.implementation){n(M,A.sibling),H=r(A,C.children||[]),H.return=M,M=H;break t}else{n(M,A);break}else e(M,A);A=A.sibling}H=lr(C,M.mode,H),H.return=M,M=H}return y(M);case F:return J=C._init,C=J(C._payload),Tt(M,A,C,H)}if(Pt(C))return at(M,A,C,H);if(qt(C)){if(J=qt(C),typeof J!="function")throw Error(u(150));return C=J.call(C),tt(M,A,C,H)}if(typeof C.then=="function")return Tt(M,A,bs(C),H);if(C.$$typeof===_)return Tt(M,A,us(M,C),H);xs(M,C)}return typeof C=="string"&&C!==""||typeof C=="number"||typeof C=="bigint"?(C=""+C,A!==null&&A.tag===6?(n(M,A.sibling),H=r(A,C),H.return=M,M=H):(n(M,A),H=ir(C,M.mode,H),H.return=M,M=H),y(M)):n(M,A)}return function(M,A,C,H){try{Zi=0;var J=Tt(M,A,C,H);return Ga=null,J}catch(W){if(W===Li||W===os)throw W;var ot=ye(29,W,null,M.mode);return ot.lanes=H,ot.return=M,ot}finally{}}}var Xa=bd(!0),xd=bd(!1),we=X(null),Xe=null;function Mn(t){var e=t.alternate;Q(Xt,Xt.current&1),Q(we,t),Xe===null&&(e===null||ja.current!==null||e.memoizedState!==null)&&(Xe=t)}function Td(t){if(t.tag===22){if(Q(Xt,Xt.current),Q(we,t),Xe===null){var e=t.alternate;e!==null&&e.memoizedState!==null&&(Xe=t)}}else wn()}function wn(){Q(Xt,Xt.current),Q(we,we.current)}function un(t){k(we),Xe===t&&(Xe=null),k(Xt)}var Xt=X(0);function Ts(t){for(var e=t;e!==null;){if(e.tag===13){var n=e.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||wo(n)))return e}else if(e.tag===19&&e.memoizedProps.revealOrder!==void 0){if((e.flags&128)!==0)return e}else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}function jr(t,e,n,l){e=t.memoizedState,n=n(l,e),n=n==null?e:g({},e,n),t.memoizedState=n,t.lanes===0&&(t.updateQueue.baseState=n)}var Hr={enqueueSetState:function(t,e,n){t=t._reactInternals;var l=be(),r=An(l);r.payload=e,n!=null&&(r.callback=n),e=Rn(t,r,l),e!==null&&(xe(e,t,l),ji(e,t,l))},enqueueReplaceState:function(t,e,n){t=t._reactInternals;var l=be(),r=An(l);r.tag=1,r.payload=e,n!=null&&(r.callback=n),e=Rn(t,r,l),e!==null&&(xe(e,t,l),ji(e,t,l))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var n=be(),l=An(n);l.tag=2,e!=null&&(l.callback=e),e=Rn(t,l,n),e!==null&&(xe(e,t,n),ji(e,t,n))}};function Ed(t,e,n,l,r,o,y){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(l,o,y):e.prototype&&e.prototype.isPureReactComponent?!wi(n,l)||!wi(r,o):!0}function Ad(t,e,n,l){t=e.state,typeof e.componentWillReceiveProps=="function"&&e.componentWillReceiveProps(n,l),typeof e.UNSAFE_componentWillReceiveProps=="function"&&e.UNSAFE_componentWillReceiveProps(n,l),e.state!==t&&Hr.enqueueReplaceState(e,e.state,null)}function ra(t,e){var n=e;if("ref"in e){n={};for(var l in e)l!=="ref"&&(n[l]=e[l])}if(t=t.defaultProps){n===e&&(n=g({},n));for(var r in t)n[r]===void 0&&(n[r]=t[r])}return n}var Es=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var e=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(e))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)};function Rd(t){Es(t)}function Dd(t){console.error(t)}function Md(t){Es(t)}function As(t,e){try{var n=t.onUncaughtError;n(e.value,{componentStack:e.stack})}catch(l){setTimeout(function(){throw l})}}function wd(t,e,n){try{var l=t.onCaughtError;l(n.value,{componentStack:n.stack,errorBoundary:e.tag===1?e.stateNode:null})}catch(r){setTimeout(function(){throw r})}}function Yr(t,e,n){return n=An(n),n.tag=3,n.payload={element:null},n.callback=function(){As(t,e)},n}function Cd(t){return t=An(t),t.tag=3,t}function Od(t,e,n,l){var r=n.type.getDerivedStateFromError;if(typeof r=="function"){var o=l.value;t.payload=function(){return r(o)},t.callback=function(){wd(e,n,l)}}var y=n.stateNode;y!==null&&typeof y.componentDidCatch=="function"&&(t.callback=function(){wd(e,n,l),typeof r!="function"&&(Un===null?Un=new Set([this]):Un.add(this));var v=l.stack;this.componentDidCatch(l.value,{componentStack:v!==null?v:""})})}function Iv(t,e,n,l,r){if(n.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){if(e=n.alternate,e!==null&&zi(e,n,r,!0),n=we.current,n!==null){switch(n.tag){case 13:return Xe===null?co():n.alternate===null&&zt===0&&(zt=3),n.flags&=-257,n.flags|=65536,n.lanes=r,l===pr?n.flags|=16384:(e=n.updateQueue,e===null?n.updateQueue=new Set([l]):e.add(l),ho(t,l,r)),!1;case 22:return n.flags|=65536,l===pr?n.flags|=16384:(e=n.updateQueue,e===null?(e={transitions:null,markerInstances:null,retryQueue:new Set([l])},n.updateQueue=e):(n=e.retryQueue,n===null?e.retryQueue=new Set([l]):n.add(l)),ho(t,l,r)),!1}throw Error(u(435,n.tag))}return ho(t,l,r),co(),!1}if(yt)return e=we.current,e!==null?((e.flags&65536)===0&&(e.flags|=256),e.flags|=65536,e.lanes=r,l!==rr&&(t=Error(u(422),{cause:l}),Vi(Ae(t,n)))):(l!==rr&&(e=Error(u(423),{cause:l}),Vi(Ae(e,n))),t=t.current.alternate,t.flags|=65536,r&=-r,t.lanes|=r,l=Ae(l,n),r=Yr(t.stateNode,l,r),vr(t,r),zt!==4&&(zt=2)),!1;var o=Error(u(520),{cause:l});if(o=Ae(o,n),Ii===null?Ii=[o]:Ii.push(o),zt!==4&&(zt=2),e===null)return!0;l=Ae(l,n),n=e;do{switch(n.tag){case 3:return n.flags|=65536,t=r&-r,n.lanes|=t,t=Yr(n.stateNode,l,t),vr(n,t),!1;case 1:if(e=n.type,o=n.stateNode,(n.flags&128)===0&&(typeof e.getDerivedStateFromError=="function"||o!==null&&typeof o.componentDidCatch=="function"&&(Un===null||!Un.has(o))))return n.flags|=65536,r&=-r,n.lanes|=r,r=Cd(r),Od(r,t,n,l),vr(n,r),!1}n=n.return}while(n!==null);return!1}var Nd=Error(u(461)),Zt=!1;function Jt(t,e,n,l){e.child=t===null?xd(e,null,n,l):Xa(e,t.child,n,l)}function Vd(t,e,n,l,r){n=n.render;var o=e.ref;if("ref"in l){var y={};for(var v in l)v!=="ref"&&(y[v]=l[v])}else y=l;return la(e),l=Er(t,e,n,y,o,r),v=Ar(),t!==null&&!Zt?(Rr(t,e,r),rn(t,e,r)):(yt&&v&&sr(e),e.flags|=1,Jt(t,e,l,r),e.child)}function zd(t,e,n,l,r){if(t===null){var o=n.type;return typeof o=="function"&&!ar(o)&&o.defaultProps===void 0&&n.compare===null?(e.tag=15,e.type=o,Ud(t,e,o,l,r)):(t=as(n.type,null,l,e,e.mode,r),t.ref=e.ref,t.return=e,e.child=t)}if(o=t.child,!Pr(t,r)){var y=o.memoizedProps;if(n=n.compare,n=n!==null?n:wi,n(y,l)&&t.ref===e.ref)return rn(t,e,r)}return e.flags|=1,t=tn(o,l),t.ref=e.ref,t.return=e,e.child=t}function Ud(t,e,n,l,r){if(t!==null){var o=t.memoizedProps;if(wi(o,l)&&t.ref===e.ref)if(Zt=!1,e.pendingProps=l=o,Pr(t,r))(t.flags&131072)!==0&&(Zt=!0);else return e.lanes=t.lanes,rn(t,e,r)}return qr(t,e,n,l,r)}function _d(t,e,n){var l=e.pendingProps,r=l.children,o=t!==null?t.memoizedState:null;if(l.mode==="hidden"){if((e.flags&128)!==0){if(l=o!==null?o.baseLanes|n:n,t!==null){for(r=e.child=t.child,o=0;r!==null;)o=o|r.lanes|r.childLanes,r=r.sibling;e.childLanes=o&~l}else e.childLanes=0,e.child=null;return Ld(t,e,l,n)}if((n&536870912)!==0)e.memoizedState={baseLanes:0,cachePool:null},t!==null&&rs(e,o!==null?o.cachePool:null),o!==null?Uh(e,o):br(),Td(e);else return e.lanes=e.childLanes=536870912,Ld(t,e,o!==null?o.baseLanes|n:n,n)}else o!==null?(rs(e,o.cachePool),Uh(e,o),wn(),e.memoizedState=null):(t!==null&&rs(e,null),br(),wn());return Jt(t,e,r,n),e.child}function Ld(t,e,n,l){var r=mr();return r=r===null?null:{parent:Gt._currentValue,pool:r},e.memoizedState={baseLanes:n,cachePool:r},t!==null&&rs(e,null),br(),Td(e),t!==null&&zi(t,e,l,!0),null}function Rs(t,e){var n=e.ref;if(n===null)t!==null&&t.ref!==null&&(e.flags|=4194816);else{if(typeof n!="function"&&typeof n!="object")throw Error(u(284));(t===null||t.ref!==n)&&(e.flags|=4194816)}}function qr(t,e,n,l,r){return la(e),n=Er(t,e,n,l,void 0,r),l=Ar(),t!==null&&!Zt?(Rr(t,e,r),rn(t,e,r)):(yt&&l&&sr(e),e.flags|=1,Jt(t,e,n,r),e.child)}function Bd(t,e,n,l,r,o){return la(e),e.updateQueue=null,n=Lh(e,l,n,r),_h(t),l=Ar(),t!==null&&!Zt?(Rr(t,e,o),rn(t,e,o)):(yt&&l&&sr(e),e.flags|=1,Jt(t,e,n,o),e.child)}function jd(t,e,n,l,r){if(la(e),e.stateNode===null){var o=za,y=n.contextType;typeof y=="object"&&y!==null&&(o=te(y)),o=new n(l,o),e.memoizedState=o.state!==null&&o.state!==void 0?o.state:null,o.updater=Hr,e.stateNode=o,o._reactInternals=e,o=e.stateNode,o.props=l,o.state=e.memoizedState,o.refs={},yr(e),y=n.contextType,o.context=typeof y=="object"&&y!==null?te(y):za,o.state=e.memoizedState,y=n.getDerivedStateFromProps,typeof y=="function"&&(jr(e,n,y,l),o.state=e.memoizedState),typeof n.getDerivedStateFromProps=="function"||typeof o.getSnapshotBeforeUpdate=="function"||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(y=o.state,typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount(),y!==o.state&&Hr.enqueueReplaceState(o,o.state,null),Yi(e,l,o,r),Hi(),o.state=e.memoizedState),typeof o.componentDidMount=="function"&&(e.flags|=4194308),l=!0}else if(t===null){o=e.stateNode;var v=e.memoizedProps,x=ra(n,v);o.props=x;var N=o.context,L=n.contextType;y=za,typeof L=="object"&&L!==null&&(y=te(L));var Y=n.getDerivedStateFromProps;L=typeof Y=="function"||typeof o.getSnapshotBeforeUpdate=="function",v=e.pendingProps!==v,L||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(v||N!==y)&&Ad(e,o,l,y),En=!1;var V=e.memoizedState;o.state=V,Yi(e,l,o,r),Hi(),N=e.memoizedState,v||V!==N||En?(typeof Y=="function"&&(jr(e,n,Y,l),N=e.memoizedState),(x=En||Ed(e,n,x,l,V,N,y))?(L||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(e.flags|=4194308)):(typeof o.componentDidMount=="function"&&(e.flags|=4194308),e.memoizedProps=l,e.memoizedState=N),o.props=l,o.state=N,o.context=y,l=x):(typeof o.componentDidMount=="function"&&(e.flags|=4194308),l=!1)}else{o=e.stateNode,gr(t,e),y=e.memoizedProps,L=ra(n,y),o.props=L,Y=e.pendingProps,V=o.context,N=n.contextType,x=za,typeof N=="object"&&N!==null&&(x=te(N)),v=n.getDerivedStateFromProps,(N=typeof v=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(y!==Y||V!==x)&&Ad(e,o,l,x),En=!1,V=e.memoizedState,o.state=V,Yi(e,l,o,r),Hi();var z=e.memoizedState;y!==Y||V!==z||En||t!==null&&t.dependencies!==null&&ss(t.dependencies)?(typeof v=="function"&&(jr(e,n,v,l),z=e.memoizedState),(L=En||Ed(e,n,L,l,V,z,x)||t!==null&&t.dependencies!==null&&ss(t.dependencies))?(N||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(l,z,x),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(l,z,x)),typeof o.componentDidUpdate=="function"&&(e.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(e.flags|=1024)):(typeof o.componentDidUpdate!="function"||y===t.memoizedProps&&V===t.memoizedState||(e.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||y===t.memoizedProps&&V===t.memoizedState||(e.flags|=1024),e.memoizedProps=l,e.memoizedState=z),o.props=l,o.state=z,o.context=x,l=L):(typeof o.componentDidUpdate!="function"||y===t.memoizedProps&&V===t.memoizedState||(e.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||y===t.memoizedProps&&V===t.memoizedState||(e.flags|=1024),l=!1)}return o=l,Rs(t,e),l=(e.flags&128)!==0,o||l?(o=e.stateNode,n=l&&typeof n.getDerivedStateFromError!="function"?null:o.render(),e.flags|=1,t!==null&&l?(e.child=Xa(e,t.child,null,r),e.child=Xa(e,null,n,r)):Jt(t,e,n,r),e.memoizedState=o.state,t=e.child):t=rn(t,e,r),t}function Hd(t,e,n,l){return Ni(),e.flags|=256,Jt(t,e,n,l),e.child}var Gr={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Xr(t){return{baseLanes:t,cachePool:Dh()}}function Kr(t,e,n){return t=t!==null?t.childLanes&~n:0,e&&(t|=Ce),t}function Yd(t,e,n){var l=e.pendingProps,r=!1,o=(e.flags&128)!==0,y;if((y=o)||(y=t!==null&&t.memoizedState===null?!1:(Xt.current&2)!==0),y&&(r=!0,e.flags&=-129),y=(e.flags&32)!==0,e.flags&=-33,t===null){if(yt){if(r?Mn(e):wn(),yt){var v=Vt,x;if(x=v){t:{for(x=v,v=Ge;x.nodeType!==8;){if(!v){v=null;break t}if(x=Le(x.nextSibling),x===null){v=null;break t}}v=x}v!==null?(e.memoizedState={dehydrated:v,treeContext:ta!==null?{id:en,overflow:nn}:null,retryLane:536870912,hydrationErrors:null},x=ye(18,null,null,0),x.stateNode=v,x.return=e,e.child=x,ie=e,Vt=null,x=!0):x=!1}x||aa(e)}if(v=e.memoizedState,v!==null&&(v=v.dehydrated,v!==null))return wo(v)?e.lanes=32:e.lanes=536870912,null;un(e)}return v=l.children,l=l.fallback,r?(wn(),r=e.mode,v=Ds({mode:"hidden",children:v},r),l=In(l,r,n,null),v.return=e,l.return=e,v.sibling=l,e.child=v,r=e.child,r.memoizedState=Xr(n),r.childLanes=Kr(t,y,n),e.memoizedState=Gr,l):(Mn(e),Zr(e,v))}if(x=t.memoizedState,x!==null&&(v=x.dehydrated,v!==null)){if(o)e.flags&256?(Mn(e),e.flags&=-257,e=Qr(t,e,n)):e.memoizedState!==null?(wn(),e.child=t.child,e.flags|=128,e=null):(wn(),r=l.fallback,v=e.mode,l=Ds({mode:"visible",children:l.children},v),r=In(r,v,n,null),r.flags|=2,l.return=e,r.return=e,l.sibling=r,e.child=l,Xa(e,t.child,null,n),l=e.child,l.memoizedState=Xr(n),l.childLanes=Kr(t,y,n),e.memoizedState=Gr,e=r);else if(Mn(e),wo(v)){if(y=v.nextSibling&&v.nextSibling.dataset,y)var N=y.dgst;y=N,l=Error(u(419)),l.stack="",l.digest=y,Vi({value:l,source:null,stack:null}),e=Qr(t,e,n)}else if(Zt||zi(t,e,n,!1),y=(n&t.childLanes)!==0,Zt||y){if(y=Rt,y!==null&&(l=n&-n,l=(l&42)!==0?1:wu(l),l=(l&(y.suspendedLanes|n))!==0?0:l,l!==0&&l!==x.retryLane))throw x.retryLane=l,Va(t,l),xe(y,t,l),Nd;v.data==="$?"||co(),e=Qr(t,e,n)}else v.data==="$?"?(e.flags|=192,e.child=t.child,e=null):(t=x.treeContext,Vt=Le(v.nextSibling),ie=e,yt=!0,na=null,Ge=!1,t!==null&&(De[Me++]=en,De[Me++]=nn,De[Me++]=ta,en=t.id,nn=t.overflow,ta=e),e=Zr(e,l.children),e.flags|=4096);return e}return r?(wn(),r=l.fallback,v=e.mode,x=t.child,N=x.sibling,l=tn(x,{mode:"hidden",children:l.children}),l.subtreeFlags=x.subtreeFlags&65011712,N!==null?r=tn(N,r):(r=In(r,v,n,null),r.flags|=2),r.return=e,l.return=e,l.sibling=r,e.child=l,l=r,r=e.child,v=t.child.memoizedState,v===null?v=Xr(n):(x=v.cachePool,x!==null?(N=Gt._currentValue,x=x.parent!==N?{parent:N,pool:N}:x):x=Dh(),v={baseLanes:v.baseLanes|n,cachePool:x}),r.memoizedState=v,r.childLanes=Kr(t,y,n),e.memoizedState=Gr,l):(Mn(e),n=t.child,t=n.sibling,n=tn(n,{mode:"visible",children:l.children}),n.return=e,n.sibling=null,t!==null&&(y=e.deletions,y===null?(e.deletions=[t],e.flags|=16):y.push(t)),e.child=n,e.memoizedState=null,n)}function Zr(t,e){return e=Ds({mode:"visible",children:e},t.mode),e.return=t,t.child=e}function Ds(t,e){return t=ye(22,t,null,e),t.lanes=0,t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},t}function Qr(t,e,n){return Xa(e,t.child,null,n),t=Zr(e,e.pendingProps.children),t.flags|=2,e.memoizedState=null,t}function qd(t,e,n){t.lanes|=e;var l=t.alternate;l!==null&&(l.lanes|=e),cr(t.return,e,n)}function kr(t,e,n,l,r){var o=t.memoizedState;o===null?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:l,tail:n,tailMode:r}:(o.isBackwards=e,o.rendering=null,o.renderingStartTime=0,o.last=l,o.tail=n,o.tailMode=r)}function Gd(t,e,n){var l=e.pendingProps,r=l.revealOrder,o=l.tail;if(Jt(t,e,l.children,n),l=Xt.current,(l&2)!==0)l=l&1|2,e.flags|=128;else{if(t!==null&&(t.flags&128)!==0)t:for(t=e.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&qd(t,n,e);else if(t.tag===19)qd(t,n,e);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break t;for(;t.sibling===null;){if(t.return===null||t.return===e)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}l&=1}switch(Q(Xt,l),r){case"forwards":for(n=e.child,r=null;n!==null;)t=n.alternate,t!==null&&Ts(t)===null&&(r=n),n=n.sibling;n=r,n===null?(r=e.child,e.child=null):(r=n.sibling,n.sibling=null),kr(e,!1,r,n,o);break;case"backwards":for(n=null,r=e.child,e.child=null;r!==null;){if(t=r.alternate,t!==null&&Ts(t)===null){e.child=r;break}t=r.sibling,r.sibling=n,n=r,r=t}kr(e,!0,n,null,o);break;case"together":kr(e,!1,null,null,void 0);break;default:e.memoizedState=null}return e.child}function rn(t,e,n){if(t!==null&&(e.dependencies=t.dependencies),zn|=e.lanes,(n&e.childLanes)===0)if(t!==null){if(zi(t,e,n,!1),(n&e.childLanes)===0)return null}else return null;if(t!==null&&e.child!==t.child)throw Error(u(153));if(e.child!==null){for(t=e.child,n=tn(t,t.pendingProps),e.child=n,n.return=e;t.sibling!==null;)t=t.sibling,n=n.sibling=tn(t,t.pendingProps),n.return=e;n.sibling=null}return e.child}function Pr(t,e){return(t.lanes&e)!==0?!0:(t=t.dependencies,!!(t!==null&&ss(t)))}function t1(t,e,n){switch(e.tag){case 3:Dt(e,e.stateNode.containerInfo),Tn(e,Gt,t.memoizedState.cache),Ni();break;case 27:case 5:Eu(e);break;case 4:Dt(e,e.stateNode.containerInfo);break;case 10:Tn(e,e.type,e.memoizedProps.value);break;case 13:var l=e.memoizedState;if(l!==null)return l.dehydrated!==null?(Mn(e),e.flags|=128,null):(n&e.child.childLanes)!==0?Yd(t,e,n):(Mn(e),t=rn(t,e,n),t!==null?t.sibling:null);Mn(e);break;case 19:var r=(t.flags&128)!==0;if(l=(n&e.childLanes)!==0,l||(zi(t,e,n,!1),l=(n&e.childLanes)!==0),r){if(l)return Gd(t,e,n);e.flags|=128}if(r=e.memoizedState,r!==null&&(r.rendering=null,r.tail=null,r.lastEffect=null),Q(Xt,Xt.current),l)break;return null;case 22:case 23:return e.lanes=0,_d(t,e,n);case 24:Tn(e,Gt,t.memoizedState.cache)}return rn(t,e,n)}function Xd(t,e,n){if(t!==null)if(t.memoizedProps!==e.pendingProps)Zt=!0;else{if(!Pr(t,n)&&(e.flags&128)===0)return Zt=!1,t1(t,e,n);Zt=(t.flags&131072)!==0}else Zt=!1,yt&&(e.flags&1048576)!==0&&Sh(e,ls,e.index);switch(e.lanes=0,e.tag){case 16:t:{t=e.pendingProps;var l=e.elementType,r=l._init;if(l=r(l._payload),e.type=l,typeof l=="function")ar(l)?(t=ra(l,t),e.tag=1,e=jd(null,e,l,t,n)):(e.tag=0,e=qr(null,e,l,t,n));else{if(l!=null){if(r=l.$$typeof,r===Z){e.tag=11,e=Vd(null,e,l,t,n);break t}else if(r===nt){e.tag=14,e=zd(null,e,l,t,n);break t}}throw e=Ye(l)||l,Error(u(306,e,""))}}return e;case 0:return qr(t,e,e.type,e.pendingProps,n);case 1:return l=e.type,r=ra(l,e.pendingProps),jd(t,e,l,r,n);case 3:t:{if(Dt(e,e.stateNode.containerInfo),t===null)throw Error(u(387));l=e.pendingProps;var o=e.memoizedState;r=o.element,gr(t,e),Yi(e,l,null,n);var y=e.memoizedState;if(l=y.cache,Tn(e,Gt,l),l!==o.cache&&fr(e,[Gt],n,!0),Hi(),l=y.element,o.isDehydrated)if(o={element:l,isDehydrated:!1,cache:y.cache},e.updateQueue.baseState=o,e.memoizedState=o,e.flags&256){e=Hd(t,e,l,n);break t}else if(l!==r){r=Ae(Error(u(424)),e),Vi(r),e=Hd(t,e,l,n);break t}else{switch(t=e.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(Vt=Le(t.firstChild),ie=e,yt=!0,na=null,Ge=!0,n=xd(e,null,l,n),e.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling}else{if(Ni(),l===r){e=rn(t,e,n);break t}Jt(t,e,l,n)}e=e.child}return e;case 26:return Rs(t,e),t===null?(n=km(e.type,null,e.pendingProps,null))?e.memoizedState=n:yt||(n=e.type,t=e.pendingProps,l=Ys(lt.current).createElement(n),l[It]=e,l[se]=t,$t(l,n,t),Kt(l),e.stateNode=l):e.memoizedState=km(e.type,t.memoizedProps,e.pendingProps,t.memoizedState),null;case 27:return Eu(e),t===null&&yt&&(l=e.stateNode=Km(e.type,e.pendingProps,lt.current),ie=e,Ge=!0,r=Vt,Bn(e.type)?(Co=r,Vt=Le(l.firstChild)):Vt=r),Jt(t,e,e.pendingProps.children,n),Rs(t,e),t===null&&(e.flags|=4194304),e.child;case 5:return t===null&&yt&&((r=l=Vt)&&(l=w1(l,e.type,e.pendingProps,Ge),l!==null?(e.stateNode=l,ie=e,Vt=Le(l.firstChild),Ge=!1,r=!0):r=!1),r||aa(e)),Eu(e),r=e.type,o=e.pendingProps,y=t!==null?t.memoizedProps:null,l=o.children,Ro(r,o)?l=null:y!==null&&Ro(r,y)&&(e.flags|=32),e.memoizedState!==null&&(r=Er(t,e,Qv,null,null,n),rl._currentValue=r),Rs(t,e),Jt(t,e,l,n),e.child;case 6:return t===null&&yt&&((t=n=Vt)&&(n=C1(n,e.pendingProps,Ge),n!==null?(e.stateNode=n,ie=e,Vt=null,t=!0):t=!1),t||aa(e)),null;case 13:return Yd(t,e,n);case 4:return Dt(e,e.stateNode.containerInfo),l=e.pendingProps,t===null?e.child=Xa(e,null,l,n):Jt(t,e,l,n),e.child;case 11:return Vd(t,e,e.type,e.pendingProps,n);case 7:return Jt(t,e,e.pendingProps,n),e.child;case 8:return Jt(t,e,e.pendingProps.children,n),e.child;case 12:return Jt(t,e,e.pendingProps.children,n),e.child;case 10:return l=e.pendingProps,Tn(e,e.type,l.value),Jt(t,e,l.children,n),e.child;case 9:return r=e.type._context,l=e.pendingProps.children,la(e),r=te(r),l=l(r),e.flags|=1,Jt(t,e,l,n),e.child;case 14:return zd(t,e,e.type,e.pendingProps,n);case 15:return Ud(t,e,e.type,e.pendingProps,n);case 19:return Gd(t,e,n);case 31:return l=e.pendingProps,n=e.mode,l={mode:l.mode,children:l.children},t===null?(n=Ds(l,n),n.ref=e.ref,e.child=n,n.return=e,e=n):(n=tn(t.child,l),n.ref=e.ref,e.child=n,n.return=e,e=n),e;case 22:return _d(t,e,n);case 24:return la(e),l=te(Gt),t===null?(r=mr(),r===null&&(r=Rt,o=hr(),r.pooledCache=o,o.refCount++,o!==null&&(r.pooledCacheLanes|=n),r=o),e.memoizedState={parent:l,cache:r},yr(e),Tn(e,Gt,r)):((t.lanes&n)!==0&&(gr(t,e),Yi(e,null,null,n),Hi()),r=t.memoizedState,o=e.memoizedState,r.parent!==l?(r={parent:l,cache:l},e.memoizedState=r,e.lanes===0&&(e.memoizedState=e.updateQueue.baseState=r),Tn(e,Gt,l)):(l=o.cache,Tn(e,Gt,l),l!==r.cache&&fr(e,[Gt],n,!0))),Jt(t,e,e.pendingProps.children,n),e.child;case 29:throw e.pendingProps}throw Error(u(156,e.tag))}function on(t){t.flags|=4}function Kd(t,e){if(e.type!=="stylesheet"||(e.state.loading&4)!==0)t.flags&=-16777217;else if(t.flags|=16777216,!Wm(e)){if(e=we.current,e!==null&&((ht&4194048)===ht?Xe!==null:(ht&62914560)!==ht&&(ht&536870912)===0||e!==Xe))throw Bi=pr,Mh;t.flags|=8192}}function Ms(t,e){e!==null&&(t.flags|=4),t.flags&16384&&(e=t.tag!==22?Tf():536870912,t.lanes|=e,ka|=e)}function ki(t,e){if(!yt)switch(t.tailMode){case"hidden":e=t.tail;for(var n=null;e!==null;)e.alternate!==null&&(n=e),e=e.sibling;n===null?t.tail=null:n.sibling=null;break;case"collapsed":n=t.tail;for(var l=null;n!==null;)n.alternate!==null&&(l=n),n=n.sibling;l===null?e||t.tail===null?t.tail=null:t.tail.sibling=null:l.sibling=null}}function Ct(t){var e=t.alternate!==null&&t.alternate.child===t.child,n=0,l=0;if(e)for(var r=t.child;r!==null;)n|=r.lanes|r.childLanes,l|=r.subtreeFlags&65011712,l|=r.flags&65011712,r.return=t,r=r.sibling;else for(r=t.child;r!==null;)n|=r.lanes|r.childLanes,l|=r.subtreeFlags,l|=r.flags,r.return=t,r=r.sibling;return t.subtreeFlags|=l,t.childLanes=n,e}function e1(t,e,n){var l=e.pendingProps;switch(ur(e),e.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ct(e),null;case 1:return Ct(e),null;case 3:return n=e.stateNode,l=null,t!==null&&(l=t.memoizedState.cache),e.memoizedState.cache!==l&&(e.flags|=2048),ln(Gt),vn(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),(t===null||t.child===null)&&(Oi(e)?on(e):t===null||t.memoizedState.isDehydrated&&(e.flags&256)===0||(e.flags|=1024,Th())),Ct(e),null;case 26:return n=e.memoizedState,t===null?(on(e),n!==null?(Ct(e),Kd(e,n)):(Ct(e),e.flags&=-16777217)):n?n!==t.memoizedState?(on(e),Ct(e),Kd(e,n)):(Ct(e),e.flags&=-16777217):(t.memoizedProps!==l&&on(e),Ct(e),e.flags&=-16777217),null;case 27:jl(e),n=lt.current;var r=e.type;if(t!==null&&e.stateNode!=null)t.memoizedProps!==l&&on(e);else{if(!l){if(e.stateNode===null)throw Error(u(166));return Ct(e),null}t=I.current,Oi(e)?bh(e):(t=Km(r,l,n),e.stateNode=t,on(e))}return Ct(e),null;case 5:if(jl(e),n=e.type,t!==null&&e.stateNode!=null)t.memoizedProps!==l&&on(e);else{if(!l){if(e.stateNode===null)throw Error(u(166));return Ct(e),null}if(t=I.current,Oi(e))bh(e);else{switch(r=Ys(lt.current),t){case 1:t=r.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:t=r.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":t=r.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":t=r.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":t=r.createElement("div"),t.innerHTML="<script><\/script>",t=t.removeChild(t.firstChild);break;case"select":t=typeof l.is=="string"?r.createElement("select",{is:l.is}):r.createElement("select"),l.multiple?t.multiple=!0:l.size&&(t.size=l.size);break;default:t=typeof l.is=="string"?r.createElement(n,{is:l.is}):r.createElement(n)}}t[It]=e,t[se]=l;t:for(r=e.child;r!==null;){if(r.tag===5||r.tag===6)t.appendChild(r.stateNode);else if(r.tag!==4&&r.tag!==27&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===e)break t;for(;r.sibling===null;){if(r.return===null||r.return===e)break t;r=r.return}r.sibling.return=r.return,r=r.sibling}e.stateNode=t;t:switch($t(t,n,l),n){case"button":case"input":case"select":case"textarea":t=!!l.autoFocus;break t;case"img":t=!0;break t;default:t=!1}t&&on(e)}}return Ct(e),e.flags&=-16777217,null;case 6:if(t&&e.stateNode!=null)t.memoizedProps!==l&&on(e);else{if(typeof l!="string"&&e.stateNode===null)throw Error(u(166));if(t=lt.current,Oi(e)){if(t=e.stateNode,n=e.memoizedProps,l=null,r=ie,r!==null)switch(r.tag){case 27:case 5:l=r.memoizedProps}t[It]=e,t=!!(t.nodeValue===n||l!==null&&l.suppressHydrationWarning===!0||Bm(t.nodeValue,n)),t||aa(e)}else t=Ys(t).createTextNode(l),t[It]=e,e.stateNode=t}return Ct(e),null;case 13:if(l=e.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(r=Oi(e),l!==null&&l.dehydrated!==null){if(t===null){if(!r)throw Error(u(318));if(r=e.memoizedState,r=r!==null?r.dehydrated:null,!r)throw Error(u(317));r[It]=e}else Ni(),(e.flags&128)===0&&(e.memoizedState=null),e.flags|=4;Ct(e),r=!1}else r=Th(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=r),r=!0;if(!r)return e.flags&256?(un(e),e):(un(e),null)}if(un(e),(e.flags&128)!==0)return e.lanes=n,e;if(n=l!==null,t=t!==null&&t.memoizedState!==null,n){l=e.child,r=null,l.alternate!==null&&l.alternate.memoizedState!==null&&l.alternate.memoizedState.cachePool!==null&&(r=l.alternate.memoizedState.cachePool.pool);var o=null;l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(o=l.memoizedState.cachePool.pool),o!==r&&(l.flags|=2048)}return n!==t&&n&&(e.child.flags|=8192),Ms(e,e.updateQueue),Ct(e),null;case 4:return vn(),t===null&&bo(e.stateNode.containerInfo),Ct(e),null;case 10:return ln(e.type),Ct(e),null;case 19:if(k(Xt),r=e.memoizedState,r===null)return Ct(e),null;if(l=(e.flags&128)!==0,o=r.rendering,o===null)if(l)ki(r,!1);else{if(zt!==0||t!==null&&(t.flags&128)!==0)for(t=e.child;t!==null;){if(o=Ts(t),o!==null){for(e.flags|=128,ki(r,!1),t=o.updateQueue,e.updateQueue=t,Ms(e,t),e.subtreeFlags=0,t=n,n=e.child;n!==null;)vh(n,t),n=n.sibling;return Q(Xt,Xt.current&1|2),e.child}t=t.sibling}r.tail!==null&&qe()>Os&&(e.flags|=128,l=!0,ki(r,!1),e.lanes=4194304)}else{if(!l)if(t=Ts(o),t!==null){if(e.flags|=128,l=!0,t=t.updateQueue,e.updateQueue=t,Ms(e,t),ki(r,!0),r.tail===null&&r.tailMode==="hidden"&&!o.alternate&&!yt)return Ct(e),null}else 2*qe()-r.renderingStartTime>Os&&n!==536870912&&(e.flags|=128,l=!0,ki(r,!1),e.lanes=4194304);r.isBackwards?(o.sibling=e.child,e.child=o):(t=r.last,t!==null?t.sibling=o:e.child=o,r.last=o)}return r.tail!==null?(e=r.tail,r.rendering=e,r.tail=e.sibling,r.renderingStartTime=qe(),e.sibling=null,t=Xt.current,Q(Xt,l?t&1|2:t&1),e):(Ct(e),null);case 22:case 23:return un(e),xr(),l=e.memoizedState!==null,t!==null?t.memoizedState!==null!==l&&(e.flags|=8192):l&&(e.flags|=8192),l?(n&536870912)!==0&&(e.flags&128)===0&&(Ct(e),e.subtreeFlags&6&&(e.flags|=8192)):Ct(e),n=e.updateQueue,n!==null&&Ms(e,n.retryQueue),n=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(n=t.memoizedState.cachePool.pool),l=null,e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(l=e.memoizedState.cachePool.pool),l!==n&&(e.flags|=2048),t!==null&&k(sa),null;case 24:return n=null,t!==null&&(n=t.memoizedState.cache),e.memoizedState.cache!==n&&(e.flags|=2048),ln(Gt),Ct(e),null;case 25:return null;case 30:return null}throw Error(u(156,e.tag))}function n1(t,e){switch(ur(e),e.tag){case 1:return t=e.flags,t&65536?(e.flags=t&-65537|128,e):null;case 3:return ln(Gt),vn(),t=e.flags,(t&65536)!==0&&(t&128)===0?(e.flags=t&-65537|128,e):null;case 26:case 27:case 5:return jl(e),null;case 13:if(un(e),t=e.memoizedState,t!==null&&t.dehydrated!==null){if(e.alternate===null)throw Error(u(340));Ni()}return t=e.flags,t&65536?(e.flags=t&-65537|128,e):null;case 19:return k(Xt),null;case 4:return vn(),null;case 10:return ln(e.type),null;case 22:case 23:return un(e),xr(),t!==null&&k(sa),t=e.flags,t&65536?(e.flags=t&-65537|128,e):null;case 24:return ln(Gt),null;case 25:return null;default:return null}}function Zd(t,e){switch(ur(e),e.tag){case 3:ln(Gt),vn();break;case 26:case 27:case 5:jl(e);break;case 4:vn();break;case 13:un(e);break;case 19:k(Xt);break;case 10:ln(e.type);break;case 22:case 23:un(e),xr(),t!==null&&k(sa);break;case 24:ln(Gt)}}function Pi(t,e){try{var n=e.updateQueue,l=n!==null?n.lastEffect:null;if(l!==null){var r=l.next;n=r;do{if((n.tag&t)===t){l=void 0;var o=n.create,y=n.inst;l=o(),y.destroy=l}n=n.next}while(n!==r)}}catch(v){Et(e,e.return,v)}}function Cn(t,e,n){try{var l=e.updateQueue,r=l!==null?l.lastEffect:null;if(r!==null){var o=r.next;l=o;do{if((l.tag&t)===t){var y=l.inst,v=y.destroy;if(v!==void 0){y.destroy=void 0,r=e;var x=n,N=v;try{N()}catch(L){Et(r,x,L)}}}l=l.next}while(l!==o)}}catch(L){Et(e,e.return,L)}}function Qd(t){var e=t.updateQueue;if(e!==null){var n=t.stateNode;try{zh(e,n)}catch(l){Et(t,t.return,l)}}}function kd(t,e,n){n.props=ra(t.type,t.memoizedProps),n.state=t.memoizedState;try{n.componentWillUnmount()}catch(l){Et(t,e,l)}}function Ji(t,e){try{var n=t.ref;if(n!==null){switch(t.tag){case 26:case 27:case 5:var l=t.stateNode;break;case 30:l=t.stateNode;break;default:l=t.stateNode}typeof n=="function"?t.refCleanup=n(l):n.current=l}}catch(r){Et(t,e,r)}}function Ke(t,e){var n=t.ref,l=t.refCleanup;if(n!==null)if(typeof l=="function")try{l()}catch(r){Et(t,e,r)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof n=="function")try{n(null)}catch(r){Et(t,e,r)}else n.current=null}function Pd(t){var e=t.type,n=t.memoizedProps,l=t.stateNode;try{t:switch(e){case"button":case"input":case"select":case"textarea":n.autoFocus&&l.focus();break t;case"img":n.src?l.src=n.src:n.srcSet&&(l.srcset=n.srcSet)}}catch(r){Et(t,t.return,r)}}function Jr(t,e,n){try{var l=t.stateNode;E1(l,t.type,n,e),l[se]=e}catch(r){Et(t,t.return,r)}}function Jd(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&Bn(t.type)||t.tag===4}function Fr(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||Jd(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&Bn(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function $r(t,e,n){var l=t.tag;if(l===5||l===6)t=t.stateNode,e?(n.nodeType===9?n.body:n.nodeName==="HTML"?n.ownerDocument.body:n).insertBefore(t,e):(e=n.nodeType===9?n.body:n.nodeName==="HTML"?n.ownerDocument.body:n,e.appendChild(t),n=n._reactRootContainer,n!=null||e.onclick!==null||(e.onclick=Hs));else if(l!==4&&(l===27&&Bn(t.type)&&(n=t.stateNode,e=null),t=t.child,t!==null))for($r(t,e,n),t=t.sibling;t!==null;)$r(t,e,n),t=t.sibling}function ws(t,e,n){var l=t.tag;if(l===5||l===6)t=t.stateNode,e?n.insertBefore(t,e):n.appendChild(t);else if(l!==4&&(l===27&&Bn(t.type)&&(n=t.stateNode),t=t.child,t!==null))for(ws(t,e,n),t=t.sibling;t!==null;)ws(t,e,n),t=t.sibling}function Fd(t){var e=t.stateNode,n=t.memoizedProps;try{for(var l=t.type,r=e.attributes;r.length;)e.removeAttributeNode(r[0]);$t(e,l,n),e[It]=t,e[se]=n}catch(o){Et(t,t.return,o)}}var cn=!1,Lt=!1,Wr=!1,$d=typeof WeakSet=="function"?WeakSet:Set,Qt=null;function a1(t,e){if(t=t.containerInfo,Eo=Qs,t=rh(t),Fu(t)){if("selectionStart"in t)var n={start:t.selectionStart,end:t.selectionEnd};else t:{n=(n=t.ownerDocument)&&n.defaultView||window;var l=n.getSelection&&n.getSelection();if(l&&l.rangeCount!==0){n=l.anchorNode;var r=l.anchorOffset,o=l.focusNode;l=l.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break t}var y=0,v=-1,x=-1,N=0,L=0,Y=t,V=null;e:for(;;){for(var z;Y!==n||r!==0&&Y.nodeType!==3||(v=y+r),Y!==o||l!==0&&Y.nodeType!==3||(x=y+l),Y.nodeType===3&&(y+=Y.nodeValue.length),(z=Y.firstChild)!==null;)V=Y,Y=z;for(;;){if(Y===t)break e;if(V===n&&++N===r&&(v=y),V===o&&++L===l&&(x=y),(z=Y.nextSibling)!==null)break;Y=V,V=Y.parentNode}Y=z}n=v===-1||x===-1?null:{start:v,end:x}}else n=null}n=n||{start:0,end:0}}else n=null;for(Ao={focusedElem:t,selectionRange:n},Qs=!1,Qt=e;Qt!==null;)if(e=Qt,t=e.child,(e.subtreeFlags&1024)!==0&&t!==null)t.return=e,Qt=t;else for(;Qt!==null;){switch(e=Qt,o=e.alternate,t=e.flags,e.tag){case 0:break;case 11:case 15:break;case 1:if((t&1024)!==0&&o!==null){t=void 0,n=e,r=o.memoizedProps,o=o.memoizedState,l=n.stateNode;try{var at=ra(n.type,r,n.elementType===n.type);t=l.getSnapshotBeforeUpdate(at,o),l.__reactInternalSnapshotBeforeUpdate=t}catch(tt){Et(n,n.return,tt)}}break;case 3:if((t&1024)!==0){if(t=e.stateNode.containerInfo,n=t.nodeType,n===9)Mo(t);else if(n===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":Mo(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((t&1024)!==0)throw Error(u(163))}if(t=e.sibling,t!==null){t.return=e.return,Qt=t;break}Qt=e.return}}function Wd(t,e,n){var l=n.flags;switch(n.tag){case 0:case 11:case 15:On(t,n),l&4&&Pi(5,n);break;case 1:if(On(t,n),l&4)if(t=n.stateNode,e===null)try{t.componentDidMount()}catch(y){Et(n,n.return,y)}else{var r=ra(n.type,e.memoizedProps);e=e.memoizedState;try{t.componentDidUpdate(r,e,t.__reactInternalSnapshotBeforeUpdate)}catch(y){Et(n,n.return,y)}}l&64&&Qd(n),l&512&&Ji(n,n.return);break;case 3:if(On(t,n),l&64&&(t=n.updateQueue,t!==null)){if(e=null,n.child!==null)switch(n.child.tag){case 27:case 5:e=n.child.stateNode;break;case 1:e=n.child.stateNode}try{zh(t,e)}catch(y){Et(n,n.return,y)}}break;case 27:e===null&&l&4&&Fd(n);case 26:case 5:On(t,n),e===null&&l&4&&Pd(n),l&512&&Ji(n,n.return);break;case 12:On(t,n);break;case 13:On(t,n),l&4&&em(t,n),l&64&&(t=n.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(n=h1.bind(null,n),O1(t,n))));break;case 22:if(l=n.memoizedState!==null||cn,!l){e=e!==null&&e.memoizedState!==null||Lt,r=cn;var o=Lt;cn=l,(Lt=e)&&!o?Nn(t,n,(n.subtreeFlags&8772)!==0):On(t,n),cn=r,Lt=o}break;case 30:break;default:On(t,n)}}function Id(t){var e=t.alternate;e!==null&&(t.alternate=null,Id(e)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(e=t.stateNode,e!==null&&Nu(e)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var Mt=null,oe=!1;function fn(t,e,n){for(n=n.child;n!==null;)tm(t,e,n),n=n.sibling}function tm(t,e,n){if(de&&typeof de.onCommitFiberUnmount=="function")try{de.onCommitFiberUnmount(yi,n)}catch{}switch(n.tag){case 26:Lt||Ke(n,e),fn(t,e,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode,n.parentNode.removeChild(n));break;case 27:Lt||Ke(n,e);var l=Mt,r=oe;Bn(n.type)&&(Mt=n.stateNode,oe=!1),fn(t,e,n),il(n.stateNode),Mt=l,oe=r;break;case 5:Lt||Ke(n,e);case 6:if(l=Mt,r=oe,Mt=null,fn(t,e,n),Mt=l,oe=r,Mt!==null)if(oe)try{(Mt.nodeType===9?Mt.body:Mt.nodeName==="HTML"?Mt.ownerDocument.body:Mt).removeChild(n.stateNode)}catch(o){Et(n,e,o)}else try{Mt.removeChild(n.stateNode)}catch(o){Et(n,e,o)}break;case 18:Mt!==null&&(oe?(t=Mt,Gm(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,n.stateNode),hl(t)):Gm(Mt,n.stateNode));break;case 4:l=Mt,r=oe,Mt=n.stateNode.containerInfo,oe=!0,fn(t,e,n),Mt=l,oe=r;break;case 0:case 11:case 14:case 15:Lt||Cn(2,n,e),Lt||Cn(4,n,e),fn(t,e,n);break;case 1:Lt||(Ke(n,e),l=n.stateNode,typeof l.componentWillUnmount=="function"&&kd(n,e,l)),fn(t,e,n);break;case 21:fn(t,e,n);break;case 22:Lt=(l=Lt)||n.memoizedState!==null,fn(t,e,n),Lt=l;break;default:fn(t,e,n)}}function em(t,e){if(e.memoizedState===null&&(t=e.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{hl(t)}catch(n){Et(e,e.return,n)}}function i1(t){switch(t.tag){case 13:case 19:var e=t.stateNode;return e===null&&(e=t.stateNode=new $d),e;case 22:return t=t.stateNode,e=t._retryCache,e===null&&(e=t._retryCache=new $d),e;default:throw Error(u(435,t.tag))}}function Ir(t,e){var n=i1(t);e.forEach(function(l){var r=d1.bind(null,t,l);n.has(l)||(n.add(l),l.then(r,r))})}function ge(t,e){var n=e.deletions;if(n!==null)for(var l=0;l<n.length;l++){var r=n[l],o=t,y=e,v=y;t:for(;v!==null;){switch(v.tag){case 27:if(Bn(v.type)){Mt=v.stateNode,oe=!1;break t}break;case 5:Mt=v.stateNode,oe=!1;break t;case 3:case 4:Mt=v.stateNode.containerInfo,oe=!0;break t}v=v.return}if(Mt===null)throw Error(u(160));tm(o,y,r),Mt=null,oe=!1,o=r.alternate,o!==null&&(o.return=null),r.return=null}if(e.subtreeFlags&13878)for(e=e.child;e!==null;)nm(e,t),e=e.sibling}var _e=null;function nm(t,e){var n=t.alternate,l=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:ge(e,t),ve(t),l&4&&(Cn(3,t,t.return),Pi(3,t),Cn(5,t,t.return));break;case 1:ge(e,t),ve(t),l&512&&(Lt||n===null||Ke(n,n.return)),l&64&&cn&&(t=t.updateQueue,t!==null&&(l=t.callbacks,l!==null&&(n=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=n===null?l:n.concat(l))));break;case 26:var r=_e;if(ge(e,t),ve(t),l&512&&(Lt||n===null||Ke(n,n.return)),l&4){var o=n!==null?n.memoizedState:null;if(l=t.memoizedState,n===null)if(l===null)if(t.stateNode===null){t:{l=t.type,n=t.memoizedProps,r=r.ownerDocument||r;e:switch(l){case"title":o=r.getElementsByTagName("title")[0],(!o||o[Si]||o[It]||o.namespaceURI==="http://www.w3.org/2000/svg"||o.hasAttribute("itemprop"))&&(o=r.createElement(l),r.head.insertBefore(o,r.querySelector("head > title"))),$t(o,l,n),o[It]=t,Kt(o),l=o;break t;case"link":var y=Fm("link","href",r).get(l+(n.href||""));if(y){for(var v=0;v<y.length;v++)if(o=y[v],o.getAttribute("href")===(n.href==null||n.href===""?null:n.href)&&o.getAttribute("rel")===(n.rel==null?null:n.rel)&&o.getAttribute("title")===(n.title==null?null:n.title)&&o.getAttribute("crossorigin")===(n.crossOrigin==null?null:n.crossOrigin)){y.splice(v,1);break e}}o=r.createElement(l),$t(o,l,n),r.head.appendChild(o);break;case"meta":if(y=Fm("meta","content",r).get(l+(n.content||""))){for(v=0;v<y.length;v++)if(o=y[v],o.getAttribute("content")===(n.content==null?null:""+n.content)&&o.getAttribute("name")===(n.name==null?null:n.name)&&o.getAttribute("property")===(n.property==null?null:n.property)&&o.getAttribute("http-equiv")===(n.httpEquiv==null?null:n.httpEquiv)&&o.getAttribute("charset")===(n.charSet==null?null:n.charSet)){y.splice(v,1);break e}}o=r.createElement(l),$t(o,l,n),r.head.appendChild(o);break;default:throw Error(u(468,l))}o[It]=t,Kt(o),l=o}t.stateNode=l}else $m(r,t.type,t.stateNode);else t.stateNode=Jm(r,l,t.memoizedProps);else o!==l?(o===null?n.stateNode!==null&&(n=n.stateNode,n.parentNode.removeChild(n)):o.count--,l===null?$m(r,t.type,t.stateNode):Jm(r,l,t.memoizedProps)):l===null&&t.stateNode!==null&&Jr(t,t.memoizedProps,n.memoizedProps)}break;case 27:ge(e,t),ve(t),l&512&&(Lt||n===null||Ke(n,n.return)),n!==null&&l&4&&Jr(t,t.memoizedProps,n.memoizedProps);break;case 5:if(ge(e,t),ve(t),l&512&&(Lt||n===null||Ke(n,n.return)),t.flags&32){r=t.stateNode;try{Ra(r,"")}catch(z){Et(t,t.return,z)}}l&4&&t.stateNode!=null&&(r=t.memoizedProps,Jr(t,r,n!==null?n.memoizedProps:r)),l&1024&&(Wr=!0);break;case 6:if(ge(e,t),ve(t),l&4){if(t.stateNode===null)throw Error(u(162));l=t.memoizedProps,n=t.stateNode;try{n.nodeValue=l}catch(z){Et(t,t.return,z)}}break;case 3:if(Xs=null,r=_e,_e=qs(e.containerInfo),ge(e,t),_e=r,ve(t),l&4&&n!==null&&n.memoizedState.isDehydrated)try{hl(e.containerInfo)}catch(z){Et(t,t.return,z)}Wr&&(Wr=!1,am(t));break;case 4:l=_e,_e=qs(t.stateNode.containerInfo),ge(e,t),ve(t),_e=l;break;case 12:ge(e,t),ve(t);break;case 13:ge(e,t),ve(t),t.child.flags&8192&&t.memoizedState!==null!=(n!==null&&n.memoizedState!==null)&&(lo=qe()),l&4&&(l=t.updateQueue,l!==null&&(t.updateQueue=null,Ir(t,l)));break;case 22:r=t.memoizedState!==null;var x=n!==null&&n.memoizedState!==null,N=cn,L=Lt;if(cn=N||r,Lt=L||x,ge(e,t),Lt=L,cn=N,ve(t),l&8192)t:for(e=t.stateNode,e._visibility=r?e._visibility&-2:e._visibility|1,r&&(n===null||x||cn||Lt||oa(t)),n=null,e=t;;){if(e.tag===5||e.tag===26){if(n===null){x=n=e;try{if(o=x.stateNode,r)y=o.style,typeof y.setProperty=="function"?y.setProperty("display","none","important"):y.display="none";else{v=x.stateNode;var Y=x.memoizedProps.style,V=Y!=null&&Y.hasOwnProperty("display")?Y.display:null;v.style.display=V==null||typeof V=="boolean"?"":(""+V).trim()}}catch(z){Et(x,x.return,z)}}}else if(e.tag===6){if(n===null){x=e;try{x.stateNode.nodeValue=r?"":x.memoizedProps}catch(z){Et(x,x.return,z)}}}else if((e.tag!==22&&e.tag!==23||e.memoizedState===null||e===t)&&e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break t;for(;e.sibling===null;){if(e.return===null||e.return===t)break t;n===e&&(n=null),e=e.return}n===e&&(n=null),e.sibling.return=e.return,e=e.sibling}l&4&&(l=t.updateQueue,l!==null&&(n=l.retryQueue,n!==null&&(l.retryQueue=null,Ir(t,n))));break;case 19:ge(e,t),ve(t),l&4&&(l=t.updateQueue,l!==null&&(t.updateQueue=null,Ir(t,l)));break;case 30:break;case 21:break;default:ge(e,t),ve(t)}}function ve(t){var e=t.flags;if(e&2){try{for(var n,l=t.return;l!==null;){if(Jd(l)){n=l;break}l=l.return}if(n==null)throw Error(u(160));switch(n.tag){case 27:var r=n.stateNode,o=Fr(t);ws(t,o,r);break;case 5:var y=n.stateNode;n.flags&32&&(Ra(y,""),n.flags&=-33);var v=Fr(t);ws(t,v,y);break;case 3:case 4:var x=n.stateNode.containerInfo,N=Fr(t);$r(t,N,x);break;default:throw Error(u(161))}}catch(L){Et(t,t.return,L)}t.flags&=-3}e&4096&&(t.flags&=-4097)}function am(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var e=t;am(e),e.tag===5&&e.flags&1024&&e.stateNode.reset(),t=t.sibling}}function On(t,e){if(e.subtreeFlags&8772)for(e=e.child;e!==null;)Wd(t,e.alternate,e),e=e.sibling}function oa(t){for(t=t.child;t!==null;){var e=t;switch(e.tag){case 0:case 11:case 14:case 15:Cn(4,e,e.return),oa(e);break;case 1:Ke(e,e.return);var n=e.stateNode;typeof n.componentWillUnmount=="function"&&kd(e,e.return,n),oa(e);break;case 27:il(e.stateNode);case 26:case 5:Ke(e,e.return),oa(e);break;case 22:e.memoizedState===null&&oa(e);break;case 30:oa(e);break;default:oa(e)}t=t.sibling}}function Nn(t,e,n){for(n=n&&(e.subtreeFlags&8772)!==0,e=e.child;e!==null;){var l=e.alternate,r=t,o=e,y=o.flags;switch(o.tag){case 0:case 11:case 15:Nn(r,o,n),Pi(4,o);break;case 1:if(Nn(r,o,n),l=o,r=l.stateNode,typeof r.componentDidMount=="function")try{r.componentDidMount()}catch(N){Et(l,l.return,N)}if(l=o,r=l.updateQueue,r!==null){var v=l.stateNode;try{var x=r.shared.hiddenCallbacks;if(x!==null)for(r.shared.hiddenCallbacks=null,r=0;r<x.length;r++)Vh(x[r],v)}catch(N){Et(l,l.return,N)}}n&&y&64&&Qd(o),Ji(o,o.return);break;case 27:Fd(o);case 26:case 5:Nn(r,o,n),n&&l===null&&y&4&&Pd(o),Ji(o,o.return);break;case 12:Nn(r,o,n);break;case 13:Nn(r,o,n),n&&y&4&&em(r,o);break;case 22:o.memoizedState===null&&Nn(r,o,n),Ji(o,o.return);break;case 30:break;default:Nn(r,o,n)}e=e.sibling}}function to(t,e){var n=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(n=t.memoizedState.cachePool.pool),t=null,e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(t=e.memoizedState.cachePool.pool),t!==n&&(t!=null&&t.refCount++,n!=null&&Ui(n))}function eo(t,e){t=null,e.alternate!==null&&(t=e.alternate.memoizedState.cache),e=e.memoizedState.cache,e!==t&&(e.refCount++,t!=null&&Ui(t))}function Ze(t,e,n,l){if(e.subtreeFlags&10256)for(e=e.child;e!==null;)im(t,e,n,l),e=e.sibling}function im(t,e,n,l){var r=e.flags;switch(e.tag){case 0:case 11:case 15:Ze(t,e,n,l),r&2048&&Pi(9,e);break;case 1:Ze(t,e,n,l);break;case 3:Ze(t,e,n,l),r&2048&&(t=null,e.alternate!==null&&(t=e.alternate.memoizedState.cache),e=e.memoizedState.cache,e!==t&&(e.refCount++,t!=null&&Ui(t)));break;case 12:if(r&2048){Ze(t,e,n,l),t=e.stateNode;try{var o=e.memoizedProps,y=o.id,v=o.onPostCommit;typeof v=="function"&&v(y,e.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(x){Et(e,e.return,x)}}else Ze(t,e,n,l);break;case 13:Ze(t,e,n,l);break;case 23:break;case 22:o=e.stateNode,y=e.alternate,e.memoizedState!==null?o._visibility&2?Ze(t,e,n,l):Fi(t,e):o._visibility&2?Ze(t,e,n,l):(o._visibility|=2,Ka(t,e,n,l,(e.subtreeFlags&10256)!==0)),r&2048&&to(y,e);break;case 24:Ze(t,e,n,l),r&2048&&eo(e.alternate,e);break;default:Ze(t,e,n,l)}}function Ka(t,e,n,l,r){for(r=r&&(e.subtreeFlags&10256)!==0,e=e.child;e!==null;){var o=t,y=e,v=n,x=l,N=y.flags;switch(y.tag){case 0:case 11:case 15:Ka(o,y,v,x,r),Pi(8,y);break;case 23:break;case 22:var L=y.stateNode;y.memoizedState!==null?L._visibility&2?Ka(o,y,v,x,r):Fi(o,y):(L._visibility|=2,Ka(o,y,v,x,r)),r&&N&2048&&to(y.alternate,y);break;case 24:Ka(o,y,v,x,r),r&&N&2048&&eo(y.alternate,y);break;default:Ka(o,y,v,x,r)}e=e.sibling}}function Fi(t,e){if(e.subtreeFlags&10256)for(e=e.child;e!==null;){var n=t,l=e,r=l.flags;switch(l.tag){case 22:Fi(n,l),r&2048&&to(l.alternate,l);break;case 24:Fi(n,l),r&2048&&eo(l.alternate,l);break;default:Fi(n,l)}e=e.sibling}}var $i=8192;function Za(t){if(t.subtreeFlags&$i)for(t=t.child;t!==null;)lm(t),t=t.sibling}function lm(t){switch(t.tag){case 26:Za(t),t.flags&$i&&t.memoizedState!==null&&X1(_e,t.memoizedState,t.memoizedProps);break;case 5:Za(t);break;case 3:case 4:var e=_e;_e=qs(t.stateNode.containerInfo),Za(t),_e=e;break;case 22:t.memoizedState===null&&(e=t.alternate,e!==null&&e.memoizedState!==null?(e=$i,$i=16777216,Za(t),$i=e):Za(t));break;default:Za(t)}}function sm(t){var e=t.alternate;if(e!==null&&(t=e.child,t!==null)){e.child=null;do e=t.sibling,t.sibling=null,t=e;while(t!==null)}}function Wi(t){var e=t.deletions;if((t.flags&16)!==0){if(e!==null)for(var n=0;n<e.length;n++){var l=e[n];Qt=l,rm(l,t)}sm(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)um(t),t=t.sibling}function um(t){switch(t.tag){case 0:case 11:case 15:Wi(t),t.flags&2048&&Cn(9,t,t.return);break;case 3:Wi(t);break;case 12:Wi(t);break;case 22:var e=t.stateNode;t.memoizedState!==null&&e._visibility&2&&(t.return===null||t.return.tag!==13)?(e._visibility&=-3,Cs(t)):Wi(t);break;default:Wi(t)}}function Cs(t){var e=t.deletions;if((t.flags&16)!==0){if(e!==null)for(var n=0;n<e.length;n++){var l=e[n];Qt=l,rm(l,t)}sm(t)}for(t=t.child;t!==null;){switch(e=t,e.tag){case 0:case 11:case 15:Cn(8,e,e.return),Cs(e);break;case 22:n=e.stateNode,n._visibility&2&&(n._visibility&=-3,Cs(e));break;default:Cs(e)}t=t.sibling}}function rm(t,e){for(;Qt!==null;){var n=Qt;switch(n.tag){case 0:case 11:case 15:Cn(8,n,e);break;case 23:case 22:if(n.memoizedState!==null&&n.memoizedState.cachePool!==null){var l=n.memoizedState.cachePool.pool;l!=null&&l.refCount++}break;case 24:Ui(n.memoizedState.cache)}if(l=n.child,l!==null)l.return=n,Qt=l;else t:for(n=t;Qt!==null;){l=Qt;var r=l.sibling,o=l.return;if(Id(l),l===n){Qt=null;break t}if(r!==null){r.return=o,Qt=r;break t}Qt=o}}}var l1={getCacheForType:function(t){var e=te(Gt),n=e.data.get(t);return n===void 0&&(n=t(),e.data.set(t,n)),n}},s1=typeof WeakMap=="function"?WeakMap:Map,vt=0,Rt=null,ct=null,ht=0,St=0,Se=null,Vn=!1,Qa=!1,no=!1,hn=0,zt=0,zn=0,ca=0,ao=0,Ce=0,ka=0,Ii=null,ce=null,io=!1,lo=0,Os=1/0,Ns=null,Un=null,Ft=0,_n=null,Pa=null,Ja=0,so=0,uo=null,om=null,tl=0,ro=null;function be(){if((vt&2)!==0&&ht!==0)return ht&-ht;if(B.T!==null){var t=La;return t!==0?t:yo()}return Rf()}function cm(){Ce===0&&(Ce=(ht&536870912)===0||yt?xf():536870912);var t=we.current;return t!==null&&(t.flags|=32),Ce}function xe(t,e,n){(t===Rt&&(St===2||St===9)||t.cancelPendingCommit!==null)&&(Fa(t,0),Ln(t,ht,Ce,!1)),vi(t,n),((vt&2)===0||t!==Rt)&&(t===Rt&&((vt&2)===0&&(ca|=n),zt===4&&Ln(t,ht,Ce,!1)),Qe(t))}function fm(t,e,n){if((vt&6)!==0)throw Error(u(327));var l=!n&&(e&124)===0&&(e&t.expiredLanes)===0||gi(t,e),r=l?o1(t,e):fo(t,e,!0),o=l;do{if(r===0){Qa&&!l&&Ln(t,e,0,!1);break}else{if(n=t.current.alternate,o&&!u1(n)){r=fo(t,e,!1),o=!1;continue}if(r===2){if(o=e,t.errorRecoveryDisabledLanes&o)var y=0;else y=t.pendingLanes&-536870913,y=y!==0?y:y&536870912?536870912:0;if(y!==0){e=y;t:{var v=t;r=Ii;var x=v.current.memoizedState.isDehydrated;if(x&&(Fa(v,y).flags|=256),y=fo(v,y,!1),y!==2){if(no&&!x){v.errorRecoveryDisabledLanes|=o,ca|=o,r=4;break t}o=ce,ce=r,o!==null&&(ce===null?ce=o:ce.push.apply(ce,o))}r=y}if(o=!1,r!==2)continue}}if(r===1){Fa(t,0),Ln(t,e,0,!0);break}t:{switch(l=t,o=r,o){case 0:case 1:throw Error(u(345));case 4:if((e&4194048)!==e)break;case 6:Ln(l,e,Ce,!Vn);break t;case 2:ce=null;break;case 3:case 5:break;default:throw Error(u(329))}if((e&62914560)===e&&(r=lo+300-qe(),10<r)){if(Ln(l,e,Ce,!Vn),Gl(l,0,!0)!==0)break t;l.timeoutHandle=Ym(hm.bind(null,l,n,ce,Ns,io,e,Ce,ca,ka,Vn,o,2,-0,0),r);break t}hm(l,n,ce,Ns,io,e,Ce,ca,ka,Vn,o,0,-0,0)}}break}while(!0);Qe(t)}function hm(t,e,n,l,r,o,y,v,x,N,L,Y,V,z){if(t.timeoutHandle=-1,Y=e.subtreeFlags,(Y&8192||(Y&16785408)===16785408)&&(ul={stylesheets:null,count:0,unsuspend:G1},lm(e),Y=K1(),Y!==null)){t.cancelPendingCommit=Y(Sm.bind(null,t,e,o,n,l,r,y,v,x,L,1,V,z)),Ln(t,o,y,!N);return}Sm(t,e,o,n,l,r,y,v,x)}function u1(t){for(var e=t;;){var n=e.tag;if((n===0||n===11||n===15)&&e.flags&16384&&(n=e.updateQueue,n!==null&&(n=n.stores,n!==null)))for(var l=0;l<n.length;l++){var r=n[l],o=r.getSnapshot;r=r.value;try{if(!pe(o(),r))return!1}catch{return!1}}if(n=e.child,e.subtreeFlags&16384&&n!==null)n.return=e,e=n;else{if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}function Ln(t,e,n,l){e&=~ao,e&=~ca,t.suspendedLanes|=e,t.pingedLanes&=~e,l&&(t.warmLanes|=e),l=t.expirationTimes;for(var r=e;0<r;){var o=31-me(r),y=1<<o;l[o]=-1,r&=~y}n!==0&&Ef(t,n,e)}function Vs(){return(vt&6)===0?(el(0),!1):!0}function oo(){if(ct!==null){if(St===0)var t=ct.return;else t=ct,an=ia=null,Dr(t),Ga=null,Zi=0,t=ct;for(;t!==null;)Zd(t.alternate,t),t=t.return;ct=null}}function Fa(t,e){var n=t.timeoutHandle;n!==-1&&(t.timeoutHandle=-1,R1(n)),n=t.cancelPendingCommit,n!==null&&(t.cancelPendingCommit=null,n()),oo(),Rt=t,ct=n=tn(t.current,null),ht=e,St=0,Se=null,Vn=!1,Qa=gi(t,e),no=!1,ka=Ce=ao=ca=zn=zt=0,ce=Ii=null,io=!1,(e&8)!==0&&(e|=e&32);var l=t.entangledLanes;if(l!==0)for(t=t.entanglements,l&=e;0<l;){var r=31-me(l),o=1<<r;e|=t[r],l&=~o}return hn=e,ts(),n}function dm(t,e){rt=null,B.H=Ss,e===Li||e===os?(e=Oh(),St=3):e===Mh?(e=Oh(),St=4):St=e===Nd?8:e!==null&&typeof e=="object"&&typeof e.then=="function"?6:1,Se=e,ct===null&&(zt=1,As(t,Ae(e,t.current)))}function mm(){var t=B.H;return B.H=Ss,t===null?Ss:t}function pm(){var t=B.A;return B.A=l1,t}function co(){zt=4,Vn||(ht&4194048)!==ht&&we.current!==null||(Qa=!0),(zn&134217727)===0&&(ca&134217727)===0||Rt===null||Ln(Rt,ht,Ce,!1)}function fo(t,e,n){var l=vt;vt|=2;var r=mm(),o=pm();(Rt!==t||ht!==e)&&(Ns=null,Fa(t,e)),e=!1;var y=zt;t:do try{if(St!==0&&ct!==null){var v=ct,x=Se;switch(St){case 8:oo(),y=6;break t;case 3:case 2:case 9:case 6:we.current===null&&(e=!0);var N=St;if(St=0,Se=null,$a(t,v,x,N),n&&Qa){y=0;break t}break;default:N=St,St=0,Se=null,$a(t,v,x,N)}}r1(),y=zt;break}catch(L){dm(t,L)}while(!0);return e&&t.shellSuspendCounter++,an=ia=null,vt=l,B.H=r,B.A=o,ct===null&&(Rt=null,ht=0,ts()),y}function r1(){for(;ct!==null;)ym(ct)}function o1(t,e){var n=vt;vt|=2;var l=mm(),r=pm();Rt!==t||ht!==e?(Ns=null,Os=qe()+500,Fa(t,e)):Qa=gi(t,e);t:do try{if(St!==0&&ct!==null){e=ct;var o=Se;e:switch(St){case 1:St=0,Se=null,$a(t,e,o,1);break;case 2:case 9:if(wh(o)){St=0,Se=null,gm(e);break}e=function(){St!==2&&St!==9||Rt!==t||(St=7),Qe(t)},o.then(e,e);break t;case 3:St=7;break t;case 4:St=5;break t;case 7:wh(o)?(St=0,Se=null,gm(e)):(St=0,Se=null,$a(t,e,o,7));break;case 5:var y=null;switch(ct.tag){case 26:y=ct.memoizedState;case 5:case 27:var v=ct;if(!y||Wm(y)){St=0,Se=null;var x=v.sibling;if(x!==null)ct=x;else{var N=v.return;N!==null?(ct=N,zs(N)):ct=null}break e}}St=0,Se=null,$a(t,e,o,5);break;case 6:St=0,Se=null,$a(t,e,o,6);break;case 8:oo(),zt=6;break t;default:throw Error(u(462))}}c1();break}catch(L){dm(t,L)}while(!0);return an=ia=null,B.H=l,B.A=r,vt=n,ct!==null?0:(Rt=null,ht=0,ts(),zt)}function c1(){for(;ct!==null&&!V0();)ym(ct)}function ym(t){var e=Xd(t.alternate,t,hn);t.memoizedProps=t.pendingProps,e===null?zs(t):ct=e}function gm(t){var e=t,n=e.alternate;switch(e.tag){case 15:case 0:e=Bd(n,e,e.pendingProps,e.type,void 0,ht);break;case 11:e=Bd(n,e,e.pendingProps,e.type.render,e.ref,ht);break;case 5:Dr(e);default:Zd(n,e),e=ct=vh(e,hn),e=Xd(n,e,hn)}t.memoizedProps=t.pendingProps,e===null?zs(t):ct=e}function $a(t,e,n,l){an=ia=null,Dr(e),Ga=null,Zi=0;var r=e.return;try{if(Iv(t,r,e,n,ht)){zt=1,As(t,Ae(n,t.current)),ct=null;return}}catch(o){if(r!==null)throw ct=r,o;zt=1,As(t,Ae(n,t.current)),ct=null;return}e.flags&32768?(yt||l===1?t=!0:Qa||(ht&536870912)!==0?t=!1:(Vn=t=!0,(l===2||l===9||l===3||l===6)&&(l=we.current,l!==null&&l.tag===13&&(l.flags|=16384))),vm(e,t)):zs(e)}function zs(t){var e=t;do{if((e.flags&32768)!==0){vm(e,Vn);return}t=e.return;var n=e1(e.alternate,e,hn);if(n!==null){ct=n;return}if(e=e.sibling,e!==null){ct=e;return}ct=e=t}while(e!==null);zt===0&&(zt=5)}function vm(t,e){do{var n=n1(t.alternate,t);if(n!==null){n.flags&=32767,ct=n;return}if(n=t.return,n!==null&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!e&&(t=t.sibling,t!==null)){ct=t;return}ct=t=n}while(t!==null);zt=6,ct=null}function Sm(t,e,n,l,r,o,y,v,x){t.cancelPendingCommit=null;do Us();while(Ft!==0);if((vt&6)!==0)throw Error(u(327));if(e!==null){if(e===t.current)throw Error(u(177));if(o=e.lanes|e.childLanes,o|=er,G0(t,n,o,y,v,x),t===Rt&&(ct=Rt=null,ht=0),Pa=e,_n=t,Ja=n,so=o,uo=r,om=l,(e.subtreeFlags&10256)!==0||(e.flags&10256)!==0?(t.callbackNode=null,t.callbackPriority=0,m1(Hl,function(){return Am(),null})):(t.callbackNode=null,t.callbackPriority=0),l=(e.flags&13878)!==0,(e.subtreeFlags&13878)!==0||l){l=B.T,B.T=null,r=K.p,K.p=2,y=vt,vt|=4;try{a1(t,e,n)}finally{vt=y,K.p=r,B.T=l}}Ft=1,bm(),xm(),Tm()}}function bm(){if(Ft===1){Ft=0;var t=_n,e=Pa,n=(e.flags&13878)!==0;if((e.subtreeFlags&13878)!==0||n){n=B.T,B.T=null;var l=K.p;K.p=2;var r=vt;vt|=4;try{nm(e,t);var o=Ao,y=rh(t.containerInfo),v=o.focusedElem,x=o.selectionRange;if(y!==v&&v&&v.ownerDocument&&uh(v.ownerDocument.documentElement,v)){if(x!==null&&Fu(v)){var N=x.start,L=x.end;if(L===void 0&&(L=N),"selectionStart"in v)v.selectionStart=N,v.selectionEnd=Math.min(L,v.value.length);else{var Y=v.ownerDocument||document,V=Y&&Y.defaultView||window;if(V.getSelection){var z=V.getSelection(),at=v.textContent.length,tt=Math.min(x.start,at),Tt=x.end===void 0?tt:Math.min(x.end,at);!z.extend&&tt>Tt&&(y=Tt,Tt=tt,tt=y);var M=sh(v,tt),A=sh(v,Tt);if(M&&A&&(z.rangeCount!==1||z.anchorNode!==M.node||z.anchorOffset!==M.offset||z.focusNode!==A.node||z.focusOffset!==A.offset)){var C=Y.createRange();C.setStart(M.node,M.offset),z.removeAllRanges(),tt>Tt?(z.addRange(C),z.extend(A.node,A.offset)):(C.setEnd(A.node,A.offset),z.addRange(C))}}}}for(Y=[],z=v;z=z.parentNode;)z.nodeType===1&&Y.push({element:z,left:z.scrollLeft,top:z.scrollTop});for(typeof v.focus=="function"&&v.focus(),v=0;v<Y.length;v++){var H=Y[v];H.element.scrollLeft=H.left,H.element.scrollTop=H.top}}Qs=!!Eo,Ao=Eo=null}finally{vt=r,K.p=l,B.T=n}}t.current=e,Ft=2}}function xm(){if(Ft===2){Ft=0;var t=_n,e=Pa,n=(e.flags&8772)!==0;if((e.subtreeFlags&8772)!==0||n){n=B.T,B.T=null;var l=K.p;K.p=2;var r=vt;vt|=4;try{Wd(t,e.alternate,e)}finally{vt=r,K.p=l,B.T=n}}Ft=3}}function Tm(){if(Ft===4||Ft===3){Ft=0,z0();var t=_n,e=Pa,n=Ja,l=om;(e.subtreeFlags&10256)!==0||(e.flags&10256)!==0?Ft=5:(Ft=0,Pa=_n=null,Em(t,t.pendingLanes));var r=t.pendingLanes;if(r===0&&(Un=null),Cu(n),e=e.stateNode,de&&typeof de.onCommitFiberRoot=="function")try{de.onCommitFiberRoot(yi,e,void 0,(e.current.flags&128)===128)}catch{}if(l!==null){e=B.T,r=K.p,K.p=2,B.T=null;try{for(var o=t.onRecoverableError,y=0;y<l.length;y++){var v=l[y];o(v.value,{componentStack:v.stack})}}finally{B.T=e,K.p=r}}(Ja&3)!==0&&Us(),Qe(t),r=t.pendingLanes,(n&4194090)!==0&&(r&42)!==0?t===ro?tl++:(tl=0,ro=t):tl=0,el(0)}}function Em(t,e){(t.pooledCacheLanes&=e)===0&&(e=t.pooledCache,e!=null&&(t.pooledCache=null,Ui(e)))}function Us(t){return bm(),xm(),Tm(),Am()}function Am(){if(Ft!==5)return!1;var t=_n,e=so;so=0;var n=Cu(Ja),l=B.T,r=K.p;try{K.p=32>n?32:n,B.T=null,n=uo,uo=null;var o=_n,y=Ja;if(Ft=0,Pa=_n=null,Ja=0,(vt&6)!==0)throw Error(u(331));var v=vt;if(vt|=4,um(o.current),im(o,o.current,y,n),vt=v,el(0,!1),de&&typeof de.onPostCommitFiberRoot=="function")try{de.onPostCommitFiberRoot(yi,o)}catch{}return!0}finally{K.p=r,B.T=l,Em(t,e)}}function Rm(t,e,n){e=Ae(n,e),e=Yr(t.stateNode,e,2),t=Rn(t,e,2),t!==null&&(vi(t,2),Qe(t))}function Et(t,e,n){if(t.tag===3)Rm(t,t,n);else for(;e!==null;){if(e.tag===3){Rm(e,t,n);break}else if(e.tag===1){var l=e.stateNode;if(typeof e.type.getDerivedStateFromError=="function"||typeof l.componentDidCatch=="function"&&(Un===null||!Un.has(l))){t=Ae(n,t),n=Cd(2),l=Rn(e,n,2),l!==null&&(Od(n,l,e,t),vi(l,2),Qe(l));break}}e=e.return}}function ho(t,e,n){var l=t.pingCache;if(l===null){l=t.pingCache=new s1;var r=new Set;l.set(e,r)}else r=l.get(e),r===void 0&&(r=new Set,l.set(e,r));r.has(n)||(no=!0,r.add(n),t=f1.bind(null,t,e,n),e.then(t,t))}function f1(t,e,n){var l=t.pingCache;l!==null&&l.delete(e),t.pingedLanes|=t.suspendedLanes&n,t.warmLanes&=~n,Rt===t&&(ht&n)===n&&(zt===4||zt===3&&(ht&62914560)===ht&&300>qe()-lo?(vt&2)===0&&Fa(t,0):ao|=n,ka===ht&&(ka=0)),Qe(t)}function Dm(t,e){e===0&&(e=Tf()),t=Va(t,e),t!==null&&(vi(t,e),Qe(t))}function h1(t){var e=t.memoizedState,n=0;e!==null&&(n=e.retryLane),Dm(t,n)}function d1(t,e){var n=0;switch(t.tag){case 13:var l=t.stateNode,r=t.memoizedState;r!==null&&(n=r.retryLane);break;case 19:l=t.stateNode;break;case 22:l=t.stateNode._retryCache;break;default:throw Error(u(314))}l!==null&&l.delete(e),Dm(t,n)}function m1(t,e){return Ru(t,e)}var _s=null,Wa=null,mo=!1,Ls=!1,po=!1,fa=0;function Qe(t){t!==Wa&&t.next===null&&(Wa===null?_s=Wa=t:Wa=Wa.next=t),Ls=!0,mo||(mo=!0,y1())}function el(t,e){if(!po&&Ls){po=!0;do for(var n=!1,l=_s;l!==null;){if(t!==0){var r=l.pendingLanes;if(r===0)var o=0;else{var y=l.suspendedLanes,v=l.pingedLanes;o=(1<<31-me(42|t)+1)-1,o&=r&~(y&~v),o=o&201326741?o&201326741|1:o?o|2:0}o!==0&&(n=!0,Om(l,o))}else o=ht,o=Gl(l,l===Rt?o:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),(o&3)===0||gi(l,o)||(n=!0,Om(l,o));l=l.next}while(n);po=!1}}function p1(){Mm()}function Mm(){Ls=mo=!1;var t=0;fa!==0&&(A1()&&(t=fa),fa=0);for(var e=qe(),n=null,l=_s;l!==null;){var r=l.next,o=wm(l,e);o===0?(l.next=null,n===null?_s=r:n.next=r,r===null&&(Wa=n)):(n=l,(t!==0||(o&3)!==0)&&(Ls=!0)),l=r}el(t)}function wm(t,e){for(var n=t.suspendedLanes,l=t.pingedLanes,r=t.expirationTimes,o=t.pendingLanes&-62914561;0<o;){var y=31-me(o),v=1<<y,x=r[y];x===-1?((v&n)===0||(v&l)!==0)&&(r[y]=q0(v,e)):x<=e&&(t.expiredLanes|=v),o&=~v}if(e=Rt,n=ht,n=Gl(t,t===e?n:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),l=t.callbackNode,n===0||t===e&&(St===2||St===9)||t.cancelPendingCommit!==null)return l!==null&&l!==null&&Du(l),t.callbackNode=null,t.callbackPriority=0;if((n&3)===0||gi(t,n)){if(e=n&-n,e===t.callbackPriority)return e;switch(l!==null&&Du(l),Cu(n)){case 2:case 8:n=Sf;break;case 32:n=Hl;break;case 268435456:n=bf;break;default:n=Hl}return l=Cm.bind(null,t),n=Ru(n,l),t.callbackPriority=e,t.callbackNode=n,e}return l!==null&&l!==null&&Du(l),t.callbackPriority=2,t.callbackNode=null,2}function Cm(t,e){if(Ft!==0&&Ft!==5)return t.callbackNode=null,t.callbackPriority=0,null;var n=t.callbackNode;if(Us()&&t.callbackNode!==n)return null;var l=ht;return l=Gl(t,t===Rt?l:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),l===0?null:(fm(t,l,e),wm(t,qe()),t.callbackNode!=null&&t.callbackNode===n?Cm.bind(null,t):null)}function Om(t,e){if(Us())return null;fm(t,e,!0)}function y1(){D1(function(){(vt&6)!==0?Ru(vf,p1):Mm()})}function yo(){return fa===0&&(fa=xf()),fa}function Nm(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:kl(""+t)}function Vm(t,e){var n=e.ownerDocument.createElement("input");return n.name=e.name,n.value=e.value,t.id&&n.setAttribute("form",t.id),e.parentNode.insertBefore(n,e),t=new FormData(t),n.parentNode.removeChild(n),t}function g1(t,e,n,l,r){if(e==="submit"&&n&&n.stateNode===r){var o=Nm((r[se]||null).action),y=l.submitter;y&&(e=(e=y[se]||null)?Nm(e.formAction):y.getAttribute("formAction"),e!==null&&(o=e,y=null));var v=new $l("action","action",null,l,r);t.push({event:v,listeners:[{instance:null,listener:function(){if(l.defaultPrevented){if(fa!==0){var x=y?Vm(r,y):new FormData(r);_r(n,{pending:!0,data:x,method:r.method,action:o},null,x)}}else typeof o=="function"&&(v.preventDefault(),x=y?Vm(r,y):new FormData(r),_r(n,{pending:!0,data:x,method:r.method,action:o},o,x))},currentTarget:r}]})}}for(var go=0;go<tr.length;go++){var vo=tr[go],v1=vo.toLowerCase(),S1=vo[0].toUpperCase()+vo.slice(1);Ue(v1,"on"+S1)}Ue(fh,"onAnimationEnd"),Ue(hh,"onAnimationIteration"),Ue(dh,"onAnimationStart"),Ue("dblclick","onDoubleClick"),Ue("focusin","onFocus"),Ue("focusout","onBlur"),Ue(Lv,"onTransitionRun"),Ue(Bv,"onTransitionStart"),Ue(jv,"onTransitionCancel"),Ue(mh,"onTransitionEnd"),Ta("onMouseEnter",["mouseout","mouseover"]),Ta("onMouseLeave",["mouseout","mouseover"]),Ta("onPointerEnter",["pointerout","pointerover"]),Ta("onPointerLeave",["pointerout","pointerover"]),Jn("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Jn("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Jn("onBeforeInput",["compositionend","keypress","textInput","paste"]),Jn("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Jn("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Jn("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var nl="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),b1=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(nl));function zm(t,e){e=(e&4)!==0;for(var n=0;n<t.length;n++){var l=t[n],r=l.event;l=l.listeners;t:{var o=void 0;if(e)for(var y=l.length-1;0<=y;y--){var v=l[y],x=v.instance,N=v.currentTarget;if(v=v.listener,x!==o&&r.isPropagationStopped())break t;o=v,r.currentTarget=N;try{o(r)}catch(L){Es(L)}r.currentTarget=null,o=x}else for(y=0;y<l.length;y++){if(v=l[y],x=v.instance,N=v.currentTarget,v=v.listener,x!==o&&r.isPropagationStopped())break t;o=v,r.currentTarget=N;try{o(r)}catch(L){Es(L)}r.currentTarget=null,o=x}}}}function ft(t,e){var n=e[Ou];n===void 0&&(n=e[Ou]=new Set);var l=t+"__bubble";n.has(l)||(Um(e,t,2,!1),n.add(l))}function So(t,e,n){var l=0;e&&(l|=4),Um(n,t,l,e)}var Bs="_reactListening"+Math.random().toString(36).slice(2);function bo(t){if(!t[Bs]){t[Bs]=!0,Mf.forEach(function(n){n!=="selectionchange"&&(b1.has(n)||So(n,!1,t),So(n,!0,t))});var e=t.nodeType===9?t:t.ownerDocument;e===null||e[Bs]||(e[Bs]=!0,So("selectionchange",!1,e))}}function Um(t,e,n,l){switch(ip(e)){case 2:var r=k1;break;case 8:r=P1;break;default:r=Uo}n=r.bind(null,e,n,t),r=void 0,!qu||e!=="touchstart"&&e!=="touchmove"&&e!=="wheel"||(r=!0),l?r!==void 0?t.addEventListener(e,n,{capture:!0,passive:r}):t.addEventListener(e,n,!0):r!==void 0?t.addEventListener(e,n,{passive:r}):t.addEventListener(e,n,!1)}function xo(t,e,n,l,r){var o=l;if((e&1)===0&&(e&2)===0&&l!==null)t:for(;;){if(l===null)return;var y=l.tag;if(y===3||y===4){var v=l.stateNode.containerInfo;if(v===r)break;if(y===4)for(y=l.return;y!==null;){var x=y.tag;if((x===3||x===4)&&y.stateNode.containerInfo===r)return;y=y.return}for(;v!==null;){if(y=Sa(v),y===null)return;if(x=y.tag,x===5||x===6||x===26||x===27){l=o=y;continue t}v=v.parentNode}}l=l.return}qf(function(){var N=o,L=Hu(n),Y=[];t:{var V=ph.get(t);if(V!==void 0){var z=$l,at=t;switch(t){case"keypress":if(Jl(n)===0)break t;case"keydown":case"keyup":z=mv;break;case"focusin":at="focus",z=Zu;break;case"focusout":at="blur",z=Zu;break;case"beforeblur":case"afterblur":z=Zu;break;case"click":if(n.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":z=Kf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":z=nv;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":z=gv;break;case fh:case hh:case dh:z=lv;break;case mh:z=Sv;break;case"scroll":case"scrollend":z=tv;break;case"wheel":z=xv;break;case"copy":case"cut":case"paste":z=uv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":z=Qf;break;case"toggle":case"beforetoggle":z=Ev}var tt=(e&4)!==0,Tt=!tt&&(t==="scroll"||t==="scrollend"),M=tt?V!==null?V+"Capture":null:V;tt=[];for(var A=N,C;A!==null;){var H=A;if(C=H.stateNode,H=H.tag,H!==5&&H!==26&&H!==27||C===null||M===null||(H=xi(A,M),H!=null&&tt.push(al(A,H,C))),Tt)break;A=A.return}0<tt.length&&(V=new z(V,at,null,n,L),Y.push({event:V,listeners:tt}))}}if((e&7)===0){t:{if(V=t==="mouseover"||t==="pointerover",z=t==="mouseout"||t==="pointerout",V&&n!==ju&&(at=n.relatedTarget||n.fromElement)&&(Sa(at)||at[va]))break t;if((z||V)&&(V=L.window===L?L:(V=L.ownerDocument)?V.defaultView||V.parentWindow:window,z?(at=n.relatedTarget||n.toElement,z=N,at=at?Sa(at):null,at!==null&&(Tt=h(at),tt=at.tag,at!==Tt||tt!==5&&tt!==27&&tt!==6)&&(at=null)):(z=null,at=N),z!==at)){if(tt=Kf,H="onMouseLeave",M="onMouseEnter",A="mouse",(t==="pointerout"||t==="pointerover")&&(tt=Qf,H="onPointerLeave",M="onPointerEnter",A="pointer"),Tt=z==null?V:bi(z),C=at==null?V:bi(at),V=new tt(H,A+"leave",z,n,L),V.target=Tt,V.relatedTarget=C,H=null,Sa(L)===N&&(tt=new tt(M,A+"enter",at,n,L),tt.target=C,tt.relatedTarget=Tt,H=tt),Tt=H,z&&at)e:{for(tt=z,M=at,A=0,C=tt;C;C=Ia(C))A++;for(C=0,H=M;H;H=Ia(H))C++;for(;0<A-C;)tt=Ia(tt),A--;for(;0<C-A;)M=Ia(M),C--;for(;A--;){if(tt===M||M!==null&&tt===M.alternate)break e;tt=Ia(tt),M=Ia(M)}tt=null}else tt=null;z!==null&&_m(Y,V,z,tt,!1),at!==null&&Tt!==null&&_m(Y,Tt,at,tt,!0)}}t:{if(V=N?bi(N):window,z=V.nodeName&&V.nodeName.toLowerCase(),z==="select"||z==="input"&&V.type==="file")var J=th;else if(Wf(V))if(eh)J=zv;else{J=Nv;var ot=Ov}else z=V.nodeName,!z||z.toLowerCase()!=="input"||V.type!=="checkbox"&&V.type!=="radio"?N&&Bu(N.elementType)&&(J=th):J=Vv;if(J&&(J=J(t,N))){If(Y,J,n,L);break t}ot&&ot(t,V,N),t==="focusout"&&N&&V.type==="number"&&N.memoizedProps.value!=null&&Lu(V,"number",V.value)}switch(ot=N?bi(N):window,t){case"focusin":(Wf(ot)||ot.contentEditable==="true")&&(Ca=ot,$u=N,Ci=null);break;case"focusout":Ci=$u=Ca=null;break;case"mousedown":Wu=!0;break;case"contextmenu":case"mouseup":case"dragend":Wu=!1,oh(Y,n,L);break;case"selectionchange":if(_v)break;case"keydown":case"keyup":oh(Y,n,L)}var W;if(ku)t:{switch(t){case"compositionstart":var et="onCompositionStart";break t;case"compositionend":et="onCompositionEnd";break t;case"compositionupdate":et="onCompositionUpdate";break t}et=void 0}else wa?Ff(t,n)&&(et="onCompositionEnd"):t==="keydown"&&n.keyCode===229&&(et="onCompositionStart");et&&(kf&&n.locale!=="ko"&&(wa||et!=="onCompositionStart"?et==="onCompositionEnd"&&wa&&(W=Gf()):(xn=L,Gu="value"in xn?xn.value:xn.textContent,wa=!0)),ot=js(N,et),0<ot.length&&(et=new Zf(et,t,null,n,L),Y.push({event:et,listeners:ot}),W?et.data=W:(W=$f(n),W!==null&&(et.data=W)))),(W=Rv?Dv(t,n):Mv(t,n))&&(et=js(N,"onBeforeInput"),0<et.length&&(ot=new Zf("onBeforeInput","beforeinput",null,n,L),Y.push({event:ot,listeners:et}),ot.data=W)),g1(Y,t,N,n,L)}zm(Y,e)})}function al(t,e,n){return{instance:t,listener:e,currentTarget:n}}function js(t,e){for(var n=e+"Capture",l=[];t!==null;){var r=t,o=r.stateNode;if(r=r.tag,r!==5&&r!==26&&r!==27||o===null||(r=xi(t,n),r!=null&&l.unshift(al(t,r,o)),r=xi(t,e),r!=null&&l.push(al(t,r,o))),t.tag===3)return l;t=t.return}return[]}function Ia(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function _m(t,e,n,l,r){for(var o=e._reactName,y=[];n!==null&&n!==l;){var v=n,x=v.alternate,N=v.stateNode;if(v=v.tag,x!==null&&x===l)break;v!==5&&v!==26&&v!==27||N===null||(x=N,r?(N=xi(n,o),N!=null&&y.unshift(al(n,N,x))):r||(N=xi(n,o),N!=null&&y.push(al(n,N,x)))),n=n.return}y.length!==0&&t.push({event:e,listeners:y})}var x1=/\r\n?/g,T1=/\u0000|\uFFFD/g;function Lm(t){return(typeof t=="string"?t:""+t).replace(x1,`
-`).replace(T1,"")}function Bm(t,e){return e=Lm(e),Lm(t)===e}function Hs(){}function xt(t,e,n,l,r,o){switch(n){case"children":typeof l=="string"?e==="body"||e==="textarea"&&l===""||Ra(t,l):(typeof l=="number"||typeof l=="bigint")&&e!=="body"&&Ra(t,""+l);break;case"className":Kl(t,"class",l);break;case"tabIndex":Kl(t,"tabindex",l);break;case"dir":case"role":case"viewBox":case"width":case"height":Kl(t,n,l);break;case"style":Hf(t,l,o);break;case"data":if(e!=="object"){Kl(t,"data",l);break}case"src":case"href":if(l===""&&(e!=="a"||n!=="href")){t.removeAttribute(n);break}if(l==null||typeof l=="function"||typeof l=="symbol"||typeof l=="boolean"){t.removeAttribute(n);break}l=kl(""+l),t.setAttribute(n,l);break;case"action":case"formAction":if(typeof l=="function"){t.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof o=="function"&&(n==="formAction"?(e!=="input"&&xt(t,e,"name",r.name,r,null),xt(t,e,"formEncType",r.formEncType,r,null),xt(t,e,"formMethod",r.formMethod,r,null),xt(t,e,"formTarget",r.formTarget,r,null)):(xt(t,e,"encType",r.encType,r,null),xt(t,e,"method",r.method,r,null),xt(t,e,"target",r.target,r,null)));if(l==null||typeof l=="symbol"||typeof l=="boolean"){t.removeAttribute(n);break}l=kl(""+l),t.setAttribute(n,l);break;case"onClick":l!=null&&(t.onclick=Hs);break;case"onScroll":l!=null&&ft("scroll",t);break;case"onScrollEnd":l!=null&&ft("scrollend",t);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(u(61));if(n=l.__html,n!=null){if(r.children!=null)throw Error(u(60));t.innerHTML=n}}break;case"multiple":t.multiple=l&&typeof l!="function"&&typeof l!="symbol";break;case"muted":t.muted=l&&typeof l!="function"&&typeof l!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(l==null||typeof l=="function"||typeof l=="boolean"||typeof l=="symbol"){t.removeAttribute("xlink:href");break}n=kl(""+l),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":l!=null&&typeof l!="function"&&typeof l!="symbol"?t.setAttribute(n,""+l):t.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":l&&typeof l!="function"&&typeof l!="symbol"?t.setAttribute(n,""):t.removeAttribute(n);break;case"capture":case"download":l===!0?t.setAttribute(n,""):l!==!1&&l!=null&&typeof l!="function"&&typeof l!="symbol"?t.setAttribute(n,l):t.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":l!=null&&typeof l!="function"&&typeof l!="symbol"&&!isNaN(l)&&1<=l?t.setAttribute(n,l):t.removeAttribute(n);break;case"rowSpan":case"start":l==null||typeof l=="function"||typeof l=="symbol"||isNaN(l)?t.removeAttribute(n):t.setAttribute(n,l);break;case"popover":ft("beforetoggle",t),ft("toggle",t),Xl(t,"popover",l);break;case"xlinkActuate":We(t,"http://www.w3.org/1999/xlink","xlink:actuate",l);break;case"xlinkArcrole":We(t,"http://www.w3.org/1999/xlink","xlink:arcrole",l);break;case"xlinkRole":We(t,"http://www.w3.org/1999/xlink","xlink:role",l);break;case"xlinkShow":We(t,"http://www.w3.org/1999/xlink","xlink:show",l);break;case"xlinkTitle":We(t,"http://www.w3.org/1999/xlink","xlink:title",l);break;case"xlinkType":We(t,"http://www.w3.org/1999/xlink","xlink:type",l);break;case"xmlBase":We(t,"http://www.w3.org/XML/1998/namespace","xml:base",l);break;case"xmlLang":We(t,"http://www.w3.org/XML/1998/namespace","xml:lang",l);break;case"xmlSpace":We(t,"http://www.w3.org/XML/1998/namespace","xml:space",l);break;case"is":Xl(t,"is",l);break;case"innerText":case"textContent":break;default:(!(2<n.length)||n[0]!=="o"&&n[0]!=="O"||n[1]!=="n"&&n[1]!=="N")&&(n=W0.get(n)||n,Xl(t,n,l))}}function To(t,e,n,l,r,o){switch(n){case"style":Hf(t,l,o);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(u(61));if(n=l.__html,n!=null){if(r.children!=null)throw Error(u(60));t.innerHTML=n}}break;case"children":typeof l=="string"?Ra(t,l):(typeof l=="number"||typeof l=="bigint")&&Ra(t,""+l);break;case"onScroll":l!=null&&ft("scroll",t);break;case"onScrollEnd":l!=null&&ft("scrollend",t);break;case"onClick":l!=null&&(t.onclick=Hs);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!wf.hasOwnProperty(n))t:{if(n[0]==="o"&&n[1]==="n"&&(r=n.endsWith("Capture"),e=n.slice(2,r?n.length-7:void 0),o=t[se]||null,o=o!=null?o[n]:null,typeof o=="function"&&t.removeEventListener(e,o,r),typeof l=="function")){typeof o!="function"&&o!==null&&(n in t?t[n]=null:t.hasAttribute(n)&&t.removeAttribute(n)),t.addEventListener(e,l,r);break t}n in t?t[n]=l:l===!0?t.setAttribute(n,""):Xl(t,n,l)}}}function $t(t,e,n){switch(e){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":ft("error",t),ft("load",t);var l=!1,r=!1,o;for(o in n)if(n.hasOwnProperty(o)){var y=n[o];if(y!=null)switch(o){case"src":l=!0;break;case"srcSet":r=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(u(137,e));default:xt(t,e,o,y,n,null)}}r&&xt(t,e,"srcSet",n.srcSet,n,null),l&&xt(t,e,"src",n.src,n,null);return;case"input":ft("invalid",t);var v=o=y=r=null,x=null,N=null;for(l in n)if(n.hasOwnProperty(l)){var L=n[l];if(L!=null)switch(l){case"name":r=L;break;case"type":y=L;break;case"checked":x=L;break;case"defaultChecked":N=L;break;case"value":o=L;break;case"defaultValue":v=L;break;case"children":case"dangerouslySetInnerHTML":if(L!=null)throw Error(u(137,e));break;default:xt(t,e,l,L,n,null)}}_f(t,o,v,x,N,y,r,!1),Zl(t);return;case"select":ft("invalid",t),l=y=o=null;for(r in n)if(n.hasOwnProperty(r)&&(v=n[r],v!=null))switch(r){case"value":o=v;break;case"defaultValue":y=v;break;case"multiple":l=v;default:xt(t,e,r,v,n,null)}e=o,n=y,t.multiple=!!l,e!=null?Aa(t,!!l,e,!1):n!=null&&Aa(t,!!l,n,!0);return;case"textarea":ft("invalid",t),o=r=l=null;for(y in n)if(n.hasOwnProperty(y)&&(v=n[y],v!=null))switch(y){case"value":l=v;break;case"defaultValue":r=v;break;case"children":o=v;break;case"dangerouslySetInnerHTML":if(v!=null)throw Error(u(91));break;default:xt(t,e,y,v,n,null)}Bf(t,l,r,o),Zl(t);return;case"option":for(x in n)if(n.hasOwnProperty(x)&&(l=n[x],l!=null))switch(x){case"selected":t.selected=l&&typeof l!="function"&&typeof l!="symbol";break;default:xt(t,e,x,l,n,null)}return;case"dialog":ft("beforetoggle",t),ft("toggle",t),ft("cancel",t),ft("close",t);break;case"iframe":case"object":ft("load",t);break;case"video":case"audio":for(l=0;l<nl.length;l++)ft(nl[l],t);break;case"image":ft("error",t),ft("load",t);break;case"details":ft("toggle",t);break;case"embed":case"source":case"link":ft("error",t),ft("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(N in n)if(n.hasOwnProperty(N)&&(l=n[N],l!=null))switch(N){case"children":case"dangerouslySetInnerHTML":throw Error(u(137,e));default:xt(t,e,N,l,n,null)}return;default:if(Bu(e)){for(L in n)n.hasOwnProperty(L)&&(l=n[L],l!==void 0&&To(t,e,L,l,n,void 0));return}}for(v in n)n.hasOwnProperty(v)&&(l=n[v],l!=null&&xt(t,e,v,l,n,null))}function E1(t,e,n,l){switch(e){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var r=null,o=null,y=null,v=null,x=null,N=null,L=null;for(z in n){var Y=n[z];if(n.hasOwnProperty(z)&&Y!=null)switch(z){case"checked":break;case"value":break;case"defaultValue":x=Y;default:l.hasOwnProperty(z)||xt(t,e,z,null,l,Y)}}for(var V in l){var z=l[V];if(Y=n[V],l.hasOwnProperty(V)&&(z!=null||Y!=null))switch(V){case"type":o=z;break;case"name":r=z;break;case"checked":N=z;break;case"defaultChecked":L=z;break;case"value":y=z;break;case"defaultValue":v=z;break;case"children":case"dangerouslySetInnerHTML":if(z!=null)throw Error(u(137,e));break;default:z!==Y&&xt(t,e,V,z,l,Y)}}_u(t,y,v,x,N,L,o,r);return;case"select":z=y=v=V=null;for(o in n)if(x=n[o],n.hasOwnProperty(o)&&x!=null)switch(o){case"value":break;case"multiple":z=x;default:l.hasOwnProperty(o)||xt(t,e,o,null,l,x)}for(r in l)if(o=l[r],x=n[r],l.hasOwnProperty(r)&&(o!=null||x!=null))switch(r){case"value":V=o;break;case"defaultValue":v=o;break;case"multiple":y=o;default:o!==x&&xt(t,e,r,o,l,x)}e=v,n=y,l=z,V!=null?Aa(t,!!n,V,!1):!!l!=!!n&&(e!=null?Aa(t,!!n,e,!0):Aa(t,!!n,n?[]:"",!1));return;case"textarea":z=V=null;for(v in n)if(r=n[v],n.hasOwnProperty(v)&&r!=null&&!l.hasOwnProperty(v))switch(v){case"value":break;case"children":break;default:xt(t,e,v,null,l,r)}for(y in l)if(r=l[y],o=n[y],l.hasOwnProperty(y)&&(r!=null||o!=null))switch(y){case"value":V=r;break;case"defaultValue":z=r;break;case"children":break;case"dangerouslySetInnerHTML":if(r!=null)throw Error(u(91));break;default:r!==o&&xt(t,e,y,r,l,o)}Lf(t,V,z);return;case"option":for(var at in n)if(V=n[at],n.hasOwnProperty(at)&&V!=null&&!l.hasOwnProperty(at))switch(at){case"selected":t.selected=!1;break;default:xt(t,e,at,null,l,V)}for(x in l)if(V=l[x],z=n[x],l.hasOwnProperty(x)&&V!==z&&(V!=null||z!=null))switch(x){case"selected":t.selected=V&&typeof V!="function"&&typeof V!="symbol";break;default:xt(t,e,x,V,l,z)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var tt in n)V=n[tt],n.hasOwnProperty(tt)&&V!=null&&!l.hasOwnProperty(tt)&&xt(t,e,tt,null,l,V);for(N in l)if(V=l[N],z=n[N],l.hasOwnProperty(N)&&V!==z&&(V!=null||z!=null))switch(N){case"children":case"dangerouslySetInnerHTML":if(V!=null)throw Error(u(137,e));break;default:xt(t,e,N,V,l,z)}return;default:if(Bu(e)){for(var Tt in n)V=n[Tt],n.hasOwnProperty(Tt)&&V!==void 0&&!l.hasOwnProperty(Tt)&&To(t,e,Tt,void 0,l,V);for(L in l)V=l[L],z=n[L],!l.hasOwnProperty(L)||V===z||V===void 0&&z===void 0||To(t,e,L,V,l,z);return}}for(var M in n)V=n[M],n.hasOwnProperty(M)&&V!=null&&!l.hasOwnProperty(M)&&xt(t,e,M,null,l,V);for(Y in l)V=l[Y],z=n[Y],!l.hasOwnProperty(Y)||V===z||V==null&&z==null||xt(t,e,Y,V,l,z)}var Eo=null,Ao=null;function Ys(t){return t.nodeType===9?t:t.ownerDocument}function jm(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Hm(t,e){if(t===0)switch(e){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&e==="foreignObject"?0:t}function Ro(t,e){return t==="textarea"||t==="noscript"||typeof e.children=="string"||typeof e.children=="number"||typeof e.children=="bigint"||typeof e.dangerouslySetInnerHTML=="object"&&e.dangerouslySetInnerHTML!==null&&e.dangerouslySetInnerHTML.__html!=null}var Do=null;function A1(){var t=window.event;return t&&t.type==="popstate"?t===Do?!1:(Do=t,!0):(Do=null,!1)}var Ym=typeof setTimeout=="function"?setTimeout:void 0,R1=typeof clearTimeout=="function"?clearTimeout:void 0,qm=typeof Promise=="function"?Promise:void 0,D1=typeof queueMicrotask=="function"?queueMicrotask:typeof qm<"u"?function(t){return qm.resolve(null).then(t).catch(M1)}:Ym;function M1(t){setTimeout(function(){throw t})}function Bn(t){return t==="head"}function Gm(t,e){var n=e,l=0,r=0;do{var o=n.nextSibling;if(t.removeChild(n),o&&o.nodeType===8)if(n=o.data,n==="/$"){if(0<l&&8>l){n=l;var y=t.ownerDocument;if(n&1&&il(y.documentElement),n&2&&il(y.body),n&4)for(n=y.head,il(n),y=n.firstChild;y;){var v=y.nextSibling,x=y.nodeName;y[Si]||x==="SCRIPT"||x==="STYLE"||x==="LINK"&&y.rel.toLowerCase()==="stylesheet"||n.removeChild(y),y=v}}if(r===0){t.removeChild(o),hl(e);return}r--}else n==="$"||n==="$?"||n==="$!"?r++:l=n.charCodeAt(0)-48;else l=0;n=o}while(n);hl(e)}function Mo(t){var e=t.firstChild;for(e&&e.nodeType===10&&(e=e.nextSibling);e;){var n=e;switch(e=e.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":Mo(n),Nu(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(n.rel.toLowerCase()==="stylesheet")continue}t.removeChild(n)}}function w1(t,e,n,l){for(;t.nodeType===1;){var r=n;if(t.nodeName.toLowerCase()!==e.toLowerCase()){if(!l&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(l){if(!t[Si])switch(e){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(o=t.getAttribute("rel"),o==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(o!==r.rel||t.getAttribute("href")!==(r.href==null||r.href===""?null:r.href)||t.getAttribute("crossorigin")!==(r.crossOrigin==null?null:r.crossOrigin)||t.getAttribute("title")!==(r.title==null?null:r.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(o=t.getAttribute("src"),(o!==(r.src==null?null:r.src)||t.getAttribute("type")!==(r.type==null?null:r.type)||t.getAttribute("crossorigin")!==(r.crossOrigin==null?null:r.crossOrigin))&&o&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(e==="input"&&t.type==="hidden"){var o=r.name==null?null:""+r.name;if(r.type==="hidden"&&t.getAttribute("name")===o)return t}else return t;if(t=Le(t.nextSibling),t===null)break}return null}function C1(t,e,n){if(e==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!n||(t=Le(t.nextSibling),t===null))return null;return t}function wo(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState==="complete"}function O1(t,e){var n=t.ownerDocument;if(t.data!=="$?"||n.readyState==="complete")e();else{var l=function(){e(),n.removeEventListener("DOMContentLoaded",l)};n.addEventListener("DOMContentLoaded",l),t._reactRetry=l}}function Le(t){for(;t!=null;t=t.nextSibling){var e=t.nodeType;if(e===1||e===3)break;if(e===8){if(e=t.data,e==="$"||e==="$!"||e==="$?"||e==="F!"||e==="F")break;if(e==="/$")return null}}return t}var Co=null;function Xm(t){t=t.previousSibling;for(var e=0;t;){if(t.nodeType===8){var n=t.data;if(n==="$"||n==="$!"||n==="$?"){if(e===0)return t;e--}else n==="/$"&&e++}t=t.previousSibling}return null}function Km(t,e,n){switch(e=Ys(n),t){case"html":if(t=e.documentElement,!t)throw Error(u(452));return t;case"head":if(t=e.head,!t)throw Error(u(453));return t;case"body":if(t=e.body,!t)throw Error(u(454));return t;default:throw Error(u(451))}}function il(t){for(var e=t.attributes;e.length;)t.removeAttributeNode(e[0]);Nu(t)}var Oe=new Map,Zm=new Set;function qs(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var dn=K.d;K.d={f:N1,r:V1,D:z1,C:U1,L:_1,m:L1,X:j1,S:B1,M:H1};function N1(){var t=dn.f(),e=Vs();return t||e}function V1(t){var e=ba(t);e!==null&&e.tag===5&&e.type==="form"?fd(e):dn.r(t)}var ti=typeof document>"u"?null:document;function Qm(t,e,n){var l=ti;if(l&&typeof e=="string"&&e){var r=Ee(e);r='link[rel="'+t+'"][href="'+r+'"]',typeof n=="string"&&(r+='[crossorigin="'+n+'"]'),Zm.has(r)||(Zm.add(r),t={rel:t,crossOrigin:n,href:e},l.querySelector(r)===null&&(e=l.createElement("link"),$t(e,"link",t),Kt(e),l.head.appendChild(e)))}}function z1(t){dn.D(t),Qm("dns-prefetch",t,null)}function U1(t,e){dn.C(t,e),Qm("preconnect",t,e)}function _1(t,e,n){dn.L(t,e,n);var l=ti;if(l&&t&&e){var r='link[rel="preload"][as="'+Ee(e)+'"]';e==="image"&&n&&n.imageSrcSet?(r+='[imagesrcset="'+Ee(n.imageSrcSet)+'"]',typeof n.imageSizes=="string"&&(r+='[imagesizes="'+Ee(n.imageSizes)+'"]')):r+='[href="'+Ee(t)+'"]';var o=r;switch(e){case"style":o=ei(t);break;case"script":o=ni(t)}Oe.has(o)||(t=g({rel:"preload",href:e==="image"&&n&&n.imageSrcSet?void 0:t,as:e},n),Oe.set(o,t),l.querySelector(r)!==null||e==="style"&&l.querySelector(ll(o))||e==="script"&&l.querySelector(sl(o))||(e=l.createElement("link"),$t(e,"link",t),Kt(e),l.head.appendChild(e)))}}function L1(t,e){dn.m(t,e);var n=ti;if(n&&t){var l=e&&typeof e.as=="string"?e.as:"script",r='link[rel="modulepreload"][as="'+Ee(l)+'"][href="'+Ee(t)+'"]',o=r;switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":o=ni(t)}if(!Oe.has(o)&&(t=g({rel:"modulepreload",href:t},e),Oe.set(o,t),n.querySelector(r)===null)){switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(sl(o)))return}l=n.createElement("link"),$t(l,"link",t),Kt(l),n.head.appendChild(l)}}}function B1(t,e,n){dn.S(t,e,n);var l=ti;if(l&&t){var r=xa(l).hoistableStyles,o=ei(t);e=e||"default";var y=r.get(o);if(!y){var v={loading:0,preload:null};if(y=l.querySelector(ll(o)))v.loading=5;else{t=g({rel:"stylesheet",href:t,"data-precedence":e},n),(n=Oe.get(o))&&Oo(t,n);var x=y=l.createElement("link");Kt(x),$t(x,"link",t),x._p=new Promise(function(N,L){x.onload=N,x.onerror=L}),x.addEventListener("load",function(){v.loading|=1}),x.addEventListener("error",function(){v.loading|=2}),v.loading|=4,Gs(y,e,l)}y={type:"stylesheet",instance:y,count:1,state:v},r.set(o,y)}}}function j1(t,e){dn.X(t,e);var n=ti;if(n&&t){var l=xa(n).hoistableScripts,r=ni(t),o=l.get(r);o||(o=n.querySelector(sl(r)),o||(t=g({src:t,async:!0},e),(e=Oe.get(r))&&No(t,e),o=n.createElement("script"),Kt(o),$t(o,"link",t),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},l.set(r,o))}}function H1(t,e){dn.M(t,e);var n=ti;if(n&&t){var l=xa(n).hoistableScripts,r=ni(t),o=l.get(r);o||(o=n.querySelector(sl(r)),o||(t=g({src:t,async:!0,type:"module"},e),(e=Oe.get(r))&&No(t,e),o=n.createElement("script"),Kt(o),$t(o,"link",t),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},l.set(r,o))}}function km(t,e,n,l){var r=(r=lt.current)?qs(r):null;if(!r)throw Error(u(446));switch(t){case"meta":case"title":return null;case"style":return typeof n.precedence=="string"&&typeof n.href=="string"?(e=ei(n.href),n=xa(r).hoistableStyles,l=n.get(e),l||(l={type:"style",instance:null,count:0,state:null},n.set(e,l)),l):{type:"void",instance:null,count:0,state:null};case"link":if(n.rel==="stylesheet"&&typeof n.href=="string"&&typeof n.precedence=="string"){t=ei(n.href);var o=xa(r).hoistableStyles,y=o.get(t);if(y||(r=r.ownerDocument||r,y={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},o.set(t,y),(o=r.querySelector(ll(t)))&&!o._p&&(y.instance=o,y.state.loading=5),Oe.has(t)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Oe.set(t,n),o||Y1(r,t,n,y.state))),e&&l===null)throw Error(u(528,""));return y}if(e&&l!==null)throw Error(u(529,""));return null;case"script":return e=n.async,n=n.src,typeof n=="string"&&e&&typeof e!="function"&&typeof e!="symbol"?(e=ni(n),n=xa(r).hoistableScripts,l=n.get(e),l||(l={type:"script",instance:null,count:0,state:null},n.set(e,l)),l):{type:"void",instance:null,count:0,state:null};default:throw Error(u(444,t))}}function ei(t){return'href="'+Ee(t)+'"'}function ll(t){return'link[rel="stylesheet"]['+t+"]"}function Pm(t){return g({},t,{"data-precedence":t.precedence,precedence:null})}function Y1(t,e,n,l){t.querySelector('link[rel="preload"][as="style"]['+e+"]")?l.loading=1:(e=t.createElement("link"),l.preload=e,e.addEventListener("load",function(){return l.loading|=1}),e.addEventListener("error",function(){return l.loading|=2}),$t(e,"link",n),Kt(e),t.head.appendChild(e))}function ni(t){return'[src="'+Ee(t)+'"]'}function sl(t){return"script[async]"+t}function Jm(t,e,n){if(e.count++,e.instance===null)switch(e.type){case"style":var l=t.querySelector('style[data-href~="'+Ee(n.href)+'"]');if(l)return e.instance=l,Kt(l),l;var r=g({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return l=(t.ownerDocument||t).createElement("style"),Kt(l),$t(l,"style",r),Gs(l,n.precedence,t),e.instance=l;case"stylesheet":r=ei(n.href);var o=t.querySelector(ll(r));if(o)return e.state.loading|=4,e.instance=o,Kt(o),o;l=Pm(n),(r=Oe.get(r))&&Oo(l,r),o=(t.ownerDocument||t).createElement("link"),Kt(o);var y=o;return y._p=new Promise(function(v,x){y.onload=v,y.onerror=x}),$t(o,"link",l),e.state.loading|=4,Gs(o,n.precedence,t),e.instance=o;case"script":return o=ni(n.src),(r=t.querySelector(sl(o)))?(e.instance=r,Kt(r),r):(l=n,(r=Oe.get(o))&&(l=g({},n),No(l,r)),t=t.ownerDocument||t,r=t.createElement("script"),Kt(r),$t(r,"link",l),t.head.appendChild(r),e.instance=r);case"void":return null;default:throw Error(u(443,e.type))}else e.type==="stylesheet"&&(e.state.loading&4)===0&&(l=e.instance,e.state.loading|=4,Gs(l,n.precedence,t));return e.instance}function Gs(t,e,n){for(var l=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),r=l.length?l[l.length-1]:null,o=r,y=0;y<l.length;y++){var v=l[y];if(v.dataset.precedence===e)o=v;else if(o!==r)break}o?o.parentNode.insertBefore(t,o.nextSibling):(e=n.nodeType===9?n.head:n,e.insertBefore(t,e.firstChild))}function Oo(t,e){t.crossOrigin==null&&(t.crossOrigin=e.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=e.referrerPolicy),t.title==null&&(t.title=e.title)}function No(t,e){t.crossOrigin==null&&(t.crossOrigin=e.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=e.referrerPolicy),t.integrity==null&&(t.integrity=e.integrity)}var Xs=null;function Fm(t,e,n){if(Xs===null){var l=new Map,r=Xs=new Map;r.set(n,l)}else r=Xs,l=r.get(n),l||(l=new Map,r.set(n,l));if(l.has(t))return l;for(l.set(t,null),n=n.getElementsByTagName(t),r=0;r<n.length;r++){var o=n[r];if(!(o[Si]||o[It]||t==="link"&&o.getAttribute("rel")==="stylesheet")&&o.namespaceURI!=="http://www.w3.org/2000/svg"){var y=o.getAttribute(e)||"";y=t+y;var v=l.get(y);v?v.push(o):l.set(y,[o])}}return l}function $m(t,e,n){t=t.ownerDocument||t,t.head.insertBefore(n,e==="title"?t.querySelector("head > title"):null)}function q1(t,e,n){if(n===1||e.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof e.precedence!="string"||typeof e.href!="string"||e.href==="")break;return!0;case"link":if(typeof e.rel!="string"||typeof e.href!="string"||e.href===""||e.onLoad||e.onError)break;switch(e.rel){case"stylesheet":return t=e.disabled,typeof e.precedence=="string"&&t==null;default:return!0}case"script":if(e.async&&typeof e.async!="function"&&typeof e.async!="symbol"&&!e.onLoad&&!e.onError&&e.src&&typeof e.src=="string")return!0}return!1}function Wm(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}var ul=null;function G1(){}function X1(t,e,n){if(ul===null)throw Error(u(475));var l=ul;if(e.type==="stylesheet"&&(typeof n.media!="string"||matchMedia(n.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var r=ei(n.href),o=t.querySelector(ll(r));if(o){t=o._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Ks.bind(l),t.then(l,l)),e.state.loading|=4,e.instance=o,Kt(o);return}o=t.ownerDocument||t,n=Pm(n),(r=Oe.get(r))&&Oo(n,r),o=o.createElement("link"),Kt(o);var y=o;y._p=new Promise(function(v,x){y.onload=v,y.onerror=x}),$t(o,"link",n),e.instance=o}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(e,t),(t=e.state.preload)&&(e.state.loading&3)===0&&(l.count++,e=Ks.bind(l),t.addEventListener("load",e),t.addEventListener("error",e))}}function K1(){if(ul===null)throw Error(u(475));var t=ul;return t.stylesheets&&t.count===0&&Vo(t,t.stylesheets),0<t.count?function(e){var n=setTimeout(function(){if(t.stylesheets&&Vo(t,t.stylesheets),t.unsuspend){var l=t.unsuspend;t.unsuspend=null,l()}},6e4);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(n)}}:null}function Ks(){if(this.count--,this.count===0){if(this.stylesheets)Vo(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var Zs=null;function Vo(t,e){t.stylesheets=null,t.unsuspend!==null&&(t.count++,Zs=new Map,e.forEach(Z1,t),Zs=null,Ks.call(t))}function Z1(t,e){if(!(e.state.loading&4)){var n=Zs.get(t);if(n)var l=n.get(null);else{n=new Map,Zs.set(t,n);for(var r=t.querySelectorAll("link[data-precedence],style[data-precedence]"),o=0;o<r.length;o++){var y=r[o];(y.nodeName==="LINK"||y.getAttribute("media")!=="not all")&&(n.set(y.dataset.precedence,y),l=y)}l&&n.set(null,l)}r=e.instance,y=r.getAttribute("data-precedence"),o=n.get(y)||l,o===l&&n.set(null,r),n.set(y,r),this.count++,l=Ks.bind(this),r.addEventListener("load",l),r.addEventListener("error",l),o?o.parentNode.insertBefore(r,o.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(r,t.firstChild)),e.state.loading|=4}}var rl={$$typeof:_,Provider:null,Consumer:null,_currentValue:$,_currentValue2:$,_threadCount:0};function Q1(t,e,n,l,r,o,y,v){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Mu(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Mu(0),this.hiddenUpdates=Mu(null),this.identifierPrefix=l,this.onUncaughtError=r,this.onCaughtError=o,this.onRecoverableError=y,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=v,this.incompleteTransitions=new Map}function Im(t,e,n,l,r,o,y,v,x,N,L,Y){return t=new Q1(t,e,n,y,v,x,N,Y),e=1,o===!0&&(e|=24),o=ye(3,null,null,e),t.current=o,o.stateNode=t,e=hr(),e.refCount++,t.pooledCache=e,e.refCount++,o.memoizedState={element:l,isDehydrated:n,cache:e},yr(o),t}function tp(t){return t?(t=za,t):za}function ep(t,e,n,l,r,o){r=tp(r),l.context===null?l.context=r:l.pendingContext=r,l=An(e),l.payload={element:n},o=o===void 0?null:o,o!==null&&(l.callback=o),n=Rn(t,l,e),n!==null&&(xe(n,t,e),ji(n,t,e))}function np(t,e){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var n=t.retryLane;t.retryLane=n!==0&&n<e?n:e}}function zo(t,e){np(t,e),(t=t.alternate)&&np(t,e)}function ap(t){if(t.tag===13){var e=Va(t,67108864);e!==null&&xe(e,t,67108864),zo(t,67108864)}}var Qs=!0;function k1(t,e,n,l){var r=B.T;B.T=null;var o=K.p;try{K.p=2,Uo(t,e,n,l)}finally{K.p=o,B.T=r}}function P1(t,e,n,l){var r=B.T;B.T=null;var o=K.p;try{K.p=8,Uo(t,e,n,l)}finally{K.p=o,B.T=r}}function Uo(t,e,n,l){if(Qs){var r=_o(l);if(r===null)xo(t,e,l,ks,n),lp(t,l);else if(F1(r,t,e,n,l))l.stopPropagation();else if(lp(t,l),e&4&&-1<J1.indexOf(t)){for(;r!==null;){var o=ba(r);if(o!==null)switch(o.tag){case 3:if(o=o.stateNode,o.current.memoizedState.isDehydrated){var y=Pn(o.pendingLanes);if(y!==0){var v=o;for(v.pendingLanes|=2,v.entangledLanes|=2;y;){var x=1<<31-me(y);v.entanglements[1]|=x,y&=~x}Qe(o),(vt&6)===0&&(Os=qe()+500,el(0))}}break;case 13:v=Va(o,2),v!==null&&xe(v,o,2),Vs(),zo(o,2)}if(o=_o(l),o===null&&xo(t,e,l,ks,n),o===r)break;r=o}r!==null&&l.stopPropagation()}else xo(t,e,l,null,n)}}function _o(t){return t=Hu(t),Lo(t)}var ks=null;function Lo(t){if(ks=null,t=Sa(t),t!==null){var e=h(t);if(e===null)t=null;else{var n=e.tag;if(n===13){if(t=f(e),t!==null)return t;t=null}else if(n===3){if(e.stateNode.current.memoizedState.isDehydrated)return e.tag===3?e.stateNode.containerInfo:null;t=null}else e!==t&&(t=null)}}return ks=t,null}function ip(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(U0()){case vf:return 2;case Sf:return 8;case Hl:case _0:return 32;case bf:return 268435456;default:return 32}default:return 32}}var Bo=!1,jn=null,Hn=null,Yn=null,ol=new Map,cl=new Map,qn=[],J1="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function lp(t,e){switch(t){case"focusin":case"focusout":jn=null;break;case"dragenter":case"dragleave":Hn=null;break;case"mouseover":case"mouseout":Yn=null;break;case"pointerover":case"pointerout":ol.delete(e.pointerId);break;case"gotpointercapture":case"lostpointercapture":cl.delete(e.pointerId)}}function fl(t,e,n,l,r,o){return t===null||t.nativeEvent!==o?(t={blockedOn:e,domEventName:n,eventSystemFlags:l,nativeEvent:o,targetContainers:[r]},e!==null&&(e=ba(e),e!==null&&ap(e)),t):(t.eventSystemFlags|=l,e=t.targetContainers,r!==null&&e.indexOf(r)===-1&&e.push(r),t)}function F1(t,e,n,l,r){switch(e){case"focusin":return jn=fl(jn,t,e,n,l,r),!0;case"dragenter":return Hn=fl(Hn,t,e,n,l,r),!0;case"mouseover":return Yn=fl(Yn,t,e,n,l,r),!0;case"pointerover":var o=r.pointerId;return ol.set(o,fl(ol.get(o)||null,t,e,n,l,r)),!0;case"gotpointercapture":return o=r.pointerId,cl.set(o,fl(cl.get(o)||null,t,e,n,l,r)),!0}return!1}function sp(t){var e=Sa(t.target);if(e!==null){var n=h(e);if(n!==null){if(e=n.tag,e===13){if(e=f(n),e!==null){t.blockedOn=e,X0(t.priority,function(){if(n.tag===13){var l=be();l=wu(l);var r=Va(n,l);r!==null&&xe(r,n,l),zo(n,l)}});return}}else if(e===3&&n.stateNode.current.memoizedState.isDehydrated){t.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}t.blockedOn=null}function Ps(t){if(t.blockedOn!==null)return!1;for(var e=t.targetContainers;0<e.length;){var n=_o(t.nativeEvent);if(n===null){n=t.nativeEvent;var l=new n.constructor(n.type,n);ju=l,n.target.dispatchEvent(l),ju=null}else return e=ba(n),e!==null&&ap(e),t.blockedOn=n,!1;e.shift()}return!0}function up(t,e,n){Ps(t)&&n.delete(e)}function $1(){Bo=!1,jn!==null&&Ps(jn)&&(jn=null),Hn!==null&&Ps(Hn)&&(Hn=null),Yn!==null&&Ps(Yn)&&(Yn=null),ol.forEach(up),cl.forEach(up)}function Js(t,e){t.blockedOn===e&&(t.blockedOn=null,Bo||(Bo=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,$1)))}var Fs=null;function rp(t){Fs!==t&&(Fs=t,a.unstable_scheduleCallback(a.unstable_NormalPriority,function(){Fs===t&&(Fs=null);for(var e=0;e<t.length;e+=3){var n=t[e],l=t[e+1],r=t[e+2];if(typeof l!="function"){if(Lo(l||n)===null)continue;break}var o=ba(n);o!==null&&(t.splice(e,3),e-=3,_r(o,{pending:!0,data:r,method:n.method,action:l},l,r))}}))}function hl(t){function e(x){return Js(x,t)}jn!==null&&Js(jn,t),Hn!==null&&Js(Hn,t),Yn!==null&&Js(Yn,t),ol.forEach(e),cl.forEach(e);for(var n=0;n<qn.length;n++){var l=qn[n];l.blockedOn===t&&(l.blockedOn=null)}for(;0<qn.length&&(n=qn[0],n.blockedOn===null);)sp(n),n.blockedOn===null&&qn.shift();if(n=(t.ownerDocument||t).$$reactFormReplay,n!=null)for(l=0;l<n.length;l+=3){var r=n[l],o=n[l+1],y=r[se]||null;if(typeof o=="function")y||rp(n);else if(y){var v=null;if(o&&o.hasAttribute("formAction")){if(r=o,y=o[se]||null)v=y.formAction;else if(Lo(r)!==null)continue}else v=y.action;typeof v=="function"?n[l+1]=v:(n.splice(l,3),l-=3),rp(n)}}}function jo(t){this._internalRoot=t}$s.prototype.render=jo.prototype.render=function(t){var e=this._internalRoot;if(e===null)throw Error(u(409));var n=e.current,l=be();ep(n,l,t,e,null,null)},$s.prototype.unmount=jo.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var e=t.containerInfo;ep(t.current,2,null,t,null,null),Vs(),e[va]=null}};function $s(t){this._internalRoot=t}$s.prototype.unstable_scheduleHydration=function(t){if(t){var e=Rf();t={blockedOn:null,target:t,priority:e};for(var n=0;n<qn.length&&e!==0&&e<qn[n].priority;n++);qn.splice(n,0,t),n===0&&sp(t)}};var op=i.version;if(op!=="19.1.0")throw Error(u(527,op,"19.1.0"));K.findDOMNode=function(t){var e=t._reactInternals;if(e===void 0)throw typeof t.render=="function"?Error(u(188)):(t=Object.keys(t).join(","),Error(u(268,t)));return t=d(e),t=t!==null?m(t):null,t=t===null?null:t.stateNode,t};var W1={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:B,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Ws=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Ws.isDisabled&&Ws.supportsFiber)try{yi=Ws.inject(W1),de=Ws}catch{}}return ml.createRoot=function(t,e){if(!c(t))throw Error(u(299));var n=!1,l="",r=Rd,o=Dd,y=Md,v=null;return e!=null&&(e.unstable_strictMode===!0&&(n=!0),e.identifierPrefix!==void 0&&(l=e.identifierPrefix),e.onUncaughtError!==void 0&&(r=e.onUncaughtError),e.onCaughtError!==void 0&&(o=e.onCaughtError),e.onRecoverableError!==void 0&&(y=e.onRecoverableError),e.unstable_transitionCallbacks!==void 0&&(v=e.unstable_transitionCallbacks)),e=Im(t,1,!1,null,null,n,l,r,o,y,v,null),t[va]=e.current,bo(t),new jo(e)},ml.hydrateRoot=function(t,e,n){if(!c(t))throw Error(u(299));var l=!1,r="",o=Rd,y=Dd,v=Md,x=null,N=null;return n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(r=n.identifierPrefix),n.onUncaughtError!==void 0&&(o=n.onUncaughtError),n.onCaughtError!==void 0&&(y=n.onCaughtError),n.onRecoverableError!==void 0&&(v=n.onRecoverableError),n.unstable_transitionCallbacks!==void 0&&(x=n.unstable_transitionCallbacks),n.formState!==void 0&&(N=n.formState)),e=Im(t,1,!0,e,n??null,l,r,o,y,v,x,N),e.context=tp(null),n=e.current,l=be(),l=wu(l),r=An(l),r.callback=null,Rn(n,r,l),n=l,e.current.lanes=n,vi(e,n),Qe(e),t[va]=e.current,bo(t),new $s(e)},ml.version="19.1.0",ml}var Sp;function rS(){if(Sp)return qo.exports;Sp=1;function a(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(a)}catch(i){console.error(i)}}return a(),qo.exports=uS(),qo.exports}var oS=rS(),pl={},bp;function cS(){if(bp)return pl;bp=1,Object.defineProperty(pl,"__esModule",{value:!0}),pl.parse=f,pl.serialize=m;const a=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,i=/^[\u0021-\u003A\u003C-\u007E]*$/,s=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,u=/^[\u0020-\u003A\u003D-\u007E]*$/,c=Object.prototype.toString,h=(()=>{const b=function(){};return b.prototype=Object.create(null),b})();function f(b,R){const D=new h,w=b.length;if(w<2)return D;const U=(R==null?void 0:R.decode)||g;let O=0;do{const j=b.indexOf("=",O);if(j===-1)break;const _=b.indexOf(";",O),Z=_===-1?w:_;if(j>Z){O=b.lastIndexOf(";",j-1)+1;continue}const q=p(b,O,j),P=d(b,j,q),nt=b.slice(q,P);if(D[nt]===void 0){let F=p(b,j+1,Z),st=d(b,Z,F);const gt=U(b.slice(F,st));D[nt]=gt}O=Z+1}while(O<w);return D}function p(b,R,D){do{const w=b.charCodeAt(R);if(w!==32&&w!==9)return R}while(++R<D);return D}function d(b,R,D){for(;R>D;){const w=b.charCodeAt(--R);if(w!==32&&w!==9)return R+1}return D}function m(b,R,D){const w=(D==null?void 0:D.encode)||encodeURIComponent;if(!a.test(b))throw new TypeError(`argument name is invalid: ${b}`);const U=w(R);if(!i.test(U))throw new TypeError(`argument val is invalid: ${R}`);let O=b+"="+U;if(!D)return O;if(D.maxAge!==void 0){if(!Number.isInteger(D.maxAge))throw new TypeError(`option maxAge is invalid: ${D.maxAge}`);O+="; Max-Age="+D.maxAge}if(D.domain){if(!s.test(D.domain))throw new TypeError(`option domain is invalid: ${D.domain}`);O+="; Domain="+D.domain}if(D.path){if(!u.test(D.path))throw new TypeError(`option path is invalid: ${D.path}`);O+="; Path="+D.path}if(D.expires){if(!S(D.expires)||!Number.isFinite(D.expires.valueOf()))throw new TypeError(`option expires is invalid: ${D.expires}`);O+="; Expires="+D.expires.toUTCString()}if(D.httpOnly&&(O+="; HttpOnly"),D.secure&&(O+="; Secure"),D.partitioned&&(O+="; Partitioned"),D.priority)switch(typeof D.priority=="string"?D.priority.toLowerCase():void 0){case"low":O+="; Priority=Low";break;case"medium":O+="; Priority=Medium";break;case"high":O+="; Priority=High";break;default:throw new TypeError(`option priority is invalid: ${D.priority}`)}if(D.sameSite)switch(typeof D.sameSite=="string"?D.sameSite.toLowerCase():D.sameSite){case!0:case"strict":O+="; SameSite=Strict";break;case"lax":O+="; SameSite=Lax";break;case"none":O+="; SameSite=None";break;default:throw new TypeError(`option sameSite is invalid: ${D.sameSite}`)}return O}function g(b){if(b.indexOf("%")===-1)return b;try{return decodeURIComponent(b)}catch{return b}}function S(b){return c.call(b)==="[object Date]"}return pl}cS();var xp="popstate";function fS(a={}){function i(u,c){let{pathname:h,search:f,hash:p}=u.location;return lc("",{pathname:h,search:f,hash:p},c.state&&c.state.usr||null,c.state&&c.state.key||"default")}function s(u,c){return typeof c=="string"?c:Al(c)}return dS(i,s,null,a)}function wt(a,i){if(a===!1||a===null||typeof a>"u")throw new Error(i)}function je(a,i){if(!a){typeof console<"u"&&console.warn(i);try{throw new Error(i)}catch{}}}function hS(){return Math.random().toString(36).substring(2,10)}function Tp(a,i){return{usr:a.state,key:a.key,idx:i}}function lc(a,i,s=null,u){return{pathname:typeof a=="string"?a:a.pathname,search:"",hash:"",...typeof i=="string"?ci(i):i,state:s,key:i&&i.key||u||hS()}}function Al({pathname:a="/",search:i="",hash:s=""}){return i&&i!=="?"&&(a+=i.charAt(0)==="?"?i:"?"+i),s&&s!=="#"&&(a+=s.charAt(0)==="#"?s:"#"+s),a}function ci(a){let i={};if(a){let s=a.indexOf("#");s>=0&&(i.hash=a.substring(s),a=a.substring(0,s));let u=a.indexOf("?");u>=0&&(i.search=a.substring(u),a=a.substring(0,u)),a&&(i.pathname=a)}return i}function dS(a,i,s,u={}){let{window:c=document.defaultView,v5Compat:h=!1}=u,f=c.history,p="POP",d=null,m=g();m==null&&(m=0,f.replaceState({...f.state,idx:m},""));function g(){return(f.state||{idx:null}).idx}function S(){p="POP";let U=g(),O=U==null?null:U-m;m=U,d&&d({action:p,location:w.location,delta:O})}function b(U,O){p="PUSH";let j=lc(w.location,U,O);m=g()+1;let _=Tp(j,m),Z=w.createHref(j);try{f.pushState(_,"",Z)}catch(q){if(q instanceof DOMException&&q.name==="DataCloneError")throw q;c.location.assign(Z)}h&&d&&d({action:p,location:w.location,delta:1})}function R(U,O){p="REPLACE";let j=lc(w.location,U,O);m=g();let _=Tp(j,m),Z=w.createHref(j);f.replaceState(_,"",Z),h&&d&&d({action:p,location:w.location,delta:0})}function D(U){return mS(U)}let w={get action(){return p},get location(){return a(c,f)},listen(U){if(d)throw new Error("A history only accepts one active listener");return c.addEventListener(xp,S),d=U,()=>{c.removeEventListener(xp,S),d=null}},createHref(U){return i(c,U)},createURL:D,encodeLocation(U){let O=D(U);return{pathname:O.pathname,search:O.search,hash:O.hash}},push:b,replace:R,go(U){return f.go(U)}};return w}function mS(a,i=!1){let s="http://localhost";typeof window<"u"&&(s=window.location.origin!=="null"?window.location.origin:window.location.href),wt(s,"No window.location.(origin|href) available to create URL");let u=typeof a=="string"?a:Al(a);return u=u.replace(/ $/,"%20"),!i&&u.startsWith("//")&&(u=s+u),new URL(u,s)}function Hy(a,i,s="/"){return pS(a,i,s,!1)}function pS(a,i,s,u){let c=typeof i=="string"?ci(i):i,h=pn(c.pathname||"/",s);if(h==null)return null;let f=Yy(a);yS(f);let p=null;for(let d=0;p==null&&d<f.length;++d){let m=MS(h);p=RS(f[d],m,u)}return p}function Yy(a,i=[],s=[],u=""){let c=(h,f,p)=>{let d={relativePath:p===void 0?h.path||"":p,caseSensitive:h.caseSensitive===!0,childrenIndex:f,route:h};d.relativePath.startsWith("/")&&(wt(d.relativePath.startsWith(u),`Absolute route path "${d.relativePath}" nested under path "${u}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),d.relativePath=d.relativePath.slice(u.length));let m=mn([u,d.relativePath]),g=s.concat(d);h.children&&h.children.length>0&&(wt(h.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${m}".`),Yy(h.children,i,g,m)),!(h.path==null&&!h.index)&&i.push({path:m,score:ES(m,h.index),routesMeta:g})};return a.forEach((h,f)=>{var p;if(h.path===""||!((p=h.path)!=null&&p.includes("?")))c(h,f);else for(let d of qy(h.path))c(h,f,d)}),i}function qy(a){let i=a.split("/");if(i.length===0)return[];let[s,...u]=i,c=s.endsWith("?"),h=s.replace(/\?$/,"");if(u.length===0)return c?[h,""]:[h];let f=qy(u.join("/")),p=[];return p.push(...f.map(d=>d===""?h:[h,d].join("/"))),c&&p.push(...f),p.map(d=>a.startsWith("/")&&d===""?"/":d)}function yS(a){a.sort((i,s)=>i.score!==s.score?s.score-i.score:AS(i.routesMeta.map(u=>u.childrenIndex),s.routesMeta.map(u=>u.childrenIndex)))}var gS=/^:[\w-]+$/,vS=3,SS=2,bS=1,xS=10,TS=-2,Ep=a=>a==="*";function ES(a,i){let s=a.split("/"),u=s.length;return s.some(Ep)&&(u+=TS),i&&(u+=SS),s.filter(c=>!Ep(c)).reduce((c,h)=>c+(gS.test(h)?vS:h===""?bS:xS),u)}function AS(a,i){return a.length===i.length&&a.slice(0,-1).every((u,c)=>u===i[c])?a[a.length-1]-i[i.length-1]:0}function RS(a,i,s=!1){let{routesMeta:u}=a,c={},h="/",f=[];for(let p=0;p<u.length;++p){let d=u[p],m=p===u.length-1,g=h==="/"?i:i.slice(h.length)||"/",S=cu({path:d.relativePath,caseSensitive:d.caseSensitive,end:m},g),b=d.route;if(!S&&m&&s&&!u[u.length-1].route.index&&(S=cu({path:d.relativePath,caseSensitive:d.caseSensitive,end:!1},g)),!S)return null;Object.assign(c,S.params),f.push({params:c,pathname:mn([h,S.pathname]),pathnameBase:NS(mn([h,S.pathnameBase])),route:b}),S.pathnameBase!=="/"&&(h=mn([h,S.pathnameBase]))}return f}function cu(a,i){typeof a=="string"&&(a={path:a,caseSensitive:!1,end:!0});let[s,u]=DS(a.path,a.caseSensitive,a.end),c=i.match(s);if(!c)return null;let h=c[0],f=h.replace(/(.)\/+$/,"$1"),p=c.slice(1);return{params:u.reduce((m,{paramName:g,isOptional:S},b)=>{if(g==="*"){let D=p[b]||"";f=h.slice(0,h.length-D.length).replace(/(.)\/+$/,"$1")}const R=p[b];return S&&!R?m[g]=void 0:m[g]=(R||"").replace(/%2F/g,"/"),m},{}),pathname:h,pathnameBase:f,pattern:a}}function DS(a,i=!1,s=!0){je(a==="*"||!a.endsWith("*")||a.endsWith("/*"),`Route path "${a}" will be treated as if it were "${a.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${a.replace(/\*$/,"/*")}".`);let u=[],c="^"+a.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(f,p,d)=>(u.push({paramName:p,isOptional:d!=null}),d?"/?([^\\/]+)?":"/([^\\/]+)"));return a.endsWith("*")?(u.push({paramName:"*"}),c+=a==="*"||a==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):s?c+="\\/*$":a!==""&&a!=="/"&&(c+="(?:(?=\\/|$))"),[new RegExp(c,i?void 0:"i"),u]}function MS(a){try{return a.split("/").map(i=>decodeURIComponent(i).replace(/\//g,"%2F")).join("/")}catch(i){return je(!1,`The URL path "${a}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${i}).`),a}}function pn(a,i){if(i==="/")return a;if(!a.toLowerCase().startsWith(i.toLowerCase()))return null;let s=i.endsWith("/")?i.length-1:i.length,u=a.charAt(s);return u&&u!=="/"?null:a.slice(s)||"/"}function wS(a,i="/"){let{pathname:s,search:u="",hash:c=""}=typeof a=="string"?ci(a):a;return{pathname:s?s.startsWith("/")?s:CS(s,i):i,search:VS(u),hash:zS(c)}}function CS(a,i){let s=i.replace(/\/+$/,"").split("/");return a.split("/").forEach(c=>{c===".."?s.length>1&&s.pop():c!=="."&&s.push(c)}),s.length>1?s.join("/"):"/"}function Zo(a,i,s,u){return`Cannot include a '${a}' character in a manually specified \`to.${i}\` field [${JSON.stringify(u)}].  Please separate it out to the \`to.${s}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function OS(a){return a.filter((i,s)=>s===0||i.route.path&&i.route.path.length>0)}function Cc(a){let i=OS(a);return i.map((s,u)=>u===i.length-1?s.pathname:s.pathnameBase)}function Oc(a,i,s,u=!1){let c;typeof a=="string"?c=ci(a):(c={...a},wt(!c.pathname||!c.pathname.includes("?"),Zo("?","pathname","search",c)),wt(!c.pathname||!c.pathname.includes("#"),Zo("#","pathname","hash",c)),wt(!c.search||!c.search.includes("#"),Zo("#","search","hash",c)));let h=a===""||c.pathname==="",f=h?"/":c.pathname,p;if(f==null)p=s;else{let S=i.length-1;if(!u&&f.startsWith("..")){let b=f.split("/");for(;b[0]==="..";)b.shift(),S-=1;c.pathname=b.join("/")}p=S>=0?i[S]:"/"}let d=wS(c,p),m=f&&f!=="/"&&f.endsWith("/"),g=(h||f===".")&&s.endsWith("/");return!d.pathname.endsWith("/")&&(m||g)&&(d.pathname+="/"),d}var mn=a=>a.join("/").replace(/\/\/+/g,"/"),NS=a=>a.replace(/\/+$/,"").replace(/^\/*/,"/"),VS=a=>!a||a==="?"?"":a.startsWith("?")?a:"?"+a,zS=a=>!a||a==="#"?"":a.startsWith("#")?a:"#"+a;function US(a){return a!=null&&typeof a.status=="number"&&typeof a.statusText=="string"&&typeof a.internal=="boolean"&&"data"in a}var Gy=["POST","PUT","PATCH","DELETE"];new Set(Gy);var _S=["GET",...Gy];new Set(_S);var fi=E.createContext(null);fi.displayName="DataRouter";var yu=E.createContext(null);yu.displayName="DataRouterState";var Xy=E.createContext({isTransitioning:!1});Xy.displayName="ViewTransition";var LS=E.createContext(new Map);LS.displayName="Fetchers";var BS=E.createContext(null);BS.displayName="Await";var He=E.createContext(null);He.displayName="Navigation";var Vl=E.createContext(null);Vl.displayName="Location";var Fe=E.createContext({outlet:null,matches:[],isDataRoute:!1});Fe.displayName="Route";var Nc=E.createContext(null);Nc.displayName="RouteError";function jS(a,{relative:i}={}){wt(hi(),"useHref() may be used only in the context of a <Router> component.");let{basename:s,navigator:u}=E.useContext(He),{hash:c,pathname:h,search:f}=zl(a,{relative:i}),p=h;return s!=="/"&&(p=h==="/"?s:mn([s,h])),u.createHref({pathname:p,search:f,hash:c})}function hi(){return E.useContext(Vl)!=null}function Qn(){return wt(hi(),"useLocation() may be used only in the context of a <Router> component."),E.useContext(Vl).location}var Ky="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function Zy(a){E.useContext(He).static||E.useLayoutEffect(a)}function gu(){let{isDataRoute:a}=E.useContext(Fe);return a?$S():HS()}function HS(){wt(hi(),"useNavigate() may be used only in the context of a <Router> component.");let a=E.useContext(fi),{basename:i,navigator:s}=E.useContext(He),{matches:u}=E.useContext(Fe),{pathname:c}=Qn(),h=JSON.stringify(Cc(u)),f=E.useRef(!1);return Zy(()=>{f.current=!0}),E.useCallback((d,m={})=>{if(je(f.current,Ky),!f.current)return;if(typeof d=="number"){s.go(d);return}let g=Oc(d,JSON.parse(h),c,m.relative==="path");a==null&&i!=="/"&&(g.pathname=g.pathname==="/"?i:mn([i,g.pathname])),(m.replace?s.replace:s.push)(g,m.state,m)},[i,s,h,c,a])}E.createContext(null);function zl(a,{relative:i}={}){let{matches:s}=E.useContext(Fe),{pathname:u}=Qn(),c=JSON.stringify(Cc(s));return E.useMemo(()=>Oc(a,JSON.parse(c),u,i==="path"),[a,c,u,i])}function YS(a,i){return Qy(a,i)}function Qy(a,i,s,u){var O;wt(hi(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:c}=E.useContext(He),{matches:h}=E.useContext(Fe),f=h[h.length-1],p=f?f.params:{},d=f?f.pathname:"/",m=f?f.pathnameBase:"/",g=f&&f.route;{let j=g&&g.path||"";ky(d,!g||j.endsWith("*")||j.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${d}" (under <Route path="${j}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${j}"> to <Route path="${j==="/"?"*":`${j}/*`}">.`)}let S=Qn(),b;if(i){let j=typeof i=="string"?ci(i):i;wt(m==="/"||((O=j.pathname)==null?void 0:O.startsWith(m)),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${m}" but pathname "${j.pathname}" was given in the \`location\` prop.`),b=j}else b=S;let R=b.pathname||"/",D=R;if(m!=="/"){let j=m.replace(/^\//,"").split("/");D="/"+R.replace(/^\//,"").split("/").slice(j.length).join("/")}let w=Hy(a,{pathname:D});je(g||w!=null,`No routes matched location "${b.pathname}${b.search}${b.hash}" `),je(w==null||w[w.length-1].route.element!==void 0||w[w.length-1].route.Component!==void 0||w[w.length-1].route.lazy!==void 0,`Matched leaf route at location "${b.pathname}${b.search}${b.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let U=ZS(w&&w.map(j=>Object.assign({},j,{params:Object.assign({},p,j.params),pathname:mn([m,c.encodeLocation?c.encodeLocation(j.pathname).pathname:j.pathname]),pathnameBase:j.pathnameBase==="/"?m:mn([m,c.encodeLocation?c.encodeLocation(j.pathnameBase).pathname:j.pathnameBase])})),h,s,u);return i&&U?E.createElement(Vl.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...b},navigationType:"POP"}},U):U}function qS(){let a=FS(),i=US(a)?`${a.status} ${a.statusText}`:a instanceof Error?a.message:JSON.stringify(a),s=a instanceof Error?a.stack:null,u="rgba(200,200,200, 0.5)",c={padding:"0.5rem",backgroundColor:u},h={padding:"2px 4px",backgroundColor:u},f=null;return console.error("Error handled by React Router default ErrorBoundary:",a),f=E.createElement(E.Fragment,null,E.createElement("p",null,"💿 Hey developer 👋"),E.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",E.createElement("code",{style:h},"ErrorBoundary")," or"," ",E.createElement("code",{style:h},"errorElement")," prop on your route.")),E.createElement(E.Fragment,null,E.createElement("h2",null,"Unexpected Application Error!"),E.createElement("h3",{style:{fontStyle:"italic"}},i),s?E.createElement("pre",{style:c},s):null,f)}var GS=E.createElement(qS,null),XS=class extends E.Component{constructor(a){super(a),this.state={location:a.location,revalidation:a.revalidation,error:a.error}}static getDerivedStateFromError(a){return{error:a}}static getDerivedStateFromProps(a,i){return i.location!==a.location||i.revalidation!=="idle"&&a.revalidation==="idle"?{error:a.error,location:a.location,revalidation:a.revalidation}:{error:a.error!==void 0?a.error:i.error,location:i.location,revalidation:a.revalidation||i.revalidation}}componentDidCatch(a,i){console.error("React Router caught the following error during render",a,i)}render(){return this.state.error!==void 0?E.createElement(Fe.Provider,{value:this.props.routeContext},E.createElement(Nc.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function KS({routeContext:a,match:i,children:s}){let u=E.useContext(fi);return u&&u.static&&u.staticContext&&(i.route.errorElement||i.route.ErrorBoundary)&&(u.staticContext._deepestRenderedBoundaryId=i.route.id),E.createElement(Fe.Provider,{value:a},s)}function ZS(a,i=[],s=null,u=null){if(a==null){if(!s)return null;if(s.errors)a=s.matches;else if(i.length===0&&!s.initialized&&s.matches.length>0)a=s.matches;else return null}let c=a,h=s==null?void 0:s.errors;if(h!=null){let d=c.findIndex(m=>m.route.id&&(h==null?void 0:h[m.route.id])!==void 0);wt(d>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(h).join(",")}`),c=c.slice(0,Math.min(c.length,d+1))}let f=!1,p=-1;if(s)for(let d=0;d<c.length;d++){let m=c[d];if((m.route.HydrateFallback||m.route.hydrateFallbackElement)&&(p=d),m.route.id){let{loaderData:g,errors:S}=s,b=m.route.loader&&!g.hasOwnProperty(m.route.id)&&(!S||S[m.route.id]===void 0);if(m.route.lazy||b){f=!0,p>=0?c=c.slice(0,p+1):c=[c[0]];break}}}return c.reduceRight((d,m,g)=>{let S,b=!1,R=null,D=null;s&&(S=h&&m.route.id?h[m.route.id]:void 0,R=m.route.errorElement||GS,f&&(p<0&&g===0?(ky("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),b=!0,D=null):p===g&&(b=!0,D=m.route.hydrateFallbackElement||null)));let w=i.concat(c.slice(0,g+1)),U=()=>{let O;return S?O=R:b?O=D:m.route.Component?O=E.createElement(m.route.Component,null):m.route.element?O=m.route.element:O=d,E.createElement(KS,{match:m,routeContext:{outlet:d,matches:w,isDataRoute:s!=null},children:O})};return s&&(m.route.ErrorBoundary||m.route.errorElement||g===0)?E.createElement(XS,{location:s.location,revalidation:s.revalidation,component:R,error:S,children:U(),routeContext:{outlet:null,matches:w,isDataRoute:!0}}):U()},null)}function Vc(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function QS(a){let i=E.useContext(fi);return wt(i,Vc(a)),i}function kS(a){let i=E.useContext(yu);return wt(i,Vc(a)),i}function PS(a){let i=E.useContext(Fe);return wt(i,Vc(a)),i}function zc(a){let i=PS(a),s=i.matches[i.matches.length-1];return wt(s.route.id,`${a} can only be used on routes that contain a unique "id"`),s.route.id}function JS(){return zc("useRouteId")}function FS(){var u;let a=E.useContext(Nc),i=kS("useRouteError"),s=zc("useRouteError");return a!==void 0?a:(u=i.errors)==null?void 0:u[s]}function $S(){let{router:a}=QS("useNavigate"),i=zc("useNavigate"),s=E.useRef(!1);return Zy(()=>{s.current=!0}),E.useCallback(async(c,h={})=>{je(s.current,Ky),s.current&&(typeof c=="number"?a.navigate(c):await a.navigate(c,{fromRouteId:i,...h}))},[a,i])}var Ap={};function ky(a,i,s){!i&&!Ap[a]&&(Ap[a]=!0,je(!1,s))}E.memo(WS);function WS({routes:a,future:i,state:s}){return Qy(a,void 0,s,i)}function IS({to:a,replace:i,state:s,relative:u}){wt(hi(),"<Navigate> may be used only in the context of a <Router> component.");let{static:c}=E.useContext(He);je(!c,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:h}=E.useContext(Fe),{pathname:f}=Qn(),p=gu(),d=Oc(a,Cc(h),f,u==="path"),m=JSON.stringify(d);return E.useEffect(()=>{p(JSON.parse(m),{replace:i,state:s,relative:u})},[p,m,u,i,s]),null}function sc(a){wt(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function tb({basename:a="/",children:i=null,location:s,navigationType:u="POP",navigator:c,static:h=!1}){wt(!hi(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let f=a.replace(/^\/*/,"/"),p=E.useMemo(()=>({basename:f,navigator:c,static:h,future:{}}),[f,c,h]);typeof s=="string"&&(s=ci(s));let{pathname:d="/",search:m="",hash:g="",state:S=null,key:b="default"}=s,R=E.useMemo(()=>{let D=pn(d,f);return D==null?null:{location:{pathname:D,search:m,hash:g,state:S,key:b},navigationType:u}},[f,d,m,g,S,b,u]);return je(R!=null,`<Router basename="${f}"> is not able to match the URL "${d}${m}${g}" because it does not start with the basename, so the <Router> won't render anything.`),R==null?null:E.createElement(He.Provider,{value:p},E.createElement(Vl.Provider,{children:i,value:R}))}function eb({children:a,location:i}){return YS(uc(a),i)}function uc(a,i=[]){let s=[];return E.Children.forEach(a,(u,c)=>{if(!E.isValidElement(u))return;let h=[...i,c];if(u.type===E.Fragment){s.push.apply(s,uc(u.props.children,h));return}wt(u.type===sc,`[${typeof u.type=="string"?u.type:u.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),wt(!u.props.index||!u.props.children,"An index route cannot have child routes.");let f={id:u.props.id||h.join("-"),caseSensitive:u.props.caseSensitive,element:u.props.element,Component:u.props.Component,index:u.props.index,path:u.props.path,loader:u.props.loader,action:u.props.action,hydrateFallbackElement:u.props.hydrateFallbackElement,HydrateFallback:u.props.HydrateFallback,errorElement:u.props.errorElement,ErrorBoundary:u.props.ErrorBoundary,hasErrorBoundary:u.props.hasErrorBoundary===!0||u.props.ErrorBoundary!=null||u.props.errorElement!=null,shouldRevalidate:u.props.shouldRevalidate,handle:u.props.handle,lazy:u.props.lazy};u.props.children&&(f.children=uc(u.props.children,h)),s.push(f)}),s}var iu="get",lu="application/x-www-form-urlencoded";function vu(a){return a!=null&&typeof a.tagName=="string"}function nb(a){return vu(a)&&a.tagName.toLowerCase()==="button"}function ab(a){return vu(a)&&a.tagName.toLowerCase()==="form"}function ib(a){return vu(a)&&a.tagName.toLowerCase()==="input"}function lb(a){return!!(a.metaKey||a.altKey||a.ctrlKey||a.shiftKey)}function sb(a,i){return a.button===0&&(!i||i==="_self")&&!lb(a)}var Is=null;function ub(){if(Is===null)try{new FormData(document.createElement("form"),0),Is=!1}catch{Is=!0}return Is}var rb=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Qo(a){return a!=null&&!rb.has(a)?(je(!1,`"${a}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${lu}"`),null):a}function ob(a,i){let s,u,c,h,f;if(ab(a)){let p=a.getAttribute("action");u=p?pn(p,i):null,s=a.getAttribute("method")||iu,c=Qo(a.getAttribute("enctype"))||lu,h=new FormData(a)}else if(nb(a)||ib(a)&&(a.type==="submit"||a.type==="image")){let p=a.form;if(p==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let d=a.getAttribute("formaction")||p.getAttribute("action");if(u=d?pn(d,i):null,s=a.getAttribute("formmethod")||p.getAttribute("method")||iu,c=Qo(a.getAttribute("formenctype"))||Qo(p.getAttribute("enctype"))||lu,h=new FormData(p,a),!ub()){let{name:m,type:g,value:S}=a;if(g==="image"){let b=m?`${m}.`:"";h.append(`${b}x`,"0"),h.append(`${b}y`,"0")}else m&&h.append(m,S)}}else{if(vu(a))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');s=iu,u=null,c=lu,f=a}return h&&c==="text/plain"&&(f=h,h=void 0),{action:u,method:s.toLowerCase(),encType:c,formData:h,body:f}}function Uc(a,i){if(a===!1||a===null||typeof a>"u")throw new Error(i)}async function cb(a,i){if(a.id in i)return i[a.id];try{let s=await import(a.module);return i[a.id]=s,s}catch(s){return console.error(`Error loading route module \`${a.module}\`, reloading page...`),console.error(s),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function fb(a){return a==null?!1:a.href==null?a.rel==="preload"&&typeof a.imageSrcSet=="string"&&typeof a.imageSizes=="string":typeof a.rel=="string"&&typeof a.href=="string"}async function hb(a,i,s){let u=await Promise.all(a.map(async c=>{let h=i.routes[c.route.id];if(h){let f=await cb(h,s);return f.links?f.links():[]}return[]}));return yb(u.flat(1).filter(fb).filter(c=>c.rel==="stylesheet"||c.rel==="preload").map(c=>c.rel==="stylesheet"?{...c,rel:"prefetch",as:"style"}:{...c,rel:"prefetch"}))}function Rp(a,i,s,u,c,h){let f=(d,m)=>s[m]?d.route.id!==s[m].route.id:!0,p=(d,m)=>{var g;return s[m].pathname!==d.pathname||((g=s[m].route.path)==null?void 0:g.endsWith("*"))&&s[m].params["*"]!==d.params["*"]};return h==="assets"?i.filter((d,m)=>f(d,m)||p(d,m)):h==="data"?i.filter((d,m)=>{var S;let g=u.routes[d.route.id];if(!g||!g.hasLoader)return!1;if(f(d,m)||p(d,m))return!0;if(d.route.shouldRevalidate){let b=d.route.shouldRevalidate({currentUrl:new URL(c.pathname+c.search+c.hash,window.origin),currentParams:((S=s[0])==null?void 0:S.params)||{},nextUrl:new URL(a,window.origin),nextParams:d.params,defaultShouldRevalidate:!0});if(typeof b=="boolean")return b}return!0}):[]}function db(a,i,{includeHydrateFallback:s}={}){return mb(a.map(u=>{let c=i.routes[u.route.id];if(!c)return[];let h=[c.module];return c.clientActionModule&&(h=h.concat(c.clientActionModule)),c.clientLoaderModule&&(h=h.concat(c.clientLoaderModule)),s&&c.hydrateFallbackModule&&(h=h.concat(c.hydrateFallbackModule)),c.imports&&(h=h.concat(c.imports)),h}).flat(1))}function mb(a){return[...new Set(a)]}function pb(a){let i={},s=Object.keys(a).sort();for(let u of s)i[u]=a[u];return i}function yb(a,i){let s=new Set;return new Set(i),a.reduce((u,c)=>{let h=JSON.stringify(pb(c));return s.has(h)||(s.add(h),u.push({key:h,link:c})),u},[])}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var gb=new Set([100,101,204,205]);function vb(a,i){let s=typeof a=="string"?new URL(a,typeof window>"u"?"server://singlefetch/":window.location.origin):a;return s.pathname==="/"?s.pathname="_root.data":i&&pn(s.pathname,i)==="/"?s.pathname=`${i.replace(/\/$/,"")}/_root.data`:s.pathname=`${s.pathname.replace(/\/$/,"")}.data`,s}function Py(){let a=E.useContext(fi);return Uc(a,"You must render this element inside a <DataRouterContext.Provider> element"),a}function Sb(){let a=E.useContext(yu);return Uc(a,"You must render this element inside a <DataRouterStateContext.Provider> element"),a}var _c=E.createContext(void 0);_c.displayName="FrameworkContext";function Jy(){let a=E.useContext(_c);return Uc(a,"You must render this element inside a <HydratedRouter> element"),a}function bb(a,i){let s=E.useContext(_c),[u,c]=E.useState(!1),[h,f]=E.useState(!1),{onFocus:p,onBlur:d,onMouseEnter:m,onMouseLeave:g,onTouchStart:S}=i,b=E.useRef(null);E.useEffect(()=>{if(a==="render"&&f(!0),a==="viewport"){let w=O=>{O.forEach(j=>{f(j.isIntersecting)})},U=new IntersectionObserver(w,{threshold:.5});return b.current&&U.observe(b.current),()=>{U.disconnect()}}},[a]),E.useEffect(()=>{if(u){let w=setTimeout(()=>{f(!0)},100);return()=>{clearTimeout(w)}}},[u]);let R=()=>{c(!0)},D=()=>{c(!1),f(!1)};return s?a!=="intent"?[h,b,{}]:[h,b,{onFocus:yl(p,R),onBlur:yl(d,D),onMouseEnter:yl(m,R),onMouseLeave:yl(g,D),onTouchStart:yl(S,R)}]:[!1,b,{}]}function yl(a,i){return s=>{a&&a(s),s.defaultPrevented||i(s)}}function xb({page:a,...i}){let{router:s}=Py(),u=E.useMemo(()=>Hy(s.routes,a,s.basename),[s.routes,a,s.basename]);return u?E.createElement(Eb,{page:a,matches:u,...i}):null}function Tb(a){let{manifest:i,routeModules:s}=Jy(),[u,c]=E.useState([]);return E.useEffect(()=>{let h=!1;return hb(a,i,s).then(f=>{h||c(f)}),()=>{h=!0}},[a,i,s]),u}function Eb({page:a,matches:i,...s}){let u=Qn(),{manifest:c,routeModules:h}=Jy(),{basename:f}=Py(),{loaderData:p,matches:d}=Sb(),m=E.useMemo(()=>Rp(a,i,d,c,u,"data"),[a,i,d,c,u]),g=E.useMemo(()=>Rp(a,i,d,c,u,"assets"),[a,i,d,c,u]),S=E.useMemo(()=>{if(a===u.pathname+u.search+u.hash)return[];let D=new Set,w=!1;if(i.forEach(O=>{var _;let j=c.routes[O.route.id];!j||!j.hasLoader||(!m.some(Z=>Z.route.id===O.route.id)&&O.route.id in p&&((_=h[O.route.id])!=null&&_.shouldRevalidate)||j.hasClientLoader?w=!0:D.add(O.route.id))}),D.size===0)return[];let U=vb(a,f);return w&&D.size>0&&U.searchParams.set("_routes",i.filter(O=>D.has(O.route.id)).map(O=>O.route.id).join(",")),[U.pathname+U.search]},[f,p,u,c,m,i,a,h]),b=E.useMemo(()=>db(g,c),[g,c]),R=Tb(g);return E.createElement(E.Fragment,null,S.map(D=>E.createElement("link",{key:D,rel:"prefetch",as:"fetch",href:D,...s})),b.map(D=>E.createElement("link",{key:D,rel:"modulepreload",href:D,...s})),R.map(({key:D,link:w})=>E.createElement("link",{key:D,...w})))}function Ab(...a){return i=>{a.forEach(s=>{typeof s=="function"?s(i):s!=null&&(s.current=i)})}}var Fy=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{Fy&&(window.__reactRouterVersion="7.6.1")}catch{}function Rb({basename:a,children:i,window:s}){let u=E.useRef();u.current==null&&(u.current=fS({window:s,v5Compat:!0}));let c=u.current,[h,f]=E.useState({action:c.action,location:c.location}),p=E.useCallback(d=>{E.startTransition(()=>f(d))},[f]);return E.useLayoutEffect(()=>c.listen(p),[c,p]),E.createElement(tb,{basename:a,children:i,location:h.location,navigationType:h.action,navigator:c})}var $y=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Wy=E.forwardRef(function({onClick:i,discover:s="render",prefetch:u="none",relative:c,reloadDocument:h,replace:f,state:p,target:d,to:m,preventScrollReset:g,viewTransition:S,...b},R){let{basename:D}=E.useContext(He),w=typeof m=="string"&&$y.test(m),U,O=!1;if(typeof m=="string"&&w&&(U=m,Fy))try{let st=new URL(window.location.href),gt=m.startsWith("//")?new URL(st.protocol+m):new URL(m),Yt=pn(gt.pathname,D);gt.origin===st.origin&&Yt!=null?m=Yt+gt.search+gt.hash:O=!0}catch{je(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let j=jS(m,{relative:c}),[_,Z,q]=bb(u,b),P=Cb(m,{replace:f,state:p,target:d,preventScrollReset:g,relative:c,viewTransition:S});function nt(st){i&&i(st),st.defaultPrevented||P(st)}let F=E.createElement("a",{...b,...q,href:U||j,onClick:O||h?i:nt,ref:Ab(R,Z),target:d,"data-discover":!w&&s==="render"?"true":void 0});return _&&!w?E.createElement(E.Fragment,null,F,E.createElement(xb,{page:j})):F});Wy.displayName="Link";var Db=E.forwardRef(function({"aria-current":i="page",caseSensitive:s=!1,className:u="",end:c=!1,style:h,to:f,viewTransition:p,children:d,...m},g){let S=zl(f,{relative:m.relative}),b=Qn(),R=E.useContext(yu),{navigator:D,basename:w}=E.useContext(He),U=R!=null&&Ub(S)&&p===!0,O=D.encodeLocation?D.encodeLocation(S).pathname:S.pathname,j=b.pathname,_=R&&R.navigation&&R.navigation.location?R.navigation.location.pathname:null;s||(j=j.toLowerCase(),_=_?_.toLowerCase():null,O=O.toLowerCase()),_&&w&&(_=pn(_,w)||_);const Z=O!=="/"&&O.endsWith("/")?O.length-1:O.length;let q=j===O||!c&&j.startsWith(O)&&j.charAt(Z)==="/",P=_!=null&&(_===O||!c&&_.startsWith(O)&&_.charAt(O.length)==="/"),nt={isActive:q,isPending:P,isTransitioning:U},F=q?i:void 0,st;typeof u=="function"?st=u(nt):st=[u,q?"active":null,P?"pending":null,U?"transitioning":null].filter(Boolean).join(" ");let gt=typeof h=="function"?h(nt):h;return E.createElement(Wy,{...m,"aria-current":F,className:st,ref:g,style:gt,to:f,viewTransition:p},typeof d=="function"?d(nt):d)});Db.displayName="NavLink";var Mb=E.forwardRef(({discover:a="render",fetcherKey:i,navigate:s,reloadDocument:u,replace:c,state:h,method:f=iu,action:p,onSubmit:d,relative:m,preventScrollReset:g,viewTransition:S,...b},R)=>{let D=Vb(),w=zb(p,{relative:m}),U=f.toLowerCase()==="get"?"get":"post",O=typeof p=="string"&&$y.test(p),j=_=>{if(d&&d(_),_.defaultPrevented)return;_.preventDefault();let Z=_.nativeEvent.submitter,q=(Z==null?void 0:Z.getAttribute("formmethod"))||f;D(Z||_.currentTarget,{fetcherKey:i,method:q,navigate:s,replace:c,state:h,relative:m,preventScrollReset:g,viewTransition:S})};return E.createElement("form",{ref:R,method:U,action:w,onSubmit:u?d:j,...b,"data-discover":!O&&a==="render"?"true":void 0})});Mb.displayName="Form";function wb(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Iy(a){let i=E.useContext(fi);return wt(i,wb(a)),i}function Cb(a,{target:i,replace:s,state:u,preventScrollReset:c,relative:h,viewTransition:f}={}){let p=gu(),d=Qn(),m=zl(a,{relative:h});return E.useCallback(g=>{if(sb(g,i)){g.preventDefault();let S=s!==void 0?s:Al(d)===Al(m);p(a,{replace:S,state:u,preventScrollReset:c,relative:h,viewTransition:f})}},[d,p,m,s,u,i,a,c,h,f])}var Ob=0,Nb=()=>`__${String(++Ob)}__`;function Vb(){let{router:a}=Iy("useSubmit"),{basename:i}=E.useContext(He),s=JS();return E.useCallback(async(u,c={})=>{let{action:h,method:f,encType:p,formData:d,body:m}=ob(u,i);if(c.navigate===!1){let g=c.fetcherKey||Nb();await a.fetch(g,s,c.action||h,{preventScrollReset:c.preventScrollReset,formData:d,body:m,formMethod:c.method||f,formEncType:c.encType||p,flushSync:c.flushSync})}else await a.navigate(c.action||h,{preventScrollReset:c.preventScrollReset,formData:d,body:m,formMethod:c.method||f,formEncType:c.encType||p,replace:c.replace,state:c.state,fromRouteId:s,flushSync:c.flushSync,viewTransition:c.viewTransition})},[a,i,s])}function zb(a,{relative:i}={}){let{basename:s}=E.useContext(He),u=E.useContext(Fe);wt(u,"useFormAction must be used inside a RouteContext");let[c]=u.matches.slice(-1),h={...zl(a||".",{relative:i})},f=Qn();if(a==null){h.search=f.search;let p=new URLSearchParams(h.search),d=p.getAll("index");if(d.some(g=>g==="")){p.delete("index"),d.filter(S=>S).forEach(S=>p.append("index",S));let g=p.toString();h.search=g?`?${g}`:""}}return(!a||a===".")&&c.route.index&&(h.search=h.search?h.search.replace(/^\?/,"?index&"):"?index"),s!=="/"&&(h.pathname=h.pathname==="/"?s:mn([s,h.pathname])),Al(h)}function Ub(a,i={}){let s=E.useContext(Xy);wt(s!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:u}=Iy("useViewTransitionState"),c=zl(a,{relative:i.relative});if(!s.isTransitioning)return!1;let h=pn(s.currentLocation.pathname,u)||s.currentLocation.pathname,f=pn(s.nextLocation.pathname,u)||s.nextLocation.pathname;return cu(c.pathname,f)!=null||cu(c.pathname,h)!=null}[...gb];const Lc=E.createContext({});function Bc(a){const i=E.useRef(null);return i.current===null&&(i.current=a()),i.current}const jc=typeof window<"u",tg=jc?E.useLayoutEffect:E.useEffect,Su=E.createContext(null);function Hc(a,i){a.indexOf(i)===-1&&a.push(i)}function Yc(a,i){const s=a.indexOf(i);s>-1&&a.splice(s,1)}const yn=(a,i,s)=>s>i?i:s<a?a:s;let qc=()=>{};const gn={},eg=a=>/^-?(?:\d+(?:\.\d+)?|\.\d+)$/u.test(a);function ng(a){return typeof a=="object"&&a!==null}const ag=a=>/^0[^.\s]+$/u.test(a);function Gc(a){let i;return()=>(i===void 0&&(i=a()),i)}const ze=a=>a,_b=(a,i)=>s=>i(a(s)),Ul=(...a)=>a.reduce(_b),Rl=(a,i,s)=>{const u=i-a;return u===0?1:(s-a)/u};class Xc{constructor(){this.subscriptions=[]}add(i){return Hc(this.subscriptions,i),()=>Yc(this.subscriptions,i)}notify(i,s,u){const c=this.subscriptions.length;if(c)if(c===1)this.subscriptions[0](i,s,u);else for(let h=0;h<c;h++){const f=this.subscriptions[h];f&&f(i,s,u)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}}const ke=a=>a*1e3,Pe=a=>a/1e3;function ig(a,i){return i?a*(1e3/i):0}const Lb=(a,i,s)=>{const u=i-a;return((s-a)%u+u)%u+a},lg=(a,i,s)=>(((1-3*s+3*i)*a+(3*s-6*i))*a+3*i)*a,Bb=1e-7,jb=12;function Hb(a,i,s,u,c){let h,f,p=0;do f=i+(s-i)/2,h=lg(f,u,c)-a,h>0?s=f:i=f;while(Math.abs(h)>Bb&&++p<jb);return f}function _l(a,i,s,u){if(a===i&&s===u)return ze;const c=h=>Hb(h,0,1,a,s);return h=>h===0||h===1?h:lg(c(h),i,u)}const sg=a=>i=>i<=.5?a(2*i)/2:(2-a(2*(1-i)))/2,ug=a=>i=>1-a(1-i),rg=_l(.33,1.53,.69,.99),Kc=ug(rg),og=sg(Kc),cg=a=>(a*=2)<1?.5*Kc(a):.5*(2-Math.pow(2,-10*(a-1))),Zc=a=>1-Math.sin(Math.acos(a)),fg=ug(Zc),hg=sg(Zc),Yb=_l(.42,0,1,1),qb=_l(0,0,.58,1),dg=_l(.42,0,.58,1),Gb=a=>Array.isArray(a)&&typeof a[0]!="number",mg=a=>Array.isArray(a)&&typeof a[0]=="number",Xb={linear:ze,easeIn:Yb,easeInOut:dg,easeOut:qb,circIn:Zc,circInOut:hg,circOut:fg,backIn:Kc,backInOut:og,backOut:rg,anticipate:cg},Kb=a=>typeof a=="string",Dp=a=>{if(mg(a)){qc(a.length===4);const[i,s,u,c]=a;return _l(i,s,u,c)}else if(Kb(a))return Xb[a];return a},tu=["setup","read","resolveKeyframes","preUpdate","update","preRender","render","postRender"],Mp={value:null};function Zb(a,i){let s=new Set,u=new Set,c=!1,h=!1;const f=new WeakSet;let p={delta:0,timestamp:0,isProcessing:!1},d=0;function m(S){f.has(S)&&(g.schedule(S),a()),d++,S(p)}const g={schedule:(S,b=!1,R=!1)=>{const w=R&&c?s:u;return b&&f.add(S),w.has(S)||w.add(S),S},cancel:S=>{u.delete(S),f.delete(S)},process:S=>{if(p=S,c){h=!0;return}c=!0,[s,u]=[u,s],s.forEach(m),i&&Mp.value&&Mp.value.frameloop[i].push(d),d=0,s.clear(),c=!1,h&&(h=!1,g.process(S))}};return g}const Qb=40;function pg(a,i){let s=!1,u=!0;const c={delta:0,timestamp:0,isProcessing:!1},h=()=>s=!0,f=tu.reduce((_,Z)=>(_[Z]=Zb(h,i?Z:void 0),_),{}),{setup:p,read:d,resolveKeyframes:m,preUpdate:g,update:S,preRender:b,render:R,postRender:D}=f,w=()=>{const _=gn.useManualTiming?c.timestamp:performance.now();s=!1,gn.useManualTiming||(c.delta=u?1e3/60:Math.max(Math.min(_-c.timestamp,Qb),1)),c.timestamp=_,c.isProcessing=!0,p.process(c),d.process(c),m.process(c),g.process(c),S.process(c),b.process(c),R.process(c),D.process(c),c.isProcessing=!1,s&&i&&(u=!1,a(w))},U=()=>{s=!0,u=!0,c.isProcessing||a(w)};return{schedule:tu.reduce((_,Z)=>{const q=f[Z];return _[Z]=(P,nt=!1,F=!1)=>(s||U(),q.schedule(P,nt,F)),_},{}),cancel:_=>{for(let Z=0;Z<tu.length;Z++)f[tu[Z]].cancel(_)},state:c,steps:f}}const{schedule:Nt,cancel:Kn,state:Wt,steps:ko}=pg(typeof requestAnimationFrame<"u"?requestAnimationFrame:ze,!0);let su;function kb(){su=void 0}const fe={now:()=>(su===void 0&&fe.set(Wt.isProcessing||gn.useManualTiming?Wt.timestamp:performance.now()),su),set:a=>{su=a,queueMicrotask(kb)}},yg=a=>i=>typeof i=="string"&&i.startsWith(a),Qc=yg("--"),Pb=yg("var(--"),kc=a=>Pb(a)?Jb.test(a.split("/*")[0].trim()):!1,Jb=/var\(--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)$/iu,di={test:a=>typeof a=="number",parse:parseFloat,transform:a=>a},Dl={...di,transform:a=>yn(0,1,a)},eu={...di,default:1},Sl=a=>Math.round(a*1e5)/1e5,Pc=/-?(?:\d+(?:\.\d+)?|\.\d+)/gu;function Fb(a){return a==null}const $b=/^(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))$/iu,Jc=(a,i)=>s=>!!(typeof s=="string"&&$b.test(s)&&s.startsWith(a)||i&&!Fb(s)&&Object.prototype.hasOwnProperty.call(s,i)),gg=(a,i,s)=>u=>{if(typeof u!="string")return u;const[c,h,f,p]=u.match(Pc);return{[a]:parseFloat(c),[i]:parseFloat(h),[s]:parseFloat(f),alpha:p!==void 0?parseFloat(p):1}},Wb=a=>yn(0,255,a),Po={...di,transform:a=>Math.round(Wb(a))},ma={test:Jc("rgb","red"),parse:gg("red","green","blue"),transform:({red:a,green:i,blue:s,alpha:u=1})=>"rgba("+Po.transform(a)+", "+Po.transform(i)+", "+Po.transform(s)+", "+Sl(Dl.transform(u))+")"};function Ib(a){let i="",s="",u="",c="";return a.length>5?(i=a.substring(1,3),s=a.substring(3,5),u=a.substring(5,7),c=a.substring(7,9)):(i=a.substring(1,2),s=a.substring(2,3),u=a.substring(3,4),c=a.substring(4,5),i+=i,s+=s,u+=u,c+=c),{red:parseInt(i,16),green:parseInt(s,16),blue:parseInt(u,16),alpha:c?parseInt(c,16)/255:1}}const rc={test:Jc("#"),parse:Ib,transform:ma.transform},Ll=a=>({test:i=>typeof i=="string"&&i.endsWith(a)&&i.split(" ").length===1,parse:parseFloat,transform:i=>`${i}${a}`}),Xn=Ll("deg"),Je=Ll("%"),it=Ll("px"),tx=Ll("vh"),ex=Ll("vw"),wp={...Je,parse:a=>Je.parse(a)/100,transform:a=>Je.transform(a*100)},ai={test:Jc("hsl","hue"),parse:gg("hue","saturation","lightness"),transform:({hue:a,saturation:i,lightness:s,alpha:u=1})=>"hsla("+Math.round(a)+", "+Je.transform(Sl(i))+", "+Je.transform(Sl(s))+", "+Sl(Dl.transform(u))+")"},ne={test:a=>ma.test(a)||rc.test(a)||ai.test(a),parse:a=>ma.test(a)?ma.parse(a):ai.test(a)?ai.parse(a):rc.parse(a),transform:a=>typeof a=="string"?a:a.hasOwnProperty("red")?ma.transform(a):ai.transform(a)},nx=/(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))/giu;function ax(a){var i,s;return isNaN(a)&&typeof a=="string"&&(((i=a.match(Pc))==null?void 0:i.length)||0)+(((s=a.match(nx))==null?void 0:s.length)||0)>0}const vg="number",Sg="color",ix="var",lx="var(",Cp="${}",sx=/var\s*\(\s*--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)|#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\)|-?(?:\d+(?:\.\d+)?|\.\d+)/giu;function Ml(a){const i=a.toString(),s=[],u={color:[],number:[],var:[]},c=[];let h=0;const p=i.replace(sx,d=>(ne.test(d)?(u.color.push(h),c.push(Sg),s.push(ne.parse(d))):d.startsWith(lx)?(u.var.push(h),c.push(ix),s.push(d)):(u.number.push(h),c.push(vg),s.push(parseFloat(d))),++h,Cp)).split(Cp);return{values:s,split:p,indexes:u,types:c}}function bg(a){return Ml(a).values}function xg(a){const{split:i,types:s}=Ml(a),u=i.length;return c=>{let h="";for(let f=0;f<u;f++)if(h+=i[f],c[f]!==void 0){const p=s[f];p===vg?h+=Sl(c[f]):p===Sg?h+=ne.transform(c[f]):h+=c[f]}return h}}const ux=a=>typeof a=="number"?0:a;function rx(a){const i=bg(a);return xg(a)(i.map(ux))}const Zn={test:ax,parse:bg,createTransformer:xg,getAnimatableNone:rx};function Jo(a,i,s){return s<0&&(s+=1),s>1&&(s-=1),s<1/6?a+(i-a)*6*s:s<1/2?i:s<2/3?a+(i-a)*(2/3-s)*6:a}function ox({hue:a,saturation:i,lightness:s,alpha:u}){a/=360,i/=100,s/=100;let c=0,h=0,f=0;if(!i)c=h=f=s;else{const p=s<.5?s*(1+i):s+i-s*i,d=2*s-p;c=Jo(d,p,a+1/3),h=Jo(d,p,a),f=Jo(d,p,a-1/3)}return{red:Math.round(c*255),green:Math.round(h*255),blue:Math.round(f*255),alpha:u}}function fu(a,i){return s=>s>0?i:a}const Ot=(a,i,s)=>a+(i-a)*s,Fo=(a,i,s)=>{const u=a*a,c=s*(i*i-u)+u;return c<0?0:Math.sqrt(c)},cx=[rc,ma,ai],fx=a=>cx.find(i=>i.test(a));function Op(a){const i=fx(a);if(!i)return!1;let s=i.parse(a);return i===ai&&(s=ox(s)),s}const Np=(a,i)=>{const s=Op(a),u=Op(i);if(!s||!u)return fu(a,i);const c={...s};return h=>(c.red=Fo(s.red,u.red,h),c.green=Fo(s.green,u.green,h),c.blue=Fo(s.blue,u.blue,h),c.alpha=Ot(s.alpha,u.alpha,h),ma.transform(c))},oc=new Set(["none","hidden"]);function hx(a,i){return oc.has(a)?s=>s<=0?a:i:s=>s>=1?i:a}function dx(a,i){return s=>Ot(a,i,s)}function Fc(a){return typeof a=="number"?dx:typeof a=="string"?kc(a)?fu:ne.test(a)?Np:yx:Array.isArray(a)?Tg:typeof a=="object"?ne.test(a)?Np:mx:fu}function Tg(a,i){const s=[...a],u=s.length,c=a.map((h,f)=>Fc(h)(h,i[f]));return h=>{for(let f=0;f<u;f++)s[f]=c[f](h);return s}}function mx(a,i){const s={...a,...i},u={};for(const c in s)a[c]!==void 0&&i[c]!==void 0&&(u[c]=Fc(a[c])(a[c],i[c]));return c=>{for(const h in u)s[h]=u[h](c);return s}}function px(a,i){const s=[],u={color:0,var:0,number:0};for(let c=0;c<i.values.length;c++){const h=i.types[c],f=a.indexes[h][u[h]],p=a.values[f]??0;s[c]=p,u[h]++}return s}const yx=(a,i)=>{const s=Zn.createTransformer(i),u=Ml(a),c=Ml(i);return u.indexes.var.length===c.indexes.var.length&&u.indexes.color.length===c.indexes.color.length&&u.indexes.number.length>=c.indexes.number.length?oc.has(a)&&!c.values.length||oc.has(i)&&!u.values.length?hx(a,i):Ul(Tg(px(u,c),c.values),s):fu(a,i)};function Eg(a,i,s){return typeof a=="number"&&typeof i=="number"&&typeof s=="number"?Ot(a,i,s):Fc(a)(a,i)}const gx=a=>{const i=({timestamp:s})=>a(s);return{start:(s=!0)=>Nt.update(i,s),stop:()=>Kn(i),now:()=>Wt.isProcessing?Wt.timestamp:fe.now()}},Ag=(a,i,s=10)=>{let u="";const c=Math.max(Math.round(i/s),2);for(let h=0;h<c;h++)u+=a(h/(c-1))+", ";return`linear(${u.substring(0,u.length-2)})`},hu=2e4;function $c(a){let i=0;const s=50;let u=a.next(i);for(;!u.done&&i<hu;)i+=s,u=a.next(i);return i>=hu?1/0:i}function vx(a,i=100,s){const u=s({...a,keyframes:[0,i]}),c=Math.min($c(u),hu);return{type:"keyframes",ease:h=>u.next(c*h).value/i,duration:Pe(c)}}const Sx=5;function Rg(a,i,s){const u=Math.max(i-Sx,0);return ig(s-a(u),i-u)}const Ut={stiffness:100,damping:10,mass:1,velocity:0,duration:800,bounce:.3,visualDuration:.3,restSpeed:{granular:.01,default:2},restDelta:{granular:.005,default:.5},minDuration:.01,maxDuration:10,minDamping:.05,maxDamping:1},Vp=.001;function bx({duration:a=Ut.duration,bounce:i=Ut.bounce,velocity:s=Ut.velocity,mass:u=Ut.mass}){let c,h,f=1-i;f=yn(Ut.minDamping,Ut.maxDamping,f),a=yn(Ut.minDuration,Ut.maxDuration,Pe(a)),f<1?(c=m=>{const g=m*f,S=g*a,b=g-s,R=cc(m,f),D=Math.exp(-S);return Vp-b/R*D},h=m=>{const S=m*f*a,b=S*s+s,R=Math.pow(f,2)*Math.pow(m,2)*a,D=Math.exp(-S),w=cc(Math.pow(m,2),f);return(-c(m)+Vp>0?-1:1)*((b-R)*D)/w}):(c=m=>{const g=Math.exp(-m*a),S=(m-s)*a+1;return-.001+g*S},h=m=>{const g=Math.exp(-m*a),S=(s-m)*(a*a);return g*S});const p=5/a,d=Tx(c,h,p);if(a=ke(a),isNaN(d))return{stiffness:Ut.stiffness,damping:Ut.damping,duration:a};{const m=Math.pow(d,2)*u;return{stiffness:m,damping:f*2*Math.sqrt(u*m),duration:a}}}const xx=12;function Tx(a,i,s){let u=s;for(let c=1;c<xx;c++)u=u-a(u)/i(u);return u}function cc(a,i){return a*Math.sqrt(1-i*i)}const Ex=["duration","bounce"],Ax=["stiffness","damping","mass"];function zp(a,i){return i.some(s=>a[s]!==void 0)}function Rx(a){let i={velocity:Ut.velocity,stiffness:Ut.stiffness,damping:Ut.damping,mass:Ut.mass,isResolvedFromDuration:!1,...a};if(!zp(a,Ax)&&zp(a,Ex))if(a.visualDuration){const s=a.visualDuration,u=2*Math.PI/(s*1.2),c=u*u,h=2*yn(.05,1,1-(a.bounce||0))*Math.sqrt(c);i={...i,mass:Ut.mass,stiffness:c,damping:h}}else{const s=bx(a);i={...i,...s,mass:Ut.mass},i.isResolvedFromDuration=!0}return i}function du(a=Ut.visualDuration,i=Ut.bounce){const s=typeof a!="object"?{visualDuration:a,keyframes:[0,1],bounce:i}:a;let{restSpeed:u,restDelta:c}=s;const h=s.keyframes[0],f=s.keyframes[s.keyframes.length-1],p={done:!1,value:h},{stiffness:d,damping:m,mass:g,duration:S,velocity:b,isResolvedFromDuration:R}=Rx({...s,velocity:-Pe(s.velocity||0)}),D=b||0,w=m/(2*Math.sqrt(d*g)),U=f-h,O=Pe(Math.sqrt(d/g)),j=Math.abs(U)<5;u||(u=j?Ut.restSpeed.granular:Ut.restSpeed.default),c||(c=j?Ut.restDelta.granular:Ut.restDelta.default);let _;if(w<1){const q=cc(O,w);_=P=>{const nt=Math.exp(-w*O*P);return f-nt*((D+w*O*U)/q*Math.sin(q*P)+U*Math.cos(q*P))}}else if(w===1)_=q=>f-Math.exp(-O*q)*(U+(D+O*U)*q);else{const q=O*Math.sqrt(w*w-1);_=P=>{const nt=Math.exp(-w*O*P),F=Math.min(q*P,300);return f-nt*((D+w*O*U)*Math.sinh(F)+q*U*Math.cosh(F))/q}}const Z={calculatedDuration:R&&S||null,next:q=>{const P=_(q);if(R)p.done=q>=S;else{let nt=q===0?D:0;w<1&&(nt=q===0?ke(D):Rg(_,q,P));const F=Math.abs(nt)<=u,st=Math.abs(f-P)<=c;p.done=F&&st}return p.value=p.done?f:P,p},toString:()=>{const q=Math.min($c(Z),hu),P=Ag(nt=>Z.next(q*nt).value,q,30);return q+"ms "+P},toTransition:()=>{}};return Z}du.applyToOptions=a=>{const i=vx(a,100,du);return a.ease=i.ease,a.duration=ke(i.duration),a.type="keyframes",a};function fc({keyframes:a,velocity:i=0,power:s=.8,timeConstant:u=325,bounceDamping:c=10,bounceStiffness:h=500,modifyTarget:f,min:p,max:d,restDelta:m=.5,restSpeed:g}){const S=a[0],b={done:!1,value:S},R=F=>p!==void 0&&F<p||d!==void 0&&F>d,D=F=>p===void 0?d:d===void 0||Math.abs(p-F)<Math.abs(d-F)?p:d;let w=s*i;const U=S+w,O=f===void 0?U:f(U);O!==U&&(w=O-S);const j=F=>-w*Math.exp(-F/u),_=F=>O+j(F),Z=F=>{const st=j(F),gt=_(F);b.done=Math.abs(st)<=m,b.value=b.done?O:gt};let q,P;const nt=F=>{R(b.value)&&(q=F,P=du({keyframes:[b.value,D(b.value)],velocity:Rg(_,F,b.value),damping:c,stiffness:h,restDelta:m,restSpeed:g}))};return nt(0),{calculatedDuration:null,next:F=>{let st=!1;return!P&&q===void 0&&(st=!0,Z(F),nt(F)),q!==void 0&&F>=q?P.next(F-q):(!st&&Z(F),b)}}}function Dx(a,i,s){const u=[],c=s||gn.mix||Eg,h=a.length-1;for(let f=0;f<h;f++){let p=c(a[f],a[f+1]);if(i){const d=Array.isArray(i)?i[f]||ze:i;p=Ul(d,p)}u.push(p)}return u}function Mx(a,i,{clamp:s=!0,ease:u,mixer:c}={}){const h=a.length;if(qc(h===i.length),h===1)return()=>i[0];if(h===2&&i[0]===i[1])return()=>i[1];const f=a[0]===a[1];a[0]>a[h-1]&&(a=[...a].reverse(),i=[...i].reverse());const p=Dx(i,u,c),d=p.length,m=g=>{if(f&&g<a[0])return i[0];let S=0;if(d>1)for(;S<a.length-2&&!(g<a[S+1]);S++);const b=Rl(a[S],a[S+1],g);return p[S](b)};return s?g=>m(yn(a[0],a[h-1],g)):m}function wx(a,i){const s=a[a.length-1];for(let u=1;u<=i;u++){const c=Rl(0,i,u);a.push(Ot(s,1,c))}}function Cx(a){const i=[0];return wx(i,a.length-1),i}function Ox(a,i){return a.map(s=>s*i)}function Nx(a,i){return a.map(()=>i||dg).splice(0,a.length-1)}function bl({duration:a=300,keyframes:i,times:s,ease:u="easeInOut"}){const c=Gb(u)?u.map(Dp):Dp(u),h={done:!1,value:i[0]},f=Ox(s&&s.length===i.length?s:Cx(i),a),p=Mx(f,i,{ease:Array.isArray(c)?c:Nx(i,c)});return{calculatedDuration:a,next:d=>(h.value=p(d),h.done=d>=a,h)}}const Vx=a=>a!==null;function Wc(a,{repeat:i,repeatType:s="loop"},u,c=1){const h=a.filter(Vx),p=c<0||i&&s!=="loop"&&i%2===1?0:h.length-1;return!p||u===void 0?h[p]:u}const zx={decay:fc,inertia:fc,tween:bl,keyframes:bl,spring:du};function Dg(a){typeof a.type=="string"&&(a.type=zx[a.type])}class Ic{constructor(){this.updateFinished()}get finished(){return this._finished}updateFinished(){this._finished=new Promise(i=>{this.resolve=i})}notifyFinished(){this.resolve()}then(i,s){return this.finished.then(i,s)}}const Ux=a=>a/100;class tf extends Ic{constructor(i){super(),this.state="idle",this.startTime=null,this.isStopped=!1,this.currentTime=0,this.holdTime=null,this.playbackSpeed=1,this.stop=(s=!0)=>{var u,c;if(s){const{motionValue:h}=this.options;h&&h.updatedAt!==fe.now()&&this.tick(fe.now())}this.isStopped=!0,this.state!=="idle"&&(this.teardown(),(c=(u=this.options).onStop)==null||c.call(u))},this.options=i,this.initAnimation(),this.play(),i.autoplay===!1&&this.pause()}initAnimation(){const{options:i}=this;Dg(i);const{type:s=bl,repeat:u=0,repeatDelay:c=0,repeatType:h,velocity:f=0}=i;let{keyframes:p}=i;const d=s||bl;d!==bl&&typeof p[0]!="number"&&(this.mixKeyframes=Ul(Ux,Eg(p[0],p[1])),p=[0,100]);const m=d({...i,keyframes:p});h==="mirror"&&(this.mirroredGenerator=d({...i,keyframes:[...p].reverse(),velocity:-f})),m.calculatedDuration===null&&(m.calculatedDuration=$c(m));const{calculatedDuration:g}=m;this.calculatedDuration=g,this.resolvedDuration=g+c,this.totalDuration=this.resolvedDuration*(u+1)-c,this.generator=m}updateTime(i){const s=Math.round(i-this.startTime)*this.playbackSpeed;this.holdTime!==null?this.currentTime=this.holdTime:this.currentTime=s}tick(i,s=!1){const{generator:u,totalDuration:c,mixKeyframes:h,mirroredGenerator:f,resolvedDuration:p,calculatedDuration:d}=this;if(this.startTime===null)return u.next(0);const{delay:m=0,keyframes:g,repeat:S,repeatType:b,repeatDelay:R,type:D,onUpdate:w,finalKeyframe:U}=this.options;this.speed>0?this.startTime=Math.min(this.startTime,i):this.speed<0&&(this.startTime=Math.min(i-c/this.speed,this.startTime)),s?this.currentTime=i:this.updateTime(i);const O=this.currentTime-m*(this.playbackSpeed>=0?1:-1),j=this.playbackSpeed>=0?O<0:O>c;this.currentTime=Math.max(O,0),this.state==="finished"&&this.holdTime===null&&(this.currentTime=c);let _=this.currentTime,Z=u;if(S){const F=Math.min(this.currentTime,c)/p;let st=Math.floor(F),gt=F%1;!gt&&F>=1&&(gt=1),gt===1&&st--,st=Math.min(st,S+1),!!(st%2)&&(b==="reverse"?(gt=1-gt,R&&(gt-=R/p)):b==="mirror"&&(Z=f)),_=yn(0,1,gt)*p}const q=j?{done:!1,value:g[0]}:Z.next(_);h&&(q.value=h(q.value));let{done:P}=q;!j&&d!==null&&(P=this.playbackSpeed>=0?this.currentTime>=c:this.currentTime<=0);const nt=this.holdTime===null&&(this.state==="finished"||this.state==="running"&&P);return nt&&D!==fc&&(q.value=Wc(g,this.options,U,this.speed)),w&&w(q.value),nt&&this.finish(),q}then(i,s){return this.finished.then(i,s)}get duration(){return Pe(this.calculatedDuration)}get time(){return Pe(this.currentTime)}set time(i){var s;i=ke(i),this.currentTime=i,this.startTime===null||this.holdTime!==null||this.playbackSpeed===0?this.holdTime=i:this.driver&&(this.startTime=this.driver.now()-i/this.playbackSpeed),(s=this.driver)==null||s.start(!1)}get speed(){return this.playbackSpeed}set speed(i){this.updateTime(fe.now());const s=this.playbackSpeed!==i;this.playbackSpeed=i,s&&(this.time=Pe(this.currentTime))}play(){var c,h;if(this.isStopped)return;const{driver:i=gx,startTime:s}=this.options;this.driver||(this.driver=i(f=>this.tick(f))),(h=(c=this.options).onPlay)==null||h.call(c);const u=this.driver.now();this.state==="finished"?(this.updateFinished(),this.startTime=u):this.holdTime!==null?this.startTime=u-this.holdTime:this.startTime||(this.startTime=s??u),this.state==="finished"&&this.speed<0&&(this.startTime+=this.calculatedDuration),this.holdTime=null,this.state="running",this.driver.start()}pause(){this.state="paused",this.updateTime(fe.now()),this.holdTime=this.currentTime}complete(){this.state!=="running"&&this.play(),this.state="finished",this.holdTime=null}finish(){var i,s;this.notifyFinished(),this.teardown(),this.state="finished",(s=(i=this.options).onComplete)==null||s.call(i)}cancel(){var i,s;this.holdTime=null,this.startTime=0,this.tick(0),this.teardown(),(s=(i=this.options).onCancel)==null||s.call(i)}teardown(){this.state="idle",this.stopDriver(),this.startTime=this.holdTime=null}stopDriver(){this.driver&&(this.driver.stop(),this.driver=void 0)}sample(i){return this.startTime=0,this.tick(i,!0)}attachTimeline(i){var s;return this.options.allowFlatten&&(this.options.type="keyframes",this.options.ease="linear",this.initAnimation()),(s=this.driver)==null||s.stop(),i.observe(this)}}function _x(a){for(let i=1;i<a.length;i++)a[i]??(a[i]=a[i-1])}const pa=a=>a*180/Math.PI,hc=a=>{const i=pa(Math.atan2(a[1],a[0]));return dc(i)},Lx={x:4,y:5,translateX:4,translateY:5,scaleX:0,scaleY:3,scale:a=>(Math.abs(a[0])+Math.abs(a[3]))/2,rotate:hc,rotateZ:hc,skewX:a=>pa(Math.atan(a[1])),skewY:a=>pa(Math.atan(a[2])),skew:a=>(Math.abs(a[1])+Math.abs(a[2]))/2},dc=a=>(a=a%360,a<0&&(a+=360),a),Up=hc,_p=a=>Math.sqrt(a[0]*a[0]+a[1]*a[1]),Lp=a=>Math.sqrt(a[4]*a[4]+a[5]*a[5]),Bx={x:12,y:13,z:14,translateX:12,translateY:13,translateZ:14,scaleX:_p,scaleY:Lp,scale:a=>(_p(a)+Lp(a))/2,rotateX:a=>dc(pa(Math.atan2(a[6],a[5]))),rotateY:a=>dc(pa(Math.atan2(-a[2],a[0]))),rotateZ:Up,rotate:Up,skewX:a=>pa(Math.atan(a[4])),skewY:a=>pa(Math.atan(a[1])),skew:a=>(Math.abs(a[1])+Math.abs(a[4]))/2};function mc(a){return a.includes("scale")?1:0}function pc(a,i){if(!a||a==="none")return mc(i);const s=a.match(/^matrix3d\(([-\d.e\s,]+)\)$/u);let u,c;if(s)u=Bx,c=s;else{const p=a.match(/^matrix\(([-\d.e\s,]+)\)$/u);u=Lx,c=p}if(!c)return mc(i);const h=u[i],f=c[1].split(",").map(Hx);return typeof h=="function"?h(f):f[h]}const jx=(a,i)=>{const{transform:s="none"}=getComputedStyle(a);return pc(s,i)};function Hx(a){return parseFloat(a.trim())}const mi=["transformPerspective","x","y","z","translateX","translateY","translateZ","scale","scaleX","scaleY","rotate","rotateX","rotateY","rotateZ","skew","skewX","skewY"],pi=new Set(mi),Bp=a=>a===di||a===it,Yx=new Set(["x","y","z"]),qx=mi.filter(a=>!Yx.has(a));function Gx(a){const i=[];return qx.forEach(s=>{const u=a.getValue(s);u!==void 0&&(i.push([s,u.get()]),u.set(s.startsWith("scale")?1:0))}),i}const ya={width:({x:a},{paddingLeft:i="0",paddingRight:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),height:({y:a},{paddingTop:i="0",paddingBottom:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),top:(a,{top:i})=>parseFloat(i),left:(a,{left:i})=>parseFloat(i),bottom:({y:a},{top:i})=>parseFloat(i)+(a.max-a.min),right:({x:a},{left:i})=>parseFloat(i)+(a.max-a.min),x:(a,{transform:i})=>pc(i,"x"),y:(a,{transform:i})=>pc(i,"y")};ya.translateX=ya.x;ya.translateY=ya.y;const ga=new Set;let yc=!1,gc=!1,vc=!1;function Mg(){if(gc){const a=Array.from(ga).filter(u=>u.needsMeasurement),i=new Set(a.map(u=>u.element)),s=new Map;i.forEach(u=>{const c=Gx(u);c.length&&(s.set(u,c),u.render())}),a.forEach(u=>u.measureInitialState()),i.forEach(u=>{u.render();const c=s.get(u);c&&c.forEach(([h,f])=>{var p;(p=u.getValue(h))==null||p.set(f)})}),a.forEach(u=>u.measureEndState()),a.forEach(u=>{u.suspendedScrollY!==void 0&&window.scrollTo(0,u.suspendedScrollY)})}gc=!1,yc=!1,ga.forEach(a=>a.complete(vc)),ga.clear()}function wg(){ga.forEach(a=>{a.readKeyframes(),a.needsMeasurement&&(gc=!0)})}function Xx(){vc=!0,wg(),Mg(),vc=!1}class ef{constructor(i,s,u,c,h,f=!1){this.state="pending",this.isAsync=!1,this.needsMeasurement=!1,this.unresolvedKeyframes=[...i],this.onComplete=s,this.name=u,this.motionValue=c,this.element=h,this.isAsync=f}scheduleResolve(){this.state="scheduled",this.isAsync?(ga.add(this),yc||(yc=!0,Nt.read(wg),Nt.resolveKeyframes(Mg))):(this.readKeyframes(),this.complete())}readKeyframes(){const{unresolvedKeyframes:i,name:s,element:u,motionValue:c}=this;if(i[0]===null){const h=c==null?void 0:c.get(),f=i[i.length-1];if(h!==void 0)i[0]=h;else if(u&&s){const p=u.readValue(s,f);p!=null&&(i[0]=p)}i[0]===void 0&&(i[0]=f),c&&h===void 0&&c.set(i[0])}_x(i)}setFinalKeyframe(){}measureInitialState(){}renderEndStyles(){}measureEndState(){}complete(i=!1){this.state="complete",this.onComplete(this.unresolvedKeyframes,this.finalKeyframe,i),ga.delete(this)}cancel(){this.state==="scheduled"&&(ga.delete(this),this.state="pending")}resume(){this.state==="pending"&&this.scheduleResolve()}}const Kx=a=>a.startsWith("--");function Zx(a,i,s){Kx(i)?a.style.setProperty(i,s):a.style[i]=s}const Qx=Gc(()=>window.ScrollTimeline!==void 0),kx={};function Px(a,i){const s=Gc(a);return()=>kx[i]??s()}const Cg=Px(()=>{try{document.createElement("div").animate({opacity:0},{easing:"linear(0, 1)"})}catch{return!1}return!0},"linearEasing"),vl=([a,i,s,u])=>`cubic-bezier(${a}, ${i}, ${s}, ${u})`,jp={linear:"linear",ease:"ease",easeIn:"ease-in",easeOut:"ease-out",easeInOut:"ease-in-out",circIn:vl([0,.65,.55,1]),circOut:vl([.55,0,1,.45]),backIn:vl([.31,.01,.66,-.59]),backOut:vl([.33,1.53,.69,.99])};function Og(a,i){if(a)return typeof a=="function"?Cg()?Ag(a,i):"ease-out":mg(a)?vl(a):Array.isArray(a)?a.map(s=>Og(s,i)||jp.easeOut):jp[a]}function Jx(a,i,s,{delay:u=0,duration:c=300,repeat:h=0,repeatType:f="loop",ease:p="easeOut",times:d}={},m=void 0){const g={[i]:s};d&&(g.offset=d);const S=Og(p,c);Array.isArray(S)&&(g.easing=S);const b={delay:u,duration:c,easing:Array.isArray(S)?"linear":S,fill:"both",iterations:h+1,direction:f==="reverse"?"alternate":"normal"};return m&&(b.pseudoElement=m),a.animate(g,b)}function Ng(a){return typeof a=="function"&&"applyToOptions"in a}function Fx({type:a,...i}){return Ng(a)&&Cg()?a.applyToOptions(i):(i.duration??(i.duration=300),i.ease??(i.ease="easeOut"),i)}class $x extends Ic{constructor(i){if(super(),this.finishedTime=null,this.isStopped=!1,!i)return;const{element:s,name:u,keyframes:c,pseudoElement:h,allowFlatten:f=!1,finalKeyframe:p,onComplete:d}=i;this.isPseudoElement=!!h,this.allowFlatten=f,this.options=i,qc(typeof i.type!="string");const m=Fx(i);this.animation=Jx(s,u,c,m,h),m.autoplay===!1&&this.animation.pause(),this.animation.onfinish=()=>{if(this.finishedTime=this.time,!h){const g=Wc(c,this.options,p,this.speed);this.updateMotionValue?this.updateMotionValue(g):Zx(s,u,g),this.animation.cancel()}d==null||d(),this.notifyFinished()}}play(){this.isStopped||(this.animation.play(),this.state==="finished"&&this.updateFinished())}pause(){this.animation.pause()}complete(){var i,s;(s=(i=this.animation).finish)==null||s.call(i)}cancel(){try{this.animation.cancel()}catch{}}stop(){if(this.isStopped)return;this.isStopped=!0;const{state:i}=this;i==="idle"||i==="finished"||(this.updateMotionValue?this.updateMotionValue():this.commitStyles(),this.isPseudoElement||this.cancel())}commitStyles(){var i,s;this.isPseudoElement||(s=(i=this.animation).commitStyles)==null||s.call(i)}get duration(){var s,u;const i=((u=(s=this.animation.effect)==null?void 0:s.getComputedTiming)==null?void 0:u.call(s).duration)||0;return Pe(Number(i))}get time(){return Pe(Number(this.animation.currentTime)||0)}set time(i){this.finishedTime=null,this.animation.currentTime=ke(i)}get speed(){return this.animation.playbackRate}set speed(i){i<0&&(this.finishedTime=null),this.animation.playbackRate=i}get state(){return this.finishedTime!==null?"finished":this.animation.playState}get startTime(){return Number(this.animation.startTime)}set startTime(i){this.animation.startTime=i}attachTimeline({timeline:i,observe:s}){var u;return this.allowFlatten&&((u=this.animation.effect)==null||u.updateTiming({easing:"linear"})),this.animation.onfinish=null,i&&Qx()?(this.animation.timeline=i,ze):s(this)}}const Vg={anticipate:cg,backInOut:og,circInOut:hg};function Wx(a){return a in Vg}function Ix(a){typeof a.ease=="string"&&Wx(a.ease)&&(a.ease=Vg[a.ease])}const Hp=10;class tT extends $x{constructor(i){Ix(i),Dg(i),super(i),i.startTime&&(this.startTime=i.startTime),this.options=i}updateMotionValue(i){const{motionValue:s,onUpdate:u,onComplete:c,element:h,...f}=this.options;if(!s)return;if(i!==void 0){s.set(i);return}const p=new tf({...f,autoplay:!1}),d=ke(this.finishedTime??this.time);s.setWithVelocity(p.sample(d-Hp).value,p.sample(d).value,Hp),p.stop()}}const Yp=(a,i)=>i==="zIndex"?!1:!!(typeof a=="number"||Array.isArray(a)||typeof a=="string"&&(Zn.test(a)||a==="0")&&!a.startsWith("url("));function eT(a){const i=a[0];if(a.length===1)return!0;for(let s=0;s<a.length;s++)if(a[s]!==i)return!0}function nT(a,i,s,u){const c=a[0];if(c===null)return!1;if(i==="display"||i==="visibility")return!0;const h=a[a.length-1],f=Yp(c,i),p=Yp(h,i);return!f||!p?!1:eT(a)||(s==="spring"||Ng(s))&&u}function nf(a){return ng(a)&&"offsetHeight"in a}const aT=new Set(["opacity","clipPath","filter","transform"]),iT=Gc(()=>Object.hasOwnProperty.call(Element.prototype,"animate"));function lT(a){var m;const{motionValue:i,name:s,repeatDelay:u,repeatType:c,damping:h,type:f}=a;if(!nf((m=i==null?void 0:i.owner)==null?void 0:m.current))return!1;const{onUpdate:p,transformTemplate:d}=i.owner.getProps();return iT()&&s&&aT.has(s)&&(s!=="transform"||!d)&&!p&&!u&&c!=="mirror"&&h!==0&&f!=="inertia"}const sT=40;class uT extends Ic{constructor({autoplay:i=!0,delay:s=0,type:u="keyframes",repeat:c=0,repeatDelay:h=0,repeatType:f="loop",keyframes:p,name:d,motionValue:m,element:g,...S}){var D;super(),this.stop=()=>{var w,U;this._animation&&(this._animation.stop(),(w=this.stopTimeline)==null||w.call(this)),(U=this.keyframeResolver)==null||U.cancel()},this.createdAt=fe.now();const b={autoplay:i,delay:s,type:u,repeat:c,repeatDelay:h,repeatType:f,name:d,motionValue:m,element:g,...S},R=(g==null?void 0:g.KeyframeResolver)||ef;this.keyframeResolver=new R(p,(w,U,O)=>this.onKeyframesResolved(w,U,b,!O),d,m,g),(D=this.keyframeResolver)==null||D.scheduleResolve()}onKeyframesResolved(i,s,u,c){this.keyframeResolver=void 0;const{name:h,type:f,velocity:p,delay:d,isHandoff:m,onUpdate:g}=u;this.resolvedAt=fe.now(),nT(i,h,f,p)||((gn.instantAnimations||!d)&&(g==null||g(Wc(i,u,s))),i[0]=i[i.length-1],u.duration=0,u.repeat=0);const b={startTime:c?this.resolvedAt?this.resolvedAt-this.createdAt>sT?this.resolvedAt:this.createdAt:this.createdAt:void 0,finalKeyframe:s,...u,keyframes:i},R=!m&&lT(b)?new tT({...b,element:b.motionValue.owner.current}):new tf(b);R.finished.then(()=>this.notifyFinished()).catch(ze),this.pendingTimeline&&(this.stopTimeline=R.attachTimeline(this.pendingTimeline),this.pendingTimeline=void 0),this._animation=R}get finished(){return this._animation?this.animation.finished:this._finished}then(i,s){return this.finished.finally(i).then(()=>{})}get animation(){var i;return this._animation||((i=this.keyframeResolver)==null||i.resume(),Xx()),this._animation}get duration(){return this.animation.duration}get time(){return this.animation.time}set time(i){this.animation.time=i}get speed(){return this.animation.speed}get state(){return this.animation.state}set speed(i){this.animation.speed=i}get startTime(){return this.animation.startTime}attachTimeline(i){return this._animation?this.stopTimeline=this.animation.attachTimeline(i):this.pendingTimeline=i,()=>this.stop()}play(){this.animation.play()}pause(){this.animation.pause()}complete(){this.animation.complete()}cancel(){var i;this._animation&&this.animation.cancel(),(i=this.keyframeResolver)==null||i.cancel()}}const rT=/^var\(--(?:([\w-]+)|([\w-]+), ?([a-zA-Z\d ()%#.,-]+))\)/u;function oT(a){const i=rT.exec(a);if(!i)return[,];const[,s,u,c]=i;return[`--${s??u}`,c]}function zg(a,i,s=1){const[u,c]=oT(a);if(!u)return;const h=window.getComputedStyle(i).getPropertyValue(u);if(h){const f=h.trim();return eg(f)?parseFloat(f):f}return kc(c)?zg(c,i,s+1):c}function af(a,i){return(a==null?void 0:a[i])??(a==null?void 0:a.default)??a}const Ug=new Set(["width","height","top","left","right","bottom",...mi]),cT={test:a=>a==="auto",parse:a=>a},_g=a=>i=>i.test(a),Lg=[di,it,Je,Xn,ex,tx,cT],qp=a=>Lg.find(_g(a));function fT(a){return typeof a=="number"?a===0:a!==null?a==="none"||a==="0"||ag(a):!0}const hT=new Set(["brightness","contrast","saturate","opacity"]);function dT(a){const[i,s]=a.slice(0,-1).split("(");if(i==="drop-shadow")return a;const[u]=s.match(Pc)||[];if(!u)return a;const c=s.replace(u,"");let h=hT.has(i)?1:0;return u!==s&&(h*=100),i+"("+h+c+")"}const mT=/\b([a-z-]*)\(.*?\)/gu,Sc={...Zn,getAnimatableNone:a=>{const i=a.match(mT);return i?i.map(dT).join(" "):a}},Gp={...di,transform:Math.round},pT={rotate:Xn,rotateX:Xn,rotateY:Xn,rotateZ:Xn,scale:eu,scaleX:eu,scaleY:eu,scaleZ:eu,skew:Xn,skewX:Xn,skewY:Xn,distance:it,translateX:it,translateY:it,translateZ:it,x:it,y:it,z:it,perspective:it,transformPerspective:it,opacity:Dl,originX:wp,originY:wp,originZ:it},lf={borderWidth:it,borderTopWidth:it,borderRightWidth:it,borderBottomWidth:it,borderLeftWidth:it,borderRadius:it,radius:it,borderTopLeftRadius:it,borderTopRightRadius:it,borderBottomRightRadius:it,borderBottomLeftRadius:it,width:it,maxWidth:it,height:it,maxHeight:it,top:it,right:it,bottom:it,left:it,padding:it,paddingTop:it,paddingRight:it,paddingBottom:it,paddingLeft:it,margin:it,marginTop:it,marginRight:it,marginBottom:it,marginLeft:it,backgroundPositionX:it,backgroundPositionY:it,...pT,zIndex:Gp,fillOpacity:Dl,strokeOpacity:Dl,numOctaves:Gp},yT={...lf,color:ne,backgroundColor:ne,outlineColor:ne,fill:ne,stroke:ne,borderColor:ne,borderTopColor:ne,borderRightColor:ne,borderBottomColor:ne,borderLeftColor:ne,filter:Sc,WebkitFilter:Sc},Bg=a=>yT[a];function jg(a,i){let s=Bg(a);return s!==Sc&&(s=Zn),s.getAnimatableNone?s.getAnimatableNone(i):void 0}const gT=new Set(["auto","none","0"]);function vT(a,i,s){let u=0,c;for(;u<a.length&&!c;){const h=a[u];typeof h=="string"&&!gT.has(h)&&Ml(h).values.length&&(c=a[u]),u++}if(c&&s)for(const h of i)a[h]=jg(s,c)}class ST extends ef{constructor(i,s,u,c,h){super(i,s,u,c,h,!0)}readKeyframes(){const{unresolvedKeyframes:i,element:s,name:u}=this;if(!s||!s.current)return;super.readKeyframes();for(let d=0;d<i.length;d++){let m=i[d];if(typeof m=="string"&&(m=m.trim(),kc(m))){const g=zg(m,s.current);g!==void 0&&(i[d]=g),d===i.length-1&&(this.finalKeyframe=m)}}if(this.resolveNoneKeyframes(),!Ug.has(u)||i.length!==2)return;const[c,h]=i,f=qp(c),p=qp(h);if(f!==p)if(Bp(f)&&Bp(p))for(let d=0;d<i.length;d++){const m=i[d];typeof m=="string"&&(i[d]=parseFloat(m))}else ya[u]&&(this.needsMeasurement=!0)}resolveNoneKeyframes(){const{unresolvedKeyframes:i,name:s}=this,u=[];for(let c=0;c<i.length;c++)(i[c]===null||fT(i[c]))&&u.push(c);u.length&&vT(i,u,s)}measureInitialState(){const{element:i,unresolvedKeyframes:s,name:u}=this;if(!i||!i.current)return;u==="height"&&(this.suspendedScrollY=window.pageYOffset),this.measuredOrigin=ya[u](i.measureViewportBox(),window.getComputedStyle(i.current)),s[0]=this.measuredOrigin;const c=s[s.length-1];c!==void 0&&i.getValue(u,c).jump(c,!1)}measureEndState(){var p;const{element:i,name:s,unresolvedKeyframes:u}=this;if(!i||!i.current)return;const c=i.getValue(s);c&&c.jump(this.measuredOrigin,!1);const h=u.length-1,f=u[h];u[h]=ya[s](i.measureViewportBox(),window.getComputedStyle(i.current)),f!==null&&this.finalKeyframe===void 0&&(this.finalKeyframe=f),(p=this.removedTransforms)!=null&&p.length&&this.removedTransforms.forEach(([d,m])=>{i.getValue(d).set(m)}),this.resolveNoneKeyframes()}}function bT(a,i,s){if(a instanceof EventTarget)return[a];if(typeof a=="string"){let u=document;const c=(s==null?void 0:s[a])??u.querySelectorAll(a);return c?Array.from(c):[]}return Array.from(a)}const Xp=30,xT=a=>!isNaN(parseFloat(a));class TT{constructor(i,s={}){this.canTrackVelocity=null,this.events={},this.updateAndNotify=(u,c=!0)=>{var f,p;const h=fe.now();if(this.updatedAt!==h&&this.setPrevFrameValue(),this.prev=this.current,this.setCurrent(u),this.current!==this.prev&&((f=this.events.change)==null||f.notify(this.current),this.dependents))for(const d of this.dependents)d.dirty();c&&((p=this.events.renderRequest)==null||p.notify(this.current))},this.hasAnimated=!1,this.setCurrent(i),this.owner=s.owner}setCurrent(i){this.current=i,this.updatedAt=fe.now(),this.canTrackVelocity===null&&i!==void 0&&(this.canTrackVelocity=xT(this.current))}setPrevFrameValue(i=this.current){this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt}onChange(i){return this.on("change",i)}on(i,s){this.events[i]||(this.events[i]=new Xc);const u=this.events[i].add(s);return i==="change"?()=>{u(),Nt.read(()=>{this.events.change.getSize()||this.stop()})}:u}clearListeners(){for(const i in this.events)this.events[i].clear()}attach(i,s){this.passiveEffect=i,this.stopPassiveEffect=s}set(i,s=!0){!s||!this.passiveEffect?this.updateAndNotify(i,s):this.passiveEffect(i,this.updateAndNotify)}setWithVelocity(i,s,u){this.set(s),this.prev=void 0,this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt-u}jump(i,s=!0){this.updateAndNotify(i),this.prev=i,this.prevUpdatedAt=this.prevFrameValue=void 0,s&&this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}dirty(){var i;(i=this.events.change)==null||i.notify(this.current)}addDependent(i){this.dependents||(this.dependents=new Set),this.dependents.add(i)}removeDependent(i){this.dependents&&this.dependents.delete(i)}get(){return this.current}getPrevious(){return this.prev}getVelocity(){const i=fe.now();if(!this.canTrackVelocity||this.prevFrameValue===void 0||i-this.updatedAt>Xp)return 0;const s=Math.min(this.updatedAt-this.prevUpdatedAt,Xp);return ig(parseFloat(this.current)-parseFloat(this.prevFrameValue),s)}start(i){return this.stop(),new Promise(s=>{this.hasAnimated=!0,this.animation=i(s),this.events.animationStart&&this.events.animationStart.notify()}).then(()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()})}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){var i,s;(i=this.dependents)==null||i.clear(),(s=this.events.destroy)==null||s.notify(),this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}}function ri(a,i){return new TT(a,i)}const Hg=(a,i)=>i&&typeof a=="number"?i.transform(a):a,{schedule:sf}=pg(queueMicrotask,!1),Be={x:!1,y:!1};function Yg(){return Be.x||Be.y}function ET(a){return a==="x"||a==="y"?Be[a]?null:(Be[a]=!0,()=>{Be[a]=!1}):Be.x||Be.y?null:(Be.x=Be.y=!0,()=>{Be.x=Be.y=!1})}function qg(a,i){const s=bT(a),u=new AbortController,c={passive:!0,...i,signal:u.signal};return[s,c,()=>u.abort()]}function Kp(a){return!(a.pointerType==="touch"||Yg())}function AT(a,i,s={}){const[u,c,h]=qg(a,s),f=p=>{if(!Kp(p))return;const{target:d}=p,m=i(d,p);if(typeof m!="function"||!d)return;const g=S=>{Kp(S)&&(m(S),d.removeEventListener("pointerleave",g))};d.addEventListener("pointerleave",g,c)};return u.forEach(p=>{p.addEventListener("pointerenter",f,c)}),h}const Gg=(a,i)=>i?a===i?!0:Gg(a,i.parentElement):!1,uf=a=>a.pointerType==="mouse"?typeof a.button!="number"||a.button<=0:a.isPrimary!==!1,RT=new Set(["BUTTON","INPUT","SELECT","TEXTAREA","A"]);function DT(a){return RT.has(a.tagName)||a.tabIndex!==-1}const uu=new WeakSet;function Zp(a){return i=>{i.key==="Enter"&&a(i)}}function $o(a,i){a.dispatchEvent(new PointerEvent("pointer"+i,{isPrimary:!0,bubbles:!0}))}const MT=(a,i)=>{const s=a.currentTarget;if(!s)return;const u=Zp(()=>{if(uu.has(s))return;$o(s,"down");const c=Zp(()=>{$o(s,"up")}),h=()=>$o(s,"cancel");s.addEventListener("keyup",c,i),s.addEventListener("blur",h,i)});s.addEventListener("keydown",u,i),s.addEventListener("blur",()=>s.removeEventListener("keydown",u),i)};function Qp(a){return uf(a)&&!Yg()}function wT(a,i,s={}){const[u,c,h]=qg(a,s),f=p=>{const d=p.currentTarget;if(!Qp(p))return;uu.add(d);const m=i(d,p),g=(R,D)=>{window.removeEventListener("pointerup",S),window.removeEventListener("pointercancel",b),uu.has(d)&&uu.delete(d),Qp(R)&&typeof m=="function"&&m(R,{success:D})},S=R=>{g(R,d===window||d===document||s.useGlobalTarget||Gg(d,R.target))},b=R=>{g(R,!1)};window.addEventListener("pointerup",S,c),window.addEventListener("pointercancel",b,c)};return u.forEach(p=>{(s.useGlobalTarget?window:p).addEventListener("pointerdown",f,c),nf(p)&&(p.addEventListener("focus",m=>MT(m,c)),!DT(p)&&!p.hasAttribute("tabindex")&&(p.tabIndex=0))}),h}function Xg(a){return ng(a)&&"ownerSVGElement"in a}function CT(a){return Xg(a)&&a.tagName==="svg"}const ae=a=>!!(a&&a.getVelocity),OT=[...Lg,ne,Zn],NT=a=>OT.find(_g(a)),rf=E.createContext({transformPagePoint:a=>a,isStatic:!1,reducedMotion:"never"});class VT extends E.Component{getSnapshotBeforeUpdate(i){const s=this.props.childRef.current;if(s&&i.isPresent&&!this.props.isPresent){const u=s.offsetParent,c=nf(u)&&u.offsetWidth||0,h=this.props.sizeRef.current;h.height=s.offsetHeight||0,h.width=s.offsetWidth||0,h.top=s.offsetTop,h.left=s.offsetLeft,h.right=c-h.width-h.left}return null}componentDidUpdate(){}render(){return this.props.children}}function zT({children:a,isPresent:i,anchorX:s}){const u=E.useId(),c=E.useRef(null),h=E.useRef({width:0,height:0,top:0,left:0,right:0}),{nonce:f}=E.useContext(rf);return E.useInsertionEffect(()=>{const{width:p,height:d,top:m,left:g,right:S}=h.current;if(i||!c.current||!p||!d)return;const b=s==="left"?`left: ${g}`:`right: ${S}`;c.current.dataset.motionPopId=u;const R=document.createElement("style");return f&&(R.nonce=f),document.head.appendChild(R),R.sheet&&R.sheet.insertRule(`
-          [data-motion-pop-id="${u}"] {
-            position: absolute !important;
-            width: ${p}px !important;
-            height: ${d}px !important;
-            ${b}px !important;
-            top: ${m}px !important;
-          }
-        `),()=>{document.head.contains(R)&&document.head.removeChild(R)}},[i]),G.jsx(VT,{isPresent:i,childRef:c,sizeRef:h,children:E.cloneElement(a,{ref:c})})}const UT=({children:a,initial:i,isPresent:s,onExitComplete:u,custom:c,presenceAffectsLayout:h,mode:f,anchorX:p})=>{const d=Bc(_T),m=E.useId();let g=!0,S=E.useMemo(()=>(g=!1,{id:m,initial:i,isPresent:s,custom:c,onExitComplete:b=>{d.set(b,!0);for(const R of d.values())if(!R)return;u&&u()},register:b=>(d.set(b,!1),()=>d.delete(b))}),[s,d,u]);return h&&g&&(S={...S}),E.useMemo(()=>{d.forEach((b,R)=>d.set(R,!1))},[s]),E.useEffect(()=>{!s&&!d.size&&u&&u()},[s]),f==="popLayout"&&(a=G.jsx(zT,{isPresent:s,anchorX:p,children:a})),G.jsx(Su.Provider,{value:S,children:a})};function _T(){return new Map}function Kg(a=!0){const i=E.useContext(Su);if(i===null)return[!0,null];const{isPresent:s,onExitComplete:u,register:c}=i,h=E.useId();E.useEffect(()=>{if(a)return c(h)},[a]);const f=E.useCallback(()=>a&&u&&u(h),[h,u,a]);return!s&&u?[!1,f]:[!0]}const nu=a=>a.key||"";function kp(a){const i=[];return E.Children.forEach(a,s=>{E.isValidElement(s)&&i.push(s)}),i}const Zg=({children:a,custom:i,initial:s=!0,onExitComplete:u,presenceAffectsLayout:c=!0,mode:h="sync",propagate:f=!1,anchorX:p="left"})=>{const[d,m]=Kg(f),g=E.useMemo(()=>kp(a),[a]),S=f&&!d?[]:g.map(nu),b=E.useRef(!0),R=E.useRef(g),D=Bc(()=>new Map),[w,U]=E.useState(g),[O,j]=E.useState(g);tg(()=>{b.current=!1,R.current=g;for(let q=0;q<O.length;q++){const P=nu(O[q]);S.includes(P)?D.delete(P):D.get(P)!==!0&&D.set(P,!1)}},[O,S.length,S.join("-")]);const _=[];if(g!==w){let q=[...g];for(let P=0;P<O.length;P++){const nt=O[P],F=nu(nt);S.includes(F)||(q.splice(P,0,nt),_.push(nt))}return h==="wait"&&_.length&&(q=_),j(kp(q)),U(g),null}const{forceRender:Z}=E.useContext(Lc);return G.jsx(G.Fragment,{children:O.map(q=>{const P=nu(q),nt=f&&!d?!1:g===O||S.includes(P),F=()=>{if(D.has(P))D.set(P,!0);else return;let st=!0;D.forEach(gt=>{gt||(st=!1)}),st&&(Z==null||Z(),j(R.current),f&&(m==null||m()),u&&u())};return G.jsx(UT,{isPresent:nt,initial:!b.current||s?void 0:!1,custom:i,presenceAffectsLayout:c,mode:h,onExitComplete:nt?void 0:F,anchorX:p,children:q},P)})})},Qg=E.createContext({strict:!1}),Pp={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},oi={};for(const a in Pp)oi[a]={isEnabled:i=>Pp[a].some(s=>!!i[s])};function LT(a){for(const i in a)oi[i]={...oi[i],...a[i]}}const BT=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function mu(a){return a.startsWith("while")||a.startsWith("drag")&&a!=="draggable"||a.startsWith("layout")||a.startsWith("onTap")||a.startsWith("onPan")||a.startsWith("onLayout")||BT.has(a)}let kg=a=>!mu(a);function jT(a){a&&(kg=i=>i.startsWith("on")?!mu(i):a(i))}try{jT(require("@emotion/is-prop-valid").default)}catch{}function HT(a,i,s){const u={};for(const c in a)c==="values"&&typeof a.values=="object"||(kg(c)||s===!0&&mu(c)||!i&&!mu(c)||a.draggable&&c.startsWith("onDrag"))&&(u[c]=a[c]);return u}function YT(a){if(typeof Proxy>"u")return a;const i=new Map,s=(...u)=>a(...u);return new Proxy(s,{get:(u,c)=>c==="create"?a:(i.has(c)||i.set(c,a(c)),i.get(c))})}const bu=E.createContext({});function xu(a){return a!==null&&typeof a=="object"&&typeof a.start=="function"}function wl(a){return typeof a=="string"||Array.isArray(a)}const of=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],cf=["initial",...of];function Tu(a){return xu(a.animate)||cf.some(i=>wl(a[i]))}function Pg(a){return!!(Tu(a)||a.variants)}function qT(a,i){if(Tu(a)){const{initial:s,animate:u}=a;return{initial:s===!1||wl(s)?s:void 0,animate:wl(u)?u:void 0}}return a.inherit!==!1?i:{}}function GT(a){const{initial:i,animate:s}=qT(a,E.useContext(bu));return E.useMemo(()=>({initial:i,animate:s}),[Jp(i),Jp(s)])}function Jp(a){return Array.isArray(a)?a.join(" "):a}const XT=Symbol.for("motionComponentSymbol");function ii(a){return a&&typeof a=="object"&&Object.prototype.hasOwnProperty.call(a,"current")}function KT(a,i,s){return E.useCallback(u=>{u&&a.onMount&&a.onMount(u),i&&(u?i.mount(u):i.unmount()),s&&(typeof s=="function"?s(u):ii(s)&&(s.current=u))},[i])}const ff=a=>a.replace(/([a-z])([A-Z])/gu,"$1-$2").toLowerCase(),ZT="framerAppearId",Jg="data-"+ff(ZT),Fg=E.createContext({});function QT(a,i,s,u,c){var w,U;const{visualElement:h}=E.useContext(bu),f=E.useContext(Qg),p=E.useContext(Su),d=E.useContext(rf).reducedMotion,m=E.useRef(null);u=u||f.renderer,!m.current&&u&&(m.current=u(a,{visualState:i,parent:h,props:s,presenceContext:p,blockInitialAnimation:p?p.initial===!1:!1,reducedMotionConfig:d}));const g=m.current,S=E.useContext(Fg);g&&!g.projection&&c&&(g.type==="html"||g.type==="svg")&&kT(m.current,s,c,S);const b=E.useRef(!1);E.useInsertionEffect(()=>{g&&b.current&&g.update(s,p)});const R=s[Jg],D=E.useRef(!!R&&!((w=window.MotionHandoffIsComplete)!=null&&w.call(window,R))&&((U=window.MotionHasOptimisedAnimation)==null?void 0:U.call(window,R)));return tg(()=>{g&&(b.current=!0,window.MotionIsMounted=!0,g.updateFeatures(),sf.render(g.render),D.current&&g.animationState&&g.animationState.animateChanges())}),E.useEffect(()=>{g&&(!D.current&&g.animationState&&g.animationState.animateChanges(),D.current&&(queueMicrotask(()=>{var O;(O=window.MotionHandoffMarkAsComplete)==null||O.call(window,R)}),D.current=!1))}),g}function kT(a,i,s,u){const{layoutId:c,layout:h,drag:f,dragConstraints:p,layoutScroll:d,layoutRoot:m,layoutCrossfade:g}=i;a.projection=new s(a.latestValues,i["data-framer-portal-id"]?void 0:$g(a.parent)),a.projection.setOptions({layoutId:c,layout:h,alwaysMeasureLayout:!!f||p&&ii(p),visualElement:a,animationType:typeof h=="string"?h:"both",initialPromotionConfig:u,crossfade:g,layoutScroll:d,layoutRoot:m})}function $g(a){if(a)return a.options.allowProjection!==!1?a.projection:$g(a.parent)}function PT({preloadedFeatures:a,createVisualElement:i,useRender:s,useVisualState:u,Component:c}){a&&LT(a);function h(p,d){let m;const g={...E.useContext(rf),...p,layoutId:JT(p)},{isStatic:S}=g,b=GT(p),R=u(p,S);if(!S&&jc){FT();const D=$T(g);m=D.MeasureLayout,b.visualElement=QT(c,R,g,i,D.ProjectionNode)}return G.jsxs(bu.Provider,{value:b,children:[m&&b.visualElement?G.jsx(m,{visualElement:b.visualElement,...g}):null,s(c,p,KT(R,b.visualElement,d),R,S,b.visualElement)]})}h.displayName=`motion.${typeof c=="string"?c:`create(${c.displayName??c.name??""})`}`;const f=E.forwardRef(h);return f[XT]=c,f}function JT({layoutId:a}){const i=E.useContext(Lc).id;return i&&a!==void 0?i+"-"+a:a}function FT(a,i){E.useContext(Qg).strict}function $T(a){const{drag:i,layout:s}=oi;if(!i&&!s)return{};const u={...i,...s};return{MeasureLayout:i!=null&&i.isEnabled(a)||s!=null&&s.isEnabled(a)?u.MeasureLayout:void 0,ProjectionNode:u.ProjectionNode}}const Cl={};function WT(a){for(const i in a)Cl[i]=a[i],Qc(i)&&(Cl[i].isCSSVariable=!0)}function Wg(a,{layout:i,layoutId:s}){return pi.has(a)||a.startsWith("origin")||(i||s!==void 0)&&(!!Cl[a]||a==="opacity")}const IT={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},tE=mi.length;function eE(a,i,s){let u="",c=!0;for(let h=0;h<tE;h++){const f=mi[h],p=a[f];if(p===void 0)continue;let d=!0;if(typeof p=="number"?d=p===(f.startsWith("scale")?1:0):d=parseFloat(p)===0,!d||s){const m=Hg(p,lf[f]);if(!d){c=!1;const g=IT[f]||f;u+=`${g}(${m}) `}s&&(i[f]=m)}}return u=u.trim(),s?u=s(i,c?"":u):c&&(u="none"),u}function hf(a,i,s){const{style:u,vars:c,transformOrigin:h}=a;let f=!1,p=!1;for(const d in i){const m=i[d];if(pi.has(d)){f=!0;continue}else if(Qc(d)){c[d]=m;continue}else{const g=Hg(m,lf[d]);d.startsWith("origin")?(p=!0,h[d]=g):u[d]=g}}if(i.transform||(f||s?u.transform=eE(i,a.transform,s):u.transform&&(u.transform="none")),p){const{originX:d="50%",originY:m="50%",originZ:g=0}=h;u.transformOrigin=`${d} ${m} ${g}`}}const df=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function Ig(a,i,s){for(const u in i)!ae(i[u])&&!Wg(u,s)&&(a[u]=i[u])}function nE({transformTemplate:a},i){return E.useMemo(()=>{const s=df();return hf(s,i,a),Object.assign({},s.vars,s.style)},[i])}function aE(a,i){const s=a.style||{},u={};return Ig(u,s,a),Object.assign(u,nE(a,i)),u}function iE(a,i){const s={},u=aE(a,i);return a.drag&&a.dragListener!==!1&&(s.draggable=!1,u.userSelect=u.WebkitUserSelect=u.WebkitTouchCallout="none",u.touchAction=a.drag===!0?"none":`pan-${a.drag==="x"?"y":"x"}`),a.tabIndex===void 0&&(a.onTap||a.onTapStart||a.whileTap)&&(s.tabIndex=0),s.style=u,s}const lE={offset:"stroke-dashoffset",array:"stroke-dasharray"},sE={offset:"strokeDashoffset",array:"strokeDasharray"};function uE(a,i,s=1,u=0,c=!0){a.pathLength=1;const h=c?lE:sE;a[h.offset]=it.transform(-u);const f=it.transform(i),p=it.transform(s);a[h.array]=`${f} ${p}`}function t0(a,{attrX:i,attrY:s,attrScale:u,pathLength:c,pathSpacing:h=1,pathOffset:f=0,...p},d,m,g){if(hf(a,p,m),d){a.style.viewBox&&(a.attrs.viewBox=a.style.viewBox);return}a.attrs=a.style,a.style={};const{attrs:S,style:b}=a;S.transform&&(b.transform=S.transform,delete S.transform),(b.transform||S.transformOrigin)&&(b.transformOrigin=S.transformOrigin??"50% 50%",delete S.transformOrigin),b.transform&&(b.transformBox=(g==null?void 0:g.transformBox)??"fill-box",delete S.transformBox),i!==void 0&&(S.x=i),s!==void 0&&(S.y=s),u!==void 0&&(S.scale=u),c!==void 0&&uE(S,c,h,f,!1)}const e0=()=>({...df(),attrs:{}}),n0=a=>typeof a=="string"&&a.toLowerCase()==="svg";function rE(a,i,s,u){const c=E.useMemo(()=>{const h=e0();return t0(h,i,n0(u),a.transformTemplate,a.style),{...h.attrs,style:{...h.style}}},[i]);if(a.style){const h={};Ig(h,a.style,a),c.style={...h,...c.style}}return c}const oE=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function mf(a){return typeof a!="string"||a.includes("-")?!1:!!(oE.indexOf(a)>-1||/[A-Z]/u.test(a))}function cE(a=!1){return(s,u,c,{latestValues:h},f)=>{const d=(mf(s)?rE:iE)(u,h,f,s),m=HT(u,typeof s=="string",a),g=s!==E.Fragment?{...m,...d,ref:c}:{},{children:S}=u,b=E.useMemo(()=>ae(S)?S.get():S,[S]);return E.createElement(s,{...g,children:b})}}function Fp(a){const i=[{},{}];return a==null||a.values.forEach((s,u)=>{i[0][u]=s.get(),i[1][u]=s.getVelocity()}),i}function pf(a,i,s,u){if(typeof i=="function"){const[c,h]=Fp(u);i=i(s!==void 0?s:a.custom,c,h)}if(typeof i=="string"&&(i=a.variants&&a.variants[i]),typeof i=="function"){const[c,h]=Fp(u);i=i(s!==void 0?s:a.custom,c,h)}return i}function ru(a){return ae(a)?a.get():a}function fE({scrapeMotionValuesFromProps:a,createRenderState:i},s,u,c){return{latestValues:hE(s,u,c,a),renderState:i()}}const a0=a=>(i,s)=>{const u=E.useContext(bu),c=E.useContext(Su),h=()=>fE(a,i,u,c);return s?h():Bc(h)};function hE(a,i,s,u){const c={},h=u(a,{});for(const b in h)c[b]=ru(h[b]);let{initial:f,animate:p}=a;const d=Tu(a),m=Pg(a);i&&m&&!d&&a.inherit!==!1&&(f===void 0&&(f=i.initial),p===void 0&&(p=i.animate));let g=s?s.initial===!1:!1;g=g||f===!1;const S=g?p:f;if(S&&typeof S!="boolean"&&!xu(S)){const b=Array.isArray(S)?S:[S];for(let R=0;R<b.length;R++){const D=pf(a,b[R]);if(D){const{transitionEnd:w,transition:U,...O}=D;for(const j in O){let _=O[j];if(Array.isArray(_)){const Z=g?_.length-1:0;_=_[Z]}_!==null&&(c[j]=_)}for(const j in w)c[j]=w[j]}}}return c}function yf(a,i,s){var h;const{style:u}=a,c={};for(const f in u)(ae(u[f])||i.style&&ae(i.style[f])||Wg(f,a)||((h=s==null?void 0:s.getValue(f))==null?void 0:h.liveStyle)!==void 0)&&(c[f]=u[f]);return c}const dE={useVisualState:a0({scrapeMotionValuesFromProps:yf,createRenderState:df})};function i0(a,i,s){const u=yf(a,i,s);for(const c in a)if(ae(a[c])||ae(i[c])){const h=mi.indexOf(c)!==-1?"attr"+c.charAt(0).toUpperCase()+c.substring(1):c;u[h]=a[c]}return u}const mE={useVisualState:a0({scrapeMotionValuesFromProps:i0,createRenderState:e0})};function pE(a,i){return function(u,{forwardMotionProps:c}={forwardMotionProps:!1}){const f={...mf(u)?mE:dE,preloadedFeatures:a,useRender:cE(c),createVisualElement:i,Component:u};return PT(f)}}function Ol(a,i,s){const u=a.getProps();return pf(u,i,s!==void 0?s:u.custom,a)}const bc=a=>Array.isArray(a);function yE(a,i,s){a.hasValue(i)?a.getValue(i).set(s):a.addValue(i,ri(s))}function gE(a){return bc(a)?a[a.length-1]||0:a}function vE(a,i){const s=Ol(a,i);let{transitionEnd:u={},transition:c={},...h}=s||{};h={...h,...u};for(const f in h){const p=gE(h[f]);yE(a,f,p)}}function SE(a){return!!(ae(a)&&a.add)}function xc(a,i){const s=a.getValue("willChange");if(SE(s))return s.add(i);if(!s&&gn.WillChange){const u=new gn.WillChange("auto");a.addValue("willChange",u),u.add(i)}}function l0(a){return a.props[Jg]}const bE=a=>a!==null;function xE(a,{repeat:i,repeatType:s="loop"},u){const c=a.filter(bE),h=i&&s!=="loop"&&i%2===1?0:c.length-1;return c[h]}const TE={type:"spring",stiffness:500,damping:25,restSpeed:10},EE=a=>({type:"spring",stiffness:550,damping:a===0?2*Math.sqrt(550):30,restSpeed:10}),AE={type:"keyframes",duration:.8},RE={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},DE=(a,{keyframes:i})=>i.length>2?AE:pi.has(a)?a.startsWith("scale")?EE(i[1]):TE:RE;function ME({when:a,delay:i,delayChildren:s,staggerChildren:u,staggerDirection:c,repeat:h,repeatType:f,repeatDelay:p,from:d,elapsed:m,...g}){return!!Object.keys(g).length}const gf=(a,i,s,u={},c,h)=>f=>{const p=af(u,a)||{},d=p.delay||u.delay||0;let{elapsed:m=0}=u;m=m-ke(d);const g={keyframes:Array.isArray(s)?s:[null,s],ease:"easeOut",velocity:i.getVelocity(),...p,delay:-m,onUpdate:b=>{i.set(b),p.onUpdate&&p.onUpdate(b)},onComplete:()=>{f(),p.onComplete&&p.onComplete()},name:a,motionValue:i,element:h?void 0:c};ME(p)||Object.assign(g,DE(a,g)),g.duration&&(g.duration=ke(g.duration)),g.repeatDelay&&(g.repeatDelay=ke(g.repeatDelay)),g.from!==void 0&&(g.keyframes[0]=g.from);let S=!1;if((g.type===!1||g.duration===0&&!g.repeatDelay)&&(g.duration=0,g.delay===0&&(S=!0)),(gn.instantAnimations||gn.skipAnimations)&&(S=!0,g.duration=0,g.delay=0),g.allowFlatten=!p.type&&!p.ease,S&&!h&&i.get()!==void 0){const b=xE(g.keyframes,p);if(b!==void 0){Nt.update(()=>{g.onUpdate(b),g.onComplete()});return}}return p.isSync?new tf(g):new uT(g)};function wE({protectedKeys:a,needsAnimating:i},s){const u=a.hasOwnProperty(s)&&i[s]!==!0;return i[s]=!1,u}function s0(a,i,{delay:s=0,transitionOverride:u,type:c}={}){let{transition:h=a.getDefaultTransition(),transitionEnd:f,...p}=i;u&&(h=u);const d=[],m=c&&a.animationState&&a.animationState.getState()[c];for(const g in p){const S=a.getValue(g,a.latestValues[g]??null),b=p[g];if(b===void 0||m&&wE(m,g))continue;const R={delay:s,...af(h||{},g)},D=S.get();if(D!==void 0&&!S.isAnimating&&!Array.isArray(b)&&b===D&&!R.velocity)continue;let w=!1;if(window.MotionHandoffAnimation){const O=l0(a);if(O){const j=window.MotionHandoffAnimation(O,g,Nt);j!==null&&(R.startTime=j,w=!0)}}xc(a,g),S.start(gf(g,S,b,a.shouldReduceMotion&&Ug.has(g)?{type:!1}:R,a,w));const U=S.animation;U&&d.push(U)}return f&&Promise.all(d).then(()=>{Nt.update(()=>{f&&vE(a,f)})}),d}function Tc(a,i,s={}){var d;const u=Ol(a,i,s.type==="exit"?(d=a.presenceContext)==null?void 0:d.custom:void 0);let{transition:c=a.getDefaultTransition()||{}}=u||{};s.transitionOverride&&(c=s.transitionOverride);const h=u?()=>Promise.all(s0(a,u,s)):()=>Promise.resolve(),f=a.variantChildren&&a.variantChildren.size?(m=0)=>{const{delayChildren:g=0,staggerChildren:S,staggerDirection:b}=c;return CE(a,i,g+m,S,b,s)}:()=>Promise.resolve(),{when:p}=c;if(p){const[m,g]=p==="beforeChildren"?[h,f]:[f,h];return m().then(()=>g())}else return Promise.all([h(),f(s.delay)])}function CE(a,i,s=0,u=0,c=1,h){const f=[],p=(a.variantChildren.size-1)*u,d=c===1?(m=0)=>m*u:(m=0)=>p-m*u;return Array.from(a.variantChildren).sort(OE).forEach((m,g)=>{m.notify("AnimationStart",i),f.push(Tc(m,i,{...h,delay:s+d(g)}).then(()=>m.notify("AnimationComplete",i)))}),Promise.all(f)}function OE(a,i){return a.sortNodePosition(i)}function NE(a,i,s={}){a.notify("AnimationStart",i);let u;if(Array.isArray(i)){const c=i.map(h=>Tc(a,h,s));u=Promise.all(c)}else if(typeof i=="string")u=Tc(a,i,s);else{const c=typeof i=="function"?Ol(a,i,s.custom):i;u=Promise.all(s0(a,c,s))}return u.then(()=>{a.notify("AnimationComplete",i)})}function u0(a,i){if(!Array.isArray(i))return!1;const s=i.length;if(s!==a.length)return!1;for(let u=0;u<s;u++)if(i[u]!==a[u])return!1;return!0}const VE=cf.length;function r0(a){if(!a)return;if(!a.isControllingVariants){const s=a.parent?r0(a.parent)||{}:{};return a.props.initial!==void 0&&(s.initial=a.props.initial),s}const i={};for(let s=0;s<VE;s++){const u=cf[s],c=a.props[u];(wl(c)||c===!1)&&(i[u]=c)}return i}const zE=[...of].reverse(),UE=of.length;function _E(a){return i=>Promise.all(i.map(({animation:s,options:u})=>NE(a,s,u)))}function LE(a){let i=_E(a),s=$p(),u=!0;const c=d=>(m,g)=>{var b;const S=Ol(a,g,d==="exit"?(b=a.presenceContext)==null?void 0:b.custom:void 0);if(S){const{transition:R,transitionEnd:D,...w}=S;m={...m,...w,...D}}return m};function h(d){i=d(a)}function f(d){const{props:m}=a,g=r0(a.parent)||{},S=[],b=new Set;let R={},D=1/0;for(let U=0;U<UE;U++){const O=zE[U],j=s[O],_=m[O]!==void 0?m[O]:g[O],Z=wl(_),q=O===d?j.isActive:null;q===!1&&(D=U);let P=_===g[O]&&_!==m[O]&&Z;if(P&&u&&a.manuallyAnimateOnMount&&(P=!1),j.protectedKeys={...R},!j.isActive&&q===null||!_&&!j.prevProp||xu(_)||typeof _=="boolean")continue;const nt=BE(j.prevProp,_);let F=nt||O===d&&j.isActive&&!P&&Z||U>D&&Z,st=!1;const gt=Array.isArray(_)?_:[_];let Yt=gt.reduce(c(O),{});q===!1&&(Yt={});const{prevResolvedValues:qt={}}=j,$e={...qt,...Yt},Ye=K=>{F=!0,b.has(K)&&(st=!0,b.delete(K)),j.needsAnimating[K]=!0;const $=a.getValue(K);$&&($.liveStyle=!1)};for(const K in $e){const $=Yt[K],pt=qt[K];if(R.hasOwnProperty(K))continue;let T=!1;bc($)&&bc(pt)?T=!u0($,pt):T=$!==pt,T?$!=null?Ye(K):b.add(K):$!==void 0&&b.has(K)?Ye(K):j.protectedKeys[K]=!0}j.prevProp=_,j.prevResolvedValues=Yt,j.isActive&&(R={...R,...Yt}),u&&a.blockInitialAnimation&&(F=!1),F&&(!(P&&nt)||st)&&S.push(...gt.map(K=>({animation:K,options:{type:O}})))}if(b.size){const U={};if(typeof m.initial!="boolean"){const O=Ol(a,Array.isArray(m.initial)?m.initial[0]:m.initial);O&&O.transition&&(U.transition=O.transition)}b.forEach(O=>{const j=a.getBaseTarget(O),_=a.getValue(O);_&&(_.liveStyle=!0),U[O]=j??null}),S.push({animation:U})}let w=!!S.length;return u&&(m.initial===!1||m.initial===m.animate)&&!a.manuallyAnimateOnMount&&(w=!1),u=!1,w?i(S):Promise.resolve()}function p(d,m){var S;if(s[d].isActive===m)return Promise.resolve();(S=a.variantChildren)==null||S.forEach(b=>{var R;return(R=b.animationState)==null?void 0:R.setActive(d,m)}),s[d].isActive=m;const g=f(d);for(const b in s)s[b].protectedKeys={};return g}return{animateChanges:f,setActive:p,setAnimateFunction:h,getState:()=>s,reset:()=>{s=$p(),u=!0}}}function BE(a,i){return typeof i=="string"?i!==a:Array.isArray(i)?!u0(i,a):!1}function ha(a=!1){return{isActive:a,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function $p(){return{animate:ha(!0),whileInView:ha(),whileHover:ha(),whileTap:ha(),whileDrag:ha(),whileFocus:ha(),exit:ha()}}class kn{constructor(i){this.isMounted=!1,this.node=i}update(){}}class jE extends kn{constructor(i){super(i),i.animationState||(i.animationState=LE(i))}updateAnimationControlsSubscription(){const{animate:i}=this.node.getProps();xu(i)&&(this.unmountControls=i.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:i}=this.node.getProps(),{animate:s}=this.node.prevProps||{};i!==s&&this.updateAnimationControlsSubscription()}unmount(){var i;this.node.animationState.reset(),(i=this.unmountControls)==null||i.call(this)}}let HE=0;class YE extends kn{constructor(){super(...arguments),this.id=HE++}update(){if(!this.node.presenceContext)return;const{isPresent:i,onExitComplete:s}=this.node.presenceContext,{isPresent:u}=this.node.prevPresenceContext||{};if(!this.node.animationState||i===u)return;const c=this.node.animationState.setActive("exit",!i);s&&!i&&c.then(()=>{s(this.id)})}mount(){const{register:i,onExitComplete:s}=this.node.presenceContext||{};s&&s(this.id),i&&(this.unmount=i(this.id))}unmount(){}}const qE={animation:{Feature:jE},exit:{Feature:YE}};function Nl(a,i,s,u={passive:!0}){return a.addEventListener(i,s,u),()=>a.removeEventListener(i,s)}function Bl(a){return{point:{x:a.pageX,y:a.pageY}}}const GE=a=>i=>uf(i)&&a(i,Bl(i));function xl(a,i,s,u){return Nl(a,i,GE(s),u)}function o0({top:a,left:i,right:s,bottom:u}){return{x:{min:i,max:s},y:{min:a,max:u}}}function XE({x:a,y:i}){return{top:i.min,right:a.max,bottom:i.max,left:a.min}}function KE(a,i){if(!i)return a;const s=i({x:a.left,y:a.top}),u=i({x:a.right,y:a.bottom});return{top:s.y,left:s.x,bottom:u.y,right:u.x}}const c0=1e-4,ZE=1-c0,QE=1+c0,f0=.01,kE=0-f0,PE=0+f0;function le(a){return a.max-a.min}function JE(a,i,s){return Math.abs(a-i)<=s}function Wp(a,i,s,u=.5){a.origin=u,a.originPoint=Ot(i.min,i.max,a.origin),a.scale=le(s)/le(i),a.translate=Ot(s.min,s.max,a.origin)-a.originPoint,(a.scale>=ZE&&a.scale<=QE||isNaN(a.scale))&&(a.scale=1),(a.translate>=kE&&a.translate<=PE||isNaN(a.translate))&&(a.translate=0)}function Tl(a,i,s,u){Wp(a.x,i.x,s.x,u?u.originX:void 0),Wp(a.y,i.y,s.y,u?u.originY:void 0)}function Ip(a,i,s){a.min=s.min+i.min,a.max=a.min+le(i)}function FE(a,i,s){Ip(a.x,i.x,s.x),Ip(a.y,i.y,s.y)}function ty(a,i,s){a.min=i.min-s.min,a.max=a.min+le(i)}function El(a,i,s){ty(a.x,i.x,s.x),ty(a.y,i.y,s.y)}const ey=()=>({translate:0,scale:1,origin:0,originPoint:0}),li=()=>({x:ey(),y:ey()}),ny=()=>({min:0,max:0}),Bt=()=>({x:ny(),y:ny()});function Ve(a){return[a("x"),a("y")]}function Wo(a){return a===void 0||a===1}function Ec({scale:a,scaleX:i,scaleY:s}){return!Wo(a)||!Wo(i)||!Wo(s)}function da(a){return Ec(a)||h0(a)||a.z||a.rotate||a.rotateX||a.rotateY||a.skewX||a.skewY}function h0(a){return ay(a.x)||ay(a.y)}function ay(a){return a&&a!=="0%"}function pu(a,i,s){const u=a-s,c=i*u;return s+c}function iy(a,i,s,u,c){return c!==void 0&&(a=pu(a,c,u)),pu(a,s,u)+i}function Ac(a,i=0,s=1,u,c){a.min=iy(a.min,i,s,u,c),a.max=iy(a.max,i,s,u,c)}function d0(a,{x:i,y:s}){Ac(a.x,i.translate,i.scale,i.originPoint),Ac(a.y,s.translate,s.scale,s.originPoint)}const ly=.999999999999,sy=1.0000000000001;function $E(a,i,s,u=!1){const c=s.length;if(!c)return;i.x=i.y=1;let h,f;for(let p=0;p<c;p++){h=s[p],f=h.projectionDelta;const{visualElement:d}=h.options;d&&d.props.style&&d.props.style.display==="contents"||(u&&h.options.layoutScroll&&h.scroll&&h!==h.root&&ui(a,{x:-h.scroll.offset.x,y:-h.scroll.offset.y}),f&&(i.x*=f.x.scale,i.y*=f.y.scale,d0(a,f)),u&&da(h.latestValues)&&ui(a,h.latestValues))}i.x<sy&&i.x>ly&&(i.x=1),i.y<sy&&i.y>ly&&(i.y=1)}function si(a,i){a.min=a.min+i,a.max=a.max+i}function uy(a,i,s,u,c=.5){const h=Ot(a.min,a.max,c);Ac(a,i,s,h,u)}function ui(a,i){uy(a.x,i.x,i.scaleX,i.scale,i.originX),uy(a.y,i.y,i.scaleY,i.scale,i.originY)}function m0(a,i){return o0(KE(a.getBoundingClientRect(),i))}function WE(a,i,s){const u=m0(a,s),{scroll:c}=i;return c&&(si(u.x,c.offset.x),si(u.y,c.offset.y)),u}const p0=({current:a})=>a?a.ownerDocument.defaultView:null,ry=(a,i)=>Math.abs(a-i);function IE(a,i){const s=ry(a.x,i.x),u=ry(a.y,i.y);return Math.sqrt(s**2+u**2)}class y0{constructor(i,s,{transformPagePoint:u,contextWindow:c,dragSnapToOrigin:h=!1}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const S=tc(this.lastMoveEventInfo,this.history),b=this.startEvent!==null,R=IE(S.offset,{x:0,y:0})>=3;if(!b&&!R)return;const{point:D}=S,{timestamp:w}=Wt;this.history.push({...D,timestamp:w});const{onStart:U,onMove:O}=this.handlers;b||(U&&U(this.lastMoveEvent,S),this.startEvent=this.lastMoveEvent),O&&O(this.lastMoveEvent,S)},this.handlePointerMove=(S,b)=>{this.lastMoveEvent=S,this.lastMoveEventInfo=Io(b,this.transformPagePoint),Nt.update(this.updatePoint,!0)},this.handlePointerUp=(S,b)=>{this.end();const{onEnd:R,onSessionEnd:D,resumeAnimation:w}=this.handlers;if(this.dragSnapToOrigin&&w&&w(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const U=tc(S.type==="pointercancel"?this.lastMoveEventInfo:Io(b,this.transformPagePoint),this.history);this.startEvent&&R&&R(S,U),D&&D(S,U)},!uf(i))return;this.dragSnapToOrigin=h,this.handlers=s,this.transformPagePoint=u,this.contextWindow=c||window;const f=Bl(i),p=Io(f,this.transformPagePoint),{point:d}=p,{timestamp:m}=Wt;this.history=[{...d,timestamp:m}];const{onSessionStart:g}=s;g&&g(i,tc(p,this.history)),this.removeListeners=Ul(xl(this.contextWindow,"pointermove",this.handlePointerMove),xl(this.contextWindow,"pointerup",this.handlePointerUp),xl(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(i){this.handlers=i}end(){this.removeListeners&&this.removeListeners(),Kn(this.updatePoint)}}function Io(a,i){return i?{point:i(a.point)}:a}function oy(a,i){return{x:a.x-i.x,y:a.y-i.y}}function tc({point:a},i){return{point:a,delta:oy(a,g0(i)),offset:oy(a,tA(i)),velocity:eA(i,.1)}}function tA(a){return a[0]}function g0(a){return a[a.length-1]}function eA(a,i){if(a.length<2)return{x:0,y:0};let s=a.length-1,u=null;const c=g0(a);for(;s>=0&&(u=a[s],!(c.timestamp-u.timestamp>ke(i)));)s--;if(!u)return{x:0,y:0};const h=Pe(c.timestamp-u.timestamp);if(h===0)return{x:0,y:0};const f={x:(c.x-u.x)/h,y:(c.y-u.y)/h};return f.x===1/0&&(f.x=0),f.y===1/0&&(f.y=0),f}function nA(a,{min:i,max:s},u){return i!==void 0&&a<i?a=u?Ot(i,a,u.min):Math.max(a,i):s!==void 0&&a>s&&(a=u?Ot(s,a,u.max):Math.min(a,s)),a}function cy(a,i,s){return{min:i!==void 0?a.min+i:void 0,max:s!==void 0?a.max+s-(a.max-a.min):void 0}}function aA(a,{top:i,left:s,bottom:u,right:c}){return{x:cy(a.x,s,c),y:cy(a.y,i,u)}}function fy(a,i){let s=i.min-a.min,u=i.max-a.max;return i.max-i.min<a.max-a.min&&([s,u]=[u,s]),{min:s,max:u}}function iA(a,i){return{x:fy(a.x,i.x),y:fy(a.y,i.y)}}function lA(a,i){let s=.5;const u=le(a),c=le(i);return c>u?s=Rl(i.min,i.max-u,a.min):u>c&&(s=Rl(a.min,a.max-c,i.min)),yn(0,1,s)}function sA(a,i){const s={};return i.min!==void 0&&(s.min=i.min-a.min),i.max!==void 0&&(s.max=i.max-a.min),s}const Rc=.35;function uA(a=Rc){return a===!1?a=0:a===!0&&(a=Rc),{x:hy(a,"left","right"),y:hy(a,"top","bottom")}}function hy(a,i,s){return{min:dy(a,i),max:dy(a,s)}}function dy(a,i){return typeof a=="number"?a:a[i]||0}const rA=new WeakMap;class oA{constructor(i){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=Bt(),this.visualElement=i}start(i,{snapToCursor:s=!1}={}){const{presenceContext:u}=this.visualElement;if(u&&u.isPresent===!1)return;const c=g=>{const{dragSnapToOrigin:S}=this.getProps();S?this.pauseAnimation():this.stopAnimation(),s&&this.snapToCursor(Bl(g).point)},h=(g,S)=>{const{drag:b,dragPropagation:R,onDragStart:D}=this.getProps();if(b&&!R&&(this.openDragLock&&this.openDragLock(),this.openDragLock=ET(b),!this.openDragLock))return;this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Ve(U=>{let O=this.getAxisMotionValue(U).get()||0;if(Je.test(O)){const{projection:j}=this.visualElement;if(j&&j.layout){const _=j.layout.layoutBox[U];_&&(O=le(_)*(parseFloat(O)/100))}}this.originPoint[U]=O}),D&&Nt.postRender(()=>D(g,S)),xc(this.visualElement,"transform");const{animationState:w}=this.visualElement;w&&w.setActive("whileDrag",!0)},f=(g,S)=>{const{dragPropagation:b,dragDirectionLock:R,onDirectionLock:D,onDrag:w}=this.getProps();if(!b&&!this.openDragLock)return;const{offset:U}=S;if(R&&this.currentDirection===null){this.currentDirection=cA(U),this.currentDirection!==null&&D&&D(this.currentDirection);return}this.updateAxis("x",S.point,U),this.updateAxis("y",S.point,U),this.visualElement.render(),w&&w(g,S)},p=(g,S)=>this.stop(g,S),d=()=>Ve(g=>{var S;return this.getAnimationState(g)==="paused"&&((S=this.getAxisMotionValue(g).animation)==null?void 0:S.play())}),{dragSnapToOrigin:m}=this.getProps();this.panSession=new y0(i,{onSessionStart:c,onStart:h,onMove:f,onSessionEnd:p,resumeAnimation:d},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:m,contextWindow:p0(this.visualElement)})}stop(i,s){const u=this.isDragging;if(this.cancel(),!u)return;const{velocity:c}=s;this.startAnimation(c);const{onDragEnd:h}=this.getProps();h&&Nt.postRender(()=>h(i,s))}cancel(){this.isDragging=!1;const{projection:i,animationState:s}=this.visualElement;i&&(i.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:u}=this.getProps();!u&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),s&&s.setActive("whileDrag",!1)}updateAxis(i,s,u){const{drag:c}=this.getProps();if(!u||!au(i,c,this.currentDirection))return;const h=this.getAxisMotionValue(i);let f=this.originPoint[i]+u[i];this.constraints&&this.constraints[i]&&(f=nA(f,this.constraints[i],this.elastic[i])),h.set(f)}resolveConstraints(){var h;const{dragConstraints:i,dragElastic:s}=this.getProps(),u=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):(h=this.visualElement.projection)==null?void 0:h.layout,c=this.constraints;i&&ii(i)?this.constraints||(this.constraints=this.resolveRefConstraints()):i&&u?this.constraints=aA(u.layoutBox,i):this.constraints=!1,this.elastic=uA(s),c!==this.constraints&&u&&this.constraints&&!this.hasMutatedConstraints&&Ve(f=>{this.constraints!==!1&&this.getAxisMotionValue(f)&&(this.constraints[f]=sA(u.layoutBox[f],this.constraints[f]))})}resolveRefConstraints(){const{dragConstraints:i,onMeasureDragConstraints:s}=this.getProps();if(!i||!ii(i))return!1;const u=i.current,{projection:c}=this.visualElement;if(!c||!c.layout)return!1;const h=WE(u,c.root,this.visualElement.getTransformPagePoint());let f=iA(c.layout.layoutBox,h);if(s){const p=s(XE(f));this.hasMutatedConstraints=!!p,p&&(f=o0(p))}return f}startAnimation(i){const{drag:s,dragMomentum:u,dragElastic:c,dragTransition:h,dragSnapToOrigin:f,onDragTransitionEnd:p}=this.getProps(),d=this.constraints||{},m=Ve(g=>{if(!au(g,s,this.currentDirection))return;let S=d&&d[g]||{};f&&(S={min:0,max:0});const b=c?200:1e6,R=c?40:1e7,D={type:"inertia",velocity:u?i[g]:0,bounceStiffness:b,bounceDamping:R,timeConstant:750,restDelta:1,restSpeed:10,...h,...S};return this.startAxisValueAnimation(g,D)});return Promise.all(m).then(p)}startAxisValueAnimation(i,s){const u=this.getAxisMotionValue(i);return xc(this.visualElement,i),u.start(gf(i,u,0,s,this.visualElement,!1))}stopAnimation(){Ve(i=>this.getAxisMotionValue(i).stop())}pauseAnimation(){Ve(i=>{var s;return(s=this.getAxisMotionValue(i).animation)==null?void 0:s.pause()})}getAnimationState(i){var s;return(s=this.getAxisMotionValue(i).animation)==null?void 0:s.state}getAxisMotionValue(i){const s=`_drag${i.toUpperCase()}`,u=this.visualElement.getProps(),c=u[s];return c||this.visualElement.getValue(i,(u.initial?u.initial[i]:void 0)||0)}snapToCursor(i){Ve(s=>{const{drag:u}=this.getProps();if(!au(s,u,this.currentDirection))return;const{projection:c}=this.visualElement,h=this.getAxisMotionValue(s);if(c&&c.layout){const{min:f,max:p}=c.layout.layoutBox[s];h.set(i[s]-Ot(f,p,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:i,dragConstraints:s}=this.getProps(),{projection:u}=this.visualElement;if(!ii(s)||!u||!this.constraints)return;this.stopAnimation();const c={x:0,y:0};Ve(f=>{const p=this.getAxisMotionValue(f);if(p&&this.constraints!==!1){const d=p.get();c[f]=lA({min:d,max:d},this.constraints[f])}});const{transformTemplate:h}=this.visualElement.getProps();this.visualElement.current.style.transform=h?h({},""):"none",u.root&&u.root.updateScroll(),u.updateLayout(),this.resolveConstraints(),Ve(f=>{if(!au(f,i,null))return;const p=this.getAxisMotionValue(f),{min:d,max:m}=this.constraints[f];p.set(Ot(d,m,c[f]))})}addListeners(){if(!this.visualElement.current)return;rA.set(this.visualElement,this);const i=this.visualElement.current,s=xl(i,"pointerdown",d=>{const{drag:m,dragListener:g=!0}=this.getProps();m&&g&&this.start(d)}),u=()=>{const{dragConstraints:d}=this.getProps();ii(d)&&d.current&&(this.constraints=this.resolveRefConstraints())},{projection:c}=this.visualElement,h=c.addEventListener("measure",u);c&&!c.layout&&(c.root&&c.root.updateScroll(),c.updateLayout()),Nt.read(u);const f=Nl(window,"resize",()=>this.scalePositionWithinConstraints()),p=c.addEventListener("didUpdate",({delta:d,hasLayoutChanged:m})=>{this.isDragging&&m&&(Ve(g=>{const S=this.getAxisMotionValue(g);S&&(this.originPoint[g]+=d[g].translate,S.set(S.get()+d[g].translate))}),this.visualElement.render())});return()=>{f(),s(),h(),p&&p()}}getProps(){const i=this.visualElement.getProps(),{drag:s=!1,dragDirectionLock:u=!1,dragPropagation:c=!1,dragConstraints:h=!1,dragElastic:f=Rc,dragMomentum:p=!0}=i;return{...i,drag:s,dragDirectionLock:u,dragPropagation:c,dragConstraints:h,dragElastic:f,dragMomentum:p}}}function au(a,i,s){return(i===!0||i===a)&&(s===null||s===a)}function cA(a,i=10){let s=null;return Math.abs(a.y)>i?s="y":Math.abs(a.x)>i&&(s="x"),s}class fA extends kn{constructor(i){super(i),this.removeGroupControls=ze,this.removeListeners=ze,this.controls=new oA(i)}mount(){const{dragControls:i}=this.node.getProps();i&&(this.removeGroupControls=i.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||ze}unmount(){this.removeGroupControls(),this.removeListeners()}}const my=a=>(i,s)=>{a&&Nt.postRender(()=>a(i,s))};class hA extends kn{constructor(){super(...arguments),this.removePointerDownListener=ze}onPointerDown(i){this.session=new y0(i,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:p0(this.node)})}createPanHandlers(){const{onPanSessionStart:i,onPanStart:s,onPan:u,onPanEnd:c}=this.node.getProps();return{onSessionStart:my(i),onStart:my(s),onMove:u,onEnd:(h,f)=>{delete this.session,c&&Nt.postRender(()=>c(h,f))}}}mount(){this.removePointerDownListener=xl(this.node.current,"pointerdown",i=>this.onPointerDown(i))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}const ou={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function py(a,i){return i.max===i.min?0:a/(i.max-i.min)*100}const gl={correct:(a,i)=>{if(!i.target)return a;if(typeof a=="string")if(it.test(a))a=parseFloat(a);else return a;const s=py(a,i.target.x),u=py(a,i.target.y);return`${s}% ${u}%`}},dA={correct:(a,{treeScale:i,projectionDelta:s})=>{const u=a,c=Zn.parse(a);if(c.length>5)return u;const h=Zn.createTransformer(a),f=typeof c[0]!="number"?1:0,p=s.x.scale*i.x,d=s.y.scale*i.y;c[0+f]/=p,c[1+f]/=d;const m=Ot(p,d,.5);return typeof c[2+f]=="number"&&(c[2+f]/=m),typeof c[3+f]=="number"&&(c[3+f]/=m),h(c)}};class mA extends E.Component{componentDidMount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:u,layoutId:c}=this.props,{projection:h}=i;WT(pA),h&&(s.group&&s.group.add(h),u&&u.register&&c&&u.register(h),h.root.didUpdate(),h.addEventListener("animationComplete",()=>{this.safeToRemove()}),h.setOptions({...h.options,onExitComplete:()=>this.safeToRemove()})),ou.hasEverUpdated=!0}getSnapshotBeforeUpdate(i){const{layoutDependency:s,visualElement:u,drag:c,isPresent:h}=this.props,{projection:f}=u;return f&&(f.isPresent=h,c||i.layoutDependency!==s||s===void 0||i.isPresent!==h?f.willUpdate():this.safeToRemove(),i.isPresent!==h&&(h?f.promote():f.relegate()||Nt.postRender(()=>{const p=f.getStack();(!p||!p.members.length)&&this.safeToRemove()}))),null}componentDidUpdate(){const{projection:i}=this.props.visualElement;i&&(i.root.didUpdate(),sf.postRender(()=>{!i.currentAnimation&&i.isLead()&&this.safeToRemove()}))}componentWillUnmount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:u}=this.props,{projection:c}=i;c&&(c.scheduleCheckAfterUnmount(),s&&s.group&&s.group.remove(c),u&&u.deregister&&u.deregister(c))}safeToRemove(){const{safeToRemove:i}=this.props;i&&i()}render(){return null}}function v0(a){const[i,s]=Kg(),u=E.useContext(Lc);return G.jsx(mA,{...a,layoutGroup:u,switchLayoutGroup:E.useContext(Fg),isPresent:i,safeToRemove:s})}const pA={borderRadius:{...gl,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:gl,borderTopRightRadius:gl,borderBottomLeftRadius:gl,borderBottomRightRadius:gl,boxShadow:dA};function yA(a,i,s){const u=ae(a)?a:ri(a);return u.start(gf("",u,i,s)),u.animation}const gA=(a,i)=>a.depth-i.depth;class vA{constructor(){this.children=[],this.isDirty=!1}add(i){Hc(this.children,i),this.isDirty=!0}remove(i){Yc(this.children,i),this.isDirty=!0}forEach(i){this.isDirty&&this.children.sort(gA),this.isDirty=!1,this.children.forEach(i)}}function SA(a,i){const s=fe.now(),u=({timestamp:c})=>{const h=c-s;h>=i&&(Kn(u),a(h-i))};return Nt.setup(u,!0),()=>Kn(u)}const S0=["TopLeft","TopRight","BottomLeft","BottomRight"],bA=S0.length,yy=a=>typeof a=="string"?parseFloat(a):a,gy=a=>typeof a=="number"||it.test(a);function xA(a,i,s,u,c,h){c?(a.opacity=Ot(0,s.opacity??1,TA(u)),a.opacityExit=Ot(i.opacity??1,0,EA(u))):h&&(a.opacity=Ot(i.opacity??1,s.opacity??1,u));for(let f=0;f<bA;f++){const p=`border${S0[f]}Radius`;let d=vy(i,p),m=vy(s,p);if(d===void 0&&m===void 0)continue;d||(d=0),m||(m=0),d===0||m===0||gy(d)===gy(m)?(a[p]=Math.max(Ot(yy(d),yy(m),u),0),(Je.test(m)||Je.test(d))&&(a[p]+="%")):a[p]=m}(i.rotate||s.rotate)&&(a.rotate=Ot(i.rotate||0,s.rotate||0,u))}function vy(a,i){return a[i]!==void 0?a[i]:a.borderRadius}const TA=b0(0,.5,fg),EA=b0(.5,.95,ze);function b0(a,i,s){return u=>u<a?0:u>i?1:s(Rl(a,i,u))}function Sy(a,i){a.min=i.min,a.max=i.max}function Ne(a,i){Sy(a.x,i.x),Sy(a.y,i.y)}function by(a,i){a.translate=i.translate,a.scale=i.scale,a.originPoint=i.originPoint,a.origin=i.origin}function xy(a,i,s,u,c){return a-=i,a=pu(a,1/s,u),c!==void 0&&(a=pu(a,1/c,u)),a}function AA(a,i=0,s=1,u=.5,c,h=a,f=a){if(Je.test(i)&&(i=parseFloat(i),i=Ot(f.min,f.max,i/100)-f.min),typeof i!="number")return;let p=Ot(h.min,h.max,u);a===h&&(p-=i),a.min=xy(a.min,i,s,p,c),a.max=xy(a.max,i,s,p,c)}function Ty(a,i,[s,u,c],h,f){AA(a,i[s],i[u],i[c],i.scale,h,f)}const RA=["x","scaleX","originX"],DA=["y","scaleY","originY"];function Ey(a,i,s,u){Ty(a.x,i,RA,s?s.x:void 0,u?u.x:void 0),Ty(a.y,i,DA,s?s.y:void 0,u?u.y:void 0)}function Ay(a){return a.translate===0&&a.scale===1}function x0(a){return Ay(a.x)&&Ay(a.y)}function Ry(a,i){return a.min===i.min&&a.max===i.max}function MA(a,i){return Ry(a.x,i.x)&&Ry(a.y,i.y)}function Dy(a,i){return Math.round(a.min)===Math.round(i.min)&&Math.round(a.max)===Math.round(i.max)}function T0(a,i){return Dy(a.x,i.x)&&Dy(a.y,i.y)}function My(a){return le(a.x)/le(a.y)}function wy(a,i){return a.translate===i.translate&&a.scale===i.scale&&a.originPoint===i.originPoint}class wA{constructor(){this.members=[]}add(i){Hc(this.members,i),i.scheduleRender()}remove(i){if(Yc(this.members,i),i===this.prevLead&&(this.prevLead=void 0),i===this.lead){const s=this.members[this.members.length-1];s&&this.promote(s)}}relegate(i){const s=this.members.findIndex(c=>i===c);if(s===0)return!1;let u;for(let c=s;c>=0;c--){const h=this.members[c];if(h.isPresent!==!1){u=h;break}}return u?(this.promote(u),!0):!1}promote(i,s){const u=this.lead;if(i!==u&&(this.prevLead=u,this.lead=i,i.show(),u)){u.instance&&u.scheduleRender(),i.scheduleRender(),i.resumeFrom=u,s&&(i.resumeFrom.preserveOpacity=!0),u.snapshot&&(i.snapshot=u.snapshot,i.snapshot.latestValues=u.animationValues||u.latestValues),i.root&&i.root.isUpdating&&(i.isLayoutDirty=!0);const{crossfade:c}=i.options;c===!1&&u.hide()}}exitAnimationComplete(){this.members.forEach(i=>{const{options:s,resumingFrom:u}=i;s.onExitComplete&&s.onExitComplete(),u&&u.options.onExitComplete&&u.options.onExitComplete()})}scheduleRender(){this.members.forEach(i=>{i.instance&&i.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function CA(a,i,s){let u="";const c=a.x.translate/i.x,h=a.y.translate/i.y,f=(s==null?void 0:s.z)||0;if((c||h||f)&&(u=`translate3d(${c}px, ${h}px, ${f}px) `),(i.x!==1||i.y!==1)&&(u+=`scale(${1/i.x}, ${1/i.y}) `),s){const{transformPerspective:m,rotate:g,rotateX:S,rotateY:b,skewX:R,skewY:D}=s;m&&(u=`perspective(${m}px) ${u}`),g&&(u+=`rotate(${g}deg) `),S&&(u+=`rotateX(${S}deg) `),b&&(u+=`rotateY(${b}deg) `),R&&(u+=`skewX(${R}deg) `),D&&(u+=`skewY(${D}deg) `)}const p=a.x.scale*i.x,d=a.y.scale*i.y;return(p!==1||d!==1)&&(u+=`scale(${p}, ${d})`),u||"none"}const ec=["","X","Y","Z"],OA={visibility:"hidden"},NA=1e3;let VA=0;function nc(a,i,s,u){const{latestValues:c}=i;c[a]&&(s[a]=c[a],i.setStaticValue(a,0),u&&(u[a]=0))}function E0(a){if(a.hasCheckedOptimisedAppear=!0,a.root===a)return;const{visualElement:i}=a.options;if(!i)return;const s=l0(i);if(window.MotionHasOptimisedAnimation(s,"transform")){const{layout:c,layoutId:h}=a.options;window.MotionCancelOptimisedAnimation(s,"transform",Nt,!(c||h))}const{parent:u}=a;u&&!u.hasCheckedOptimisedAppear&&E0(u)}function A0({attachResizeListener:a,defaultParent:i,measureScroll:s,checkIsScrollRoot:u,resetTransform:c}){return class{constructor(f={},p=i==null?void 0:i()){this.id=VA++,this.animationId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,this.nodes.forEach(_A),this.nodes.forEach(YA),this.nodes.forEach(qA),this.nodes.forEach(LA)},this.resolvedRelativeTargetAt=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=f,this.root=p?p.root||p:this,this.path=p?[...p.path,p]:[],this.parent=p,this.depth=p?p.depth+1:0;for(let d=0;d<this.path.length;d++)this.path[d].shouldResetTransform=!0;this.root===this&&(this.nodes=new vA)}addEventListener(f,p){return this.eventHandlers.has(f)||this.eventHandlers.set(f,new Xc),this.eventHandlers.get(f).add(p)}notifyListeners(f,...p){const d=this.eventHandlers.get(f);d&&d.notify(...p)}hasListeners(f){return this.eventHandlers.has(f)}mount(f){if(this.instance)return;this.isSVG=Xg(f)&&!CT(f),this.instance=f;const{layoutId:p,layout:d,visualElement:m}=this.options;if(m&&!m.current&&m.mount(f),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(d||p)&&(this.isLayoutDirty=!0),a){let g;const S=()=>this.root.updateBlockedByResize=!1;a(f,()=>{this.root.updateBlockedByResize=!0,g&&g(),g=SA(S,250),ou.hasAnimatedSinceResize&&(ou.hasAnimatedSinceResize=!1,this.nodes.forEach(Oy))})}p&&this.root.registerSharedNode(p,this),this.options.animate!==!1&&m&&(p||d)&&this.addEventListener("didUpdate",({delta:g,hasLayoutChanged:S,hasRelativeLayoutChanged:b,layout:R})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}const D=this.options.transition||m.getDefaultTransition()||QA,{onLayoutAnimationStart:w,onLayoutAnimationComplete:U}=m.getProps(),O=!this.targetLayout||!T0(this.targetLayout,R),j=!S&&b;if(this.options.layoutRoot||this.resumeFrom||j||S&&(O||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0),this.setAnimationOrigin(g,j);const _={...af(D,"layout"),onPlay:w,onComplete:U};(m.shouldReduceMotion||this.options.layoutRoot)&&(_.delay=0,_.type=!1),this.startAnimation(_)}else S||Oy(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=R})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const f=this.getStack();f&&f.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),Kn(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(GA),this.animationId++)}getTransformTemplate(){const{visualElement:f}=this.options;return f&&f.getProps().transformTemplate}willUpdate(f=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&E0(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let g=0;g<this.path.length;g++){const S=this.path[g];S.shouldResetTransform=!0,S.updateScroll("snapshot"),S.options.layoutRoot&&S.willUpdate(!1)}const{layoutId:p,layout:d}=this.options;if(p===void 0&&!d)return;const m=this.getTransformTemplate();this.prevTransformTemplateValue=m?m(this.latestValues,""):void 0,this.updateSnapshot(),f&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(Cy);return}this.isUpdating||this.nodes.forEach(jA),this.isUpdating=!1,this.nodes.forEach(HA),this.nodes.forEach(zA),this.nodes.forEach(UA),this.clearAllSnapshots();const p=fe.now();Wt.delta=yn(0,1e3/60,p-Wt.timestamp),Wt.timestamp=p,Wt.isProcessing=!0,ko.update.process(Wt),ko.preRender.process(Wt),ko.render.process(Wt),Wt.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,sf.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(BA),this.sharedNodes.forEach(XA)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Nt.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Nt.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!le(this.snapshot.measuredBox.x)&&!le(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let d=0;d<this.path.length;d++)this.path[d].updateScroll();const f=this.layout;this.layout=this.measure(!1),this.layoutCorrected=Bt(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:p}=this.options;p&&p.notify("LayoutMeasure",this.layout.layoutBox,f?f.layoutBox:void 0)}updateScroll(f="measure"){let p=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===f&&(p=!1),p&&this.instance){const d=u(this.instance);this.scroll={animationId:this.root.animationId,phase:f,isRoot:d,offset:s(this.instance),wasRoot:this.scroll?this.scroll.isRoot:d}}}resetTransform(){if(!c)return;const f=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,p=this.projectionDelta&&!x0(this.projectionDelta),d=this.getTransformTemplate(),m=d?d(this.latestValues,""):void 0,g=m!==this.prevTransformTemplateValue;f&&this.instance&&(p||da(this.latestValues)||g)&&(c(this.instance,m),this.shouldResetTransform=!1,this.scheduleRender())}measure(f=!0){const p=this.measurePageBox();let d=this.removeElementScroll(p);return f&&(d=this.removeTransform(d)),kA(d),{animationId:this.root.animationId,measuredBox:p,layoutBox:d,latestValues:{},source:this.id}}measurePageBox(){var m;const{visualElement:f}=this.options;if(!f)return Bt();const p=f.measureViewportBox();if(!(((m=this.scroll)==null?void 0:m.wasRoot)||this.path.some(PA))){const{scroll:g}=this.root;g&&(si(p.x,g.offset.x),si(p.y,g.offset.y))}return p}removeElementScroll(f){var d;const p=Bt();if(Ne(p,f),(d=this.scroll)!=null&&d.wasRoot)return p;for(let m=0;m<this.path.length;m++){const g=this.path[m],{scroll:S,options:b}=g;g!==this.root&&S&&b.layoutScroll&&(S.wasRoot&&Ne(p,f),si(p.x,S.offset.x),si(p.y,S.offset.y))}return p}applyTransform(f,p=!1){const d=Bt();Ne(d,f);for(let m=0;m<this.path.length;m++){const g=this.path[m];!p&&g.options.layoutScroll&&g.scroll&&g!==g.root&&ui(d,{x:-g.scroll.offset.x,y:-g.scroll.offset.y}),da(g.latestValues)&&ui(d,g.latestValues)}return da(this.latestValues)&&ui(d,this.latestValues),d}removeTransform(f){const p=Bt();Ne(p,f);for(let d=0;d<this.path.length;d++){const m=this.path[d];if(!m.instance||!da(m.latestValues))continue;Ec(m.latestValues)&&m.updateSnapshot();const g=Bt(),S=m.measurePageBox();Ne(g,S),Ey(p,m.latestValues,m.snapshot?m.snapshot.layoutBox:void 0,g)}return da(this.latestValues)&&Ey(p,this.latestValues),p}setTargetDelta(f){this.targetDelta=f,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(f){this.options={...this.options,...f,crossfade:f.crossfade!==void 0?f.crossfade:!0}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==Wt.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(f=!1){var b;const p=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=p.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=p.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=p.isSharedProjectionDirty);const d=!!this.resumingFrom||this!==p;if(!(f||d&&this.isSharedProjectionDirty||this.isProjectionDirty||(b=this.parent)!=null&&b.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;const{layout:g,layoutId:S}=this.options;if(!(!this.layout||!(g||S))){if(this.resolvedRelativeTargetAt=Wt.timestamp,!this.targetDelta&&!this.relativeTarget){const R=this.getClosestProjectingParent();R&&R.layout&&this.animationProgress!==1?(this.relativeParent=R,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Bt(),this.relativeTargetOrigin=Bt(),El(this.relativeTargetOrigin,this.layout.layoutBox,R.layout.layoutBox),Ne(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(!(!this.relativeTarget&&!this.targetDelta)&&(this.target||(this.target=Bt(),this.targetWithTransforms=Bt()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),FE(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Ne(this.target,this.layout.layoutBox),d0(this.target,this.targetDelta)):Ne(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget)){this.attemptToResolveRelativeTarget=!1;const R=this.getClosestProjectingParent();R&&!!R.resumingFrom==!!this.resumingFrom&&!R.options.layoutScroll&&R.target&&this.animationProgress!==1?(this.relativeParent=R,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Bt(),this.relativeTargetOrigin=Bt(),El(this.relativeTargetOrigin,this.target,R.target),Ne(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}}}getClosestProjectingParent(){if(!(!this.parent||Ec(this.parent.latestValues)||h0(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){var D;const f=this.getLead(),p=!!this.resumingFrom||this!==f;let d=!0;if((this.isProjectionDirty||(D=this.parent)!=null&&D.isProjectionDirty)&&(d=!1),p&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(d=!1),this.resolvedRelativeTargetAt===Wt.timestamp&&(d=!1),d)return;const{layout:m,layoutId:g}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(m||g))return;Ne(this.layoutCorrected,this.layout.layoutBox);const S=this.treeScale.x,b=this.treeScale.y;$E(this.layoutCorrected,this.treeScale,this.path,p),f.layout&&!f.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(f.target=f.layout.layoutBox,f.targetWithTransforms=Bt());const{target:R}=f;if(!R){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(by(this.prevProjectionDelta.x,this.projectionDelta.x),by(this.prevProjectionDelta.y,this.projectionDelta.y)),Tl(this.projectionDelta,this.layoutCorrected,R,this.latestValues),(this.treeScale.x!==S||this.treeScale.y!==b||!wy(this.projectionDelta.x,this.prevProjectionDelta.x)||!wy(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",R))}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(f=!0){var p;if((p=this.options.visualElement)==null||p.scheduleRender(),f){const d=this.getStack();d&&d.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=li(),this.projectionDelta=li(),this.projectionDeltaWithTransform=li()}setAnimationOrigin(f,p=!1){const d=this.snapshot,m=d?d.latestValues:{},g={...this.latestValues},S=li();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!p;const b=Bt(),R=d?d.source:void 0,D=this.layout?this.layout.source:void 0,w=R!==D,U=this.getStack(),O=!U||U.members.length<=1,j=!!(w&&!O&&this.options.crossfade===!0&&!this.path.some(ZA));this.animationProgress=0;let _;this.mixTargetDelta=Z=>{const q=Z/1e3;Ny(S.x,f.x,q),Ny(S.y,f.y,q),this.setTargetDelta(S),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(El(b,this.layout.layoutBox,this.relativeParent.layout.layoutBox),KA(this.relativeTarget,this.relativeTargetOrigin,b,q),_&&MA(this.relativeTarget,_)&&(this.isProjectionDirty=!1),_||(_=Bt()),Ne(_,this.relativeTarget)),w&&(this.animationValues=g,xA(g,m,this.latestValues,q,j,O)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=q},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(f){var p,d,m;this.notifyListeners("animationStart"),(p=this.currentAnimation)==null||p.stop(!1),(m=(d=this.resumingFrom)==null?void 0:d.currentAnimation)==null||m.stop(!1),this.pendingAnimation&&(Kn(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Nt.update(()=>{ou.hasAnimatedSinceResize=!0,this.motionValue||(this.motionValue=ri(0)),this.currentAnimation=yA(this.motionValue,[0,1e3],{...f,isSync:!0,onUpdate:g=>{this.mixTargetDelta(g),f.onUpdate&&f.onUpdate(g)},onStop:()=>{},onComplete:()=>{f.onComplete&&f.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const f=this.getStack();f&&f.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(NA),this.currentAnimation.stop(!1)),this.completeAnimation()}applyTransformsToTarget(){const f=this.getLead();let{targetWithTransforms:p,target:d,layout:m,latestValues:g}=f;if(!(!p||!d||!m)){if(this!==f&&this.layout&&m&&R0(this.options.animationType,this.layout.layoutBox,m.layoutBox)){d=this.target||Bt();const S=le(this.layout.layoutBox.x);d.x.min=f.target.x.min,d.x.max=d.x.min+S;const b=le(this.layout.layoutBox.y);d.y.min=f.target.y.min,d.y.max=d.y.min+b}Ne(p,d),ui(p,g),Tl(this.projectionDeltaWithTransform,this.layoutCorrected,p,g)}}registerSharedNode(f,p){this.sharedNodes.has(f)||this.sharedNodes.set(f,new wA),this.sharedNodes.get(f).add(p);const m=p.options.initialPromotionConfig;p.promote({transition:m?m.transition:void 0,preserveFollowOpacity:m&&m.shouldPreserveFollowOpacity?m.shouldPreserveFollowOpacity(p):void 0})}isLead(){const f=this.getStack();return f?f.lead===this:!0}getLead(){var p;const{layoutId:f}=this.options;return f?((p=this.getStack())==null?void 0:p.lead)||this:this}getPrevLead(){var p;const{layoutId:f}=this.options;return f?(p=this.getStack())==null?void 0:p.prevLead:void 0}getStack(){const{layoutId:f}=this.options;if(f)return this.root.sharedNodes.get(f)}promote({needsReset:f,transition:p,preserveFollowOpacity:d}={}){const m=this.getStack();m&&m.promote(this,d),f&&(this.projectionDelta=void 0,this.needsReset=!0),p&&this.setOptions({transition:p})}relegate(){const f=this.getStack();return f?f.relegate(this):!1}resetSkewAndRotation(){const{visualElement:f}=this.options;if(!f)return;let p=!1;const{latestValues:d}=f;if((d.z||d.rotate||d.rotateX||d.rotateY||d.rotateZ||d.skewX||d.skewY)&&(p=!0),!p)return;const m={};d.z&&nc("z",f,m,this.animationValues);for(let g=0;g<ec.length;g++)nc(`rotate${ec[g]}`,f,m,this.animationValues),nc(`skew${ec[g]}`,f,m,this.animationValues);f.render();for(const g in m)f.setStaticValue(g,m[g]),this.animationValues&&(this.animationValues[g]=m[g]);f.scheduleRender()}getProjectionStyles(f){if(!this.instance||this.isSVG)return;if(!this.isVisible)return OA;const p={visibility:""},d=this.getTransformTemplate();if(this.needsReset)return this.needsReset=!1,p.opacity="",p.pointerEvents=ru(f==null?void 0:f.pointerEvents)||"",p.transform=d?d(this.latestValues,""):"none",p;const m=this.getLead();if(!this.projectionDelta||!this.layout||!m.target){const R={};return this.options.layoutId&&(R.opacity=this.latestValues.opacity!==void 0?this.latestValues.opacity:1,R.pointerEvents=ru(f==null?void 0:f.pointerEvents)||""),this.hasProjected&&!da(this.latestValues)&&(R.transform=d?d({},""):"none",this.hasProjected=!1),R}const g=m.animationValues||m.latestValues;this.applyTransformsToTarget(),p.transform=CA(this.projectionDeltaWithTransform,this.treeScale,g),d&&(p.transform=d(g,p.transform));const{x:S,y:b}=this.projectionDelta;p.transformOrigin=`${S.origin*100}% ${b.origin*100}% 0`,m.animationValues?p.opacity=m===this?g.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:g.opacityExit:p.opacity=m===this?g.opacity!==void 0?g.opacity:"":g.opacityExit!==void 0?g.opacityExit:0;for(const R in Cl){if(g[R]===void 0)continue;const{correct:D,applyTo:w,isCSSVariable:U}=Cl[R],O=p.transform==="none"?g[R]:D(g[R],m);if(w){const j=w.length;for(let _=0;_<j;_++)p[w[_]]=O}else U?this.options.visualElement.renderState.vars[R]=O:p[R]=O}return this.options.layoutId&&(p.pointerEvents=m===this?ru(f==null?void 0:f.pointerEvents)||"":"none"),p}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(f=>{var p;return(p=f.currentAnimation)==null?void 0:p.stop(!1)}),this.root.nodes.forEach(Cy),this.root.sharedNodes.clear()}}}function zA(a){a.updateLayout()}function UA(a){var s;const i=((s=a.resumeFrom)==null?void 0:s.snapshot)||a.snapshot;if(a.isLead()&&a.layout&&i&&a.hasListeners("didUpdate")){const{layoutBox:u,measuredBox:c}=a.layout,{animationType:h}=a.options,f=i.source!==a.layout.source;h==="size"?Ve(S=>{const b=f?i.measuredBox[S]:i.layoutBox[S],R=le(b);b.min=u[S].min,b.max=b.min+R}):R0(h,i.layoutBox,u)&&Ve(S=>{const b=f?i.measuredBox[S]:i.layoutBox[S],R=le(u[S]);b.max=b.min+R,a.relativeTarget&&!a.currentAnimation&&(a.isProjectionDirty=!0,a.relativeTarget[S].max=a.relativeTarget[S].min+R)});const p=li();Tl(p,u,i.layoutBox);const d=li();f?Tl(d,a.applyTransform(c,!0),i.measuredBox):Tl(d,u,i.layoutBox);const m=!x0(p);let g=!1;if(!a.resumeFrom){const S=a.getClosestProjectingParent();if(S&&!S.resumeFrom){const{snapshot:b,layout:R}=S;if(b&&R){const D=Bt();El(D,i.layoutBox,b.layoutBox);const w=Bt();El(w,u,R.layoutBox),T0(D,w)||(g=!0),S.options.layoutRoot&&(a.relativeTarget=w,a.relativeTargetOrigin=D,a.relativeParent=S)}}}a.notifyListeners("didUpdate",{layout:u,snapshot:i,delta:d,layoutDelta:p,hasLayoutChanged:m,hasRelativeLayoutChanged:g})}else if(a.isLead()){const{onExitComplete:u}=a.options;u&&u()}a.options.transition=void 0}function _A(a){a.parent&&(a.isProjecting()||(a.isProjectionDirty=a.parent.isProjectionDirty),a.isSharedProjectionDirty||(a.isSharedProjectionDirty=!!(a.isProjectionDirty||a.parent.isProjectionDirty||a.parent.isSharedProjectionDirty)),a.isTransformDirty||(a.isTransformDirty=a.parent.isTransformDirty))}function LA(a){a.isProjectionDirty=a.isSharedProjectionDirty=a.isTransformDirty=!1}function BA(a){a.clearSnapshot()}function Cy(a){a.clearMeasurements()}function jA(a){a.isLayoutDirty=!1}function HA(a){const{visualElement:i}=a.options;i&&i.getProps().onBeforeLayoutMeasure&&i.notify("BeforeLayoutMeasure"),a.resetTransform()}function Oy(a){a.finishAnimation(),a.targetDelta=a.relativeTarget=a.target=void 0,a.isProjectionDirty=!0}function YA(a){a.resolveTargetDelta()}function qA(a){a.calcProjection()}function GA(a){a.resetSkewAndRotation()}function XA(a){a.removeLeadSnapshot()}function Ny(a,i,s){a.translate=Ot(i.translate,0,s),a.scale=Ot(i.scale,1,s),a.origin=i.origin,a.originPoint=i.originPoint}function Vy(a,i,s,u){a.min=Ot(i.min,s.min,u),a.max=Ot(i.max,s.max,u)}function KA(a,i,s,u){Vy(a.x,i.x,s.x,u),Vy(a.y,i.y,s.y,u)}function ZA(a){return a.animationValues&&a.animationValues.opacityExit!==void 0}const QA={duration:.45,ease:[.4,0,.1,1]},zy=a=>typeof navigator<"u"&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(a),Uy=zy("applewebkit/")&&!zy("chrome/")?Math.round:ze;function _y(a){a.min=Uy(a.min),a.max=Uy(a.max)}function kA(a){_y(a.x),_y(a.y)}function R0(a,i,s){return a==="position"||a==="preserve-aspect"&&!JE(My(i),My(s),.2)}function PA(a){var i;return a!==a.root&&((i=a.scroll)==null?void 0:i.wasRoot)}const JA=A0({attachResizeListener:(a,i)=>Nl(a,"resize",i),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),ac={current:void 0},D0=A0({measureScroll:a=>({x:a.scrollLeft,y:a.scrollTop}),defaultParent:()=>{if(!ac.current){const a=new JA({});a.mount(window),a.setOptions({layoutScroll:!0}),ac.current=a}return ac.current},resetTransform:(a,i)=>{a.style.transform=i!==void 0?i:"none"},checkIsScrollRoot:a=>window.getComputedStyle(a).position==="fixed"}),FA={pan:{Feature:hA},drag:{Feature:fA,ProjectionNode:D0,MeasureLayout:v0}};function Ly(a,i,s){const{props:u}=a;a.animationState&&u.whileHover&&a.animationState.setActive("whileHover",s==="Start");const c="onHover"+s,h=u[c];h&&Nt.postRender(()=>h(i,Bl(i)))}class $A extends kn{mount(){const{current:i}=this.node;i&&(this.unmount=AT(i,(s,u)=>(Ly(this.node,u,"Start"),c=>Ly(this.node,c,"End"))))}unmount(){}}class WA extends kn{constructor(){super(...arguments),this.isActive=!1}onFocus(){let i=!1;try{i=this.node.current.matches(":focus-visible")}catch{i=!0}!i||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Ul(Nl(this.node.current,"focus",()=>this.onFocus()),Nl(this.node.current,"blur",()=>this.onBlur()))}unmount(){}}function By(a,i,s){const{props:u}=a;if(a.current instanceof HTMLButtonElement&&a.current.disabled)return;a.animationState&&u.whileTap&&a.animationState.setActive("whileTap",s==="Start");const c="onTap"+(s==="End"?"":s),h=u[c];h&&Nt.postRender(()=>h(i,Bl(i)))}class IA extends kn{mount(){const{current:i}=this.node;i&&(this.unmount=wT(i,(s,u)=>(By(this.node,u,"Start"),(c,{success:h})=>By(this.node,c,h?"End":"Cancel")),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}}const Dc=new WeakMap,ic=new WeakMap,t2=a=>{const i=Dc.get(a.target);i&&i(a)},e2=a=>{a.forEach(t2)};function n2({root:a,...i}){const s=a||document;ic.has(s)||ic.set(s,{});const u=ic.get(s),c=JSON.stringify(i);return u[c]||(u[c]=new IntersectionObserver(e2,{root:a,...i})),u[c]}function a2(a,i,s){const u=n2(i);return Dc.set(a,s),u.observe(a),()=>{Dc.delete(a),u.unobserve(a)}}const i2={some:0,all:1};class l2 extends kn{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:i={}}=this.node.getProps(),{root:s,margin:u,amount:c="some",once:h}=i,f={root:s?s.current:void 0,rootMargin:u,threshold:typeof c=="number"?c:i2[c]},p=d=>{const{isIntersecting:m}=d;if(this.isInView===m||(this.isInView=m,h&&!m&&this.hasEnteredView))return;m&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",m);const{onViewportEnter:g,onViewportLeave:S}=this.node.getProps(),b=m?g:S;b&&b(d)};return a2(this.node.current,f,p)}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>"u")return;const{props:i,prevProps:s}=this.node;["amount","margin","root"].some(s2(i,s))&&this.startObserver()}unmount(){}}function s2({viewport:a={}},{viewport:i={}}={}){return s=>a[s]!==i[s]}const u2={inView:{Feature:l2},tap:{Feature:IA},focus:{Feature:WA},hover:{Feature:$A}},r2={layout:{ProjectionNode:D0,MeasureLayout:v0}},Mc={current:null},M0={current:!1};function o2(){if(M0.current=!0,!!jc)if(window.matchMedia){const a=window.matchMedia("(prefers-reduced-motion)"),i=()=>Mc.current=a.matches;a.addListener(i),i()}else Mc.current=!1}const c2=new WeakMap;function f2(a,i,s){for(const u in i){const c=i[u],h=s[u];if(ae(c))a.addValue(u,c);else if(ae(h))a.addValue(u,ri(c,{owner:a}));else if(h!==c)if(a.hasValue(u)){const f=a.getValue(u);f.liveStyle===!0?f.jump(c):f.hasAnimated||f.set(c)}else{const f=a.getStaticValue(u);a.addValue(u,ri(f!==void 0?f:c,{owner:a}))}}for(const u in s)i[u]===void 0&&a.removeValue(u);return i}const jy=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"];class h2{scrapeMotionValuesFromProps(i,s,u){return{}}constructor({parent:i,props:s,presenceContext:u,reducedMotionConfig:c,blockInitialAnimation:h,visualState:f},p={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=ef,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{const b=fe.now();this.renderScheduledAt<b&&(this.renderScheduledAt=b,Nt.render(this.render,!1,!0))};const{latestValues:d,renderState:m}=f;this.latestValues=d,this.baseTarget={...d},this.initialValues=s.initial?{...d}:{},this.renderState=m,this.parent=i,this.props=s,this.presenceContext=u,this.depth=i?i.depth+1:0,this.reducedMotionConfig=c,this.options=p,this.blockInitialAnimation=!!h,this.isControllingVariants=Tu(s),this.isVariantNode=Pg(s),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(i&&i.current);const{willChange:g,...S}=this.scrapeMotionValuesFromProps(s,{},this);for(const b in S){const R=S[b];d[b]!==void 0&&ae(R)&&R.set(d[b],!1)}}mount(i){this.current=i,c2.set(i,this),this.projection&&!this.projection.instance&&this.projection.mount(i),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((s,u)=>this.bindToMotionValue(u,s)),M0.current||o2(),this.shouldReduceMotion=this.reducedMotionConfig==="never"?!1:this.reducedMotionConfig==="always"?!0:Mc.current,this.parent&&this.parent.children.add(this),this.update(this.props,this.presenceContext)}unmount(){this.projection&&this.projection.unmount(),Kn(this.notifyUpdate),Kn(this.render),this.valueSubscriptions.forEach(i=>i()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent&&this.parent.children.delete(this);for(const i in this.events)this.events[i].clear();for(const i in this.features){const s=this.features[i];s&&(s.unmount(),s.isMounted=!1)}this.current=null}bindToMotionValue(i,s){this.valueSubscriptions.has(i)&&this.valueSubscriptions.get(i)();const u=pi.has(i);u&&this.onBindTransform&&this.onBindTransform();const c=s.on("change",p=>{this.latestValues[i]=p,this.props.onUpdate&&Nt.preRender(this.notifyUpdate),u&&this.projection&&(this.projection.isTransformDirty=!0)}),h=s.on("renderRequest",this.scheduleRender);let f;window.MotionCheckAppearSync&&(f=window.MotionCheckAppearSync(this,i,s)),this.valueSubscriptions.set(i,()=>{c(),h(),f&&f(),s.owner&&s.stop()})}sortNodePosition(i){return!this.current||!this.sortInstanceNodePosition||this.type!==i.type?0:this.sortInstanceNodePosition(this.current,i.current)}updateFeatures(){let i="animation";for(i in oi){const s=oi[i];if(!s)continue;const{isEnabled:u,Feature:c}=s;if(!this.features[i]&&c&&u(this.props)&&(this.features[i]=new c(this)),this.features[i]){const h=this.features[i];h.isMounted?h.update():(h.mount(),h.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):Bt()}getStaticValue(i){return this.latestValues[i]}setStaticValue(i,s){this.latestValues[i]=s}update(i,s){(i.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=i,this.prevPresenceContext=this.presenceContext,this.presenceContext=s;for(let u=0;u<jy.length;u++){const c=jy[u];this.propEventSubscriptions[c]&&(this.propEventSubscriptions[c](),delete this.propEventSubscriptions[c]);const h="on"+c,f=i[h];f&&(this.propEventSubscriptions[c]=this.on(c,f))}this.prevMotionValues=f2(this,this.scrapeMotionValuesFromProps(i,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(i){return this.props.variants?this.props.variants[i]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(i){const s=this.getClosestVariantNode();if(s)return s.variantChildren&&s.variantChildren.add(i),()=>s.variantChildren.delete(i)}addValue(i,s){const u=this.values.get(i);s!==u&&(u&&this.removeValue(i),this.bindToMotionValue(i,s),this.values.set(i,s),this.latestValues[i]=s.get())}removeValue(i){this.values.delete(i);const s=this.valueSubscriptions.get(i);s&&(s(),this.valueSubscriptions.delete(i)),delete this.latestValues[i],this.removeValueFromRenderState(i,this.renderState)}hasValue(i){return this.values.has(i)}getValue(i,s){if(this.props.values&&this.props.values[i])return this.props.values[i];let u=this.values.get(i);return u===void 0&&s!==void 0&&(u=ri(s===null?void 0:s,{owner:this}),this.addValue(i,u)),u}readValue(i,s){let u=this.latestValues[i]!==void 0||!this.current?this.latestValues[i]:this.getBaseTargetFromProps(this.props,i)??this.readValueFromInstance(this.current,i,this.options);return u!=null&&(typeof u=="string"&&(eg(u)||ag(u))?u=parseFloat(u):!NT(u)&&Zn.test(s)&&(u=jg(i,s)),this.setBaseTarget(i,ae(u)?u.get():u)),ae(u)?u.get():u}setBaseTarget(i,s){this.baseTarget[i]=s}getBaseTarget(i){var h;const{initial:s}=this.props;let u;if(typeof s=="string"||typeof s=="object"){const f=pf(this.props,s,(h=this.presenceContext)==null?void 0:h.custom);f&&(u=f[i])}if(s&&u!==void 0)return u;const c=this.getBaseTargetFromProps(this.props,i);return c!==void 0&&!ae(c)?c:this.initialValues[i]!==void 0&&u===void 0?void 0:this.baseTarget[i]}on(i,s){return this.events[i]||(this.events[i]=new Xc),this.events[i].add(s)}notify(i,...s){this.events[i]&&this.events[i].notify(...s)}}class w0 extends h2{constructor(){super(...arguments),this.KeyframeResolver=ST}sortInstanceNodePosition(i,s){return i.compareDocumentPosition(s)&2?1:-1}getBaseTargetFromProps(i,s){return i.style?i.style[s]:void 0}removeValueFromRenderState(i,{vars:s,style:u}){delete s[i],delete u[i]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:i}=this.props;ae(i)&&(this.childSubscription=i.on("change",s=>{this.current&&(this.current.textContent=`${s}`)}))}}function C0(a,{style:i,vars:s},u,c){Object.assign(a.style,i,c&&c.getProjectionStyles(u));for(const h in s)a.style.setProperty(h,s[h])}function d2(a){return window.getComputedStyle(a)}class m2 extends w0{constructor(){super(...arguments),this.type="html",this.renderInstance=C0}readValueFromInstance(i,s){var u;if(pi.has(s))return(u=this.projection)!=null&&u.isProjecting?mc(s):jx(i,s);{const c=d2(i),h=(Qc(s)?c.getPropertyValue(s):c[s])||0;return typeof h=="string"?h.trim():h}}measureInstanceViewportBox(i,{transformPagePoint:s}){return m0(i,s)}build(i,s,u){hf(i,s,u.transformTemplate)}scrapeMotionValuesFromProps(i,s,u){return yf(i,s,u)}}const O0=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function p2(a,i,s,u){C0(a,i,void 0,u);for(const c in i.attrs)a.setAttribute(O0.has(c)?c:ff(c),i.attrs[c])}class y2 extends w0{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1,this.measureInstanceViewportBox=Bt}getBaseTargetFromProps(i,s){return i[s]}readValueFromInstance(i,s){if(pi.has(s)){const u=Bg(s);return u&&u.default||0}return s=O0.has(s)?s:ff(s),i.getAttribute(s)}scrapeMotionValuesFromProps(i,s,u){return i0(i,s,u)}build(i,s,u){t0(i,s,this.isSVGTag,u.transformTemplate,u.style)}renderInstance(i,s,u,c){p2(i,s,u,c)}mount(i){this.isSVGTag=n0(i.tagName),super.mount(i)}}const g2=(a,i)=>mf(a)?new y2(i):new m2(i,{allowProjection:a!==E.Fragment}),v2=pE({...qE,...u2,...FA,...r2},g2),At=YT(v2);function S2(...a){const i=E.useRef(0),[s,u]=E.useState(a[i.current]),c=E.useCallback(h=>{i.current=typeof h!="number"?Lb(0,a.length,i.current+1):h,u(a[i.current])},[a.length,...a]);return[s,c]}const N0=()=>({userName:localStorage.getItem("userName")}),b2=a=>{localStorage.setItem("userName",a)},x2=({onLoginSuccess:a})=>{const[i,s]=E.useState(""),[u,c]=E.useState(!1),h=gu(),f=async()=>{alert("This service is not available.")},p=async d=>{d.preventDefault(),c(!0),setTimeout(()=>{b2(i),a(i),h("/dashboard")},500)};return G.jsx("div",{className:"min-h-screen bg-gradient-to-b from-gray-900 to-gray-800 flex items-center justify-center px-4",children:G.jsxs(At.div,{initial:{opacity:0,y:30},animate:{opacity:1,y:0},transition:{duration:.6,ease:"easeOut"},className:"w-full text-center max-w-md p-8 bg-white/5 backdrop-blur-lg rounded-2xl shadow-2xl",children:[G.jsx(At.h1,{initial:{scale:.8,opacity:0},animate:{scale:1,opacity:1},transition:{delay:.3,duration:.5},className:"text-4xl md:text-5xl font-extrabold text-center bg-gradient-to-r from-indigo-400 to-purple-500 bg-clip-text text-transparent mb-10 tracking-tight",children:"Short Cutter"}),G.jsxs(At.button,{whileHover:{scale:1.05},whileTap:{scale:.95},onClick:f,disabled:u,className:`w-full py-3 px-6 bg-white text-gray-800 font-semibold text-lg rounded-xl shadow-md hover:shadow-xl transition-all flex items-center justify-center gap-3
-        ${u?"opacity-70 cursor-not-allowed":"cursor-pointer"}
-        `,children:[G.jsx("img",{src:"https://upload.wikimedia.org/wikipedia/commons/c/c1/Google_%22G%22_logo.svg",alt:"Google logo",className:"w-5 h-5"}),"Sign in with Google"]}),G.jsxs("div",{className:"flex items-center my-6",children:[G.jsx("div",{className:"flex-grow h-px bg-gray-700"}),G.jsx("span",{className:"px-4 text-gray-400",children:"OR"}),G.jsx("div",{className:"flex-grow h-px bg-gray-700"})]}),G.jsxs(At.form,{onSubmit:p,initial:{opacity:0,y:10},animate:{opacity:1,y:0},transition:{delay:.5},className:"space-y-6",children:[G.jsx(At.input,{whileFocus:{scale:1.02},type:"userName",placeholder:"What do we call you ?",value:i,required:!0,onChange:d=>s(d.target.value),className:"w-full px-5 py-4 rounded-xl bg-gray-800 text-white placeholder-gray-400 border border-gray-700 focus:outline-none focus:ring-2 focus:ring-indigo-500 transition-all"}),G.jsx(At.button,{whileHover:{scale:1.05},whileTap:{scale:.95},type:"submit",className:`w-full py-3 px-6 bg-gradient-to-r from-indigo-500 to-purple-600 rounded-xl text-white font-semibold text-lg shadow-lg hover:from-indigo-600 hover:to-purple-700 transition-all duration-300
-          ${u?"cursor-not-allowed opacity-70":"cursor-pointer"}
-        `,disabled:u,children:u?"Getting In...":"Let's Go!"})]})]})})},T2=a=>{try{if(!confirm("Are you sure, you want to log out?"))return;localStorage.removeItem("userName"),localStorage.removeItem("responseMsg"),localStorage.removeItem("progressError"),a("/")}catch(i){console.error("Logout error:",i)}},E2=({darkMode:a,onChange:i})=>{const[s,u]=E.useState({clipCount:4,maxDuration:40,quality:720,cache:!0,highlightKeyword:""}),c=`w-full h-14 px-4 py-2 rounded-xl border focus:outline-none transition-all duration-200 ${a?"bg-gray-800/50 border-gray-700 text-white placeholder-gray-400 focus:border-blue-500":"bg-white/50 border-gray-200 text-gray-900 placeholder-gray-500 focus:border-blue-500"}`;E.useEffect(()=>{i(s)},[s,i]);const h=(f,p)=>{u(d=>({...d,[f]:p}))};return G.jsxs(At.div,{initial:{opacity:0,y:10},animate:{opacity:1,y:0},className:`grid grid-cols-1 p-4 md:grid-cols-2 gap-4 w-full rounded-2xl shadow-md 
-        ${a?"text-gray-50":""}`,children:[G.jsxs("div",{className:"flex flex-col",children:[G.jsx("label",{className:"mb-1 px-2 font-medium text-sm",children:"Number of Clips (1-10)"}),G.jsx(At.input,{whileFocus:{scale:1.01},type:"number",min:1,max:10,value:s.clipCount,onChange:f=>h("clipCount",Number(f.target.value)),className:c})]}),G.jsxs("div",{className:"flex flex-col",children:[G.jsx("label",{className:"mb-1 px-2 font-medium text-sm",children:"Clip Duration (10-100)"}),G.jsx(At.input,{whileFocus:{scale:1.01},type:"number",min:10,max:100,value:s.maxDuration,onChange:f=>h("maxDuration",Number(f.target.value)),className:c})]}),G.jsxs("div",{className:"flex flex-col",children:[G.jsx("label",{className:"mb-1 px-2 font-medium text-sm",children:"Select Quality"}),G.jsxs(At.select,{whileFocus:{scale:1.01},value:s.quality,onChange:f=>h("quality",Number(f.target.value)),className:`${c} cursor-pointer`,children:[G.jsx("option",{value:480,children:"480p"}),G.jsx("option",{value:720,children:"720p"}),G.jsx("option",{value:1080,children:"1080p"}),G.jsx("option",{value:1440,children:"1440p / 2K"})]})]}),G.jsxs("div",{className:"w-full flex flex-col justify-end",children:[G.jsx("label",{className:"mb-1 px-2 font-medium text-sm",children:"Keyword (optional)"}),G.jsx(At.input,{whileFocus:{scale:1.01},type:"text",placeholder:"e.g., funny, educational, motivational",value:s.highlightKeyword,onChange:f=>h("highlightKeyword",f.target.value),className:c})]}),G.jsxs("div",{className:"flex px-2 items-center space-x-3 md:col-span-2 pt-2",children:[G.jsx("input",{type:"checkbox",checked:s.cache,onChange:f=>h("cache",f.target.checked),className:"w-5 h-5 cursor-pointer"}),G.jsx("label",{className:"text-sm font-medium",children:"Do you want cached result?"})]})]})},A2=()=>G.jsx("div",{className:"flex items-center justify-center h-[10vh]",children:G.jsx("div",{className:"w-12 h-12 border-4 border-blue-500 border-dashed rounded-full animate-spin"})}),R2=({darkMode:a,loading:i})=>{const[s,u]=E.useState(window.scrollY+window.innerHeight/2),[c,h]=E.useState(!1),[f,p]=E.useState([]),[d,m]=E.useState(()=>{const w=localStorage.getItem("yt-logs");return w?JSON.parse(w):[]}),g=E.useRef(null),S=E.useRef(null),b=E.useRef(null);E.useEffect(()=>{S.current&&S.current.scrollTo({top:S.current.scrollHeight,behavior:"smooth"})},[f]),E.useEffect(()=>{if(!c)return;const w=setTimeout(()=>{g.current&&g.current.scrollTo({top:g.current.scrollHeight,behavior:"smooth"})},300);return()=>clearTimeout(w)},[c,d]),E.useEffect(()=>{function w(){u(window.scrollY+window.innerHeight/2)}return window.addEventListener("scroll",w),window.addEventListener("resize",w),w(),()=>{window.removeEventListener("scroll",w),window.removeEventListener("resize",w)}},[]),E.useEffect(()=>{function w(U){const O=U.target;g.current&&!g.current.contains(O)&&b.current&&!b.current.contains(O)&&h(!1)}return c&&document.addEventListener("mousedown",w),()=>{document.removeEventListener("mousedown",w)}},[c]),E.useEffect(()=>{if(!i)return p([]);const w=new EventSource("/api/events");return w.onmessage=U=>{const j=`[${new Date().toLocaleTimeString()}] ${U.data}`;p(_=>[..._,U.data+`
-`]),m(_=>{const Z=[..._,j+`
-`];return localStorage.setItem("yt-logs",JSON.stringify(Z)),Z})},w.onerror=()=>{const U="[ERROR] SSE connection lost.";console.error("❌",U),p(O=>[...O,U]),m(O=>{const j=[...O,U];return localStorage.setItem("yt-logs",JSON.stringify(j)),j}),w.close()},()=>{w.close(),p([])}},[i]);const R=()=>{confirm("Are you sure you want to clear all logs?")&&(m([]),localStorage.removeItem("yt-logs"))},D=w=>w.includes("[INFO]")?"text-blue-400":w.includes("[WARN]")?"text-yellow-400":w.includes("[ERROR]")?"text-red-500":w.includes("[DONE]")?"text-green-500":w.includes("[PROGRESS]")?"text-green-300":w.includes("[FALLBACK]")?"text-orange-400":w.includes("[DEV]")?"text-purple-600":a?"text-gray-300":"text-gray-700";return G.jsxs(G.Fragment,{children:[G.jsx("div",{className:"w-full flex justify-end",children:G.jsx(At.button,{ref:b,onClick:()=>h(w=>!w),whileHover:{scale:1.05},className:"px-4 py-2 cursor-pointer bg-blue-600 text-white rounded-lg shadow-lg z-50",children:c?"Hide Logs":"Show Logs"})}),G.jsx(Zg,{children:c&&G.jsxs(At.div,{initial:{opacity:0,scale:.95},animate:{opacity:1,scale:1},exit:{opacity:0,scale:.95},transition:{duration:.2},style:{top:s},className:`absolute left-1/2 transform -translate-x-1/2 -translate-y-1/2 
-        w-full max-w-md max-h-[60vh] rounded-xl shadow-2xl z-50 border
-        ${a?"bg-gray-900 text-white border-gray-700":"bg-white text-gray-800 border-gray-300"}`,children:[G.jsxs("div",{className:"flex justify-between items-center px-4 pt-3 pb-2 border-b text-sm font-semibold sticky top-0 z-10 bg-inherit",children:[G.jsx("span",{children:"Logs"}),G.jsx("button",{onClick:R,className:`text-xs cursor-pointer hover:underline ${a?"text-red-400":"text-red-600"}`,children:"Clear"})]}),G.jsx("div",{ref:g,className:"px-4 py-3 space-y-2 text-sm font-mono truncate overflow-y-auto max-h-[50vh]",children:d.length>0?d.map((w,U)=>G.jsx("pre",{className:`whitespace-pre-wrap ${D(w)}`,children:w},U)):G.jsx("p",{className:`italic ${a?"text-gray-400":"text-gray-600"}`,children:"No logs yet."})})]})}),f.length>0&&G.jsx("div",{ref:S,className:`${a?"bg-gray-800/50 text-gray-200":"bg-white/50 text-gray-800"} p-4 mt-4 max-h-60 overflow-auto rounded-xl font-mono text-sm whitespace-pre-wrap`,children:f.map((w,U)=>G.jsx("span",{className:D(w),children:w},U))})]})},D2=({error:a,darkMode:i,responseMsg:s,loading:u})=>G.jsxs(Zg,{children:[G.jsxs(At.div,{initial:{opacity:0,y:20},animate:{opacity:1,y:0},className:"mt-6",children:[a&&G.jsx("div",{className:`p-4 rounded-xl mb-4 ${i?"bg-gray-800/50":"bg-white/50"}`,children:G.jsx("p",{className:"text-green-500 whitespace-pre-wrap",children:a})}),G.jsx(R2,{darkMode:i,loading:u})]}),u&&G.jsx(At.div,{initial:{opacity:0},animate:{opacity:1},exit:{opacity:0},className:"mt-8",children:G.jsx(A2,{})}),a&&G.jsxs(At.div,{initial:{opacity:0,y:20},animate:{opacity:1,y:0},className:"mt-4 space-y-6",children:[s&&"videos"in s&&G.jsxs(At.div,{initial:{opacity:0},animate:{opacity:1},className:`p-6 rounded-xl ${i?"bg-gray-800/50":"bg-white/50"}`,children:[G.jsxs("h3",{className:"text-lg text-gray-50 font-semibold mb-4",children:["Long press to download clips:"," "]}),G.jsx("div",{className:"flex flex-wrap gap-4 overflow-y-auto px-1",children:s.videos.map((c,h)=>{var p;const f=(p=s.timestamp)==null?void 0:p[h];return G.jsxs("div",{className:"flex-[1_1_250px] text-white shrink-0 space-y-4",children:[G.jsxs("video",{controls:!0,className:"w-full rounded-lg h-[60vh] object-cover",children:[G.jsx("source",{src:c,type:"video/mp4"}),"Your browser does not support the video tag."]}),G.jsxs("div",{className:`p-4 rounded-lg ${i?"bg-gray-700":"bg-gray-100"}`,children:[G.jsx("h4",{className:"text-base font-semibold",children:f==null?void 0:f.title}),G.jsx("p",{className:"text-sm italic text-gray-400",children:f==null?void 0:f.mood}),G.jsx("p",{className:"text-sm text-gray-200",children:f==null?void 0:f.description}),(f==null?void 0:f.tags)&&G.jsx("div",{className:"mt-2 flex flex-wrap gap-1",children:f.tags.map((d,m)=>G.jsx("span",{className:"px-2 py-1 text-xs bg-blue-100 text-blue-700 rounded-full",children:d},m))}),(f==null?void 0:f.hook)&&G.jsxs("p",{className:"mt-2 text-sm font-medium text-indigo-500",children:["Hook: ",f.hook]})]}),G.jsx("a",{href:`data:text/json;charset=utf-8,${encodeURIComponent(JSON.stringify(f,null,2))}`,download:`clip_${h+1}_meta.json`,className:"text-sm text-blue-600 underline",children:"Download Clip Metadata"})]},h)})})]}),s&&"status"in s&&s.status!=="error"&&G.jsxs(At.div,{initial:{opacity:0},animate:{opacity:1},className:`p-6 rounded-xl ${i?"bg-gray-800/50":"bg-white/50"}`,children:[G.jsx("h3",{className:"text-yellow-500 font-bold mb-2",children:"Fallback mode triggered"}),G.jsx("pre",{className:"whitespace-pre-wrap text-sm text-gray-300",children:s.content})]})]})]});function M2(){const[a,i]=E.useState(""),[s,u]=E.useState(""),[c,h]=E.useState(null),[f,p]=E.useState(!1),[d,m]=E.useState(!0),{userName:g}=N0(),S=gu(),[b,R]=E.useState(localStorage.getItem("progressError")),[D,w]=E.useState(()=>{const _=localStorage.getItem("responseMsg");return _?JSON.parse(_):null}),U=_=>{h(_)},O=_=>/^(https?:\/\/)?(www\.)?(youtube\.com\/(watch\?v=|shorts\/)|youtu\.be\/)[\w-]{11}/.test(_.trim()),j=async _=>{if(_.preventDefault(),s){alert("Fix errors before submitting.");return}if(!(D&&!confirm("Are you sure ?"))){localStorage.removeItem("yt-logs"),p(!0),R("Fetching data..."),w(null),i(a.trim());try{const Z=await fetch("/api/process",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({youtube_url:a,quality:c==null?void 0:c.quality,locally_cached:c==null?void 0:c.cache,keywords:c==null?void 0:c.highlightKeyword,clip_count:Math.min((c==null?void 0:c.clipCount)||4,10),clip_duration:Math.min((c==null?void 0:c.maxDuration)||40,100)})}),q=await Z.json();if(!Z.ok){const P=q.message||q.error||"Unknown error occurred.";throw new Error(P)}w(q),R(`Data fetched successfully 🔰
-Total time taken by the server to respond: ${q.time_taken}`),localStorage.setItem("responseMsg",JSON.stringify(q)),localStorage.setItem("progressError",`Here is your cached Data 🔰
-NOTE: If videos are not playable servers might be down`)}catch(Z){R("Error: "+(Z instanceof Error?Z.message:String(Z)))}finally{p(!1)}}};return G.jsx("div",{className:`${d?"bg-gradient-to-br from-gray-900 to-gray-800":"bg-gradient-to-br from-white to-gray-100"} min-h-screen p-4 md:p-8 transition-all duration-500 ease-in-out`,children:G.jsx(At.div,{initial:{opacity:0,y:20},animate:{opacity:1,y:0},className:"max-w-4xl mx-auto",children:G.jsxs("div",{className:"backdrop-blur-md bg-white/10 p-6 md:p-8 rounded-2xl shadow-2xl",children:[G.jsxs("div",{className:"flex flex-col md:flex-row justify-between items-center mb-8 gap-4",children:[G.jsxs(At.h1,{initial:{x:-20},animate:{x:0},className:"leading-relaxed text-3xl md:text-4xl font-bold bg-gradient-to-r from-blue-500 to-purple-600 bg-clip-text text-transparent",children:["Hey, ",g||"Buddy","!"]}),G.jsx(At.button,{whileHover:{scale:1.05},whileTap:{scale:.95},onClick:()=>m(!d),className:`px-4 py-2 rounded-full cursor-pointer text-sm font-medium transition-all duration-300 ${d?"bg-gradient-to-r from-yellow-400 to-orange-500 text-gray-900":"bg-gradient-to-r from-gray-800 to-gray-900 text-white"}`,children:d?"Switch to Light":"Switch to Dark"}),G.jsx(At.button,{whileHover:{scale:1.05},whileTap:{scale:.95},onClick:async()=>T2(S),className:"px-4 py-2 rounded-full cursor-pointer text-sm font-medium bg-gradient-to-r from-red-500 to-pink-600 text-white shadow-md hover:from-red-600 hover:to-pink-700 transition-all duration-300",children:"Logout"})]}),G.jsxs(At.form,{onSubmit:j,className:"space-y-6 ",children:[G.jsxs("div",{className:"relative",children:[G.jsx(At.input,{whileFocus:{scale:1.01},transition:{type:"spring",stiffness:300},type:"text",placeholder:"Paste YouTube URL here...",value:a,onChange:_=>i(_.target.value),onBlur:_=>{const Z=_.target.value;O(Z)?u(""):u("Please enter a valid YouTube URL.")},className:`w-full p-4 rounded-xl border focus:outline-none transition-all duration-200 ${s?"border-red-500 text-white":d?"bg-gray-800/50 border-gray-700 text-white placeholder-gray-400 focus:border-blue-500":"bg-white/50 border-gray-200 text-gray-900 placeholder-gray-500 focus:border-blue-500"}`,required:!0}),s&&G.jsx("p",{className:"mt-1 text-sm text-red-500",children:s})]}),G.jsx(E2,{darkMode:d,onChange:U}),G.jsx(At.button,{whileHover:{scale:1.02},whileTap:{scale:.98},type:"submit",disabled:f,className:"w-full md:w-auto cursor-pointer px-8 py-3 bg-gradient-to-r from-blue-600 to-indigo-600 text-white rounded-xl font-medium hover:from-blue-700 hover:to-indigo-700 transition-all duration-300 disabled:opacity-50",children:f?"Processing...":"Download"})]}),G.jsx(D2,{error:b,darkMode:d,responseMsg:D,loading:f})]})})})}const w2=()=>{const[a,i]=S2("",".","..","..."),s=[{text:"> Booting system...",color:"text-indigo-400"},{text:"> Initializing Short Cutter engine...",color:"text-purple-400"},{text:"> Establishing shortcut protocols...",color:"text-indigo-300"},{text:"✔️ System ready.",color:"text-green-400"}];return E.useEffect(()=>{const u=setInterval(()=>{i()},300);return()=>clearInterval(u)},[i]),G.jsx("div",{className:"h-screen overflow-hidden flex flex-col items-center justify-center px-6 bg-gradient-to-b from-gray-900 to-gray-800 font-mono select-none",children:G.jsxs("div",{className:"w-full max-w-md flex flex-col space-y-1 mb-10",children:[s.map(({text:u,color:c},h)=>G.jsx(At.div,{initial:{opacity:0,x:-20},animate:{opacity:1,x:0},transition:{delay:h*.2,duration:.2,ease:"easeOut"},className:`whitespace-pre ${c} text-base md:text-lg font-semibold`,children:u},h)),G.jsxs(At.div,{initial:{opacity:0,y:10},animate:{opacity:1,y:0},transition:{delay:.2+s.length*.2,duration:.3,ease:"easeOut"},className:"text-lg md:text-xl lg:text-2xl font-extrabold bg-gradient-to-r from-indigo-400 to-purple-600 bg-clip-text text-transparent tracking-tight mt-4",children:["Getting things done faster",a]})]})})};function C2(){const[a,i]=E.useState(!0),[s,u]=E.useState(null);return E.useEffect(()=>{const c=setTimeout(()=>{i(!1)},2e3);return()=>clearTimeout(c)},[]),E.useEffect(()=>{const c=N0().userName;u(c)},[]),a?G.jsx(w2,{}):G.jsx(Rb,{children:G.jsxs(eb,{children:[G.jsx(sc,{path:"/",element:G.jsx(x2,{onLoginSuccess:u})}),G.jsx(sc,{path:"/dashboard",element:s?G.jsx(M2,{}):G.jsx(IS,{to:"/"})})]})})}oS.createRoot(document.getElementById("root")).render(G.jsx(E.StrictMode,{children:G.jsx(C2,{})}));
@@ -8,7 +8,12 @@ const ResponseMessage = ({
   darkMode,
   responseMsg,
   loading,
+  jobId,
+  renders,
 }: ResponseMsgProps) => {
+  // Until the job's result arrives, play whatever is ready of each clip
+  const ready = responseMsg ? [] : renders.filter((render) => render.url || render.preview_url);
+
   return (
     <AnimatePresence>
       <motion.div
@@ -25,8 +30,46 @@ const ResponseMessage = ({
             <p className="text-green-500 whitespace-pre-wrap">{error}</p>
           </div>
         )}
-        <SSEConsole darkMode={darkMode} loading={loading} />
+        <SSEConsole darkMode={darkMode} loading={loading} jobId={jobId} />
       </motion.div>
+      {ready.length > 0 && (
+        <motion.div
+          initial={{ opacity: 0 }}
+          animate={{ opacity: 1 }}
+          className={`mt-4 p-6 rounded-xl ${
+            darkMode ? "bg-gray-800/50" : "bg-white/50"
+          }`}
+        >
+          <h3 className="text-lg text-gray-50 font-semibold mb-4">
+            Clips ready so far:{" "}
+          </h3>
+          <div className="flex flex-wrap gap-4 overflow-y-auto px-1">
+            {ready.map((render) => {
+              const src = render.url || render.preview_url;
+              return (
+                <div
+                  key={render.index}
+                  className="flex-[1_1_250px] text-white shrink-0 space-y-2"
+                >
+                  {/* Keyed by source, the full render swaps in for the preview */}
+                  <video
+                    key={src}
+                    controls
+                    className="w-full rounded-lg h-[60vh] object-cover"
+                  >
+                    <source src={src} type="video/mp4" />
+                    Your browser does not support the video tag.
+                  </video>
+                  <p className="text-sm text-gray-400">
+                    Clip {render.index}
+                    {render.url ? "" : " (preview, full quality follows)"}
+                  </p>
+                </div>
+              );
+            })}
+          </div>
+        </motion.div>
+      )}
       {loading && (
         <motion.div
           initial={{ opacity: 0 }}
@@ -3,7 +3,7 @@ import { useEffect, useRef, useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import type { SSEConsoleProps } from "../utils/types";
 
-const SSEConsole = ({ darkMode, loading }: SSEConsoleProps) => {
+const SSEConsole = ({ darkMode, loading, jobId }: SSEConsoleProps) => {
   const [topPosition, setTopPosition] = useState(
     window.scrollY + window.innerHeight / 2
   );
@@ -83,8 +83,12 @@ const SSEConsole = ({ darkMode, loading }: SSEConsoleProps) => {
 
   useEffect(() => {
     if (!loading) return setLatestMessages([]);
+    if (!jobId) return;
 
-    const eventSource = new EventSource(`/api/events`);
+    // Each job has its own channel, the browser resumes it with Last-Event-ID
+    const eventSource = new EventSource(`/api/events/${jobId}`);
+
+    eventSource.addEventListener("end", () => eventSource.close());
 
     eventSource.onmessage = (event) => {
       const timestamp = new Date().toLocaleTimeString();
@@ -99,6 +103,9 @@ const SSEConsole = ({ darkMode, loading }: SSEConsoleProps) => {
     };
 
     eventSource.onerror = () => {
+      // Let the browser retry while it is still reconnecting
+      if (eventSource.readyState === EventSource.CONNECTING) return;
+
       const errorMsg = "[ERROR] SSE connection lost.";
       console.error("❌", errorMsg);
 
@@ -115,7 +122,7 @@ const SSEConsole = ({ darkMode, loading }: SSEConsoleProps) => {
       eventSource.close();
       setLatestMessages([]);
     };
-  }, [loading]);
+  }, [loading, jobId]);
 
   const clearLogs = () => {
     const result = confirm("Are you sure you want to clear all logs?");
@@ -4,7 +4,7 @@ import { motion } from "framer-motion";
 import { logout } from "../utils/logout";
 import FormInputs from "../components/InputHandler";
 import ResponseMessage from "../components/ResponseMsg";
-import type { ResponseData } from "../utils/types";
+import type { ClipRender, ResponseData } from "../utils/types";
 import type { FormValues } from "../utils/types";
 import { getUserInfo } from "../utils/userInfo";
 import { useNavigate } from "react-router-dom";
@@ -14,6 +14,8 @@ function Dashboard() {
   const [urlError, setUrlError] = useState("");
   const [formValues, setFormValues] = useState<FormValues | null>(null);
   const [loading, setLoading] = useState(false);
+  const [jobId, setJobId] = useState<string | null>(null);
+  const [renders, setRenders] = useState<ClipRender[]>([]);
   const [darkMode, setDarkMode] = useState<boolean>(true);
   const { userName } = getUserInfo();
   const navigate = useNavigate();
@@ -50,6 +52,8 @@ function Dashboard() {
     }
 
     localStorage.removeItem("yt-logs");
+    setJobId(null);
+    setRenders([]);
     setLoading(true);
     setError("Fetching data...");
     setResponseMsg(null);
@@ -69,13 +73,33 @@ function Dashboard() {
         }),
       });
 
-      const data = await res.json();
+      const queued = await res.json();
 
       if (!res.ok) {
-        const message = data.message || data.error || "Unknown error occurred.";
+        const message = queued.message || queued.error || "Unknown error occurred.";
         throw new Error(message);
       }
 
+      setJobId(queued.job_id);
+
+      // The server queues the job, poll until it has a result
+      let job = queued;
+      while (!["completed", "failed", "cancelled"].includes(job.status)) {
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+        const poll = await fetch(queued.status_url);
+        job = await poll.json();
+        if (!poll.ok) {
+          throw new Error(job.error || "Unknown error occurred.");
+        }
+        // Clips show up as soon as their preview or full render is ready
+        setRenders(job.renders || []);
+      }
+
+      const data = job.result;
+      if (job.status !== "completed") {
+        throw new Error(job.error || data?.message || data?.error || `Job ${job.status}.`);
+      }
+
       setResponseMsg(data);
       setError(
         `Data fetched successfully 🔰\nTotal time taken by the server to respond: ${data.time_taken}`
@@ -183,6 +207,8 @@ function Dashboard() {
             darkMode={darkMode}
             responseMsg={responseMsg}
             loading={loading}
+            jobId={jobId}
+            renders={renders}
           />
         </div>
       </motion.div>
@@ -20,9 +20,21 @@ export type ResponseData =
       content: string;
     };
 
+// What is ready of one clip while the job runs, the preview until the full render replaces it
+export type ClipRender = {
+  index: number;
+  start: number;
+  end: number;
+  preview: string | null;
+  full: string | null;
+  preview_url?: string;
+  url?: string;
+};
+
 export type SSEConsoleProps = {
   darkMode: boolean;
   loading: boolean;
+  jobId: string | null;
 };
 
 export type InputHandlerProps = {
@@ -47,7 +59,8 @@ export type ResponseMsgProps = {
   darkMode: boolean;
   responseMsg: ResponseData | null;
   loading: boolean;
-
+  jobId: string | null;
+  renders: ClipRender[];
 };
 
 export type LoginProps = {